@@ -0,0 +1,1005 @@
+"""複数住戸の一括計算
+
+室の数・境界の数が等しい K 個の住戸を先頭軸 k に積み重ね、各ステップの計算をまとめて行う。
+連立方程式の求解や行列積は [k, i, i], [k, j, j] の配列に対して一度に実行されるため、
+住戸ごとに core.calc を呼び出す場合に比べて、ステップごとのインタープリタの負荷が住戸数に依存しにくくなる。
+
+運転モードの判定・目標温度の計算・次ステップの温度と負荷の計算・潜熱負荷の係数の計算など、
+住戸ごとに条件分岐を伴う処理は、住戸ごとに Sequence と同じ関数を用いて計算する。
+"""
+
+import numpy as np
+import pandas as pd
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from heat_load_calc import next_condition, occupants, boundaries, sequence, recorder, conditions, period, snapshot
+from heat_load_calc.core import make_sequence, run_up_ground, get_run_up_options
+from heat_load_calc.global_number import get_c_a, get_rho_a, get_l_wtr
+from heat_load_calc.conditions import Conditions
+from heat_load_calc.recorder import Recorder
+from heat_load_calc.operation_mode import OperationMode
+from heat_load_calc.schedule import Schedule
+from heat_load_calc.sequence import Sequence
+from heat_load_calc.tenum import ERunUpGroundMethod
+from heat_load_calc.weather import Weather
+
+
+logger = logging.getLogger('HeatLoadCalc').getChild('batch')
+
+
+class BatchSequence:
+
+    def __init__(self, sqcs: List[Sequence]):
+        """
+        Args:
+            sqcs: 住戸 k の Sequence クラス, [k]
+        Notes:
+            すべての住戸の室の数・境界の数・時間間隔は等しくなければならない。
+        """
+
+        if len(sqcs) == 0:
+            raise ValueError('一括して計算する住戸が指定されていません。')
+
+        sqc0 = sqcs[0]
+
+        for sqc in sqcs:
+
+            if (sqc.rms.n_r != sqc0.rms.n_r) or (sqc.bs.n_b != sqc0.bs.n_b):
+                raise ValueError('室の数または境界の数が異なる住戸は一括して計算できません。')
+
+            if sqc.itv.get_delta_t() != sqc0.itv.get_delta_t():
+                raise ValueError('時間間隔が異なる住戸は一括して計算できません。')
+
+        def stack(f) -> np.ndarray:
+            return np.stack([f(sqc) for sqc in sqcs])
+
+        # 住戸 k の Sequence クラス, [k]
+        self._sqcs = sqcs
+
+        # 時間間隔, s
+        self._delta_t = sqc0.itv.get_delta_t()
+
+        # region 気象
+
+        # ステップ n における住戸 k の外気温度, degree C, [k, n+1]
+        self._theta_o_ks_ns_plus = stack(lambda s: s.weather.theta_o_ns_plus)
+
+        # ステップ n における住戸 k の外気絶対湿度, kg/kg(DA), [k, n+1]
+        self._x_o_ks_ns_plus = stack(lambda s: s.weather.x_o_ns_plus)
+
+        # endregion
+
+        # region スケジュール
+
+        # ステップ n における住戸 k の室 i の在室人数, [k, i, n]
+        self._n_hum_ks_is_ns = stack(lambda s: s.scd.n_hum_is_ns)
+
+        # ステップ n における住戸 k の室 i の人体発熱を除く内部発熱, W, [k, i, n]
+        self._q_gen_ks_is_ns = stack(lambda s: s.scd.q_gen_is_ns)
+
+        # ステップ n における住戸 k の室 i の人体発湿を除く内部発湿, kg/s, [k, i, n]
+        self._x_gen_ks_is_ns = stack(lambda s: s.scd.x_gen_is_ns)
+
+        # endregion
+
+        # region 室
+
+        # 住戸 k の室 i の容積, m3, [k, i, 1]
+        self._v_r_ks_is = stack(lambda s: s.rms.v_r_is)
+
+        # 住戸 k の室 i の備品等の熱容量, J/K, [k, i, 1]
+        self._c_sh_frt_ks_is = stack(lambda s: s.rms.c_sh_frt_is)
+
+        # 住戸 k の室 i の備品等と空気間の熱コンダクタンス, W/K, [k, i, 1]
+        self._g_sh_frt_ks_is = stack(lambda s: s.rms.g_sh_frt_is)
+
+        # 住戸 k の室 i の備品等の湿気容量, kg/(kg/kg(DA)), [k, i, 1]
+        self._c_lh_frt_ks_is = stack(lambda s: s.rms.c_lh_frt_is)
+
+        # 住戸 k の室 i の備品等と空気間の湿気コンダクタンス, kg/(s kg/kg(DA)), [k, i, 1]
+        self._g_lh_frt_ks_is = stack(lambda s: s.rms.g_lh_frt_is)
+
+        # 住戸 k の室 i の自然風利用時の換気量, m3/s, [k, i, 1]
+        self._v_vent_ntr_set_ks_is = stack(lambda s: s.rms.v_vent_ntr_set_is)
+
+        # 住戸 k の室間の機械換気量, m3/s, [k, i, i]
+        self._v_vent_int_ks_is_is = stack(lambda s: s.mvs.v_vent_int_is_is)
+
+        # endregion
+
+        # region 境界
+
+        # 住戸 k の境界 j の面積, m2, [k, j, 1]
+        self._a_s_ks_js = stack(lambda s: s.bs.a_s_js)
+
+        # 住戸 k の境界 j の室内側対流熱伝達率, W/(m2 K), [k, j, 1]
+        self._h_s_c_ks_js = stack(lambda s: s.bs.h_s_c_js)
+
+        # 住戸 k の境界 j の室内側放射熱伝達率, W/(m2 K), [k, j, 1]
+        self._h_s_r_ks_js = stack(lambda s: s.bs.h_s_r_js)
+
+        # 住戸 k の境界 j と室 i の接続に関する係数, -, [k, j, i]
+        self._p_ks_js_is = stack(lambda s: s.bs.p_js_is)
+
+        # 住戸 k の境界 j の裏面温度に境界 j* の等価温度が与える影響, -, [k, j, j]
+        self._k_ei_ks_js_js = stack(lambda s: s.bs.k_ei_js_js)
+
+        # 住戸 k の境界 j の裏面温度に境界 j の相当外気温度が与える影響, -, [k, j, 1]
+        self._k_eo_ks_js = stack(lambda s: s.bs.k_eo_js)
+
+        # 住戸 k の境界 j の裏面温度に室 i の空気温度が与える影響, -, [k, j, i]
+        self._k_s_r_ks_js_is = stack(lambda s: s.bs.k_s_r_js_is)
+
+        # 住戸 k の境界 j の項別公比法の指数項 m の吸熱応答係数, m2 K/W, [k, j, m]
+        self._phi_a1_ks_js_ms = stack(lambda s: s.bs.phi_a1_js_ms)
+
+        # 住戸 k の境界 j の項別公比法の指数項 m の貫流応答係数, -, [k, j, m]
+        self._phi_t1_ks_js_ms = stack(lambda s: s.bs.phi_t1_js_ms)
+
+        # 住戸 k の境界 j の項別公比法の指数項 m の公比, -, [k, j, m]
+        self._r_ks_js_ms = stack(lambda s: s.bs.r_js_ms)
+
+        # ステップ n における住戸 k の境界 j の相当外気温度, degree C, [k, j, n+1]
+        self._theta_o_eqv_ks_js_nspls = stack(lambda s: s.bs.theta_o_eqv_js_nspls)
+
+        # endregion
+
+        # region 設備
+
+        # 住戸 k の室 i の放射暖房設備の対流成分比率, -, [k, i, 1]
+        self._beta_h_ks_is = stack(lambda s: s.es.beta_h_is)
+
+        # 住戸 k の室 i の放射冷房設備の対流成分比率, -, [k, i, 1]
+        self._beta_c_ks_is = stack(lambda s: s.es.beta_c_is)
+
+        # 住戸 k の室 i の放射暖房の放熱量の放射成分に対する境界 j の室内側表面の吸収比率, -, [k, j, i]
+        self._f_flr_h_ks_js_is = stack(lambda s: s.es.f_flr_h_js_is)
+
+        # 住戸 k の室 i の放射冷房の吸熱量の放射成分に対する境界 j の室内側表面の放熱比率, -, [k, j, i]
+        self._f_flr_c_ks_js_is = stack(lambda s: s.es.f_flr_c_js_is)
+
+        # endregion
+
+        # region 事前計算された係数
+
+        # ステップ n における住戸 k の室 i の機械換気量, m3/s, [k, i, n]
+        self._v_vent_mec_ks_is_ns = stack(lambda s: s.v_vent_mec_is_ns)
+
+        # ステップ n における住戸 k の室 i の備品等が吸収した透過日射量, W, [k, i, n]
+        self._q_sol_frt_ks_is_ns = stack(lambda s: s.q_sol_frt_is_ns)
+
+        # ステップ n における住戸 k の境界 j の透過日射吸収熱量, W/m2, [k, j, n]
+        self._q_s_sol_ks_js_ns = stack(lambda s: s.q_s_sol_js_ns)
+
+        # 住戸 k の室 i の在室者に対する境界 j の形態係数, -, [k, i, j]
+        self._f_mrt_hum_ks_is_js = stack(lambda s: s.f_mrt_hum_is_js)
+
+        # 住戸 k の室 i の微小球に対する境界 j の形態係数, -, [k, i, j]
+        self._f_mrt_ks_is_js = stack(lambda s: s.f_mrt_is_js)
+
+        # 住戸 k の係数 f_WSR, -, [k, j, i]
+        self._f_wsr_ks_js_is = stack(lambda s: s.f_wsr_js_is)
+
+        # ステップ n における住戸 k の係数 f_WSC, degree C, [k, j, n]
+        self._f_wsc_ks_js_ns = stack(lambda s: s.f_wsc_js_ns)
+
+        # 住戸 k の係数 f_XOT, [k, i, i]
+        self._f_xot_ks_is_is_n_pls = stack(lambda s: s.f_xot_is_is_n_pls)
+
+        # 住戸 k の係数 f_AX の逆行列, -, [k, j, j]
+        self._f_ax_inv_ks_js_js = stack(lambda s: s.f_ax_inv_js_js)
+
+        # 住戸 k の係数 f_BRM のうち時間によって変化しない部分, W/K, [k, i, i]
+        self._f_brm_cst_ks_is_is = stack(lambda s: s.f_brm_cst_is_is)
+
+        # 住戸 k の係数 f_h_wgt のうち時間によって変化しない部分, kg/(s kg/kg(DA)), [k, i, i]
+        self._f_h_wgt_cst_ks_is_is = stack(lambda s: s.f_h_wgt_cst_is_is)
+
+        # 住戸 k の境界 j の表面温度が室 i の係数 f_BRC に与える影響を表す係数, W/K, [k, i, j]
+        self._f_brc_ws_ks_is_js = stack(lambda s: s.f_brc_ws_is_js)
+
+        # ステップ n における住戸 k の係数 f_BRC のうち係数 f_WSC による部分, W, [k, i, n+1]
+        self._f_brc_wsc_ks_is_ns = stack(lambda s: s.f_brc_wsc_is_ns)
+
+        # 住戸 k の境界 j の表面温度が室 i の係数 f_XC に与える影響を表す係数, -, [k, i, j]
+        self._f_xc_ws_ks_is_js = stack(lambda s: s.f_xc_ws_is_js)
+
+        # ステップ n における住戸 k の係数 f_XC のうち係数 f_WSC による部分, degree C, [k, i, n+1]
+        self._f_xc_wsc_ks_is_ns = stack(lambda s: s.f_xc_wsc_is_ns)
+
+        # 住戸 k の境界 j の表面温度が境界 j の等価温度の放射成分に与える影響を表す係数, -, [k, j, j]
+        self._f_mrt_ks_js_js = stack(lambda s: s.f_mrt_js_js)
+
+        # 住戸 k の室 i の放射暖房運転時・放射冷房運転時の係数 f_WSB, K/W, [k, j, i]
+        self._f_wsb_h_ks_js_is = stack(lambda s: s.f_wsb_h_js_is)
+        self._f_wsb_c_ks_js_is = stack(lambda s: s.f_wsb_c_js_is)
+
+        # 住戸 k の室 i の放射暖房運転時・放射冷房運転時の係数 f_BRL, -, [k, i, i]
+        self._f_brl_h_ks_is_is = stack(lambda s: s.f_brl_h_is_is)
+        self._f_brl_c_ks_is_is = stack(lambda s: s.f_brl_c_is_is)
+
+        # 住戸 k の室 i の放射暖房運転時・放射冷房運転時の係数 f_XLR, K/W, [k, i, i]
+        self._f_xlr_h_ks_is_is = stack(lambda s: s.f_xlr_h_is_is)
+        self._f_xlr_c_ks_is_is = stack(lambda s: s.f_xlr_c_is_is)
+
+        # endregion
+
+    @property
+    def sqcs(self) -> List[Sequence]:
+        """住戸 k の Sequence クラス, [k]"""
+        return self._sqcs
+
+    @property
+    def n_k(self) -> int:
+        """住戸の数"""
+        return len(self._sqcs)
+
+    def run_tick(self, n: int, c_n: Conditions, recorders: List[Recorder], exe_verify: bool = False) -> Conditions:
+        """すべての住戸についてステップ n からステップ n+1 の計算を行う。
+
+        Args:
+            n: ステップ
+            c_n: ステップ n における状態（各値は先頭軸 k をもつ）
+            recorders: 住戸 k の Recorder クラス, [k]
+            exe_verify: 熱収支のチェックを行うか否か（住戸ごとに Sequence.verify を呼ぶ）
+
+        Returns:
+            ステップ n+1 における状態（各値は先頭軸 k をもつ）
+        """
+
+        delta_t = self._delta_t
+
+        sqcs = self._sqcs
+
+        # ステップ n における住戸 k の外気温度, degree C, [k, 1, 1]
+        theta_o_n = self._theta_o_ks_ns_plus[:, n].reshape(-1, 1, 1)
+
+        # ステップ n+1 における住戸 k の外気温度, degree C, [k, 1, 1]
+        theta_o_n_pls = self._theta_o_ks_ns_plus[:, n + 1].reshape(-1, 1, 1)
+
+        # ステップ n+1 における住戸 k の外気絶対湿度, kg/kg(DA), [k, 1, 1]
+        x_o_n_pls = self._x_o_ks_ns_plus[:, n + 1].reshape(-1, 1, 1)
+
+        # ステップ n+1 における住戸 k の係数 f_WSC, degree C, [k, j, 1]
+        f_wsc_js_n_pls = self._f_wsc_ks_js_ns[:, :, [n + 1]]
+
+        # region 人体発熱・人体発湿
+
+        # ステップnからステップn+1における室iの1人あたりの人体発熱, W, [k, i, 1]
+        q_hum_psn_is_n = occupants.get_q_hum_psn_is_n(theta_r_is_n=c_n.theta_r_is_n)
+
+        # ステップ n からステップ n+1 における室 i の人体発熱, W, [k, i, 1]
+        q_hum_is_n = sequence.get_q_hum_is_n(n_hum_is_n=self._n_hum_ks_is_ns[:, :, [n]], q_hum_psn_is_n=q_hum_psn_is_n)
+
+        # ステップnの室iにおける1人あたりの人体発湿, kg/s, [k, i, 1]
+        x_hum_psn_is_n = occupants.get_x_hum_psn_is_n(theta_r_is_n=c_n.theta_r_is_n)
+
+        # ステップnの室iにおける人体発湿, kg/s, [k, i, 1]
+        x_hum_is_n = sequence.get_x_hum_is_n(n_hum_is_n=self._n_hum_ks_is_ns[:, :, [n]], x_hum_psn_is_n=x_hum_psn_is_n)
+
+        # endregion
+
+        # ステップ n の境界 j における裏面温度, degree C, [k, j, 1]
+        theta_rear_js_n = sequence.get_theta_s_rear_js_n(
+            k_s_er_js_js=self._k_ei_ks_js_js,
+            theta_er_js_n=c_n.theta_ei_js_n,
+            k_s_eo_js=self._k_eo_ks_js,
+            theta_eo_js_n=self._theta_o_eqv_ks_js_nspls[:, :, [n]],
+            k_s_r_js_is=self._k_s_r_ks_js_is,
+            theta_r_is_n=c_n.theta_r_is_n
+        )
+
+        # ステップnの室iにおけるすきま風量, m3/s, [k, i, 1]
+        v_leak_is_n = np.stack([
+            sqc.building.get_v_leak_is_n(
+                theta_r_is_n=c_n.theta_r_is_n[k],
+                theta_o_n=sqc.weather.theta_o_ns_plus[n],
+                v_r_is=sqc.rms.v_r_is
+            )
+            for k, sqc in enumerate(sqcs)
+        ])
+
+        # ステップ n+1 の境界 j における項別公比法の指数項 m の貫流応答の項別成分, degree C, [k, j, m]
+        theta_dsh_s_t_js_ms_n_pls = boundaries._get_theta_dsh_s_t_js_ms_n_pls(
+            phi_t1_js_ms=self._phi_t1_ks_js_ms,
+            r_js_ms=self._r_ks_js_ms,
+            theta_dsh_srf_t_js_ms_n=c_n.theta_dsh_srf_t_js_ms_n,
+            theta_rear_js_n=theta_rear_js_n
+        )
+
+        # ステップ n+1 の境界 j における項別公比法の指数項 m の吸熱応答の項別成分, degree C, [k, j, m]
+        theta_dsh_s_a_js_ms_n_pls = boundaries._get_theta_dsh_s_a_js_ms_n_pls(
+            phi_a1_js_ms=self._phi_a1_ks_js_ms,
+            q_s_js_n=c_n.q_s_js_n,
+            r_js_ms=self._r_ks_js_ms,
+            theta_dsh_srf_a_js_ms_n=c_n.theta_dsh_srf_a_js_ms_n
+        )
+
+        # ステップ n+1 の境界 j における係数f_CVL, degree C, [k, j, 1]
+        f_cvl_js_n_pls = boundaries._get_f_cvl_js_n_pls(
+            theta_dsh_s_a_js_ms_n_pls=theta_dsh_s_a_js_ms_n_pls,
+            theta_dsh_s_t_js_ms_n_pls=theta_dsh_s_t_js_ms_n_pls
+        )
+
+        # ステップ n+1 の境界 j における係数 f_WSV, degree C, [k, j, 1]
+        f_wsv_js_n_pls = sequence.get_f_wsv_js_n_pls(f_cvl_js_n_pls=f_cvl_js_n_pls, f_ax_inv_js_js=self._f_ax_inv_ks_js_js)
+
+        # ステップnからステップn+1における室iの換気・隙間風による外気の流入量, m3/s, [k, i, 1]
+        v_vent_out_non_nv_is_n = sequence.get_v_vent_out_non_ntr_is_n(
+            v_leak_is_n=v_leak_is_n,
+            v_vent_mec_is_n=self._v_vent_mec_ks_is_ns[:, :, [n]]
+        )
+
+        # ステップ n+1 の室 i における係数 f_BRC, W, [k, i, 1]
+        f_brc_non_nv_is_n_pls, f_brc_nv_is_n_pls = sequence.get_f_brc_is_n_pls(
+            c_a=get_c_a(),
+            v_rm_is=self._v_r_ks_is,
+            c_sh_frt_is=self._c_sh_frt_ks_is,
+            delta_t=delta_t,
+            f_brc_ws_is_js=self._f_brc_ws_ks_is_js,
+            f_brc_wsc_is_n_pls=self._f_brc_wsc_ks_is_ns[:, :, [n + 1]],
+            f_wsv_js_n_pls=f_wsv_js_n_pls,
+            g_sh_frt_is=self._g_sh_frt_ks_is,
+            q_gen_is_n=self._q_gen_ks_is_ns[:, :, [n]],
+            q_hum_is_n=q_hum_is_n,
+            q_sol_frt_is_n=self._q_sol_frt_ks_is_ns[:, :, [n]],
+            rho_a=get_rho_a(),
+            theta_frt_is_n=c_n.theta_frt_is_n,
+            theta_o_n_pls=theta_o_n_pls,
+            theta_r_is_n=c_n.theta_r_is_n,
+            v_vent_out_non_nv_is_n=v_vent_out_non_nv_is_n,
+            v_vent_ntr_is_n=self._v_vent_ntr_set_ks_is
+        )
+
+        # ステップ n+1 における係数 f_BRM, W/K, [k, i, i]
+        f_brm_non_nv_is_is_n_pls, f_brm_nv_is_is_n_pls = sequence.get_f_brm_is_is_n_pls(
+            c_a=get_c_a(),
+            f_brm_cst_is_is=self._f_brm_cst_ks_is_is,
+            rho_a=get_rho_a(),
+            v_vent_out_non_nv_is_n=v_vent_out_non_nv_is_n,
+            v_vent_ntr_set_is=self._v_vent_ntr_set_ks_is
+        )
+
+        # ステップn+1における室iの係数 XC, [k, i, 1]
+        f_xc_is_n_pls = sequence.get_f_xc_is_n_pls(
+            f_xc_ws_is_js=self._f_xc_ws_ks_is_js,
+            f_xc_wsc_is_n_pls=self._f_xc_wsc_ks_is_ns[:, :, [n + 1]],
+            f_wsv_js_n_pls=f_wsv_js_n_pls
+        )
+
+        # ステップ n における係数 f_BRM,OT, W/K, [k, i, i]
+        f_brm_ot_non_nv_is_is_n_pls, f_brm_ot_nv_is_is_n_pls = sequence.get_f_brm_ot_is_is_n_pls(
+            f_xot_is_is_n_pls=self._f_xot_ks_is_is_n_pls,
+            f_brm_non_nv_is_is_n_pls=f_brm_non_nv_is_is_n_pls,
+            f_brm_nv_is_is_n_pls=f_brm_nv_is_is_n_pls
+        )
+
+        # ステップ n における係数 f_BRC,OT, W, [k, i, 1]
+        f_brc_ot_non_nv_is_n_pls, f_brc_ot_nv_is_n_pls = sequence.get_f_brc_ot_is_n_pls(
+            f_xc_is_n_pls=f_xc_is_n_pls,
+            f_brc_non_nv_is_n_pls=f_brc_non_nv_is_n_pls,
+            f_brc_nv_is_n_pls=f_brc_nv_is_n_pls,
+            f_brm_non_nv_is_is_n_pls=f_brm_non_nv_is_is_n_pls,
+            f_brm_nv_is_is_n_pls=f_brm_nv_is_is_n_pls
+        )
+
+        # ステップnにおける室iの潜熱バランスに関する係数f_h_cst, kg / s, [k, i, 1]
+        f_h_cst_non_nv_is_n, f_h_cst_nv_is_n = sequence.get_f_h_cst_is_n(
+            c_lh_frt_is=self._c_lh_frt_ks_is,
+            delta_t=delta_t,
+            g_lh_frt_is=self._g_lh_frt_ks_is,
+            rho_a=get_rho_a(),
+            v_rm_is=self._v_r_ks_is,
+            x_frt_is_n=c_n.x_frt_is_n,
+            x_gen_is_n=self._x_gen_ks_is_ns[:, :, [n]],
+            x_hum_is_n=x_hum_is_n,
+            x_o_n_pls=x_o_n_pls,
+            x_r_is_n=c_n.x_r_is_n,
+            v_vent_out_non_nv_is_n=v_vent_out_non_nv_is_n,
+            v_vent_ntr_is=self._v_vent_ntr_set_ks_is
+        )
+
+        # ステップnにおける室i*の絶対湿度が室iの潜熱バランスに与える影響を表す係数,　kg/(s kg/kg(DA)), [k, i, i]
+        f_h_wgt_non_nv_is_is_n, f_h_wgt_nv_is_is_n = sequence.get_f_h_wgt_is_is_n(
+            f_h_wgt_cst_is_is=self._f_h_wgt_cst_ks_is_is,
+            rho_a=get_rho_a(),
+            v_vent_out_non_nv_is_n=v_vent_out_non_nv_is_n,
+            v_vent_ntr_is=self._v_vent_ntr_set_ks_is
+        )
+
+        # ステップn+1における自然作用温度, degree C, [k, i, 1]
+        theta_r_ot_ntr_non_nv_is_n_pls, theta_r_ot_ntr_nv_is_n_pls = sequence.get_theta_r_ot_ntr_is_n_pls(
+            f_brc_ot_non_nv_is_n_pls=f_brc_ot_non_nv_is_n_pls,
+            f_brc_ot_nv_is_n_pls=f_brc_ot_nv_is_n_pls,
+            f_brm_ot_non_nv_is_is_n_pls=f_brm_ot_non_nv_is_is_n_pls,
+            f_brm_ot_nv_is_is_n_pls=f_brm_ot_nv_is_is_n_pls
+        )
+
+        theta_r_ntr_non_nv_is_n_pls = np.matmul(self._f_xot_ks_is_is_n_pls, theta_r_ot_ntr_non_nv_is_n_pls) - f_xc_is_n_pls
+        theta_r_ntr_nv_is_n_pls = np.matmul(self._f_xot_ks_is_is_n_pls, theta_r_ot_ntr_nv_is_n_pls) - f_xc_is_n_pls
+
+        theta_s_ntr_non_nv_js_n_pls = np.matmul(self._f_wsr_ks_js_is, theta_r_ntr_non_nv_is_n_pls) + f_wsc_js_n_pls + f_wsv_js_n_pls
+        theta_s_ntr_nv_js_n_pls = np.matmul(self._f_wsr_ks_js_is, theta_r_ntr_nv_is_n_pls) + f_wsc_js_n_pls + f_wsv_js_n_pls
+
+        theta_mrt_hum_ntr_non_nv_is_n_pls = np.matmul(self._f_mrt_ks_is_js, theta_s_ntr_non_nv_js_n_pls)
+        theta_mrt_hum_ntr_nv_is_n_pls = np.matmul(self._f_mrt_ks_is_js, theta_s_ntr_nv_js_n_pls)
+
+        # ステップn+1における室iの加湿・除湿を行わない場合の絶対湿度, kg/kg(DA) [k, i, 1]
+        x_r_ntr_non_nv_is_n_pls, x_r_ntr_nv_is_n_pls = sequence.get_x_r_ntr_is_n_pls(
+            f_h_cst_non_nv_is_n=f_h_cst_non_nv_is_n,
+            f_h_wgt_non_nv_is_is_n=f_h_wgt_non_nv_is_is_n,
+            f_h_cst_nv_is_n=f_h_cst_nv_is_n,
+            f_h_wgt_nv_is_is_n=f_h_wgt_nv_is_is_n
+        )
+
+        # ステップ n における室 i の運転モード, [k, i, 1]
+        operation_mode_is_n = np.stack([
+            sqc.op.get_t_operation_mode_is_n(
+                n=n,
+                is_radiative_heating_is=sqc.es.is_radiative_heating_is,
+                is_radiative_cooling_is=sqc.es.is_radiative_cooling_is,
+                met_is=sqc.rms.met_is,
+                theta_r_ot_ntr_non_nv_is_n_pls=theta_r_ot_ntr_non_nv_is_n_pls[k],
+                theta_r_ot_ntr_nv_is_n_pls=theta_r_ot_ntr_nv_is_n_pls[k],
+                theta_r_ntr_non_nv_is_n_pls=theta_r_ntr_non_nv_is_n_pls[k],
+                theta_r_ntr_nv_is_n_pls=theta_r_ntr_nv_is_n_pls[k],
+                theta_mrt_hum_ntr_non_nv_is_n_pls=theta_mrt_hum_ntr_non_nv_is_n_pls[k],
+                theta_mrt_hum_ntr_nv_is_n_pls=theta_mrt_hum_ntr_nv_is_n_pls[k],
+                x_r_ntr_non_nv_is_n_pls=x_r_ntr_non_nv_is_n_pls[k],
+                x_r_ntr_nv_is_n_pls=x_r_ntr_nv_is_n_pls[k]
+            )
+            for k, sqc in enumerate(sqcs)
+        ])
+
+        is_nv_is_n = operation_mode_is_n == OperationMode.STOP_OPEN.value
+
+        f_brm_is_is_n_pls = np.where(is_nv_is_n, f_brm_nv_is_is_n_pls, f_brm_non_nv_is_is_n_pls)
+
+        v_vent_ntr_is_n = np.where(is_nv_is_n, self._v_vent_ntr_set_ks_is, 0.0)
+
+        f_brm_ot_is_is_n_pls = np.where(is_nv_is_n, f_brm_ot_nv_is_is_n_pls, f_brm_ot_non_nv_is_is_n_pls)
+
+        f_brc_ot_is_n_pls = np.where(is_nv_is_n, f_brc_ot_nv_is_n_pls, f_brc_ot_non_nv_is_n_pls)
+
+        f_h_cst_is_n = np.where(is_nv_is_n, f_h_cst_nv_is_n, f_h_cst_non_nv_is_n)
+
+        f_h_wgt_is_is_n = np.where(is_nv_is_n, f_h_wgt_nv_is_is_n, f_h_wgt_non_nv_is_is_n)
+
+        theta_r_ot_ntr_is_n_pls = np.where(is_nv_is_n, theta_r_ot_ntr_nv_is_n_pls, theta_r_ot_ntr_non_nv_is_n_pls)
+
+        theta_r_ntr_is_n_pls = np.where(is_nv_is_n, theta_r_ntr_nv_is_n_pls, theta_r_ntr_non_nv_is_n_pls)
+
+        theta_mrt_hum_ntr_is_n_pls = np.where(is_nv_is_n, theta_mrt_hum_ntr_nv_is_n_pls, theta_mrt_hum_ntr_non_nv_is_n_pls)
+
+        x_r_ntr_is_n_pls = np.where(is_nv_is_n, x_r_ntr_nv_is_n_pls, x_r_ntr_non_nv_is_n_pls)
+
+        targets = [
+            sqc.op.get_theta_target_is_n(
+                operation_mode_is_n=operation_mode_is_n[k],
+                theta_r_ntr_is_n_pls=theta_r_ntr_is_n_pls[k],
+                theta_mrt_hum_ntr_is_n_pls=theta_mrt_hum_ntr_is_n_pls[k],
+                x_r_ntr_is_n_pls=x_r_ntr_is_n_pls[k],
+                n=n,
+                is_radiative_heating_is=sqc.es.is_radiative_heating_is,
+                is_radiative_cooling_is=sqc.es.is_radiative_cooling_is,
+                met_is=sqc.rms.met_is
+            )
+            for k, sqc in enumerate(sqcs)
+        ]
+
+        theta_lower_target_is_n_pls, theta_upper_target_is_n_pls, h_hum_c_is_n, h_hum_r_is_n \
+            = (np.stack(v) for v in zip(*targets))
+
+        # ステップ n+1 における係数 f_flr, -, [k, j, i]
+        f_flr_js_is_n = sequence.get_f_flr_js_is_n(
+            f_flr_c_js_is=self._f_flr_c_ks_js_is,
+            f_flr_h_js_is=self._f_flr_h_ks_js_is,
+            operation_mode_is_n=operation_mode_is_n
+        )
+
+        # ステップ n からステップ n+1 における室 i の放射暖冷房設備の対流成分比率, -, [k, i, 1]
+        beta_is_n = sequence.get_beta_is_n(
+            beta_c_is=self._beta_c_ks_is,
+            beta_h_is=self._beta_h_ks_is,
+            operation_mode_is_n=operation_mode_is_n
+        )
+
+        # ステップ n における係数 f_WSB, K/W, [k, j, i]
+        f_wsb_js_is_n_pls = sequence.get_x_xs_is_n_by_operation_mode(
+            x_c_xs_is=self._f_wsb_c_ks_js_is,
+            x_h_xs_is=self._f_wsb_h_ks_js_is,
+            operation_mode_is_n=operation_mode_is_n
+        )
+
+        # ステップ n における係数 f_BRL, -, [k, i, i]
+        f_brl_is_is_n = sequence.get_x_xs_is_n_by_operation_mode(
+            x_c_xs_is=self._f_brl_c_ks_is_is,
+            x_h_xs_is=self._f_brl_h_ks_is_is,
+            operation_mode_is_n=operation_mode_is_n
+        )
+
+        # ステップn+1における室iの係数 f_XLR, K/W, [k, i, i]
+        f_xlr_is_is_n_pls = sequence.get_x_xs_is_n_by_operation_mode(
+            x_c_xs_is=self._f_xlr_c_ks_is_is,
+            x_h_xs_is=self._f_xlr_h_ks_is_is,
+            operation_mode_is_n=operation_mode_is_n
+        )
+
+        # ステップ n における係数 f_BRL_OT, -, [k, i, i]
+        f_brl_ot_is_is_n = sequence.get_f_brl_ot_is_is_n(
+            f_brl_is_is_n=f_brl_is_is_n,
+            f_brm_is_is_n_pls=f_brm_is_is_n_pls,
+            f_xlr_is_is_n_pls=f_xlr_is_is_n_pls
+        )
+
+        # ステップ n+1 における室 i の作用温度, degree C, [k, i, 1]
+        # ステップ n における室 i に設置された対流暖房の放熱量, W, [k, i, 1]
+        # ステップ n における室 i に設置された放射暖房の放熱量, W, [k, i, 1]
+        loads = [
+            next_condition.get_next_temp_and_load(
+                ac_demand_is_ns=sqc.scd.r_ac_demand_is_ns,
+                brc_ot_is_n=f_brc_ot_is_n_pls[k],
+                brm_ot_is_is_n=f_brm_ot_is_is_n_pls[k],
+                brl_ot_is_is_n=f_brl_ot_is_is_n[k],
+                theta_lower_target_is_n=theta_lower_target_is_n_pls[k],
+                theta_upper_target_is_n=theta_upper_target_is_n_pls[k],
+                operation_mode_is_n=operation_mode_is_n[k],
+                is_radiative_heating_is=sqc.es.is_radiative_heating_is,
+                is_radiative_cooling_is=sqc.es.is_radiative_cooling_is,
+                lr_h_max_cap_is=sqc.es.q_rs_h_max_is,
+                lr_cs_max_cap_is=sqc.es.q_rs_c_max_is,
+                theta_natural_is_n=theta_r_ot_ntr_is_n_pls[k],
+                n=n
+            )
+            for k, sqc in enumerate(sqcs)
+        ]
+
+        theta_ot_is_n_pls, l_cs_is_n, l_rs_is_n = (np.stack(v) for v in zip(*loads))
+
+        # ステップ n+1 における室 i の室温, degree C, [k, i, 1]
+        theta_r_is_n_pls = sequence.get_theta_r_is_n_pls(
+            f_xc_is_n_pls=f_xc_is_n_pls,
+            f_xlr_is_is_n_pls=f_xlr_is_is_n_pls,
+            f_xot_is_is_n_pls=self._f_xot_ks_is_is_n_pls,
+            l_rs_is_n=l_rs_is_n,
+            theta_ot_is_n_pls=theta_ot_is_n_pls
+        )
+
+        # ステップ n+1 における境界 j の表面温度, degree C, [k, j, 1]
+        theta_s_js_n_pls = sequence.get_theta_s_js_n_pls(
+            f_wsb_js_is_n_pls=f_wsb_js_is_n_pls,
+            f_wsc_js_n_pls=f_wsc_js_n_pls,
+            f_wsr_js_is=self._f_wsr_ks_js_is,
+            f_wsv_js_n_pls=f_wsv_js_n_pls,
+            l_rs_is_n=l_rs_is_n,
+            theta_r_is_n_pls=theta_r_is_n_pls
+        )
+
+        # ステップ n+1 における室 i　の備品等の温度, degree C, [k, i, 1]
+        theta_frt_is_n_pls = sequence.get_theta_frt_is_n_pls(
+            c_sh_frt_is=self._c_sh_frt_ks_is,
+            delta_t=delta_t,
+            g_sh_frt_is=self._g_sh_frt_ks_is,
+            q_sol_frt_is_n=self._q_sol_frt_ks_is_ns[:, :, [n]],
+            theta_frt_is_n=c_n.theta_frt_is_n,
+            theta_r_is_n_pls=theta_r_is_n_pls
+        )
+
+        # ステップ n+1 における室 i の人体に対する平均放射温度, degree C, [k, i, 1]
+        theta_mrt_hum_is_n_pls = sequence.get_theta_mrt_hum_is_n_pls(
+            f_mrt_hum_is_js=self._f_mrt_hum_ks_is_js,
+            theta_s_js_n_pls=theta_s_js_n_pls
+        )
+
+        # ステップ n+1 における境界 j の等価温度, degree C, [k, j, 1]
+        theta_ei_js_n_pls = sequence.get_theta_ei_js_n_pls(
+            a_s_js=self._a_s_ks_js,
+            beta_is_n=beta_is_n,
+            f_mrt_js_js=self._f_mrt_ks_js_js,
+            f_flr_js_is_n=f_flr_js_is_n,
+            h_s_c_js=self._h_s_c_ks_js,
+            h_s_r_js=self._h_s_r_ks_js,
+            l_rs_is_n=l_rs_is_n,
+            p_js_is=self._p_ks_js_is,
+            q_s_sol_js_n_pls=self._q_s_sol_ks_js_ns[:, :, [n + 1]],
+            theta_r_is_n_pls=theta_r_is_n_pls,
+            theta_s_js_n_pls=theta_s_js_n_pls
+        )
+
+        # ステップ n+1 における境界 j の裏面温度, degree C, [k, j, 1]
+        theta_rear_js_n_pls = sequence.get_theta_s_rear_js_n(
+            k_s_er_js_js=self._k_ei_ks_js_js,
+            theta_er_js_n=theta_ei_js_n_pls,
+            k_s_eo_js=self._k_eo_ks_js,
+            theta_eo_js_n=self._theta_o_eqv_ks_js_nspls[:, :, [n + 1]],
+            k_s_r_js_is=self._k_s_r_ks_js_is,
+            theta_r_is_n=theta_r_is_n_pls
+        )
+
+        # ステップ n+1 における境界 j の表面熱流（壁体吸熱を正とする）, W/m2, [k, j, 1]
+        q_s_js_n_pls = sequence.get_q_s_js_n_pls(
+            h_s_c_js=self._h_s_c_ks_js,
+            h_s_r_js=self._h_s_r_ks_js,
+            theta_ei_js_n_pls=theta_ei_js_n_pls,
+            theta_s_js_n_pls=theta_s_js_n_pls
+        )
+
+        # ステップ n から n+1 における室 i の潜熱負荷に与える影響を表す係数, kg/s, [k, i, 1]
+        # ステップ n+1 における室 i∗ の絶対湿度がステップ n から n+1 における室 i の潜熱負荷に与える影響を表す係数, kg/(s (kg/kg(DA))), [k, i, i]
+        f_l_cls = [
+            sqc.get_f_l_cl(
+                l_cs_is_n=l_cs_is_n[k],
+                theta_r_is_n_pls=theta_r_is_n_pls[k],
+                x_r_ntr_is_n_pls=x_r_ntr_is_n_pls[k]
+            )
+            for k, sqc in enumerate(sqcs)
+        ]
+
+        f_l_cl_cst_is_n, f_l_cl_wgt_is_is_n = (np.stack(v) for v in zip(*f_l_cls))
+
+        # ステップ n+1 における室 i の 絶対湿度, kg/kg(DA), [k, i, 1]
+        x_r_is_n_pls = sequence.get_x_r_is_n_pls(
+            f_h_cst_is_n=f_h_cst_is_n,
+            f_h_wgt_is_is_n=f_h_wgt_is_is_n,
+            f_l_cl_cst_is_n=f_l_cl_cst_is_n,
+            f_l_cl_wgt_is_is_n=f_l_cl_wgt_is_is_n
+        )
+
+        # ステップ n から ステップ n+1 における室 i の潜熱負荷（加湿を正・除湿を負とする）, W, [k, i, 1]
+        l_cl_is_n = sequence.get_l_cl_is_n(
+            f_l_cl_wgt_is_is_n=f_l_cl_wgt_is_is_n,
+            f_l_cl_cst_is_n=f_l_cl_cst_is_n,
+            l_wtr=get_l_wtr(),
+            x_r_is_n_pls=x_r_is_n_pls
+        )
+
+        # ステップ n+1 における室 i の備品等等の絶対湿度, kg/kg(DA), [k, i, 1]
+        x_frt_is_n_pls = sequence.get_x_frt_is_n_pls(
+            c_lh_frt_is=self._c_lh_frt_ks_is,
+            delta_t=delta_t,
+            g_lh_frt_is=self._g_lh_frt_ks_is,
+            x_frt_is_n=c_n.x_frt_is_n,
+            x_r_is_n_pls=x_r_is_n_pls
+        )
+
+        if exe_verify:
+
+            # ステップ n における住戸 k の状態, [k]
+            cs_n = unstack_conditions(c=c_n)
+
+            for k, sqc in enumerate(sqcs):
+
+                sqc.verify(
+                    n=n,
+                    c_n=cs_n[k],
+                    theta_r_is_n_pls=theta_r_is_n_pls[k],
+                    theta_s_js_n_pls=theta_s_js_n_pls[k],
+                    theta_frt_is_n_pls=theta_frt_is_n_pls[k],
+                    x_r_is_n_pls=x_r_is_n_pls[k],
+                    x_frt_is_n_pls=x_frt_is_n_pls[k],
+                    theta_rear_js_n_pls=theta_rear_js_n_pls[k],
+                    f_cvl_js_n_pls=f_cvl_js_n_pls[k],
+                    q_s_js_n_pls=q_s_js_n_pls[k],
+                    l_cs_is_n=l_cs_is_n[k],
+                    l_rs_is_n=l_rs_is_n[k],
+                    l_cl_is_n=l_cl_is_n[k],
+                    beta_is_n=beta_is_n[k],
+                    q_hum_is_n=q_hum_is_n[k],
+                    x_hum_is_n=x_hum_is_n[k],
+                    v_leak_is_n=v_leak_is_n[k],
+                    v_vent_ntr_is_n=v_vent_ntr_is_n[k]
+                )
+
+        if recorders is not None:
+
+            for k, rcd in enumerate(recorders):
+
+                rcd.recording(
+                    n=n,
+                    theta_r_is_n_pls=theta_r_is_n_pls[k],
+                    theta_mrt_hum_is_n_pls=theta_mrt_hum_is_n_pls[k],
+                    x_r_is_n_pls=x_r_is_n_pls[k],
+                    theta_frt_is_n_pls=theta_frt_is_n_pls[k],
+                    x_frt_is_n_pls=x_frt_is_n_pls[k],
+                    theta_ei_js_n_pls=theta_ei_js_n_pls[k],
+                    q_s_js_n_pls=q_s_js_n_pls[k],
+                    theta_ot_is_n_pls=theta_ot_is_n_pls[k],
+                    theta_s_js_n_pls=theta_s_js_n_pls[k],
+                    theta_rear_js_n=theta_rear_js_n_pls[k],
+                    f_cvl_js_n_pls=f_cvl_js_n_pls[k],
+                    operation_mode_is_n=operation_mode_is_n[k],
+                    l_cs_is_n=l_cs_is_n[k],
+                    l_rs_is_n=l_rs_is_n[k],
+                    l_cl_is_n=l_cl_is_n[k],
+                    h_hum_c_is_n=h_hum_c_is_n[k],
+                    h_hum_r_is_n=h_hum_r_is_n[k],
+                    q_hum_is_n=q_hum_is_n[k],
+                    x_hum_is_n=x_hum_is_n[k],
+                    v_leak_is_n=v_leak_is_n[k],
+                    v_vent_ntr_is_n=v_vent_ntr_is_n[k]
+                )
+
+        return Conditions(
+            operation_mode_is_n=operation_mode_is_n,
+            theta_r_is_n=theta_r_is_n_pls,
+            theta_mrt_hum_is_n=theta_mrt_hum_is_n_pls,
+            x_r_is_n=x_r_is_n_pls,
+            theta_dsh_s_a_js_ms_n=theta_dsh_s_a_js_ms_n_pls,
+            theta_dsh_s_t_js_ms_n=theta_dsh_s_t_js_ms_n_pls,
+            q_s_js_n=q_s_js_n_pls,
+            theta_frt_is_n=theta_frt_is_n_pls,
+            x_frt_is_n=x_frt_is_n_pls,
+            theta_ei_js_n=theta_ei_js_n_pls
+        )
+
+
+def stack_conditions(cs: List[Conditions]) -> Conditions:
+    """住戸ごとの状態を先頭軸 k に積み重ねる。
+
+    Args:
+        cs: 住戸 k の状態, [k]
+
+    Returns:
+        各値が先頭軸 k をもつ状態
+    """
+
+    return Conditions(
+        operation_mode_is_n=np.stack([c.operation_mode_is_n for c in cs]),
+        theta_r_is_n=np.stack([c.theta_r_is_n for c in cs]),
+        theta_mrt_hum_is_n=np.stack([c.theta_mrt_hum_is_n for c in cs]),
+        x_r_is_n=np.stack([c.x_r_is_n for c in cs]),
+        theta_dsh_s_a_js_ms_n=np.stack([c.theta_dsh_srf_a_js_ms_n for c in cs]),
+        theta_dsh_s_t_js_ms_n=np.stack([c.theta_dsh_srf_t_js_ms_n for c in cs]),
+        q_s_js_n=np.stack([c.q_s_js_n for c in cs]),
+        theta_frt_is_n=np.stack([c.theta_frt_is_n for c in cs]),
+        x_frt_is_n=np.stack([c.x_frt_is_n for c in cs]),
+        theta_ei_js_n=np.stack([c.theta_ei_js_n for c in cs])
+    )
+
+
+def unstack_conditions(c: Conditions) -> List[Conditions]:
+    """先頭軸 k をもつ状態を住戸ごとの状態に分割する。
+
+    Args:
+        c: 各値が先頭軸 k をもつ状態
+
+    Returns:
+        住戸 k の状態, [k]
+    """
+
+    return [
+        Conditions(
+            operation_mode_is_n=c.operation_mode_is_n[k],
+            theta_r_is_n=c.theta_r_is_n[k],
+            theta_mrt_hum_is_n=c.theta_mrt_hum_is_n[k],
+            x_r_is_n=c.x_r_is_n[k],
+            theta_dsh_s_a_js_ms_n=c.theta_dsh_srf_a_js_ms_n[k],
+            theta_dsh_s_t_js_ms_n=c.theta_dsh_srf_t_js_ms_n[k],
+            q_s_js_n=c.q_s_js_n[k],
+            theta_frt_is_n=c.theta_frt_is_n[k],
+            x_frt_is_n=c.x_frt_is_n[k],
+            theta_ei_js_n=c.theta_ei_js_n[k]
+        )
+        for k in range(c.theta_r_is_n.shape[0])
+    ]
+
+
+def calc_batch(
+        ds: List[Dict],
+        entry_point_dir: str,
+        output_names: Optional[List[str]] = None,
+        exe_verify: bool = False
+    ) -> List[Tuple[pd.DataFrame, pd.DataFrame, Schedule, Weather]]:
+    """複数住戸を一括して計算する。
+
+    Args:
+        ds: 住戸 k の input data as dictionary / 住宅計算条件, [k]
+        entry_point_dir: the pass of the entry point directory
+        output_names: 出力する項目の出力名（"t_r", "l_s_c" 等）のリスト
+            None の場合は住戸ごとに入力データの common の output_names を用い、それも無い場合はすべての項目を出力する。
+        exe_verify: 熱収支のチェックを行うか否か
+
+    Returns:
+        住戸 k ごとの core.calc と同じタプル, [k]
+            (1) 計算結果（詳細版）をいれたDataFrame
+            (2) 計算結果（簡易版）をいれたDataFrame
+            (3) schedule
+            (4) weather
+
+    Notes:
+        すべての住戸の室の数・境界の数・時間間隔・計算日数・助走計算の収束判定の許容値は等しくなければならない。
+        地盤の助走計算の方法及び保存された助走計算の後の状態値（snapshot）は住戸ごとに core.calc と同様に扱う。
+    """
+
+    prepared = [make_sequence(d=d, entry_point_dir=entry_point_dir) for d in ds]
+
+    if len(set(p[1:] for p in prepared)) > 1:
+        raise ValueError('計算日数が異なる住戸は一括して計算できません。')
+
+    run_up_options = [get_run_up_options(d=d) for d in ds]
+
+    if len(set(opt.get('tol_run_up') for opt in run_up_options)) > 1:
+        raise ValueError('助走計算の収束判定の許容値が異なる住戸は一括して計算できません。')
+
+    sqcs = [p[0] for p in prepared]
+
+    bsqc = BatchSequence(sqcs=sqcs)
+
+    n_step_main, n_step_run_up, n_step_run_up_build = prepared[0][1:]
+
+    results = [
+        recorder.Recorder(
+            n_step_main=n_step_main,
+            id_rm_is=list(sqc.rms.id_r_is.flatten()),
+            id_bs_js=list(sqc.bs.id_js.flatten()),
+            output_names=d['common'].get('output_names', None) if output_names is None else output_names
+        )
+        for d, sqc in zip(ds, sqcs)
+    ]
+
+    for sqc, result in zip(sqcs, results):
+
+        result.pre_recording(
+            weather=sqc.weather,
+            scd=sqc.scd,
+            bs=sqc.bs,
+            q_sol_frt_is_ns=sqc.q_sol_frt_is_ns,
+            q_s_sol_js_ns=sqc.q_s_sol_js_ns,
+            q_trs_sol_is_ns=sqc.q_trs_sol_is_ns
+        )
+
+    loaded = [snapshot.load(d=d, w=sqc.weather) for d, sqc in zip(ds, sqcs)]
+
+    if all(ld is not None for ld in loaded):
+
+        c_ns = [None] * bsqc.n_k
+
+    else:
+
+        c_ns = unstack_conditions(
+            c=_run_up_batch(
+                bsqc=bsqc,
+                n_step_run_up=n_step_run_up,
+                n_step_run_up_build=n_step_run_up_build,
+                results=results,
+                run_up_options=run_up_options
+            )
+        )
+
+    for k, (d, sqc, result) in enumerate(zip(ds, sqcs, results)):
+
+        if loaded[k] is None:
+
+            snapshot.save(d=d, w=sqc.weather, c_n=c_ns[k], values_i=result.get_first_values_i())
+
+        else:
+
+            c_ns[k], values_i = loaded[k]
+
+            result.set_first_values_i(values_i=values_i)
+
+    c_n = stack_conditions(cs=c_ns)
+
+    logger.info('本計算（{} 住戸）'.format(bsqc.n_k))
+
+    m = 1
+
+    for n in range(0, n_step_main):
+
+        c_n = bsqc.run_tick(n=n, c_n=c_n, recorders=results, exe_verify=exe_verify)
+
+        if n == int(n_step_main / 12 * m):
+            logger.info("{} / 12 calculated.".format(m))
+            m = m + 1
+
+    logger.info('ログ作成')
+
+    outputs = []
+
+    for sqc, result in zip(sqcs, results):
+
+        result.post_recording(rms=sqc.rms, bs=sqc.bs, f_mrt_is_js=sqc.f_mrt_is_js, es=sqc.es)
+
+        dd_i, dd_a = result.export_pd()
+
+        outputs.append((dd_i, dd_a, sqc.scd, sqc.weather))
+
+    return outputs
+
+
+def _run_up_batch(
+        bsqc: BatchSequence,
+        n_step_run_up: int,
+        n_step_run_up_build: int,
+        results: List[Recorder],
+        run_up_options: List[Dict]
+    ) -> Conditions:
+    """すべての住戸の助走計算（地盤のみ・建物全体）を行う。
+
+    Args:
+        bsqc: BatchSequence クラス
+        n_step_run_up: 助走計算のステップ数
+        n_step_run_up_build: 助走計算のうち建物全体を解くステップ数
+        results: 住戸 k の Recorder クラス（1/1 0:00 の瞬時値を記録する）, [k]
+        run_up_options: 住戸 k の core.get_run_up_options の値, [k]
+
+    Returns:
+        1/1 0:00 の状態（各値は先頭軸 k をもつ）
+
+    Notes:
+        収束判定を行う場合は core.calc と同様に本計算の前日を繰り返し計算し、
+        住戸ごとに収束した時点の状態値及び 1/1 0:00 の瞬時値を用いる。
+        収束した住戸も、すべての住戸が収束するまでは一括して計算を続ける。
+    """
+
+    n_step_day = bsqc.sqcs[0].itv.get_n_day()
+
+    tol_run_up = run_up_options[0].get('tol_run_up')
+
+    if tol_run_up is None:
+        n_step_run_up_ground_end = n_step_run_up_build
+    else:
+        n_step_run_up_ground_end = min(n_step_day, n_step_run_up)
+
+    c_n = stack_conditions(
+        cs=[
+            run_up_ground(
+                sqc=sqc,
+                n_step_run_up=n_step_run_up,
+                n_step_run_up_ground_end=n_step_run_up_ground_end,
+                run_up_ground_method=opt.get('run_up_ground_method', ERunUpGroundMethod.STEP)
+            )
+            for sqc, opt in zip(bsqc.sqcs, run_up_options)
+        ]
+    )
+
+    logger.info('助走計算（建物全体）')
+
+    if tol_run_up is None:
+
+        for n in range(-n_step_run_up_build, 0):
+            c_n = bsqc.run_tick(n=n, c_n=c_n, recorders=results)
+
+        return c_n
+
+    tol_theta, tol_q = tol_run_up
+
+    n_d_max = max(n_step_run_up_build // n_step_day, period.N_D_RUN_UP_BUILD_MIN)
+
+    # 住戸 k の収束した時点の状態値及び 1/1 0:00 の瞬時値（収束していない場合は None）, [k]
+    converged = [None] * bsqc.n_k
+
+    for n_d in range(1, n_d_max + 1):
+
+        c_pre = conditions.copy_conditions(c=c_n)
+
+        for n in range(-n_step_day, 0):
+            c_n = bsqc.run_tick(n=n, c_n=c_n, recorders=results)
+
+        if n_d < period.N_D_RUN_UP_BUILD_MIN:
+            continue
+
+        for k, (c1, c2) in enumerate(zip(unstack_conditions(c=c_pre), unstack_conditions(c=c_n))):
+            if converged[k] is None and conditions.is_converged(c1=c1, c2=c2, tol_theta=tol_theta, tol_q=tol_q):
+                converged[k] = (conditions.copy_conditions(c=c2), results[k].get_first_values_i())
+
+        if all(cv is not None for cv in converged):
+            logger.info('助走計算（建物全体）は {} 日で収束しました。'.format(n_d))
+            break
+
+    else:
+
+        logger.warning('助走計算（建物全体）は {} 日で収束しませんでした。'.format(n_d_max))
+
+    c_ns = unstack_conditions(c=c_n)
+
+    for k, cv in enumerate(converged):
+
+        if cv is not None:
+
+            c_ns[k], values_i = cv
+
+            results[k].set_first_values_i(values_i=values_i)
+
+    return stack_conditions(cs=c_ns)
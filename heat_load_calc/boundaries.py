@@ -1,11 +1,12 @@
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable
 from enum import Enum
 
 from heat_load_calc.matrix_method import v_diag
-from heat_load_calc import response_factor, transmission_solar_radiation, shape_factor
+from heat_load_calc import response_factor, transmission_solar_radiation, shape_factor, inclined_surface_solar_radiation
 from heat_load_calc.weather import Weather
+from heat_load_calc.inclined_surface_solar_radiation import SolarGeometryTable
 from heat_load_calc.response_factor import ResponseFactor
 from heat_load_calc.direction import Direction
 from heat_load_calc.solar_shading import SolarShading
@@ -123,59 +124,101 @@ class Boundaries:
         # indoor surface convection heat transfer coefficient of boundary j / 境界jの室内側表面対流熱伝達率, W/m2K, [J, 1]
         h_s_c_js = np.array([float(b['h_c']) for b in ds]).reshape(-1, 1)
 
-        # boundary j / 境界 j, [J]
-        bss = [self._get_boundary(d=d, h_s_c_js=h_s_c_js, h_s_r_js=h_s_r_js, w=w, id_js=id_js) for d in ds]
-
-        # GOUND の数
-        n_ground =sum(bs.t_b == BoundaryType.GROUND for bs in bss)
-
-        # id of boundary j, [J, 1]
-        id_js = np.array([bs.id for bs in bss]).reshape(-1, 1)
+        # ID of boundary j, [J]
+        id_j_list = [int(d['id']) for d in ds]
 
         # name of boundary j, [J, 1]
-        name_js = np.array([bs.name for bs in bss]).reshape(-1, 1)
+        name_js = np.array([str(d['name']) for d in ds]).reshape(-1, 1)
 
         # sub name of boundary j, [J, 1]
-        sub_name_js = np.array([bs.sub_name for bs in bss]).reshape(-1, 1)
+        sub_name_js = np.array([str(d['sub_name']) for d in ds]).reshape(-1, 1)
+
+        # type of boundary j / 境界の種類, [J]
+        t_b_js = [BoundaryType(d['boundary_type']) for d in ds]
+
+        # GOUND の数
+        n_ground = sum(t_b_j == BoundaryType.GROUND for t_b_j in t_b_js)
 
         # is the boundary j floor ?, [J, 1]
-        b_floor_js = np.array([bs.b_floor for bs in bss]).reshape(-1, 1)
+        b_floor_js = np.array([bool(d['is_floor']) for d in ds]).reshape(-1, 1)
 
         # is the boundary j ground ?, [J, 1]
-        b_ground_js = np.array([bs.t_b == BoundaryType.GROUND for bs in bss]).reshape(-1, 1)
+        b_ground_js = np.array([t_b_j == BoundaryType.GROUND for t_b_j in t_b_js]).reshape(-1, 1)
+
+        # is inside solar radiation absorbed of boundary j / 室内侵入日射吸収の有無 (True:吸収する/False:吸収しない), [J, 1]
+        b_sol_abs_js = np.array([bool(d['is_solar_absorbed_inside']) for d in ds]).reshape(-1, 1)
+
+        # temperature difference coefficient of boundary j / 温度差係数, [J]
+        k_eo_j_list = [_read_k_eo(d=d, id=id_j, t_b=t_b_j) for (d, id_j, t_b_j) in zip(ds, id_j_list, t_b_js)]
+
+        # rear boundary index of boundary j, [J]
+        j_rear_js = [_read_j_rear(b=d, id=id_j, t_b=t_b_j, id_js=id_js) for (d, id_j, t_b_j) in zip(ds, id_j_list, t_b_js)]
+
+        # is the sun striked to outside of boundary j / 外気側に日射が当たるか否か, [J]
+        b_sun_strkd_out_js = [_read_b_sun_strkd_out(d=d, id=id_j, t_b=t_b_j) for (d, id_j, t_b_j) in zip(ds, id_j_list, t_b_js)]
+
+        # direction of boundary j / 方位, [J]
+        t_drct_js = [_read_t_drct(d=d, b_sun_strkd_out=b) for (d, b) in zip(ds, b_sun_strkd_out_js)]
+
+        # solar shading of boundary j / 日よけ, [J]
+        ssp_js = [
+            _read_ssp(ssp_dict=d['solar_shading_part'], b_sun_strkd_out=b, t_drct=t_drct_j)
+            for (d, b, t_drct_j) in zip(ds, b_sun_strkd_out_js, t_drct_js)
+        ]
+
+        # solar absorption ratio at outside surface of boundary j / 境界jの室外側表面日射吸収率, -, [J]
+        a_sol_js = [_read_a_sol(d=d, id=id_j, t_b=t_b_j) for (d, id_j, t_b_j) in zip(ds, id_j_list, t_b_js)]
+
+        # outside heat transfer resistance of boundary j / 室外側熱伝達抵抗, m2 K / W, [J]
+        r_s_o_js = [_read_r_s_o(d=d, id=id_j, t_b=t_b_j) for (d, id_j, t_b_j) in zip(ds, id_j_list, t_b_js)]
+
+        # long wavelength emissivity at outside surface of boundary j, -, [J]
+        eps_r_o_js = [_read_eps_r_o(d=d, id=id_j, t_b=t_b_j) for (d, id_j, t_b_j) in zip(ds, id_j_list, t_b_js)]
+
+        # standard heat transmittance coefficient (u value) of boundary j, W / ( m2 K ), [J]
+        u_w_std_js = [_get_u_std(d=d, id=id_j, t_b=t_b_j) for (d, id_j, t_b_j) in zip(ds, id_j_list, t_b_js)]
+
+        # window class of boundary j, [J]
+        window_js = [
+            _get_window_class_j(
+                t_b_j=t_b_j,
+                u_w_std_j=u_w_std_j,
+                eta_w_std_j=_read_eta_std(d=d, id=id_j, t_b=t_b_j),
+                t_glz_j=_read_t_glz(d=d, id=id_j, t_b=t_b_j),
+                r_a_w_g_j=_read_r_a_w_g(d=d, id=id_j, t_b=t_b_j)
+            )
+            for (d, id_j, t_b_j, u_w_std_j) in zip(ds, id_j_list, t_b_js, u_w_std_js)
+        ]
+
+        # response factor of boundary j, [J]
+        rfs = _get_response_factors(
+            ds=ds, h_s_c_js=h_s_c_js, h_s_r_js=h_s_r_js, id_js=id_j_list, t_b_js=t_b_js, j_rear_js=j_rear_js,
+            r_s_o_js=r_s_o_js, u_w_std_js=u_w_std_js
+        )
 
         # coefficient representing the effect of equivalent room temperature of other boundary j to the rear temperature of boundary j
         # 裏面温度に他の境界 j の等価室温が与える影響, [J, J]
-        k_ei_js_js = np.array([bs.k_ei_js for bs in bss])
+        k_ei_js_js = _get_k_ei_js_js(t_b_js=t_b_js, j_rear_js=j_rear_js)
 
-        # temperature difference coefficient of boundary j / 温度差係数, [J]
-        k_eo_js = np.array([bs.k_eo for bs in bss]).reshape(-1, 1)
+        # temperature difference coefficient of boundary j / 温度差係数, [J, 1]
+        k_eo_js = np.array(k_eo_j_list).reshape(-1, 1)
 
         # coefficient representing the effect of room air temperature i to the rear temperature of boundary j / 裏面温度に室の空気温度が与える影響, [J, I]
-        k_s_r_js = np.array([bs.k_s_r for bs in bss])
+        k_s_r_js = np.array([_get_k_s_r_j(t_b_j=t_b_j, k_eo_j=k_eo_j) for (t_b_j, k_eo_j) in zip(t_b_js, k_eo_j_list)])
         k_s_r_js_is = p_is_js.T * k_s_r_js[:, np.newaxis]
 
-        # is inside solar radiation absorbed of boundary j / 室内侵入日射吸収の有無 (True:吸収する/False:吸収しない) 
-        b_sol_abs_js = np.array([bs.b_sol_abs for bs in bss]).reshape(-1, 1)
-
         # the resistance from the inside surface of boundary j to the outside air, m2K/W, [J, 1]
-        r_total_js = np.array([bs.rf.r_total for bs in bss]).reshape(-1, 1)
+        r_total_js = np.array([rf.r_total for rf in rfs]).reshape(-1, 1)
 
         # thermal transmittance coefficient of boundary j, W/m2K, [J, 1]
         u_js = 1.0 / (1.0 / (h_s_c_js + h_s_r_js) + r_total_js)
 
         # response factor of boundary j, [J, 1] or [J, M]
-        phi_a0_js = np.array([bs.rf.rfa0 for bs in bss]).reshape(-1, 1)
-        phi_a1_js_ms = np.array([bs.rf.rfa1 for bs in bss])
-        phi_t0_js = np.array([bs.rf.rft0 for bs in bss]).reshape(-1, 1)
-        phi_t1_js_ms = np.array([bs.rf.rft1 for bs in bss])
-        r_js_ms = np.array([bs.rf.row for bs in bss])
-
-        # outside equivalent temperature of boundary j, degree C, [J, N+1]
-        theta_o_eqv_js_nspls = np.array([bs.theta_o_eqv_nspls for bs in bss])
-
-        # transmitted solar radiation of boundary j, W, [J, N+1]
-        q_trs_sol_js_nspls = np.array([bs.q_trs_sol_nplus for bs in bss])
+        phi_a0_js = np.array([rf.rfa0 for rf in rfs]).reshape(-1, 1)
+        phi_a1_js_ms = np.array([rf.rfa1 for rf in rfs])
+        phi_t0_js = np.array([rf.rft0 for rf in rfs]).reshape(-1, 1)
+        phi_t1_js_ms = np.array([rf.rft1 for rf in rfs])
+        r_js_ms = np.array([rf.row for rf in rfs])
 
         self._n_b = n_b
         self._connected_room_id_js = connected_room_id_js
@@ -201,123 +244,46 @@ class Boundaries:
         self._phi_t0_js = phi_t0_js
         self._phi_t1_js_ms = phi_t1_js_ms
         self._r_js_ms = r_js_ms
-        self._theta_o_eqv_js_nspls = theta_o_eqv_js_nspls
-        self._q_trs_sol_js_nspls = q_trs_sol_js_nspls
 
-    @staticmethod
-    def _get_boundary(d: Dict, h_s_c_js: np.ndarray, h_s_r_js: np.ndarray, w: Weather, id_js: np.ndarray) -> Boundary:
-        """
+        # properties of the outside surface of boundary j used to calculate the values depending on the weather, [J]
+        self._t_b_js = t_b_js
+        self._b_sun_strkd_out_js = b_sun_strkd_out_js
+        self._t_drct_js = t_drct_js
+        self._a_sol_js = a_sol_js
+        self._eps_r_o_js = eps_r_o_js
+        self._r_s_o_js = r_s_o_js
+        self._ssp_js = ssp_js
+        self._u_w_std_js = u_w_std_js
+        self._window_js = window_js
+
+        self.set_weather(w=w)
+
+    def set_weather(self, w: Weather):
+        """Calculate the outside equivalent temperature and the transmitted solar radiation for the weather.
+        気象データに対する相当外気温度及び透過日射熱取得を計算する。
 
         Args:
-            d: dictionary of boundary j
-            h_s_c_js: 境界jの室内側表面対流熱伝達率, W/m2K, [J, 1]
-            h_s_r_js: 境界jの室内側表面放射熱伝達率, W/m2K, [J, 1]
             w: Weather クラス
-            id_js: id of boundaries, [J]
 
-        Returns:
-            Boundary クラス
+        Notes:
+            複数年の計算では、年ごとの気象データに対して呼び出す。
         """
 
-        # ID of boundary j
-        id_j = int(d['id'])
-
-        # name of boundary j / 名前
-        name_j = str(d['name'])
-
-        # sub name of boundary j / 副名称
-        sub_name_j = str(d['sub_name'])
-
-        # type of boundary j / 境界の種類
-        t_b_j = BoundaryType(d['boundary_type'])
-
-        # surface area of boundary j/ 面積, m2
-        a_s_j = _read_a_s(d=d)
-
-        # temperature difference coefficient of boundary j / 温度差係数
-        k_eo_j = _read_k_eo(d=d, id=id_j, t_b=t_b_j)
+        # solar geometry table shared among boundaries of the same direction / 方位ごとの入射角及び傾斜面日射量の表
+        sgt = SolarGeometryTable(w=w)
 
-        # rear boundary index of boundary j
-        j_rear_j = _read_j_rear(b=d, id=id_j, t_b=t_b_j, id_js=id_js)
-
-        # is inside solar radiation absorbed of boundary j / 室内侵入日射吸収の有無 (True:吸収する/False:吸収しない)
-        b_sol_abs_j = bool(d['is_solar_absorbed_inside'])
-
-        # is boundary j floor / 床か否か(True:床/False:床以外)
-        b_floor_j = bool(d['is_floor'])
-
-        # is the sun striked to outside of boundary j / 外気側に日射が当たるか否か
-        b_sun_strkd_out_j = _read_b_sun_strkd_out(d=d, id=id_j, t_b=t_b_j)
-        
-        # direction of boundary j / 方位
-        t_drct_j = _read_t_drct(d=d, b_sun_strkd_out=b_sun_strkd_out_j)
-        
-        # solar shading of boundary j / 日よけ        
-        ssp_j = _read_ssp(ssp_dict=d['solar_shading_part'], b_sun_strkd_out=b_sun_strkd_out_j, t_drct=t_drct_j)
-
-        # solar absorption ratio at outside surface of boundary j / 境界jの室外側表面日射吸収率, -
-        a_sol_j = _read_a_sol(d=d, id=id_j, t_b=t_b_j)
-
-        # outside heat transfer resistance of boundary j / 室外側熱伝達抵抗, m2 K / W
-        r_s_o_j = _read_r_s_o(d=d, id=id_j, t_b=t_b_j)
-
-        # long wavelength emissivity at outside surface of boundary j, -
-        eps_r_o_j = _read_eps_r_o(d=d, id=id_j, t_b=t_b_j)
-
-        # standard heat transmittance coefficient (u value) of boundary j, W / ( m2 K )
-        u_w_std_j = _get_u_std(d=d, id=id_j, t_b=t_b_j)
-
-        # standard solar gain coefficient (eta value) of boundary j, -
-        eta_w_std_j = _read_eta_std(d=d, id=id_j, t_b=t_b_j)
-
-        # grazing area ratio of boundary j, -
-        r_a_w_g_j = _read_r_a_w_g(d=d, id=id_j, t_b=t_b_j)
-
-        # grazing type of boundary j/ グレージングの種類
-        t_glz_j = _read_t_glz(d=d, id=id_j, t_b=t_b_j)
-
-        # window class of boundary j
-        window_j = _get_window_class_j(t_b_j=t_b_j, u_w_std_j=u_w_std_j, eta_w_std_j=eta_w_std_j, t_glz_j=t_glz_j, r_a_w_g_j=r_a_w_g_j)
-
-        # equivalent outside temperature of boundary i at step n, degree C, [N+1]
-        theta_o_eqv_j_nspls = _get_theta_o_eqv_j_ns(t_b_j=t_b_j, w=w, b_sun_strkd_out_j=b_sun_strkd_out_j, t_drct_j=t_drct_j, a_sol_j=a_sol_j, eps_r_o_j=eps_r_o_j, r_s_o_j=r_s_o_j, ssp_j=ssp_j, u_w_std_j=u_w_std_j, window_j=window_j)
-
-        # transmitted solar radiation of boundary j at step n, W, [N+1]
-        q_trs_sol_j_nspls = _get_q_trs_sol_j_ns(t_b_j=t_b_j, w=w, b_sun_strkd_out_j=b_sun_strkd_out_j, t_drct_j=t_drct_j, a_s_j=a_s_j, ssp_j=ssp_j, window_j=window_j)
-
-        # convective heat transfer coefficient of the rear surface of boundary j, W/m2K
-        h_s_c_rear_j = float(h_s_c_js[j_rear_j, 0]) if t_b_j == BoundaryType.INTERNAL else None
-
-        # radiative heat transfer coefficient of the rear surface of boundary j, W/m2K
-        h_s_r_rear_j = float(h_s_r_js[j_rear_j, 0]) if t_b_j == BoundaryType.INTERNAL else None
-
-        # response factor of boundary j
-        rf = _get_response_factor(d=d, h_s_c_rear_j=h_s_c_rear_j, h_s_r_rear_j=h_s_r_rear_j, id_j=id_j, t_b_j=t_b_j, r_s_o_j=r_s_o_j, u_w_std_j=u_w_std_j)
-        
-        # coefficient representing the effect of equivalent room temperature of other boundary j to the rear temperature of boundary j
-        # 裏面温度に他の境界 j の等価室温が与える影響, [J]
-        k_ei_js_j = _get_k_ei_js_j(id_js=id_js, t_b_j=t_b_j, j_rear_j=j_rear_j)
-
-        # coefficient representing the effect of room air temperature to the rear temperature of boundary j / 裏面温度に室の空気温度が与える影響
-        k_s_r_j = _get_k_s_r_j(t_b_j=t_b_j, k_eo_j=k_eo_j)
-
-
-        return Boundary(
-            id=id_j,
-            name=name_j,
-            sub_name=sub_name_j,
-            t_b=t_b_j,
-            a_s=a_s_j,
-            k_eo=k_eo_j,
-            b_floor=b_floor_j,
-            b_sol_abs=b_sol_abs_j,
-            theta_o_eqv_nspls=theta_o_eqv_j_nspls,
-            q_trs_sol_nplus=q_trs_sol_j_nspls,
-            rf=rf,
-            k_ei_js=k_ei_js_j,
-            k_s_r=k_s_r_j
+        # outside equivalent temperature of boundary j, degree C, [J, N+1]
+        self._theta_o_eqv_js_nspls = _get_theta_o_eqv_js_ns(
+            t_b_js=self._t_b_js, w=w, b_sun_strkd_out_js=self._b_sun_strkd_out_js, t_drct_js=self._t_drct_js,
+            a_sol_js=self._a_sol_js, eps_r_o_js=self._eps_r_o_js, r_s_o_js=self._r_s_o_js, ssp_js=self._ssp_js,
+            u_w_std_js=self._u_w_std_js, window_js=self._window_js, sgt=sgt
         )
 
+        # transmitted solar radiation of boundary j, W, [J, N+1]
+        self._q_trs_sol_js_nspls = _get_q_trs_sol_js_ns(
+            t_b_js=self._t_b_js, w=w, b_sun_strkd_out_js=self._b_sun_strkd_out_js, t_drct_js=self._t_drct_js,
+            a_s_js=self._a_s_js, ssp_js=self._ssp_js, window_js=self._window_js, sgt=sgt
+        )
 
     @property
     def n_b(self) -> int:
@@ -1055,150 +1021,251 @@ def _get_window_class_j(t_b_j: BoundaryType, u_w_std_j: Optional[float], eta_w_s
         raise Exception()
 
 
-def _get_theta_o_eqv_j_ns(
-    t_b_j: BoundaryType,
+def _get_theta_o_eqv_js_ns(
+    t_b_js: List[BoundaryType],
     w: Weather,
-    b_sun_strkd_out_j: Optional[bool],
-    t_drct_j: Optional[Direction],
-    a_sol_j: Optional[float],
-    eps_r_o_j: Optional[float],
-    r_s_o_j: Optional[float],
-    ssp_j: Optional[SolarShading],
-    u_w_std_j: Optional[float],
-    window_j: Optional[Window]
+    b_sun_strkd_out_js: List[bool],
+    t_drct_js: List[Optional[Direction]],
+    a_sol_js: List[Optional[float]],
+    eps_r_o_js: List[Optional[float]],
+    r_s_o_js: List[Optional[float]],
+    ssp_js: List[Optional[SolarShading]],
+    u_w_std_js: List[Optional[float]],
+    window_js: List[Optional[Window]],
+    sgt: SolarGeometryTable
 ) -> np.ndarray:
-    """Calculate the equivalent outside temperature of boundary j at step n.
+    """Calculate the equivalent outside temperature of all boundaries at step n.
 
     Args:
-        t_b_j: type of boundary j
+        t_b_js: type of boundary j, [J]
         w: weather class
-        b_sun_strkd_out_j: is the sun striked to boundary j
-        t_drct_j: direction of boundary j
-        a_sol_j: solar absorption ratio of boundary j, -
-        eps_r_o_j: long wavelength emissivity of boundary j, -
-        r_s_o_j: thermal resistance at the outside surface of boundary j, m2 K / W
-        ssp_j: solar shading part class of boundary j
-        u_w_std_j: standard heat transmittance coefficient (U value) of boundary j, W / m2 K
-        window_j: window class of boundary j
+        b_sun_strkd_out_js: is the sun striked to boundary j, [J]
+        t_drct_js: direction of boundary j, [J]
+        a_sol_js: solar absorption ratio of boundary j, -, [J]
+        eps_r_o_js: long wavelength emissivity of boundary j, -, [J]
+        r_s_o_js: thermal resistance at the outside surface of boundary j, m2 K / W, [J]
+        ssp_js: solar shading part class of boundary j, [J]
+        u_w_std_js: standard heat transmittance coefficient (U value) of boundary j, W / m2 K, [J]
+        window_js: window class of boundary j, [J]
+        sgt: solar geometry table of the directions
 
     Returns:
-        equivalent outside temperature of boundary j at step n, degree C, [N+1]
+        equivalent outside temperature of boundary j at step n, degree C, [J, N+1]
+    Notes:
+        The boundaries are divided into the groups which have the same equation,
+        and the equivalent outside temperature of each group is calculated as the matrix [J', N+1] at once.
     """
-    
-    if t_b_j == BoundaryType.INTERNAL:
 
-        return outside_eqv_temp.get_theta_o_eqv_j_ns_for_internal(w=w)
+    theta_o_eqv_js_ns = np.empty((len(t_b_js), w.number_of_data_plus), dtype=float)
 
-    elif t_b_j in [BoundaryType.EXTERNAL_GENERAL_PART, BoundaryType.EXTERNAL_OPAQUE_PART]:
-
-        if b_sun_strkd_out_j:
+    # index of the boundaries which are external general part or external opaque part and are striked by the sun
+    js_opq = [
+        j for (j, (t_b_j, b)) in enumerate(zip(t_b_js, b_sun_strkd_out_js))
+        if t_b_j in [BoundaryType.EXTERNAL_GENERAL_PART, BoundaryType.EXTERNAL_OPAQUE_PART] and b
+    ]
 
-            if t_drct_j is None:
-                raise Exception("t_drct should be decided when boundary type is external transparent part.")
-            
-            if a_sol_j is None:
-                raise Exception("a_sol should be decided when boundary type is external transparent part.")
-            
-            if eps_r_o_j is None:
-                raise Exception("eps_r_o should be decided when boundary type is external transparent part.")
-            
-            if r_s_o_j is None:
-                raise Exception("r_s_o should be decided when boundary type is external transparent part.")
-            
-            if ssp_j is None:
-                raise Exception("ssp should be decided when boundary type is external transparent part.")
-        
-            return outside_eqv_temp.get_theta_o_eqv_j_ns_for_external_general_part_and_external_opaque_part(
-                t_drct_j=t_drct_j, a_sol_j=a_sol_j, eps_r_o_j=eps_r_o_j, r_s_o_j=r_s_o_j, ssp_j=ssp_j, w=w
-            )
+    # index of the boundaries which are external transparent part and are striked by the sun
+    js_trs = [
+        j for (j, (t_b_j, b)) in enumerate(zip(t_b_js, b_sun_strkd_out_js))
+        if t_b_j == BoundaryType.EXTERNAL_TRANSPARENT_PART and b
+    ]
 
+    for (j, (t_b_j, b)) in enumerate(zip(t_b_js, b_sun_strkd_out_js)):
+
+        if t_b_j == BoundaryType.INTERNAL:
+            theta_o_eqv_js_ns[j] = outside_eqv_temp.get_theta_o_eqv_j_ns_for_internal(w=w)
+        elif t_b_j == BoundaryType.GROUND:
+            theta_o_eqv_js_ns[j] = outside_eqv_temp.get_theta_o_eqv_j_ns_for_ground(w=w)
+        elif t_b_j in [
+            BoundaryType.EXTERNAL_GENERAL_PART, BoundaryType.EXTERNAL_OPAQUE_PART, BoundaryType.EXTERNAL_TRANSPARENT_PART
+        ]:
+            if not b:
+                theta_o_eqv_js_ns[j] = outside_eqv_temp.get_theta_o_eqv_j_ns_for_external_not_sun_striked(w=w)
         else:
+            raise Exception()
 
-            return outside_eqv_temp.get_theta_o_eqv_j_ns_for_external_not_sun_striked(w=w)  
+    if len(js_opq) > 0:
+
+        if any(a_sol_js[j] is None or eps_r_o_js[j] is None or r_s_o_js[j] is None or ssp_js[j] is None for j in js_opq):
+            raise Exception("a_sol, eps_r_o, r_s_o and ssp should be decided when the sun is striked out.")
+
+        sg_js = sgt.gather(drct_js=[t_drct_js[j] for j in js_opq])
+
+        theta_o_eqv_js_ns[js_opq] = outside_eqv_temp.get_theta_o_eqv_js_ns_for_external_general_part_and_external_opaque_part(
+            a_sol_js=_get_column(v_js=a_sol_js, js=js_opq),
+            eps_r_o_js=_get_column(v_js=eps_r_o_js, js=js_opq),
+            r_s_o_js=_get_column(v_js=r_s_o_js, js=js_opq),
+            f_ss_dn_js_ns=_get_f_ss_dn_js_ns(ssp_js=[ssp_js[j] for j in js_opq], w=w, i_s_dn_js_ns=sg_js.i_s_dn_j_ns),
+            f_ss_sky_js=_get_column(v_js=[ssp_js[j].get_f_ss_sky_j() for j in js_opq]),
+            f_ss_ref_js=_get_column(v_js=[ssp_js[j].get_f_ss_ref_j() for j in js_opq]),
+            i_s_dn_js_ns=sg_js.i_s_dn_j_ns,
+            i_s_sky_js_ns=sg_js.i_s_sky_j_ns,
+            i_s_ref_js_ns=sg_js.i_s_ref_j_ns,
+            r_s_n_js_ns=sg_js.r_s_n_j_ns,
+            w=w
+        )
 
-    elif t_b_j == BoundaryType.EXTERNAL_TRANSPARENT_PART:
+    if len(js_trs) > 0:
+
+        if any(
+            eps_r_o_js[j] is None or r_s_o_js[j] is None or u_w_std_js[j] is None or ssp_js[j] is None or window_js[j] is None
+            for j in js_trs
+        ):
+            raise Exception("eps_r_o, r_s_o, u_w_std, ssp and window should be defined when sun is striked out.")
+
+        sg_js = sgt.gather(drct_js=[t_drct_js[j] for j in js_trs])
+
+        theta_o_eqv_js_ns[js_trs] = outside_eqv_temp.get_theta_o_eqv_js_ns_for_external_transparent_part(
+            eps_r_o_js=_get_column(v_js=eps_r_o_js, js=js_trs),
+            r_s_o_js=_get_column(v_js=r_s_o_js, js=js_trs),
+            u_w_std_js=_get_column(v_js=u_w_std_js, js=js_trs),
+            f_ss_dn_js_ns=_get_f_ss_dn_js_ns(ssp_js=[ssp_js[j] for j in js_trs], w=w, i_s_dn_js_ns=sg_js.i_s_dn_j_ns),
+            f_ss_sky_js=_get_column(v_js=[ssp_js[j].get_f_ss_sky_j() for j in js_trs]),
+            f_ss_ref_js=_get_column(v_js=[ssp_js[j].get_f_ss_ref_j() for j in js_trs]),
+            b_w_d_js_ns=_get_d_js_ns(
+                get_d_j_ns_js=[window_js[j].get_b_w_d_j_ns for j in js_trs], phi_js_ns=sg_js.phi_j_ns, i_s_dn_js_ns=sg_js.i_s_dn_j_ns
+            ),
+            b_w_s_js=_get_column(v_js=[window_js[j].b_w_s_j for j in js_trs]),
+            b_w_r_js=_get_column(v_js=[window_js[j].b_w_r_j for j in js_trs]),
+            i_s_dn_js_ns=sg_js.i_s_dn_j_ns,
+            i_s_sky_js_ns=sg_js.i_s_sky_j_ns,
+            i_s_ref_js_ns=sg_js.i_s_ref_j_ns,
+            r_s_n_js_ns=sg_js.r_s_n_j_ns,
+            w=w
+        )
 
-        if b_sun_strkd_out_j:
+    return theta_o_eqv_js_ns
 
-            if t_drct_j is None:
-                raise Exception("t_drct should be defined when sun is striked out.")
 
-            if eps_r_o_j is None:
-                raise Exception("eps_r_o should be defined when sun is striked out.")
+def _get_q_trs_sol_js_ns(
+    t_b_js: List[BoundaryType],
+    w: Weather,
+    b_sun_strkd_out_js: List[bool],
+    t_drct_js: List[Optional[Direction]],
+    a_s_js: np.ndarray,
+    ssp_js: List[Optional[SolarShading]],
+    window_js: List[Optional[Window]],
+    sgt: SolarGeometryTable
+) -> np.ndarray:
+    """Calculate the transmitted solar radiation of all boundaries at step n
 
-            if r_s_o_j is None:
-                raise Exception("r_s_o should be defined when sun is striked out.")
+    Args:
+        t_b_js: type of boundary j, [J]
+        w: weather class
+        b_sun_strkd_out_js: is the sun striked at boundary j, [J]
+        t_drct_js: direction of boundary j, [J]
+        a_s_js: area of boundary j, m2, [J, 1]
+        ssp_js: solar shading part class of boundary j, [J]
+        window_js: window class of boundary j, [J]
+        sgt: solar geometry table of the directions
 
-            if u_w_std_j is None:
-                raise Exception("u_w_std should be defined when sun is striked out.")
+    Returns:
+        transmitted solar radiation of boundary j at step n, W, [J, N+1]
+    Notes:
+        Only the external transparent parts striked by the sun have the transmitted solar radiation.
+    """
 
-            if ssp_j is None:
-                raise Exception("ssp should be defined when sun is striked out.")
+    q_trs_sol_js_ns = np.zeros((len(t_b_js), w.number_of_data_plus), dtype=float)
 
-            if window_j is None:
-                raise Exception("window should be defined when sun is striked out.")
+    # index of the boundaries which are external transparent part and are striked by the sun
+    js_trs = [
+        j for (j, (t_b_j, b)) in enumerate(zip(t_b_js, b_sun_strkd_out_js))
+        if t_b_j == BoundaryType.EXTERNAL_TRANSPARENT_PART and b
+    ]
 
-            return outside_eqv_temp.get_theta_o_eqv_j_ns_for_external_transparent_part(
-                t_drct_j=t_drct_j, eps_r_o_j=eps_r_o_j, r_s_o_j=r_s_o_j, u_w_std_j=u_w_std_j, ssp_j=ssp_j, window_j=window_j, w=w
-            )
+    if len(js_trs) > 0:
+
+        if any(ssp_js[j] is None or window_js[j] is None for j in js_trs):
+            raise Exception("ssp and window should be defined when sun is striked out.")
+
+        sg_js = sgt.gather(drct_js=[t_drct_js[j] for j in js_trs])
+
+        q_trs_sol_js_ns[js_trs] = transmission_solar_radiation.get_q_trs_sol_js_ns_for_transparent_sun_striked(
+            a_s_js=a_s_js[js_trs],
+            f_ss_dn_js_ns=_get_f_ss_dn_js_ns(ssp_js=[ssp_js[j] for j in js_trs], w=w, i_s_dn_js_ns=sg_js.i_s_dn_j_ns),
+            f_ss_sky_js=_get_column(v_js=[ssp_js[j].get_f_ss_sky_j() for j in js_trs]),
+            f_ss_ref_js=_get_column(v_js=[ssp_js[j].get_f_ss_ref_j() for j in js_trs]),
+            tau_w_d_js_ns=_get_d_js_ns(
+                get_d_j_ns_js=[window_js[j].get_tau_w_d_j_ns for j in js_trs], phi_js_ns=sg_js.phi_j_ns, i_s_dn_js_ns=sg_js.i_s_dn_j_ns
+            ),
+            tau_w_s_js=_get_column(v_js=[window_js[j].tau_w_s_j for j in js_trs]),
+            tau_w_r_js=_get_column(v_js=[window_js[j].tau_w_r_j for j in js_trs]),
+            i_s_dn_js_ns=sg_js.i_s_dn_j_ns,
+            i_s_sky_js_ns=sg_js.i_s_sky_j_ns,
+            i_s_ref_js_ns=sg_js.i_s_ref_j_ns
+        )
 
-        else:
+    return q_trs_sol_js_ns
 
-            return outside_eqv_temp.get_theta_o_eqv_j_ns_for_external_not_sun_striked(w=w)
 
-    elif t_b_j == BoundaryType.GROUND:
+def _get_column(v_js: List, js: Optional[List[int]] = None) -> np.ndarray:
+    """Make the column vector of float from the list of the values.
 
-        return outside_eqv_temp.get_theta_o_eqv_j_ns_for_ground(w=w)
+    Args:
+        v_js: values of boundary j
+        js: indices of the boundaries to be taken (None means all)
 
-    else:
+    Returns:
+        column vector, [J', 1]
+    """
 
-        raise Exception()
+    if js is not None:
+        v_js = [v_js[j] for j in js]
 
+    return np.array(v_js, dtype=float).reshape(-1, 1)
 
-def _get_q_trs_sol_j_ns(t_b_j: BoundaryType, w: Weather, b_sun_strkd_out_j: Optional[bool], t_drct_j: Optional[Direction], a_s_j: float, ssp_j: Optional[SolarShading], window_j: Optional[Window]) -> np.ndarray:
-    """Calculate the transmitted solar radiation of boundary j at step n
+
+def _get_f_ss_dn_js_ns(ssp_js: List[SolarShading], w: Weather, i_s_dn_js_ns: np.ndarray) -> np.ndarray:
+    """Get the shading ratio of the solar shading for the direct solar radiation of boundary j at step n.
 
     Args:
-        t_b_j: type of boundary j
+        ssp_js: solar shading part class of boundary j, [J]
         w: weather class
-        b_sun_strkd_out_j: is the sun striked at boundary j
-        t_drct_j: direction of boundary j
-        a_s_j: solar absorption ratio of boundary j
-        ssp_j: solar shading part class of boundary j
-        window_j: window class of boundary j
+        i_s_dn_js_ns: direct solar radiation incident on boundary j at step n, W/m2, [J, N+1]
 
     Returns:
-        transmitted solar radiation of boundary j at step n, W, [N+1]
+        shading ratio for the direct solar radiation of boundary j at step n, -, [J, N+1]
+
+    Notes:
+        The ratio is only used multiplied by the direct solar radiation,
+        so it is calculated only at the steps when the direct solar radiation is incident and 0.0 is set at the other steps.
     """
 
-    if t_b_j in [BoundaryType.INTERNAL, BoundaryType.EXTERNAL_GENERAL_PART, BoundaryType.EXTERNAL_OPAQUE_PART, BoundaryType.GROUND]:
+    f_ss_dn_js_ns = np.zeros((len(ssp_js), w.number_of_data_plus), dtype=float)
 
-        return transmission_solar_radiation.get_q_trs_sol_j_ns_for_not(w=w)
+    for (j, (ssp_j, i_s_dn_j_ns)) in enumerate(zip(ssp_js, i_s_dn_js_ns)):
 
-    elif t_b_j == BoundaryType.EXTERNAL_TRANSPARENT_PART:
+        ns_sun = inclined_surface_solar_radiation.get_ns_sun(i_s_dn_j_ns=i_s_dn_j_ns)
 
-        if b_sun_strkd_out_j:
+        f_ss_dn_js_ns[j, ns_sun] = ssp_j.get_f_ss_dn_j_ns(h_sun_ns=w.h_sun_ns_plus[ns_sun], a_sun_ns=w.a_sun_ns_plus[ns_sun])
 
-            if t_drct_j is None:
-                raise Exception("t_drct should be defined when sun is striked out.")
+    return f_ss_dn_js_ns
 
-            if ssp_j is None:
-                raise Exception("ssp should be defined when sun is striked out.")
 
-            if window_j is None:
-                raise Exception("window should be defined when sun is striked out.")
+def _get_d_js_ns(get_d_j_ns_js: List[Callable[[np.ndarray], np.ndarray]], phi_js_ns: np.ndarray, i_s_dn_js_ns: np.ndarray) -> np.ndarray:
+    """Get the property of the window for the direct solar radiation of boundary j at step n.
 
-            return transmission_solar_radiation.get_q_trs_sol_j_ns_for_transparent_sun_striked(
-                t_drct_j=t_drct_j, a_s_j=a_s_j, ssp_j=ssp_j, window_j=window_j, w=w
-            )
-    
-        else:
+    Args:
+        get_d_j_ns_js: function of the incident angle of boundary j (e.g. Window.get_tau_w_d_j_ns), [J]
+        phi_js_ns: incident angle of boundary j at step n, rad, [J, N+1]
+        i_s_dn_js_ns: direct solar radiation incident on boundary j at step n, W/m2, [J, N+1]
 
-            return transmission_solar_radiation.get_q_trs_sol_j_ns_for_not(w=w)
-    
-    else:
+    Returns:
+        property of the window for the direct solar radiation of boundary j at step n, [J, N+1]
 
-        raise Exception()
+    Notes:
+        The property is calculated only at the steps when the direct solar radiation is incident and 0.0 is set at the other steps.
+    """
+
+    d_js_ns = np.zeros_like(phi_js_ns, dtype=float)
+
+    for (j, (get_d_j_ns, phi_j_ns, i_s_dn_j_ns)) in enumerate(zip(get_d_j_ns_js, phi_js_ns, i_s_dn_js_ns)):
+
+        ns_sun = inclined_surface_solar_radiation.get_ns_sun(i_s_dn_j_ns=i_s_dn_j_ns)
+
+        d_js_ns[j, ns_sun] = get_d_j_ns(phi_j_ns=phi_j_ns[ns_sun])
+
+    return d_js_ns
 
 
 def _read_r_i_std_j(d: Dict, boundary_id: int) -> float:
@@ -1287,6 +1354,73 @@ def _get_response_factor(d: Dict, h_s_c_rear_j: Optional[float], h_s_r_rear_j: O
         raise KeyError()
 
 
+def _get_response_factors(
+        ds: List[Dict],
+        h_s_c_js: np.ndarray,
+        h_s_r_js: np.ndarray,
+        id_js: List[int],
+        t_b_js: List[BoundaryType],
+        j_rear_js: List[Optional[int]],
+        r_s_o_js: List[Optional[float]],
+        u_w_std_js: List[Optional[float]]
+) -> List[ResponseFactor]:
+    """Get response factors of all boundaries.
+
+    Args:
+        ds: dictionary of boundaries
+        h_s_c_js: convective heat transfer coefficient of boundary j, W/m2K, [J, 1]
+        h_s_r_js: radiative heat transfer coefficient of boundary j, W/m2K, [J, 1]
+        id_js: id of boundary j, [J]
+        t_b_js: type of boundary j, [J]
+        j_rear_js: rear boundary index of boundary j, [J]
+        r_s_o_js: outside heat transfer resistance of boundary j, m2 K / W, [J]
+        u_w_std_js: standard heat transmittance coefficient (U value) of boundary j, W/m2K, [J]
+
+    Returns:
+        response factor class of boundary j, [J]
+
+    Notes:
+        The response factors of the internal boundaries and the external general parts are calculated at once.
+        The others are calculated for each boundary by _get_response_factor.
+    """
+
+    rfs: List[Optional[ResponseFactor]] = [None] * len(ds)
+
+    # index of the boundaries which are internal or external general part
+    js_unsteady = [j for (j, t_b_j) in enumerate(t_b_js) if t_b_j in [BoundaryType.INTERNAL, BoundaryType.EXTERNAL_GENERAL_PART]]
+
+    cs_ws = [
+        np.array([_read_cs_j_l(layer=layer, id=id_js[j], layer_id=l) for (l, layer) in enumerate(ds[j]['layers'])])
+        for j in js_unsteady
+    ]
+    rs_ws = [
+        np.array([_read_rs_j_l(layer=layer, id=id_js[j], layer_id=l) for (l, layer) in enumerate(ds[j]['layers'])])
+        for j in js_unsteady
+    ]
+
+    # rear (outside) heat transfer resistance, m2K/W
+    # The rear surface heat transfer coefficients are used in case of INTERNAL.
+    r_o_ws = []
+    for j in js_unsteady:
+        if t_b_js[j] == BoundaryType.INTERNAL:
+            r_o_ws.append(1.0 / (float(h_s_c_js[j_rear_js[j], 0]) + float(h_s_r_js[j_rear_js[j], 0])))
+        else:
+            if r_s_o_js[j] is None:
+                raise Exception("r_s_o should be defined when boundary type is external general part.")
+            r_o_ws.append(r_s_o_js[j])
+
+    for (j, rf) in zip(js_unsteady, ResponseFactor.create_for_unsteady_not_ground_walls(cs_ws=cs_ws, rs_ws=rs_ws, r_o_ws=r_o_ws)):
+        rfs[j] = rf
+
+    for j in range(len(ds)):
+        if rfs[j] is None:
+            rfs[j] = _get_response_factor(
+                d=ds[j], h_s_c_rear_j=None, h_s_r_rear_j=None, id_j=id_js[j], t_b_j=t_b_js[j], r_s_o_j=r_s_o_js[j], u_w_std_j=u_w_std_js[j]
+            )
+
+    return rfs
+
+
 def _read_cs_j_l(layer: Dict, id: int, layer_id: int) -> float:
 
     cs_j_l = float(layer['thermal_capacity'])
@@ -1307,26 +1441,37 @@ def _read_rs_j_l(layer: Dict, id: int, layer_id: int) -> float:
     return rs_j_l
 
 
-def _get_k_ei_js_j(id_js: np.ndarray, t_b_j: BoundaryType, j_rear_j: Optional[int]) -> np.ndarray:
+def _get_k_ei_js_js(t_b_js: List[BoundaryType], j_rear_js: List[Optional[int]]) -> np.ndarray:
+    """Get the coefficient representing the effect of equivalent room temperature of other boundary j to the rear temperature of boundary j.
 
-    k_ei_js_j = np.zeros_like(id_js, dtype=float).flatten()
+    Args:
+        t_b_js: type of boundary j, [J]
+        j_rear_js: rear boundary index of boundary j, [J]
 
-    if t_b_j in [
-        BoundaryType.EXTERNAL_OPAQUE_PART,
-        BoundaryType.EXTERNAL_TRANSPARENT_PART,
-        BoundaryType.EXTERNAL_GENERAL_PART,
-        BoundaryType.GROUND
-    ]:
-        pass
+    Returns:
+        coefficient representing the effect of equivalent room temperature of other boundary j to the rear temperature of boundary j, [J, J]
+    """
 
-    elif t_b_j == BoundaryType.INTERNAL:
-        # 室内壁の場合にk_ei_jsを登録する。
-        k_ei_js_j[j_rear_j] = 1.0
+    k_ei_js_js = np.zeros((len(t_b_js), len(t_b_js)), dtype=float)
 
-    else:
-        raise Exception()
-    
-    return k_ei_js_j
+    for (j, (t_b_j, j_rear_j)) in enumerate(zip(t_b_js, j_rear_js)):
+
+        if t_b_j in [
+            BoundaryType.EXTERNAL_OPAQUE_PART,
+            BoundaryType.EXTERNAL_TRANSPARENT_PART,
+            BoundaryType.EXTERNAL_GENERAL_PART,
+            BoundaryType.GROUND
+        ]:
+            pass
+
+        elif t_b_j == BoundaryType.INTERNAL:
+            # 室内壁の場合にk_ei_jsを登録する。
+            k_ei_js_js[j, j_rear_j] = 1.0
+
+        else:
+            raise Exception()
+
+    return k_ei_js_js
 
 
 def _get_k_s_r_j(t_b_j: BoundaryType, k_eo_j: Optional[float]) -> float:
@@ -1449,8 +1594,8 @@ def _get_f_flb_js_is_n_pls(a_s_js, beta_is_n, f_flr_js_is_n, h_s_c_js, h_s_r_js,
 
     """
 
-    return f_flr_js_is_n * (1.0 - beta_is_n.T) * phi_a0_js / a_s_js \
-        + np.dot(k_ei_js_js, f_flr_js_is_n * (1.0 - beta_is_n.T)) * phi_t0_js / (h_s_c_js + h_s_r_js) / a_s_js
+    return f_flr_js_is_n * (1.0 - np.swapaxes(beta_is_n, -1, -2)) * phi_a0_js / a_s_js \
+        + np.matmul(k_ei_js_js, f_flr_js_is_n * (1.0 - np.swapaxes(beta_is_n, -1, -2))) * phi_t0_js / (h_s_c_js + h_s_r_js) / a_s_js
 
 
 def _get_f_cvl_js_n_pls(theta_dsh_s_a_js_ms_n_pls, theta_dsh_s_t_js_ms_n_pls):
@@ -1465,7 +1610,7 @@ def _get_f_cvl_js_n_pls(theta_dsh_s_a_js_ms_n_pls, theta_dsh_s_t_js_ms_n_pls):
     Notes:
         式(2.28)
     """
-    return np.sum(theta_dsh_s_t_js_ms_n_pls + theta_dsh_s_a_js_ms_n_pls, axis=1, keepdims=True)
+    return np.sum(theta_dsh_s_t_js_ms_n_pls + theta_dsh_s_a_js_ms_n_pls, axis=-1, keepdims=True)
 
 
 def _get_theta_dsh_s_t_js_ms_n_pls(phi_t1_js_ms, r_js_ms, theta_dsh_srf_t_js_ms_n, theta_rear_js_n):
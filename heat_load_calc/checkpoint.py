@@ -0,0 +1,135 @@
+"""本計算の途中の状態値の保存・読み込み（チェックポイント）
+
+本計算を一定のステップ数ごとに状態値及び記録済みの計算結果を保存し、計算が中断された場合に保存したステップから再開する。
+"""
+
+import os
+import json
+import logging
+import hashlib
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from heat_load_calc.conditions import Conditions
+from heat_load_calc.weather import Weather
+from heat_load_calc.file_util import write_atomic
+from heat_load_calc.snapshot import CONDITIONS_ITEMS
+
+
+logger = logging.getLogger(name='HeatLoadCalc').getChild('checkpoint')
+
+# version of the format of the checkpoint file
+_CHECKPOINT_VERSION = 1
+
+# name of the checkpoint file in the checkpoint directory
+_CHECKPOINT_FILE_NAME = 'checkpoint.npz'
+
+
+def get_key(d: Dict, w: Weather, n_step_main: int, output_names: Optional[List[str]]) -> str:
+    """Get the key of the calculation. / 計算のキーを取得する。
+
+    Args:
+        d: input data as dictionary / 住宅計算条件
+        w: Weather class
+        n_step_main: 本計算のステップ数
+        output_names: 出力する項目の出力名のリスト
+
+    Returns:
+        hash of the inputs, the weather data and the output names
+    """
+
+    h = hashlib.sha256()
+    h.update('v{}'.format(_CHECKPOINT_VERSION).encode('utf-8'))
+    h.update(json.dumps(
+        [d, n_step_main, output_names], sort_keys=True, ensure_ascii=False, default=str
+    ).encode('utf-8'))
+
+    for a in [w.a_sun_ns_plus, w.h_sun_ns_plus, w.i_dn_ns_plus, w.i_sky_ns_plus, w.r_n_ns_plus, w.theta_o_ns_plus, w.x_o_ns_plus]:
+        h.update(np.ascontiguousarray(a, dtype=np.float64).tobytes())
+
+    return h.hexdigest()[0:32]
+
+
+def load(checkpoint_dir: str, key: str) -> Optional[Tuple[int, Conditions, Dict[str, np.ndarray]]]:
+    """Load the checkpoint file. / チェックポイントを読み込む。
+
+    Args:
+        checkpoint_dir: チェックポイントのディレクトリ
+        key: 計算のキー
+
+    Returns:
+        以下のタプル（ファイルが無い場合・異なる計算のファイルの場合は None）
+            (1) 再開するステップ
+            (2) 再開するステップの状態値
+            (3) 記録済みの値（Recorder.get_filled_values の値）
+    """
+
+    checkpoint_path = os.path.join(checkpoint_dir, _CHECKPOINT_FILE_NAME)
+
+    if not os.path.isfile(checkpoint_path):
+        return None
+
+    try:
+
+        with np.load(checkpoint_path) as data:
+
+            if str(data['key']) != key:
+                logger.warning('The checkpoint file `{}` is for another calculation and is not used.'.format(checkpoint_path))
+                return None
+
+            n = int(data['n'])
+
+            c_n = Conditions(**{arg: data['c_' + attr].copy() for arg, attr in CONDITIONS_ITEMS})
+
+            values = {k[2:]: data[k].copy() for k in data.files if k.startswith('r_')}
+
+    except (OSError, ValueError, KeyError) as e:
+
+        logger.warning('The checkpoint file `{}` could not be read. ({})'.format(checkpoint_path, e))
+
+        return None
+
+    logger.info('The main calculation is resumed from step {} by the checkpoint file `{}`.'.format(n, checkpoint_path))
+
+    return n, c_n, values
+
+
+def save(checkpoint_dir: str, key: str, n: int, c_n: Conditions, values: Dict[str, np.ndarray]):
+    """Save the checkpoint file. / チェックポイントを保存する。
+
+    Args:
+        checkpoint_dir: チェックポイントのディレクトリ
+        key: 計算のキー
+        n: 再開するステップ（ステップ n - 1 までの計算が済んでいること）
+        c_n: ステップ n の状態値
+        values: 記録済みの値（Recorder.get_filled_values の値）
+
+    Notes:
+        The file is written to a temporary file and renamed,
+        so that the previous checkpoint remains if the process is stopped while writing.
+    """
+
+    checkpoint_path = os.path.join(checkpoint_dir, _CHECKPOINT_FILE_NAME)
+
+    data = {'key': np.array(key), 'n': np.array(n)}
+
+    data.update({'c_' + attr: c_n.__dict__[attr] for _, attr in CONDITIONS_ITEMS})
+
+    data.update({'r_' + k: v for k, v in values.items()})
+
+    write_atomic(path=checkpoint_path, write=lambda f: np.savez(f, **data))
+
+    logger.info('checkpoint at step {}'.format(n))
+
+
+def remove(checkpoint_dir: str):
+    """Remove the checkpoint file. / チェックポイントを削除する。
+
+    Args:
+        checkpoint_dir: チェックポイントのディレクトリ
+    """
+
+    checkpoint_path = os.path.join(checkpoint_dir, _CHECKPOINT_FILE_NAME)
+
+    if os.path.isfile(checkpoint_path):
+        os.remove(checkpoint_path)
@@ -20,8 +20,8 @@ class Conditions:
             theta_ei_js_n
     ):
 
-        # ステップnにおける室iの運転状態, [i, 1]
-        # 列挙体 OperationMode で表される。
+        # ステップnにおける室iの運転状態, [i, 1], int8型
+        # 列挙体 OperationMode の値（OperationMode.value）で表される。
         #     COOLING ： 冷房
         #     HEATING : 暖房
         #     STOP_OPEN : 暖房・冷房停止で窓「開」
@@ -80,7 +80,7 @@ def initialize_conditions(n_spaces: int, n_bdries: int):
 
     # ステップnにおける室iの運転状態, [i, 1]
     # 初期値を暖房・冷房停止で窓「閉」とする。
-    operation_mode_is_n = np.full((total_number_of_spaces, 1), OperationMode.STOP_CLOSE)
+    operation_mode_is_n = np.full((total_number_of_spaces, 1), OperationMode.STOP_CLOSE.value, dtype=np.int8)
 
     # ステップnにおける室iの空気温度, degree C, [i, 1]
     # 初期値を15℃とする。
@@ -129,6 +129,51 @@ def initialize_conditions(n_spaces: int, n_bdries: int):
     )
 
 
+def copy_conditions(c: Conditions) -> Conditions:
+    """状態値を複製する。
+
+    Args:
+        c: 状態値
+
+    Returns:
+        複製した状態値
+    """
+
+    return Conditions(
+        operation_mode_is_n=c.operation_mode_is_n.copy(),
+        theta_r_is_n=c.theta_r_is_n.copy(),
+        theta_mrt_hum_is_n=c.theta_mrt_hum_is_n.copy(),
+        x_r_is_n=c.x_r_is_n.copy(),
+        theta_dsh_s_a_js_ms_n=c.theta_dsh_srf_a_js_ms_n.copy(),
+        theta_dsh_s_t_js_ms_n=c.theta_dsh_srf_t_js_ms_n.copy(),
+        q_s_js_n=c.q_s_js_n.copy(),
+        theta_frt_is_n=c.theta_frt_is_n.copy(),
+        x_frt_is_n=c.x_frt_is_n.copy(),
+        theta_ei_js_n=c.theta_ei_js_n.copy()
+    )
+
+
+def is_converged(c1: Conditions, c2: Conditions, tol_theta: float, tol_q: float) -> bool:
+    """2つの状態値の差が許容値以下か否かを判定する。
+
+    Args:
+        c1: 状態値
+        c2: 状態値
+        tol_theta: 室の空気温度・項別公比法の指数項mの吸熱応答及び貫流応答の項別成分の許容値, K
+        tol_q: 境界の表面熱流の許容値, W/m2
+
+    Returns:
+        すべての値の差の絶対値が許容値以下の場合は True
+    """
+
+    return bool(
+        np.all(np.abs(c2.theta_r_is_n - c1.theta_r_is_n) <= tol_theta)
+        and np.all(np.abs(c2.theta_dsh_srf_a_js_ms_n - c1.theta_dsh_srf_a_js_ms_n) <= tol_theta)
+        and np.all(np.abs(c2.theta_dsh_srf_t_js_ms_n - c1.theta_dsh_srf_t_js_ms_n) <= tol_theta)
+        and np.all(np.abs(c2.q_s_js_n - c1.q_s_js_n) <= tol_q)
+    )
+
+
 def initialize_ground_conditions(n_grounds: int):
 
     # ステップnの統合された境界j*における指数項mの吸熱応答の項別成分, degree C, [j*, 12]
@@ -1,6 +1,8 @@
+import os
+import itertools
 import pandas as pd
 import logging
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional, List, Iterable, Iterator, Callable
 
 from heat_load_calc.input_all import InputAll
 from heat_load_calc.input_models.input_common import InputCommon
@@ -10,14 +12,15 @@ from heat_load_calc.input_models.input_room import InputRoom
 from heat_load_calc.input_models.input_calculation_day import InputCalculationDay
 from heat_load_calc.input_models.input_building import InputBuilding
 
-from heat_load_calc import recorder, period, conditions
+from heat_load_calc import recorder, period, conditions, snapshot, checkpoint
 from heat_load_calc.interval import Interval
 from heat_load_calc.weather import Weather
+from heat_load_calc.recorder import Recorder, ResultStore
 from heat_load_calc.season import Season
 from heat_load_calc.building import Building
 from heat_load_calc.schedule import Schedule
 from heat_load_calc.sequence import Sequence
-from heat_load_calc.tenum import EShapeFactorMethod
+from heat_load_calc.tenum import EShapeFactorMethod, ERunUpGroundMethod
 from heat_load_calc.rooms import Rooms
 
 logger = logging.getLogger('HeatLoadCalc').getChild('core')
@@ -26,87 +29,258 @@ logger = logging.getLogger('HeatLoadCalc').getChild('core')
 def calc(
         d: Dict,
         entry_point_dir: str,
-        exe_verify: bool = False
-    ) -> tuple[pd.DataFrame, pd.DataFrame, Schedule, Weather]:
+        exe_verify: bool = False,
+        store_dir: Optional[str] = None,
+        n_step_block: Optional[int] = None,
+        output_names: Optional[List[str]] = None,
+        w: Optional[Weather] = None,
+        checkpoint_dir: Optional[str] = None,
+        n_step_checkpoint: Optional[int] = None
+    ) -> tuple[pd.DataFrame | ResultStore, pd.DataFrame | ResultStore, Schedule, Weather]:
     """core main program
 
     Args:
         d: input data as dictionary / 住宅計算条件
         entry_point_dir: the pass of the entry point directory
+        store_dir: 計算結果をブロックごとに書き出すディレクトリ（None の場合は全期間分をメモリ上に保持する）
+            指定した場合は全期間分の DataFrame を作成せず、書き出した計算結果を読み込む ResultStore を返す。
+        n_step_block: 計算結果を書き出す1ブロックあたりのステップ数（None の場合は1日分）
+        output_names: 出力する項目の出力名（"t_r", "l_s_c" 等）のリスト
+            None の場合は入力データの common の output_names を用い、それも無い場合はすべての項目を出力する。
+        w: 作成済みの Weather クラス（None の場合は入力データから作成する）
+        checkpoint_dir: 本計算の途中の状態値（チェックポイント）を保存するディレクトリ（None の場合は保存しない）
+            同じ計算のチェックポイントが保存されている場合は、保存されたステップから計算を再開する。
+            計算が終了した時点でチェックポイントは削除する。
+        n_step_checkpoint: チェックポイントを保存する間隔のステップ数（None の場合は30日分）
 
     Returns:
         以下のタプル
-            (1) 計算結果（詳細版）をいれたDataFrame
-            (2) 計算結果（簡易版）をいれたDataFrame
+            (1) 計算結果（詳細版）をいれたDataFrame（store_dir を指定した場合は ResultStore）
+            (2) 計算結果（簡易版）をいれたDataFrame（store_dir を指定した場合は ResultStore）
             (3)
             (4) schedule
 
     Notes:
         「助走計算のうち建物全体を解く日数」は「助走計算を行う日数」で指定した値以下でないといけない。
+        チェックポイントは計算結果を全期間分メモリ上に保持する場合（store_dir が None の場合）のみ保存できる。
     """
 
-    ipt_all = InputAll(d=d)
+    if checkpoint_dir is not None and store_dir is not None:
+        raise ValueError('計算結果をブロックごとに書き出す場合はチェックポイントを保存できません。')
 
-    ipt_common: InputCommon = ipt_all.ipt_common
+    sqc, n_step_main, n_step_run_up, n_step_run_up_build = make_sequence(d=d, entry_point_dir=entry_point_dir, w=w)
 
-    ipt_weather: InputWeather = ipt_common.ipt_weather
+    scd = sqc.scd
 
-    ipt_season: InputSeason = ipt_common.ipt_season
+    w = sqc.weather
 
-    ipt_calculation_day: InputCalculationDay = ipt_common.ipt_calculation_day
+    if output_names is None:
+        output_names = d['common'].get('output_names', None)
 
-    ipt_building: InputBuilding = ipt_all.ipt_building
+    result = _make_recorder(
+        sqc=sqc, n_step_main=n_step_main, store_dir=store_dir, n_step_block=n_step_block, output_names=output_names
+    )
 
-    ipt_rooms: list[InputRoom] = ipt_all.ipt_rooms
+    if checkpoint_dir is None:
 
-    d_common = ipt_all.d_common
+        loaded, on_checkpoint = None, None
 
-    d_rooms = ipt_all.d_rooms
+    else:
 
-    itv: Interval = Interval.create(ipt_common=ipt_common)
+        key = checkpoint.get_key(d=d, w=w, n_step_main=n_step_main, output_names=output_names)
 
-    shape_factor_method: EShapeFactorMethod = ipt_common.shape_factor_method
+        loaded = checkpoint.load(checkpoint_dir=checkpoint_dir, key=key)
 
-    # Make Weather class.
-    w: Weather = Weather.make_weather(ipt_weather=ipt_weather, itv=itv, entry_point_dir=entry_point_dir)
+        def on_checkpoint(n: int, c: conditions.Conditions):
+            checkpoint.save(
+                checkpoint_dir=checkpoint_dir, key=key, n=n, c_n=c, values=result.get_filled_values(n_step_filled=n)
+            )
 
-    season: Season = Season.make_season(ipt_season=ipt_season, w=w, itv=itv, ipt_weather=ipt_weather)
+    if loaded is None:
 
-    # Make Schedule class.
-    scd: Schedule = Schedule.get_schedule(
-        n_ocp=ipt_common.n_ocp,
-        a_f_is=[ipt_room.a_f for ipt_room in ipt_rooms],
-        itv=itv,
-        scd_is=[ipt_room.ipt_schedule_data for ipt_room in ipt_rooms]
+        n_start = 0
+
+        c_n = _run_up_or_load(
+            d=d, sqc=sqc, n_step_run_up=n_step_run_up, n_step_run_up_build=n_step_run_up_build, result=result
+        )
+
+    else:
+
+        n_start, c_n, values = loaded
+
+        result.set_filled_values(values=values)
+
+    logger.info('本計算')
+
+    # TODO: recorder に1/1 0:00の瞬時状態値を書き込む
+    _run_main(
+        sqc=sqc,
+        c_n=c_n,
+        result=result,
+        n_step_main=n_step_main,
+        exe_verify=exe_verify,
+        n_start=n_start,
+        on_checkpoint=on_checkpoint,
+        n_step_checkpoint=sqc.itv.get_n_day() * 30 if n_step_checkpoint is None else n_step_checkpoint
     )
 
-    # Building Class
-    bdg = Building.create_building(ipt_building=ipt_building)
+    if checkpoint_dir is not None:
+        checkpoint.remove(checkpoint_dir=checkpoint_dir)
 
-    # Rooms Class
-    rms = Rooms(ipt_rooms=ipt_rooms)
+    result.post_recording(rms=sqc.rms, bs=sqc.bs, f_mrt_is_js=sqc.f_mrt_is_js, es=sqc.es)
 
-    # number of steps for main calculation
-    # number of steps for run-up calculation
-    # number of steps to calculate building in run-up calculation
-    n_step_main, n_step_run_up, n_step_run_up_build = period.get_n_step(itv=itv, ipt_calculation_day=ipt_calculation_day)
+    logger.info('ログ作成')
 
-    # json, csv ファイルからパラメータをロードする。
-    # （ループ計算する必要の無い）事前計算を行い, クラス PreCalcParameters, PreCalcParametersGround に必要な変数を格納する。
-    sqc = Sequence(itv=itv, d=d, weather=w, scd=scd, bdg=bdg, shape_factor_method=shape_factor_method, rms=rms)
+    dd_i, dd_a = _export(result=result, store_dir=store_dir)
 
-    gc_n = conditions.initialize_ground_conditions(n_grounds=sqc.bs.n_ground)
+    return dd_i, dd_a, scd, w
 
-    logger.info('run up calculation for ground')
 
-    for n in range(-n_step_run_up, -n_step_run_up_build):
-        gc_n = sqc.run_tick_ground(gc_n=gc_n, n=n)
+def calc_years(
+        d: Dict,
+        entry_point_dir: str,
+        ws: Iterable[Weather],
+        exe_verify: bool = False,
+        store_dir: Optional[str] = None,
+        n_step_block: Optional[int] = None,
+        output_names: Optional[List[str]] = None
+    ) -> Iterator[Tuple[pd.DataFrame | ResultStore, pd.DataFrame | ResultStore]]:
+    """複数年の気象データに対して年ごとに計算する。
 
-    result = recorder.Recorder(
-        n_step_main=n_step_main,
-        id_rm_is=list(sqc.rms.id_r_is.flatten()),
-        id_bs_js=list(sqc.bs.id_js.flatten())
-    )
+    Args:
+        d: input data as dictionary / 住宅計算条件
+        entry_point_dir: the pass of the entry point directory
+        ws: 年ごとの Weather クラス（WeatherStream 等）
+        exe_verify: 熱収支のチェックを行うか否か
+        store_dir: 計算結果をブロックごとに書き出すディレクトリ（None の場合は1年分をメモリ上に保持する）
+            年ごとに "year1", "year2", ... のサブディレクトリに書き出し、DataFrame の代わりに ResultStore を返す。
+        n_step_block: 計算結果を書き出す1ブロックあたりのステップ数（None の場合は1日分）
+        output_names: 出力する項目の出力名（"t_r", "l_s_c" 等）のリスト
+            None の場合は入力データの common の output_names を用い、それも無い場合はすべての項目を出力する。
+
+    Returns:
+        年ごとの以下のタプルのイテレータ
+            (1) 計算結果（詳細版）をいれたDataFrame（store_dir を指定した場合は ResultStore）
+            (2) 計算結果（簡易版）をいれたDataFrame（store_dir を指定した場合は ResultStore）
+
+    Notes:
+        助走計算は最初の年の気象データを用いて1回のみ行い、各年の最後の状態を次の年の初期状態として引き継ぐ。
+        各年の本計算は1年分（入力データの本計算の日数によらない）とする。
+        気象データに依存するステップごとの値（相当外気温度・透過日射熱取得・係数 f_WSC 等）は年ごとに計算し直し、
+        全期間分の気象データ及び計算結果はメモリ上に保持しない。
+        チェックポイントの保存・再開には対応していない（calc の checkpoint_dir を参照）。
+    """
+
+    blocks = iter(ws)
+
+    w = next(blocks)
+
+    sqc, _, n_step_run_up, n_step_run_up_build = make_sequence(d=d, entry_point_dir=entry_point_dir, w=w)
+
+    if output_names is None:
+        output_names = d['common'].get('output_names', None)
+
+    c_n = None
+
+    last_values_i = None
+
+    for y, w in enumerate(itertools.chain([w], blocks)):
+
+        logger.info('{} 年目'.format(y + 1))
+
+        if y > 0:
+            sqc.set_weather(weather=w)
+
+        store_dir_y = None if store_dir is None else os.path.join(store_dir, 'year{}'.format(y + 1))
+
+        result = _make_recorder(
+            sqc=sqc,
+            n_step_main=w.number_of_data,
+            store_dir=store_dir_y,
+            n_step_block=n_step_block,
+            output_names=output_names
+        )
+
+        if y == 0:
+            c_n = _run_up_or_load(
+                d=d, sqc=sqc, n_step_run_up=n_step_run_up, n_step_run_up_build=n_step_run_up_build, result=result
+            )
+        else:
+            # 前の年の最後の瞬時値を 1/1 0:00 の瞬時値とする。
+            result.recording(n=-1, **last_values_i)
+
+        c_n = _run_main(sqc=sqc, c_n=c_n, result=result, n_step_main=w.number_of_data, exe_verify=exe_verify)
+
+        last_values_i = result.get_last_values_i()
+
+        result.post_recording(rms=sqc.rms, bs=sqc.bs, f_mrt_is_js=sqc.f_mrt_is_js, es=sqc.es)
+
+        yield _export(result=result, store_dir=store_dir_y)
+
+
+def _export(
+        result: Recorder, store_dir: Optional[str]
+) -> Tuple[pd.DataFrame | ResultStore, pd.DataFrame | ResultStore]:
+    """計算結果を出力する。
+
+    Args:
+        result: Recorder クラス
+        store_dir: 計算結果をブロックごとに書き出したディレクトリ（None の場合は全期間分をメモリ上に保持している）
+
+    Returns:
+        以下のタプル
+            (1) 計算結果（詳細版）をいれたDataFrame（store_dir を指定した場合は ResultStore）
+            (2) 計算結果（簡易版）をいれたDataFrame（store_dir を指定した場合は ResultStore）
+
+    Notes:
+        store_dir を指定した場合は、全期間分の配列・DataFrame をメモリ上に作成しない。
+    """
+
+    if store_dir is None:
+        # dd: data detail, 15分間隔のすべてのパラメータ pd.DataFrame
+        return result.export_pd()
+
+    return ResultStore(store_dir=store_dir, kind='i'), ResultStore(store_dir=store_dir, kind='a')
+
+
+def _make_recorder(
+        sqc: Sequence, n_step_main: int, store_dir: Optional[str], n_step_block: Optional[int], output_names: Optional[List[str]]
+) -> Recorder:
+    """計算結果を記録する Recorder クラスを作成し、事前に決まる値を記録する。
+
+    Args:
+        sqc: Sequence クラス
+        n_step_main: 本計算のステップ数
+        store_dir: 計算結果をブロックごとに書き出すディレクトリ（None の場合は全期間分をメモリ上に保持する）
+        n_step_block: 計算結果を書き出す1ブロックあたりのステップ数（None の場合は1日分）
+        output_names: 出力する項目の出力名のリスト（None の場合はすべての項目を出力する）
+
+    Returns:
+        Recorder クラス
+    """
+
+    if store_dir is None:
+
+        result = recorder.Recorder(
+            n_step_main=n_step_main,
+            id_rm_is=list(sqc.rms.id_r_is.flatten()),
+            id_bs_js=list(sqc.bs.id_js.flatten()),
+            output_names=output_names
+        )
+
+    else:
+
+        result = recorder.StreamingRecorder(
+            n_step_main=n_step_main,
+            id_rm_is=list(sqc.rms.id_r_is.flatten()),
+            id_bs_js=list(sqc.bs.id_js.flatten()),
+            store_dir=store_dir,
+            rms=sqc.rms,
+            f_mrt_is_js=sqc.f_mrt_is_js,
+            es=sqc.es,
+            n_step_block=sqc.itv.get_n_day() if n_step_block is None else n_step_block,
+            output_names=output_names
+        )
 
     result.pre_recording(
         weather=sqc.weather,
@@ -117,27 +291,227 @@ def calc(
         q_trs_sol_is_ns=sqc.q_trs_sol_is_ns
     )
 
+    return result
+
+
+def _run_up_or_load(
+        d: Dict, sqc: Sequence, n_step_run_up: int, n_step_run_up_build: int, result: Recorder
+) -> conditions.Conditions:
+    """助走計算を行うか、保存された助走計算の後の状態値を読み込む。
+
+    Args:
+        d: input data as dictionary / 住宅計算条件
+        sqc: Sequence クラス
+        n_step_run_up: 助走計算のステップ数
+        n_step_run_up_build: 助走計算のうち建物全体を解くステップ数
+        result: Recorder クラス（1/1 0:00 の瞬時値を記録する）
+
+    Returns:
+        1/1 0:00 の状態値
+
+    Notes:
+        snapshot.set_snapshot_dir（又は環境変数 HEAT_LOAD_CALC_SNAPSHOT）で保存するディレクトリが指定された場合、
+        建物の物理的な入力（運転スケジュール・設定温度等を除く）が等しい計算の状態値が保存されていれば助走計算を省略し、
+        保存されていなければ助走計算の後の状態値を保存する。
+    """
+
+    loaded = snapshot.load(d=d, w=sqc.weather)
+
+    if loaded is not None:
+
+        c_n, values_i = loaded
+
+        result.set_first_values_i(values_i=values_i)
+
+        return c_n
+
+    c_n = _run_up(
+        sqc=sqc,
+        n_step_run_up=n_step_run_up,
+        n_step_run_up_build=n_step_run_up_build,
+        result=result,
+        **get_run_up_options(d=d)
+    )
+
+    snapshot.save(d=d, w=sqc.weather, c_n=c_n, values_i=result.get_first_values_i())
+
+    return c_n
+
+
+def _run_up(
+        sqc: Sequence,
+        n_step_run_up: int,
+        n_step_run_up_build: int,
+        result: Recorder,
+        tol_run_up: Optional[Tuple[float, float]] = None,
+        run_up_ground_method: ERunUpGroundMethod = ERunUpGroundMethod.STEP
+) -> conditions.Conditions:
+    """助走計算（地盤のみ・建物全体）を行う。
+
+    Args:
+        sqc: Sequence クラス
+        n_step_run_up: 助走計算のステップ数
+        n_step_run_up_build: 助走計算のうち建物全体を解くステップ数
+            収束判定を行う場合は、建物全体を解く日数の上限とする。
+        result: Recorder クラス（1/1 0:00 の瞬時値を記録する）
+        tol_run_up: 助走計算（建物全体）の収束判定に用いる温度の許容値（K）及び表面熱流の許容値（W/m2）
+            None の場合は収束判定を行わない。
+        run_up_ground_method: 地盤の助走計算の方法
+            PERIODIC の場合は地盤のみの助走計算を行わず、地盤の周期定常解を建物全体の助走計算の初期値とする。
+
+    Returns:
+        1/1 0:00 の状態値
+
+    Notes:
+        収束判定を行う場合は、地盤のみの助走計算を本計算の前日の開始時刻まで行い、
+        建物全体の助走計算は本計算の前日を繰り返し計算し、前日の繰り返しとの状態値の差が許容値以下になった時点で終了する。
+    """
+
+    n_step_day = sqc.itv.get_n_day()
+
+    if tol_run_up is None:
+        n_step_run_up_ground_end = n_step_run_up_build
+    else:
+        n_step_run_up_ground_end = min(n_step_day, n_step_run_up)
+
+    c_n = run_up_ground(
+        sqc=sqc,
+        n_step_run_up=n_step_run_up,
+        n_step_run_up_ground_end=n_step_run_up_ground_end,
+        run_up_ground_method=run_up_ground_method
+    )
+
+    logger.info('助走計算（建物全体）')
+
+    if tol_run_up is None:
+
+        for n in range(-n_step_run_up_build, 0):
+            c_n = sqc.run_tick(n=n, c_n=c_n, recorder=result)
+
+        return c_n
+
+    tol_theta, tol_q = tol_run_up
+
+    n_d_max = max(n_step_run_up_build // n_step_day, period.N_D_RUN_UP_BUILD_MIN)
+
+    for n_d in range(1, n_d_max + 1):
+
+        c_pre = conditions.copy_conditions(c=c_n)
+
+        for n in range(-n_step_day, 0):
+            c_n = sqc.run_tick(n=n, c_n=c_n, recorder=result)
+
+        if n_d >= period.N_D_RUN_UP_BUILD_MIN and conditions.is_converged(
+                c1=c_pre, c2=c_n, tol_theta=tol_theta, tol_q=tol_q
+        ):
+            logger.info('助走計算（建物全体）は {} 日で収束しました。'.format(n_d))
+            break
+
+    else:
+
+        logger.warning('助走計算（建物全体）は {} 日で収束しませんでした。'.format(n_d_max))
+
+    return c_n
+
+
+def run_up_ground(
+        sqc: Sequence,
+        n_step_run_up: int,
+        n_step_run_up_ground_end: int,
+        run_up_ground_method: ERunUpGroundMethod = ERunUpGroundMethod.STEP
+) -> conditions.Conditions:
+    """地盤のみの助走計算を行い、建物全体の助走計算の初期値を作成する。
+
+    Args:
+        sqc: Sequence クラス
+        n_step_run_up: 助走計算のステップ数
+        n_step_run_up_ground_end: 地盤のみの助走計算を終了するステップ（1/1 0:00 から遡るステップ数）
+        run_up_ground_method: 地盤の助走計算の方法
+
+    Returns:
+        ステップ -n_step_run_up_ground_end の建物全体の状態値（地盤の状態値を引き継いだ初期値）
+    """
+
+    if run_up_ground_method == ERunUpGroundMethod.PERIODIC:
+
+        logger.info('periodic steady state of ground')
+
+        gc_n = sqc.get_ground_conditions_periodic(n=-n_step_run_up_ground_end)
+
+    else:
+
+        gc_n = conditions.initialize_ground_conditions(n_grounds=sqc.bs.n_ground)
+
+        logger.info('run up calculation for ground')
+
+        gc_n = sqc.run_ticks_ground(gc_n=gc_n, n_start=-n_step_run_up, n_end=-n_step_run_up_ground_end)
+
     # 建物を計算するにあたって初期値を与える
     c_n = conditions.initialize_conditions(n_spaces=sqc.rms.n_r, n_bdries=sqc.bs.n_b)
 
     # 地盤計算の結果（項別公比法の指数項mの吸熱応答の項別成分・表面熱流）を建物の計算に引き継ぐ
-    c_n = conditions.update_conditions_by_ground_conditions(
+    return conditions.update_conditions_by_ground_conditions(
         is_ground=sqc.bs.b_ground_js.flatten(),
         c=c_n,
         gc=gc_n
     )
 
-    logger.info('助走計算（建物全体）')
 
-    for n in range(-n_step_run_up_build, 0):
-        c_n = sqc.run_tick(n=n, c_n=c_n, recorder=result)
+def get_run_up_options(d: Dict) -> Dict:
+    """助走計算の方法を取得する。
 
-    logger.info('本計算')
+    Args:
+        d: input data as dictionary / 住宅計算条件
+
+    Returns:
+        _run_up の引数 tol_run_up（収束判定に用いる許容値）及び run_up_ground_method（地盤の助走計算の方法）
+    """
+
+    d_common = d['common']
+
+    if 'calculation_day' not in d_common:
+        return {}
+
+    ipt_calculation_day = InputCalculationDay.read(d_calculation_day=d_common['calculation_day'])
+
+    return {
+        'tol_run_up': period.get_tol_run_up(ipt_calculation_day=ipt_calculation_day),
+        'run_up_ground_method': ipt_calculation_day.run_up_ground_method
+    }
+
+
+def _run_main(
+        sqc: Sequence,
+        c_n: conditions.Conditions,
+        result: Recorder,
+        n_step_main: int,
+        exe_verify: bool = False,
+        n_start: int = 0,
+        on_checkpoint: Optional[Callable[[int, conditions.Conditions], None]] = None,
+        n_step_checkpoint: Optional[int] = None
+) -> conditions.Conditions:
+    """本計算を行う。
+
+    Args:
+        sqc: Sequence クラス
+        c_n: ステップ n_start の状態値
+        result: Recorder クラス
+        n_step_main: 本計算のステップ数
+        exe_verify: 熱収支のチェックを行うか否か
+        n_start: 計算を開始するステップ（チェックポイントから再開する場合）
+        on_checkpoint: チェックポイントを保存する関数（引数は再開するステップ及びその状態値, None の場合は保存しない）
+        n_step_checkpoint: チェックポイントを保存する間隔のステップ数
+
+    Returns:
+        本計算の最後のステップの状態値
+    """
 
-    # TODO: recorder に1/1 0:00の瞬時状態値を書き込む
     m = 1
 
-    for n in range(0, n_step_main):
+    while int(n_step_main / 12 * m) < n_start:
+        m = m + 1
+
+    for n in range(n_start, n_step_main):
 
         c_n = sqc.run_tick(n=n, c_n=c_n, recorder=result, exe_verify=exe_verify)
 
@@ -145,11 +519,77 @@ def calc(
             logger.info("{} / 12 calculated.".format(m))
             m = m + 1
 
-    result.post_recording(rms=sqc.rms, bs=sqc.bs, f_mrt_is_js=sqc.f_mrt_is_js, es=sqc.es)
+        if on_checkpoint is not None and (n + 1) % n_step_checkpoint == 0 and n + 1 < n_step_main:
+            on_checkpoint(n + 1, c_n)
 
-    logger.info('ログ作成')
+    return c_n
 
-    # dd: data detail, 15分間隔のすべてのパラメータ pd.DataFrame
-    dd_i, dd_a = result.export_pd()
 
-    return dd_i, dd_a, scd, w
+def make_sequence(d: Dict, entry_point_dir: str, w: Optional[Weather] = None) -> Tuple[Sequence, int, int, int]:
+    """入力データから Sequence クラスと計算ステップ数を作成する。
+
+    Args:
+        d: input data as dictionary / 住宅計算条件
+        entry_point_dir: the pass of the entry point directory
+        w: 作成済みの Weather クラス（None の場合は入力データから作成する）
+
+    Returns:
+        以下のタプル
+            (1) Sequence クラス
+            (2) 本計算のステップ数
+            (3) 助走計算のステップ数
+            (4) 助走計算のうち建物全体を解くステップ数
+    """
+
+    ipt_all = InputAll(d=d)
+
+    ipt_common: InputCommon = ipt_all.ipt_common
+
+    ipt_weather: InputWeather = ipt_common.ipt_weather
+
+    ipt_season: InputSeason = ipt_common.ipt_season
+
+    ipt_calculation_day: InputCalculationDay = ipt_common.ipt_calculation_day
+
+    ipt_building: InputBuilding = ipt_all.ipt_building
+
+    ipt_rooms: list[InputRoom] = ipt_all.ipt_rooms
+
+    d_common = ipt_all.d_common
+
+    d_rooms = ipt_all.d_rooms
+
+    itv: Interval = Interval.create(ipt_common=ipt_common)
+
+    shape_factor_method: EShapeFactorMethod = ipt_common.shape_factor_method
+
+    # Make Weather class.
+    if w is None:
+        w = Weather.make_weather(ipt_weather=ipt_weather, itv=itv, entry_point_dir=entry_point_dir)
+
+    season: Season = Season.make_season(ipt_season=ipt_season, w=w, itv=itv, ipt_weather=ipt_weather)
+
+    # Make Schedule class.
+    scd: Schedule = Schedule.get_schedule(
+        n_ocp=ipt_common.n_ocp,
+        a_f_is=[ipt_room.a_f for ipt_room in ipt_rooms],
+        itv=itv,
+        scd_is=[ipt_room.ipt_schedule_data for ipt_room in ipt_rooms]
+    )
+
+    # Building Class
+    bdg = Building.create_building(ipt_building=ipt_building)
+
+    # Rooms Class
+    rms = Rooms(ipt_rooms=ipt_rooms)
+
+    # number of steps for main calculation
+    # number of steps for run-up calculation
+    # number of steps to calculate building in run-up calculation
+    n_step_main, n_step_run_up, n_step_run_up_build = period.get_n_step(itv=itv, ipt_calculation_day=ipt_calculation_day)
+
+    # json, csv ファイルからパラメータをロードする。
+    # （ループ計算する必要の無い）事前計算を行い, クラス PreCalcParameters, PreCalcParametersGround に必要な変数を格納する。
+    sqc = Sequence(itv=itv, d=d, weather=w, scd=scd, bdg=bdg, shape_factor_method=shape_factor_method, rms=rms)
+
+    return sqc, n_step_main, n_step_run_up, n_step_run_up_build
@@ -484,6 +484,98 @@ class RAC_C(RAC_HC):
         return theta_r - q_s / (get_c_a() * get_rho_a() * v * (1.0 - self.bf))
 
 
+@dataclass
+class RAC_Cs:
+    """Table of all RAC cooling units, held as arrays over unit k."""
+
+    # room index where the unit k is installed, [K]
+    room_index_ks: np.ndarray
+
+    # minimum cooling capacity of the unit k, W, [K]
+    q_min_ks: np.ndarray
+
+    # maximum cooling capacity of the unit k, W, [K]
+    q_max_ks: np.ndarray
+
+    # minimum air flow volume of the unit k, m3/min, [K]
+    v_min_ks: np.ndarray
+
+    # maximum air flow volume of the unit k, m3/min, [K]
+    v_max_ks: np.ndarray
+
+    # bypass factor of the unit k, -, [K]
+    bf_ks: np.ndarray
+
+    @classmethod
+    def create(cls, ces: List[Individual]):
+        """Create the table from the individual cooling equipments whose equipment is RAC_C.
+
+        Args:
+            ces: list of Individual class whose equipment is RAC_C, [K]
+        """
+
+        return RAC_Cs(
+            room_index_ks=np.array([ce.room_index for ce in ces], dtype=int),
+            q_min_ks=np.array([ce.e.q_min for ce in ces], dtype=float),
+            q_max_ks=np.array([ce.e.q_max for ce in ces], dtype=float),
+            v_min_ks=np.array([ce.e.v_min for ce in ces], dtype=float),
+            v_max_ks=np.array([ce.e.v_max for ce in ces], dtype=float),
+            bf_ks=np.array([ce.e.bf for ce in ces], dtype=float)
+        )
+
+    def get_f_l_cl_is_n(
+            self, q_s_is_n: np.ndarray, theta_r_is_n_pls: np.ndarray, x_r_ntr_is_n_pls: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """get parameters of constant and weighted for f_l_cl function of all units.
+
+        Args:
+            q_s_is_n: sensitive heat load of room i, W, [I, 1]
+            theta_r_is_n_pls: room temperature of room i, degree C, [I, 1]
+            x_r_ntr_is_n_pls: absolute humidity of room i without dehumidification, kg/kg(DA), [I, 1]
+
+        Returns:
+            sum of the weighted parameter of the units in room i, kg/s(kg/kg(DA)), [I, 1]
+            sum of the constant parameter of the units in room i, kg/s, [I, 1]
+
+        Notes:
+            The same calculation as RAC_C.get_f_l_cl, done for all units at once.
+        """
+
+        n_rm = q_s_is_n.shape[0]
+
+        q_s_ks = q_s_is_n[self.room_index_ks, 0]
+        theta_r_ks = theta_r_is_n_pls[self.room_index_ks, 0]
+        x_r_ks = x_r_ntr_is_n_pls[self.room_index_ks, 0]
+
+        # maximum and minimum air flow rate, m3/s
+        v_max_per_sec_ks = self.v_max_ks / 60.0
+        v_min_per_sec_ks = self.v_min_ks / 60.0
+
+        # air flow rate, m3/s, eq.14
+        v_ks = np.clip(
+            v_min_per_sec_ks * (self.q_max_ks - q_s_ks) / (self.q_max_ks - self.q_min_ks)
+            + v_max_per_sec_ks * (self.q_min_ks - q_s_ks) / (self.q_min_ks - self.q_max_ks),
+            a_min=v_min_per_sec_ks,
+            a_max=v_max_per_sec_ks
+        )
+
+        # surface temperature of internal heat exchanger unit, deg. C
+        theta_ex_srf_ks = theta_r_ks - q_s_ks / (get_c_a() * get_rho_a() * v_ks * (1.0 - self.bf_ks))
+
+        # absolute humidity of internal heat exchanger unit, kg/kg(DA)
+        x_ex_srf_ks = get_x(p_v=get_p_vs(theta_ex_srf_ks))
+
+        is_dehumidified_ks = (x_r_ks > x_ex_srf_ks) & (q_s_ks > 0.0)
+
+        f_l_cl_wgt_ks = np.where(is_dehumidified_ks, get_rho_a() * v_ks * (1 - self.bf_ks), 0.0)
+        f_l_cl_cst_ks = np.where(is_dehumidified_ks, get_rho_a() * v_ks * (1 - self.bf_ks) * x_ex_srf_ks, 0.0)
+
+        f_l_cl_wgt_is = np.bincount(self.room_index_ks, weights=f_l_cl_wgt_ks, minlength=n_rm).reshape(-1, 1)
+        f_l_cl_cst_is = np.bincount(self.room_index_ks, weights=f_l_cl_cst_ks, minlength=n_rm).reshape(-1, 1)
+
+        return f_l_cl_wgt_is, f_l_cl_cst_is
+
+
 @dataclass
 class Floor_HC(IndividualEquipment, ABC):
 
@@ -598,6 +690,11 @@ class Equipments:
         self._hes = hes
         self._ces = ces
 
+        # RAC cooling units are calculated at once as a table.
+        # The other cooling equipments are calculated individually.
+        self._rac_cs = RAC_Cs.create(ces=[ce for ce in ces if isinstance(ce.e, RAC_C)])
+        self._other_ces = [ce for ce in ces if not isinstance(ce.e, RAC_C)]
+
         is_radiative_heating_ks_is = _get_is_radiative_ks_is(es=hes)
         is_radiative_cooling_ks_is = _get_is_radiative_ks_is(es=ces)
 
@@ -683,24 +780,29 @@ class Equipments:
 
         q_s_is_n = -l_cs_is_n
 
-        ls = [
-            ce.get_f_l_is_n(
+        # RAC の係数 la と 係数 lb を室ごとに合計した値
+        # coeff la, kg/s(kg/kg(DA)), [I, 1]
+        # coeff lb, kg/kg(DA), [I, 1]
+        f_l_cl_wgt_is_n, f_l_cl_cst_is_n = self._rac_cs.get_f_l_cl_is_n(
+            q_s_is_n=q_s_is_n,
+            theta_r_is_n_pls=theta_r_is_n_pls,
+            x_r_ntr_is_n_pls=x_r_ntr_is_n_pls
+        )
+
+        # TODO: La は正負が仕様書と逆になっている
+        f_l_cl_wgt_is_is_n = - v_diag(f_l_cl_wgt_is_n)
+
+        # RAC 以外の設備
+        for ce in self._other_ces:
+
+            f_l_cl_wgt_other_is_is_n, f_l_cl_cst_other_is_n = ce.get_f_l_is_n(
                 q_s_is_n=q_s_is_n,
                 theta_r_is_n_pls=theta_r_is_n_pls,
                 x_r_ntr_is_n_pls=x_r_ntr_is_n_pls
             )
-            for ce in self._ces
-        ]
-
-        # 係数 la と 係数 lb をタプルから別々に取り出す。
-        # coeff la, kg/s(kg/kg(DA)), [K, I, I]
-        f_l_cl_wgt_ks_is_is_n = np.array([l[0] for l in ls])
-        # coeff lb, kg/kg(DA), [K, I, 1]
-        f_l_cl_cst_ks_is_n = np.array([l[1] for l in ls])
-        
-        # TODO: La は正負が仕様書と逆になっている
-        f_l_cl_wgt_is_is_n = - f_l_cl_wgt_ks_is_is_n.sum(axis=0)
-        f_l_cl_cst_is_n = f_l_cl_cst_ks_is_n.sum(axis=0)
+
+            f_l_cl_wgt_is_is_n = f_l_cl_wgt_is_is_n - f_l_cl_wgt_other_is_is_n
+            f_l_cl_cst_is_n = f_l_cl_cst_is_n + f_l_cl_cst_other_is_n
 
         return f_l_cl_cst_is_n, f_l_cl_wgt_is_is_n
 
@@ -0,0 +1,35 @@
+"""ファイルの書き出しに関する共通処理"""
+
+import os
+import tempfile
+from typing import BinaryIO, Callable
+
+
+def write_atomic(path: str, write: Callable[[BinaryIO], None]):
+    """Write the file atomically. / ファイルを一時ファイルに書き出した後に置き換える。
+
+    Args:
+        path: path of the file
+        write: function to write the data to the binary file object given as the argument
+
+    Notes:
+        The file is written to a temporary file in the same directory and renamed,
+        so that the other processes do not read the file being written
+        and the previous file remains if the process is stopped while writing.
+        The temporary file is removed if the writing fails.
+        OSError is not caught here and the caller decides whether to ignore it.
+    """
+
+    dir_path = os.path.dirname(path) or os.curdir
+
+    os.makedirs(dir_path, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
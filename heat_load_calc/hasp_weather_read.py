@@ -1,7 +1,19 @@
-import pandas as pd
 import numpy as np
 
 
+# 1行あたりの気象要素の数（1時～24時）
+_N_HOUR = 24
+
+# 気象要素1つあたりの文字数
+_N_WIDTH = 3
+
+# 気象要素の種類の数（気温、絶対湿度、法線面直達日射量、水平面天空日射量、夜間放射量、風向、風速）
+_N_ELEMENT = 7
+
+# 1年の日数
+_N_DAY = 365
+
+
 def hasp_read(file_name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     '''
     HASP形式のテキストファイル（utf-8）から気温、絶対湿度、法線面直達日射量、水平面天空日射量、夜間放射量、風向、風速を読み込む
@@ -18,69 +30,85 @@ def hasp_read(file_name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.nd
         風速, m/s
     '''
 
-    # 区切り文字数
-    column_width = [3] * 24
-    # 年、月、日、曜日、気象要素番号
-    column_width += [2, 2, 2, 1, 1]
-
-    # テキストファイルを読み込み
-    weather_data_pd = pd.read_fwf(
-        filepath_or_buffer=file_name,
-        widths=column_width,
-        header=None
-    )
-    # 余計な列を削除（年、月、日、曜日、気象要素番号）
-    weather_data_pd.drop(weather_data_pd.columns[[24, 25, 26, 27, 28]], axis=1, inplace=True)
+    # 気象要素, [7, 8760]
+    weather_data = read_hasp_array(file_name=file_name).astype('float')
 
     # 外気温度
-    ta_data = get_element(weather_data_pd, 0)
+    ta_data = weather_data[0]
     # 換算し端数処理
     ta_data = np.round((ta_data - 500.0) * 0.1, decimals=1)
 
     # 絶対湿度
-    xa_data = get_element(weather_data_pd, 1)
+    xa_data = weather_data[1]
     xa_data = np.round(xa_data * 0.0001, decimals=4)
 
     # 法線面直達日射量
-    idn_data = get_element(weather_data_pd, 2)
+    idn_data = weather_data[2]
     idn_data = np.round(idn_data * (0.01 * 1.0e6 / 3600.0), decimals=0)
 
     # 水平面天空日射量
-    isky_data = get_element(weather_data_pd, 3)
+    isky_data = weather_data[3]
     isky_data = np.round(isky_data * (0.01 * 1.0e6 / 3600.0), decimals=0)
 
     # 夜間放射量
-    rn_data = get_element(weather_data_pd, 4)
+    rn_data = weather_data[4]
     rn_data = np.round(rn_data * (0.01 * 1.0e6 / 3600.0), decimals=0)
 
     # 風向
-    wdre_data = get_element(weather_data_pd, 5)
+    wdre_data = weather_data[5]
 
     # 風速
-    wv_data = get_element(weather_data_pd, 6)
+    wv_data = weather_data[6]
     wv_data = np.round(wv_data * 0.1, decimals=1)
 
     return (ta_data, xa_data, idn_data, isky_data, rn_data, wdre_data, wv_data)
 
 
-def get_element(weather_pd: pd, row_number: int) -> np.ndarray:
-    '''
-    7行置きにデータを抽出し、１行に連結させたのちにnumpy配列として返す
+def read_hasp_array(file_name: str) -> np.ndarray:
+    """
+    HASP形式のテキストファイルの気象要素を換算せずに整数の配列として読み込む
+
     Args:
-        weather_pd: 気象データを読み込んだPandas
-        row_number: シフト行　0:気温、1:絶対湿度、2:法線面直達日射量、3:水平面天空日射量、4:夜間放射量、5:風向、6:風速
+        file_name: HASP形式のファイル名（3カラムのSI形式）
 
     Returns:
-        8760時間分の気象要素（ただし、換算はしていない）
-    '''
+        8760時間分の気象要素（ただし、換算はしていない）, [7, 8760]
+            0:気温、1:絶対湿度、2:法線面直達日射量、3:水平面天空日射量、4:夜間放射量、5:風向、6:風速
+
+    Notes:
+        1行は3文字ずつの24時間分の値と年、月、日、曜日、気象要素番号からなる。
+        各行の先頭72文字をバイト列のまま [行, 24, 3] の配列とみなし、桁ごとの数字を足し合わせて整数に変換する。
+        空白は0とみなす。
+    """
+
+    with open(file_name, 'rb') as f:
+        lines = [line for line in f.read().splitlines() if line.strip() != b'']
+
+    if len(lines) != _N_DAY * _N_ELEMENT:
+        raise ValueError('HASP形式のファイルの行数は{}行である必要があります。'.format(_N_DAY * _N_ELEMENT))
+
+    n_char = _N_HOUR * _N_WIDTH
+
+    # 各行の値の部分, [365 * 7, 24, 3]
+    c = np.frombuffer(
+        b''.join(line[:n_char].ljust(n_char) for line in lines), dtype=np.uint8
+    ).reshape(-1, _N_HOUR, _N_WIDTH)
+
+    is_digit = (c >= ord('0')) & (c <= ord('9'))
+    is_minus = c == ord('-')
+
+    if not np.all(is_digit | is_minus | (c == ord(' '))):
+        raise ValueError('HASP形式のファイルに数値として読み込めない文字が含まれています。')
+
+    d = np.where(is_digit, c.astype(np.int64) - ord('0'), 0)
+
+    v = d[:, :, 0] * 100 + d[:, :, 1] * 10 + d[:, :, 2]
 
-    # row_numberだけシフトし7行置きにデータを抽出
-    element_data = weather_pd[row_number::7]
-    # 1行のNumpyに変換する
-    element_data_np = element_data.values.flatten()
+    v = np.where(is_minus.any(axis=2), -v, v)
 
-    # 実数型に変換
-    return element_data_np.astype('float')
+    # 日ごとに7行（気象要素）ずつ並んでいるため、気象要素ごとに1年分を連結する。
+    # [365 * 7, 24] -> [365, 7, 24] -> [7, 365, 24] -> [7, 8760]
+    return v.reshape(_N_DAY, _N_ELEMENT, _N_HOUR).transpose(1, 0, 2).reshape(_N_ELEMENT, _N_DAY * _N_HOUR)
 
 
 if __name__ == '__main__':
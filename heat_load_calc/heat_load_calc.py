@@ -3,14 +3,19 @@ import sys
 import time
 import logging
 import argparse
+import importlib.util
 from os import path, getcwd, mkdir
 import urllib.request, urllib.error
+import numpy as np
+import pandas as pd
 
 # Obtain absolute paths for module discovery
 sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), '..')))
 
 from heat_load_calc import core, weather, interval
 
+logger = logging.getLogger('HeatLoadCalc').getChild('heat_load_calc')
+
 
 def run(
         logger,
@@ -18,7 +23,8 @@ def run(
         output_data_dir: str,
         is_schedule_saved: bool = False,
         is_weather_saved: bool = False,
-        exe_specify: bool = False
+        exe_specify: bool = False,
+        output_format: str = 'csv'
 ):
     """run the heat load calculation
 
@@ -28,8 +34,12 @@ def run(
         output_data_dir:path of the directory for output files
         is_schedule_saved: is the schedule written out ?
         is_weather_saved: is the climate data written out ?
+        output_format: format of the result files ('csv', 'parquet', 'feather' or 'npz')
     """
 
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError('出力形式 `{}` には対応していません。'.format(output_format))
+
     # ---- preparations for this calculation ----
 
     # create the output directory
@@ -78,18 +88,130 @@ def run(
     # ---- save the calculated results ----
 
     # instantaneous values
-    result_detail_i_path = path.join(output_data_dir, 'result_detail_i.csv')
+    result_detail_i_path = save_result(
+        dd=dd_i, output_data_dir=output_data_dir, name='result_detail_i', output_format=output_format
+    )
     logger.info('Save calculation results data (detailed version) to `{}`'.format(result_detail_i_path))
-    dd_i.to_csv(result_detail_i_path, encoding='cp932')
 
     # integrated values and average values
-    result_detail_a_path = path.join(output_data_dir, 'result_detail_a.csv')
+    result_detail_a_path = save_result(
+        dd=dd_a, output_data_dir=output_data_dir, name='result_detail_a', output_format=output_format
+    )
     logger.info('Save calculation results data (simplified version) to `{}`'.format(result_detail_a_path))
-    dd_a.to_csv(result_detail_a_path, encoding='cp932')
+
+
+# formats of the result files
+OUTPUT_FORMATS = ['csv', 'parquet', 'feather', 'npz']
+
+
+def save_result(dd: pd.DataFrame, output_data_dir: str, name: str, output_format: str = 'csv') -> str:
+    """save the calculated results
+
+    Args:
+        dd: calculated results made by Recorder.export_pd
+        output_data_dir: path of the directory for output files
+        name: file name without extension
+        output_format: format of the result file ('csv', 'parquet', 'feather' or 'npz')
+
+    Returns:
+        path of the saved file
+
+    Notes:
+        Parquet and Feather require pyarrow. If pyarrow is not installed, the results are saved as npz instead.
+        The operation mode (OperationMode) is saved as text in the same way as the csv file.
+        Feather does not store the index, so the datetime index is saved as columns. Use read_result_feather to restore it.
+    """
+
+    if output_format == 'csv':
+        result_path = path.join(output_data_dir, name + '.csv')
+        dd.to_csv(result_path, encoding='cp932')
+        return result_path
+
+    # columns of objects (OperationMode) are converted to text in the same way as the csv file
+    dd = dd.apply(lambda c: c.astype(str) if c.dtype == object else c)
+
+    if output_format in ['parquet', 'feather']:
+
+        if importlib.util.find_spec('pyarrow') is None:
+            logger.warning('pyarrow is not installed. The results are saved as npz instead of {}.'.format(output_format))
+            output_format = 'npz'
+
+    if output_format == 'parquet':
+        result_path = path.join(output_data_dir, name + '.parquet')
+        dd.to_parquet(result_path, compression='zstd')
+    elif output_format == 'feather':
+        # feather does not store the index, so the index is stored as columns
+        result_path = path.join(output_data_dir, name + '.feather')
+        dd.reset_index().to_feather(result_path, compression='zstd')
+    else:
+        result_path = path.join(output_data_dir, name + '.npz')
+        np.savez_compressed(
+            result_path,
+            index_names=np.array(dd.index.names, dtype=str),
+            columns=np.array(dd.columns, dtype=str),
+            **{'index_{}'.format(k): dd.index.get_level_values(k).values for k in range(dd.index.nlevels)},
+            **{'column_{}'.format(k): _to_numpy(s=dd.iloc[:, k]) for k in range(dd.shape[1])}
+        )
+
+    return result_path
+
+
+def _to_numpy(s: pd.Series) -> np.ndarray:
+    """convert the column to numpy array which can be loaded without pickle"""
+
+    v = s.to_numpy()
+
+    return v.astype(str) if v.dtype == object else v
+
+
+def read_result_npz(result_path: str) -> pd.DataFrame:
+    """read the calculated results saved as npz
+
+    Args:
+        result_path: path of the npz file made by save_result
+
+    Returns:
+        calculated results with the same column names and datetime index as Recorder.export_pd
+    """
+
+    with np.load(result_path) as f:
+
+        index_names = list(f['index_names'])
+        columns = list(f['columns'])
+
+        index = pd.MultiIndex.from_arrays(
+            [f['index_{}'.format(k)] for k in range(len(index_names))], names=index_names
+        ) if len(index_names) > 1 else pd.Index(f['index_0'], name=index_names[0])
+
+        return pd.DataFrame(data={c: f['column_{}'.format(k)] for k, c in enumerate(columns)}, index=index)
+
+
+def read_result_feather(result_path: str) -> pd.DataFrame:
+    """read the calculated results saved as feather
+
+    Args:
+        result_path: path of the feather file made by save_result
+
+    Returns:
+        calculated results with the same column names and datetime index as Recorder.export_pd
+
+    Notes:
+        The columns of the datetime index ('start_time' and 'end_time') saved by save_result are set as the index again.
+    """
+
+    dd = pd.read_feather(result_path)
+
+    return dd.set_index([c for c in ['start_time', 'end_time'] if c in dd.columns])
 
 
 def main():
 
+    # `heat_load_calc sweep ...` runs the parameter sweep
+    if len(sys.argv) > 1 and sys.argv[1] == 'sweep':
+        from heat_load_calc import sweep
+        sweep.main(args=sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(description='heat load calculation')
 
     parser.add_argument(
@@ -130,11 +252,19 @@ def main():
         help='If specified, set exe_specify=True.'
     )
 
+    parser.add_argument(
+        '--output-format',
+        dest='output_format',
+        choices=OUTPUT_FORMATS,
+        default='csv',
+        help="Specify the format of the result files. Parquet and Feather fall back to npz without pyarrow. (Default=csv)"
+    )
+
     # make args
     args = parser.parse_args()
 
     # make logger
-    logger = _make_logger(log=args.log)
+    logger = make_logger(log=args.log)
 
     # record start time
     start = time.time()
@@ -145,7 +275,8 @@ def main():
         output_data_dir=args.output_data_dir,
         is_schedule_saved=args.schedule_saved,
         is_weather_saved=args.weather_saved,
-        exe_specify=args.exe_specify
+        exe_specify=args.exe_specify,
+        output_format=args.output_format
     )
 
     # take the difference between the start time and the end time
@@ -155,7 +286,7 @@ def main():
     logger.info("elapsed_time:{0}".format(elapsed_time) + "[sec]")
 
 
-def _make_logger(
+def make_logger(
         log: str
     ) -> logging.Logger:
     """make logger
@@ -1,4 +1,5 @@
-from typing import Tuple
+from typing import Tuple, Dict, List
+from dataclasses import dataclass
 import numpy as np
 
 from heat_load_calc.direction import Direction
@@ -61,6 +62,151 @@ def get_i_s_j_ns(
     return i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, r_s_n_j_ns
 
 
+def get_ns_sun(i_s_dn_j_ns: np.ndarray) -> np.ndarray:
+    """直達日射が当たるステップの番号を取得する。
+    Args:
+        i_s_dn_j_ns: ステップnにおける境界jに入射する日射量の直達成分, W/m2, [N+1]
+    Returns:
+        直達日射が当たるステップの番号, [N_sun]
+    Notes:
+        直達日射に対する日よけの影面積比率・窓の日射透過率等は直達成分に掛けて用いるため、
+        直達成分がゼロのステップ（夜間、太陽が傾斜面の裏側にある場合等）では計算する必要がない。
+    """
+
+    return np.flatnonzero(i_s_dn_j_ns != 0.0)
+
+
+def expand_ns_sun(v_ns_sun: np.ndarray, ns_sun: np.ndarray, n: int) -> np.ndarray:
+    """直達日射が当たるステップについて計算した値を全ステップの配列に展開する。
+    Args:
+        v_ns_sun: 直達日射が当たるステップにおける値, [N_sun]
+        ns_sun: 直達日射が当たるステップの番号, [N_sun]
+        n: ステップの数 (N+1)
+    Returns:
+        ステップnにおける値, [N+1]
+    Notes:
+        直達日射が当たらないステップの値は 0.0 とする。
+    """
+
+    v_ns = np.zeros(n, dtype=float)
+
+    v_ns[ns_sun] = v_ns_sun
+
+    return v_ns
+
+
+@dataclass
+class SolarGeometry:
+    """ある方位の傾斜面に対する入射角及び傾斜面日射量
+
+    同じ方位の境界の間で共有されるため、配列は読み取り専用とする。
+    """
+
+    # ステップnにおける傾斜面に入射する太陽の入射角, rad, [N+1]
+    phi_j_ns: np.ndarray
+
+    # ステップnにおける傾斜面に入射する日射量のうち直達成分, W/m2, [N+1]
+    i_s_dn_j_ns: np.ndarray
+
+    # ステップnにおける傾斜面に入射する日射量のうち天空成分, W/m2, [N+1]
+    i_s_sky_j_ns: np.ndarray
+
+    # ステップnにおける傾斜面に入射する日射量のうち地盤反射成分, W/m2, [N+1]
+    i_s_ref_j_ns: np.ndarray
+
+    # ステップnにおける傾斜面の夜間放射量, W/m2, [N+1]
+    r_s_n_j_ns: np.ndarray
+
+    @classmethod
+    def create(cls, w: Weather, drct_j: Direction):
+        """
+        Args:
+            w: Weather Class
+            drct_j: Direction Class
+        Returns:
+            SolarGeometry Class
+        """
+
+        phi_j_ns = get_phi_j_ns(h_sun_ns=w.h_sun_ns_plus, a_sun_ns=w.a_sun_ns_plus, drct_j=drct_j)
+
+        i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, r_s_n_j_ns = get_i_s_j_ns(w=w, drct_j=drct_j)
+
+        for a in (phi_j_ns, i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, r_s_n_j_ns):
+            a.flags.writeable = False
+
+        return SolarGeometry(
+            phi_j_ns=phi_j_ns,
+            i_s_dn_j_ns=i_s_dn_j_ns,
+            i_s_sky_j_ns=i_s_sky_j_ns,
+            i_s_ref_j_ns=i_s_ref_j_ns,
+            r_s_n_j_ns=r_s_n_j_ns
+        )
+
+
+class SolarGeometryTable:
+    """方位ごとの SolarGeometry の表
+
+    入射角及び傾斜面日射量は方位と気象データのみで決まるため、
+    境界ごとではなく、同じ方位の境界の間で一度だけ計算する。
+    """
+
+    def __init__(self, w: Weather):
+        """
+        Args:
+            w: Weather Class
+        """
+
+        self._w = w
+
+        self._sgs: Dict[Direction, SolarGeometry] = {}
+
+    def get(self, drct_j: Direction) -> SolarGeometry:
+        """方位に対する SolarGeometry を取得する。（初めて参照された方位の場合のみ計算する。）
+        Args:
+            drct_j: Direction Class
+        Returns:
+            SolarGeometry Class
+        """
+
+        if drct_j not in self._sgs:
+            self._sgs[drct_j] = SolarGeometry.create(w=self._w, drct_j=drct_j)
+
+        return self._sgs[drct_j]
+
+    def gather(self, drct_js: List[Direction]) -> SolarGeometry:
+        """境界ごとの方位に対する入射角及び傾斜面日射量を方位ごとの表から集める。
+        Args:
+            drct_js: 境界jの Direction Class, [J]
+        Returns:
+            各値が[J, N+1]の配列である SolarGeometry Class
+        """
+
+        # 境界jの方位の表における番号, [J]
+        drcts = list(dict.fromkeys(drct_js))
+        idx_js = np.array([drcts.index(drct_j) for drct_j in drct_js], dtype=int)
+
+        sgs = [self.get(drct_j=drct) for drct in drcts]
+
+        def take(name: str) -> np.ndarray:
+            if len(sgs) == 0:
+                return np.empty((0, self._w.number_of_data_plus), dtype=float)
+            return np.stack([getattr(sg, name) for sg in sgs])[idx_js]
+
+        return SolarGeometry(
+            phi_j_ns=take('phi_j_ns'),
+            i_s_dn_j_ns=take('i_s_dn_j_ns'),
+            i_s_sky_j_ns=take('i_s_sky_j_ns'),
+            i_s_ref_j_ns=take('i_s_ref_j_ns'),
+            r_s_n_j_ns=take('r_s_n_j_ns')
+        )
+
+    @property
+    def n_direction(self) -> int:
+        """計算済みの方位の数"""
+
+        return len(self._sgs)
+
+
 def _get_i_s_dn_j_ns(i_dn_ns: np.ndarray, phi_j_ns: np.ndarray) -> np.ndarray:
     """ステップnにおける境界jに入射する日射量の直達成分を計算する。
     Args:
@@ -1,15 +1,33 @@
 from dataclasses import dataclass
 
+from heat_load_calc.tenum import ERunUpGroundMethod
+
 
 @dataclass
 class InputCalculationDay:
 
+    # 本計算の日数（キー main）
     n_d_main: int
 
+    # 助走計算の日数（キー run_up）
     n_d_run_up: int | None
 
+    # 助走計算のうち建物全体を解く日数（キー run_up_building）
+    # run_up_tolerance を指定した場合は日数ではなく、本計算の前日を繰り返し計算する回数の上限となる。
+    # この場合の助走計算は、地盤のみの助走計算を本計算の前日の開始時刻まで行った後に本計算の前日を繰り返し計算するため、
+    # 1/1 0:00 の状態は日数を固定した助走計算とは一致しない（例題の住宅では室温の差は 0.02 K 程度）。
     n_d_run_up_build: int | None
 
+    # 助走計算（建物全体）の収束判定に用いる温度の許容値, K（キー run_up_tolerance）
+    # None の場合は助走計算（建物全体）を指定された日数行う。
+    tol_theta_run_up: float | None = None
+
+    # 助走計算（建物全体）の収束判定に用いる表面熱流の許容値, W/m2（キー run_up_tolerance_heat_flux）
+    tol_q_run_up: float | None = None
+
+    # 地盤の助走計算の方法
+    run_up_ground_method: ERunUpGroundMethod = ERunUpGroundMethod.STEP
+
     @classmethod
     def read(cls, d_calculation_day: dict):
 
@@ -27,6 +45,9 @@ class InputCalculationDay:
 
             n_d_run_up = int(d_calculation_day['run_up']) if 'run_up' in d_calculation_day else None
             n_d_run_up_build = int(d_calculation_day['run_up_building']) if 'run_up_building' in d_calculation_day else None
+            tol_theta_run_up = float(d_calculation_day['run_up_tolerance']) if 'run_up_tolerance' in d_calculation_day else None
+            tol_q_run_up = float(d_calculation_day['run_up_tolerance_heat_flux']) if 'run_up_tolerance_heat_flux' in d_calculation_day else None
+            run_up_ground_method = ERunUpGroundMethod(d_calculation_day.get('run_up_ground_method', 'step'))
             
         except ValueError:
             raise ValueError('An invalid value was specified in \'calculation_day\' tag.')
@@ -41,6 +62,21 @@ class InputCalculationDay:
         if n_d_run_up_build is not None:
             if not 365 >= n_d_run_up_build >= 0:
                 raise ValueError('Value \'main\' in tag \'calculation_day\' is out of range.')
+
+        if tol_theta_run_up is not None:
+            if not tol_theta_run_up > 0.0:
+                raise ValueError('Value \'run_up_tolerance\' in tag \'calculation_day\' is out of range.')
+
+        if tol_q_run_up is not None:
+            if not tol_q_run_up > 0.0:
+                raise ValueError('Value \'run_up_tolerance_heat_flux\' in tag \'calculation_day\' is out of range.')
         
-        return InputCalculationDay(n_d_main=n_d_main, n_d_run_up=n_d_run_up, n_d_run_up_build=n_d_run_up_build)
+        return InputCalculationDay(
+            n_d_main=n_d_main,
+            n_d_run_up=n_d_run_up,
+            n_d_run_up_build=n_d_run_up_build,
+            tol_theta_run_up=tol_theta_run_up,
+            tol_q_run_up=tol_q_run_up,
+            run_up_ground_method=run_up_ground_method
+        )
 
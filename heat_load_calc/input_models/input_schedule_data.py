@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import json
 import os
+from functools import lru_cache
 
 
 from heat_load_calc.tenum import ENumberOfOccupants, EScheduleType
@@ -30,16 +31,7 @@ class InputScheduleData(ABC):
 
             name = str(d_schedule['name'])
 
-            try:
-
-                with open(str(os.path.dirname(os.path.dirname(__file__))) + '/schedule/' + name + '.json', 'r', encoding='utf-8') as f:
-                    d_schedule = json.load(f)
-            
-            except FileNotFoundError as e:
-
-                raise FileNotFoundError(f'Schedule file \'{name}\' could not found.')
-
-            return cls.read_from_dict(id=id, d_schedule=d_schedule)
+            return cls.read_from_dict(id=id, d_schedule=_load_schedule_file(name=name))
 
 
     @staticmethod
@@ -131,3 +123,28 @@ class InputScheduleDataNumber(InputScheduleData):
             ENumberOfOccupants.Four: self.ipt_schedule_data_day_types_four
         }[noo]
     
+
+
+@lru_cache(maxsize=None)
+def _load_schedule_file(name: str) -> dict:
+    """Load the schedule file in the schedule directory.
+
+    Args:
+        name: name of the schedule file without extension
+
+    Returns:
+        schedule as dictionary
+
+    Notes:
+        The file is read only once per process, since the same schedule is used in many rooms and calculations.
+        The returned dictionary is shared and should not be modified.
+    """
+
+    try:
+
+        with open(str(os.path.dirname(os.path.dirname(__file__))) + '/schedule/' + name + '.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    except FileNotFoundError as e:
+
+        raise FileNotFoundError(f'Schedule file \'{name}\' could not found.')
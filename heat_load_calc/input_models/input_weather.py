@@ -19,7 +19,7 @@ class InputWeather(ABC):
         if 'method' not in d_weather:
             raise KeyError('Key method could not be found in weather tag.')
         
-        # 'method' takes the value of either 'ees' or 'file'.
+        # 'method' takes the value of 'ees', 'file' or 'hasp'.
         match EWeatherMethod(d_weather['method']):
 
             case EWeatherMethod.EES:
@@ -33,17 +33,19 @@ class InputWeather(ABC):
                 
                 return InputWeatherEES(region=region)
                             
-            case EWeatherMethod.FILE:
+            case EWeatherMethod.FILE | EWeatherMethod.HASP:
+
+                method = EWeatherMethod(d_weather['method'])
 
                 # Tag 'file_path' should be defined.
                 if 'file_path' not in d_weather:
-                    raise KeyError('Key file_path should be specified if the file method applied.')
+                    raise KeyError('Key file_path should be specified if the {} method applied.'.format(method.value))
 
                 file_path = str(d_weather['file_path'])
 
                 # Tag 'latitude' should be defined.
                 if 'latitude' not in d_weather:
-                    raise KeyError('Key latitude should be specified if the file method applied.')
+                    raise KeyError('Key latitude should be specified if the {} method applied.'.format(method.value))
                 
                 # Latitude should be float from -90.0 to 90.0 (deg.).
                 latitude = float(d_weather['latitude'])
@@ -53,7 +55,7 @@ class InputWeather(ABC):
                 
                 # Tag 'longitude' should be defined.
                 if 'longitude' not in d_weather:
-                    raise KeyError('Key longitude should be specified if the file method applied.')
+                    raise KeyError('Key longitude should be specified if the {} method applied.'.format(method.value))
 
                 # Longitude should be float from -180.0 to 180.0 (deg.).                
                 longitude = float(d_weather['longitude'])
@@ -61,6 +63,9 @@ class InputWeather(ABC):
                 if (longitude < -180.0) or (longitude > 180.0):
                     raise ValueError('Longitude should be defined between -180.0 deg. and 180.0 deg.')
                 
+                if method == EWeatherMethod.HASP:
+                    return InputWeatherHASP(file_path=file_path, latitude=latitude, longitude=longitude)
+
                 return InputWeatherFile(file_path=file_path, latitude=latitude, longitude=longitude)
             
             case _:
@@ -80,3 +85,8 @@ class InputWeatherFile(InputWeather):
     latitude: float
     longitude: float
     method: EWeatherMethod = EWeatherMethod.FILE
+
+@dataclass
+class InputWeatherHASP(InputWeatherFile):
+
+    method: EWeatherMethod = EWeatherMethod.HASP
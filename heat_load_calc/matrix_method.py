@@ -2,5 +2,20 @@ import numpy as np
 
 
 def v_diag(v_matrix: np.ndarray) -> np.ndarray:
-    arr = v_matrix.flatten()
-    return np.diag(arr)
+    """縦ベクトルを対角成分にもつ対角行列を作成する。
+
+    Args:
+        v_matrix: 縦ベクトル, [i, 1] または先頭軸をもつ [k, i, 1]
+
+    Returns:
+        対角行列, [i, i] または [k, i, i]
+
+    Notes:
+        先頭軸をもつ場合は、末尾2軸について対角行列を作成する。
+    """
+
+    if v_matrix.ndim <= 2:
+        arr = v_matrix.flatten()
+        return np.diag(arr)
+
+    return v_matrix * np.identity(v_matrix.shape[-2], dtype=float)
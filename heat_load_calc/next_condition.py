@@ -42,8 +42,8 @@ def get_next_temp_and_load(
     k = brc_ot_is_n
 
     # 実際に暖房が行われるかどうか。
-    is_heating = (operation_mode_is_n == OperationMode.HEATING) & (theta_natural_is_n < theta_lower_target_is_n)
-    is_cooling = (operation_mode_is_n == OperationMode.COOLING) & (theta_upper_target_is_n < theta_natural_is_n)
+    is_heating = (operation_mode_is_n == OperationMode.HEATING.value) & (theta_natural_is_n < theta_lower_target_is_n)
+    is_cooling = (operation_mode_is_n == OperationMode.COOLING.value) & (theta_upper_target_is_n < theta_natural_is_n)
 #    is_heating = is_heating_is_n
 #    is_cooling = is_cooling_is_n
 
@@ -53,8 +53,8 @@ def get_next_temp_and_load(
     # 後で再計算する際に、負荷が機器容量を超えている場合は、最大暖房／冷房負荷で処理されることになるため、
     # 室温を指定しない場合は、この限りではない。
 #    nt = np.zeros(room_shape, dtype=int)
-#    nt[operation_mode_is_n == OperationMode.STOP_CLOSE] = 1
-#    nt[operation_mode_is_n == OperationMode.STOP_OPEN] = 1
+#    nt[operation_mode_is_n == OperationMode.STOP_CLOSE.value] = 1
+#    nt[operation_mode_is_n == OperationMode.STOP_OPEN.value] = 1
     nt = np.full(room_shape, 1, dtype=int)
     nt[is_heating] = 0
     nt[is_cooling] = 0
@@ -74,8 +74,8 @@ def get_next_temp_and_load(
     #   operation_mode が COOLING でかつ、 is_radiative_cooling_is が false の場合
     # のどちらかである。
     c = np.zeros(room_shape, dtype=int)
-#    c[(operation_mode_is_n == OperationMode.HEATING) & (np.logical_not(is_radiative_heating_is))] = 1
-#    c[(operation_mode_is_n == OperationMode.COOLING) & (np.logical_not(is_radiative_cooling_is))] = 1
+#    c[(operation_mode_is_n == OperationMode.HEATING.value) & (np.logical_not(is_radiative_heating_is))] = 1
+#    c[(operation_mode_is_n == OperationMode.COOLING.value) & (np.logical_not(is_radiative_cooling_is))] = 1
     c[is_heating & (np.logical_not(is_radiative_heating_is))] = 1
     c[is_cooling & (np.logical_not(is_radiative_cooling_is))] = 1
 
@@ -92,8 +92,8 @@ def get_next_temp_and_load(
     #   operation_mode が COOLING でかつ、 is_radiative_cooling_is が true の場合
     # のどちらかである。
     r = np.zeros(room_shape, dtype=int)
-#    r[(operation_mode_is_n == OperationMode.HEATING) & is_radiative_heating_is] = 1
-#    r[(operation_mode_is_n == OperationMode.COOLING) & is_radiative_cooling_is] = 1
+#    r[(operation_mode_is_n == OperationMode.HEATING.value) & is_radiative_heating_is] = 1
+#    r[(operation_mode_is_n == OperationMode.COOLING.value) & is_radiative_cooling_is] = 1
     r[is_heating & is_radiative_heating_is] = 1
     r[is_cooling & is_radiative_cooling_is] = 1
 
@@ -111,6 +111,14 @@ def get_next_temp_and_load(
     # 計算された放射空調負荷が最大放熱量を上回る場合は、放熱量を最大放熱量に固定して、対流空調負荷を未知数として再計算する。
     over_lr = lr > lr_h_max_cap_is
 
+    # 計算された放射空調負荷が最大放熱量を下回る場合は、放熱量を最大放熱量に固定して、対流空調負荷を未知数として再計算する。
+    # 注意：冷房の最大放熱量は正の値で指定される。一方、計算される負荷（lr）は、冷房の場合、負の値で指定される。
+    under_lr = lr < -lr_cs_max_cap_is
+
+    # 最大放熱量を超える室が無い場合は、再計算しても結果は変わらないため、再計算を省略する。
+    if not (np.any(over_lr) or np.any(under_lr)):
+        return theta, lc, lr
+
     # 対流負荷を未知数とする。
     c[over_lr] = 1
 
@@ -118,10 +126,6 @@ def get_next_temp_and_load(
     r[over_lr] = 0
     lr_set[over_lr] = lr_h_max_cap_is[over_lr]
 
-    # 計算された放射空調負荷が最大放熱量を下回る場合は、放熱量を最大放熱量に固定して、対流空調負荷を未知数として再計算する。
-    # 注意：冷房の最大放熱量は正の値で指定される。一方、計算される負荷（lr）は、冷房の場合、負の値で指定される。
-    under_lr = lr < -lr_cs_max_cap_is
-
     # 対流負荷を未知数とする。
     c[under_lr] = 1
 
@@ -124,43 +124,6 @@ class ACConfigs:
             return x_upper_target
 
 
-class OperationSchedule:
-
-    def __init__(self, x_lower_target: float, x_upper_target: float, r_ac_demand: float):
-
-        self._x_lower_target = x_lower_target
-        self._x_upper_target = x_upper_target
-        self._r_ac_demand = r_ac_demand
-
-    def get_opmode_heating_cooling(self, x_h: float, x_c: float, x_wop: float) -> OperationMode:
-
-        # 空調需要が0より大の場合（ケース 2）
-        if self._r_ac_demand > 0:
-
-            # 暖房用参照値が目標下限値を下回る場合は「暖房」とする。（ケース 2-1）
-            if x_h < self._x_lower_target:
-
-                return OperationMode.HEATING
-                
-            # 冷房用参照値が目標上限値を上回り、かつ、窓開け用参照値が目標上限値を上回る場合は「冷房」とする。（ケース 2-2-1）
-            elif (x_c > self._x_upper_target) & (x_wop > self._x_upper_target):
-                
-                return OperationMode.COOLING
-
-            # 冷房用参照値が目標上限値を上回り、かつ、窓開け用参照値が目標上限値以下の場合は「暖房・冷房停止で窓「開」」とする。（ケース 2-2-2）
-            elif (x_c > self._x_upper_target) & (x_wop <= self._x_upper_target):
-                return OperationMode.STOP_OPEN
-            
-            # 空港需要が0より大であるが、上記のケース2-1, 2-2-1, 2-2-2 を満たさない場合は「暖房・冷房停止で窓「閉」」とする。（ケース 2-3）
-            else:
-                return OperationMode.STOP_CLOSE
-
-        # 空調需要が0の場合は「暖房・冷房停止で窓「閉」」とする。（ケース 1）
-        else:
-
-            return OperationMode.STOP_CLOSE
-        
-
 class Operation:
 
     def __init__(self, d_common: dict, t_ac_mode_is_ns: np.ndarray, r_ac_demand_is_ns: np.ndarray, n_rm: int):
@@ -183,9 +146,13 @@ class Operation:
         # - lower limit
         ac_configs = ACConfigs.set_ac_configs(d_common=d_common)
 
+        # ac modes used in the schedule and the index of the mode of room i at step n, [I, N]
+        t_ac_modes, t_ac_mode_index_is_ns = np.unique(t_ac_mode_is_ns, return_inverse=True)
+        t_ac_mode_index_is_ns = t_ac_mode_index_is_ns.reshape(np.shape(t_ac_mode_is_ns))
+
         # lower and upper target, [I, N]
-        x_lower_target_is_ns = np.vectorize(ac_configs.get_lower)(t_ac_mode_is_ns)
-        x_upper_target_is_ns = np.vectorize(ac_configs.get_upper)(t_ac_mode_is_ns)
+        x_lower_target_is_ns = np.array([ac_configs.get_lower(t_ac_mode) for t_ac_mode in t_ac_modes], dtype=float)[t_ac_mode_index_is_ns]
+        x_upper_target_is_ns = np.array([ac_configs.get_upper(t_ac_mode) for t_ac_mode in t_ac_modes], dtype=float)[t_ac_mode_index_is_ns]
 
         self._ac_method = ac_method
         self._x_lower_target_is_ns = x_lower_target_is_ns
@@ -193,8 +160,6 @@ class Operation:
         self._r_ac_demand_is_ns = r_ac_demand_is_ns
         self._n_rm = n_rm
 
-        self._operation_schedule_is_ns = np.vectorize(OperationSchedule)(x_lower_target_is_ns, x_upper_target_is_ns, r_ac_demand_is_ns)
-
     @property
     def ac_method(self):
         return self._ac_method
@@ -230,7 +195,7 @@ class Operation:
             x_r_ntr_non_nv_is_n_pls: ステップn+1における室iの自然風非利用時の絶対湿度, kg/kg(DA), [i, 1]
             x_r_ntr_nv_is_n_pls: ステップn+1における室iの自然風利用時の絶対湿度, kg/kg(DA), [i, 1]
         Returns:
-
+            ステップ n における室 i の運転モードの値（OperationMode.value）, [i, 1], int8型
         """
 
         if self.ac_method in [ACMethod.AIR_TEMPERATURE, ACMethod.SIMPLE, ACMethod.OT]:
@@ -273,12 +238,14 @@ class Operation:
         else:
             raise Exception()
 
-        operation_schedule_is_n = self._operation_schedule_is_ns[:, n].reshape(-1, 1)
-
-        def apply_f(c: OperationSchedule, x_h: float, x_c: float, x_wop: float) -> OperationMode:
-            return c.get_opmode_heating_cooling(x_h, x_c, x_wop)
-
-        t_operation_mode_is_n = np.vectorize(apply_f)(operation_schedule_is_n, x_heating_is_n_pls, x_cooling_is_n_pls, x_window_open_is_n_pls)
+        t_operation_mode_is_n = _get_operation_mode_code_is_n(
+            x_lower_target_is_n=self._x_lower_target_is_ns[:, n].reshape(-1, 1),
+            x_upper_target_is_n=self._x_upper_target_is_ns[:, n].reshape(-1, 1),
+            r_ac_demand_is_n=self._r_ac_demand_is_ns[:, n].reshape(-1, 1),
+            x_h_is_n=x_heating_is_n_pls,
+            x_c_is_n=x_cooling_is_n_pls,
+            x_wop_is_n=x_window_open_is_n_pls
+        ).astype(np.int8)
 
         return t_operation_mode_is_n
 
@@ -383,6 +350,76 @@ class Operation:
         return k_c_is, k_r_is
 
 
+# 運転モードの値（OperationMode.value）から OperationMode への変換表
+_OPERATION_MODES = np.array([None] + [OperationMode(v) for v in range(1, len(OperationMode) + 1)], dtype=object)
+
+
+def get_operation_mode_is_ns(operation_mode_code_is_ns: np.ndarray) -> np.ndarray:
+    """運転モードの値（OperationMode.value）を列挙体 OperationMode に変換する。
+
+    Args:
+        operation_mode_code_is_ns: 室 i の運転モードの値, [i, n], int型
+
+    Returns:
+        室 i の運転モード, [i, n], object型（OperationMode）
+
+    Notes:
+        計算中の運転モードは int8 型の値で扱い、結果の出力時にのみ列挙体に変換する。
+    """
+
+    return _OPERATION_MODES[operation_mode_code_is_ns]
+
+
+def _get_operation_mode_code_is_n(
+        x_lower_target_is_n: np.ndarray,
+        x_upper_target_is_n: np.ndarray,
+        r_ac_demand_is_n: np.ndarray,
+        x_h_is_n: np.ndarray,
+        x_c_is_n: np.ndarray,
+        x_wop_is_n: np.ndarray
+) -> np.ndarray:
+    """暖房用・冷房用・窓開け用参照値から運転モードを決定する。
+
+    Args:
+        x_lower_target_is_n: ステップ n における室 i の目標下限値, [i, 1]
+        x_upper_target_is_n: ステップ n における室 i の目標上限値, [i, 1]
+        r_ac_demand_is_n: ステップ n における室 i の空調需要, [i, 1]
+        x_h_is_n: ステップ n+1 における室 i の暖房用参照値, [i, 1]
+        x_c_is_n: ステップ n+1 における室 i の冷房用参照値, [i, 1]
+        x_wop_is_n: ステップ n+1 における室 i の窓開け用参照値, [i, 1]
+
+    Returns:
+        ステップ n における室 i の運転モードの値（OperationMode.value）, [i, 1], int型
+
+    Notes:
+        空調需要が0の場合は「暖房・冷房停止で窓「閉」」とする。（ケース 1）
+        空調需要が0より大の場合（ケース 2）
+            暖房用参照値が目標下限値を下回る場合は「暖房」とする。（ケース 2-1）
+            冷房用参照値が目標上限値を上回り、かつ、窓開け用参照値が目標上限値を上回る場合は「冷房」とする。（ケース 2-2-1）
+            冷房用参照値が目標上限値を上回り、かつ、窓開け用参照値が目標上限値以下の場合は「暖房・冷房停止で窓「開」」とする。（ケース 2-2-2）
+            上記のいずれも満たさない場合は「暖房・冷房停止で窓「閉」」とする。（ケース 2-3）
+        目標値が設定されていない（nan）場合は比較が常に偽となるため「暖房・冷房停止で窓「閉」」となる。
+    """
+
+    is_demand = r_ac_demand_is_n > 0
+
+    is_over_upper = is_demand & (x_c_is_n > x_upper_target_is_n)
+
+    return np.select(
+        condlist=[
+            is_demand & (x_h_is_n < x_lower_target_is_n),
+            is_over_upper & (x_wop_is_n > x_upper_target_is_n),
+            is_over_upper & (x_wop_is_n <= x_upper_target_is_n)
+        ],
+        choicelist=[
+            OperationMode.HEATING.value,
+            OperationMode.COOLING.value,
+            OperationMode.STOP_OPEN.value
+        ],
+        default=OperationMode.STOP_CLOSE.value
+    )
+
+
 def _get_x_is_n_pls_ot_and_air_temperature_control(
         theta_r_ot_ntr_non_nv_is_n_pls: np.ndarray,
         theta_r_ot_ntr_nv_is_n_pls: np.ndarray,
@@ -526,8 +563,8 @@ def _get_theta_target(
         clo_is_n: np.ndarray
 ):
 
-    f_h = operation_mode_is_n == OperationMode.HEATING
-    f_c = operation_mode_is_n == OperationMode.COOLING
+    f_h = operation_mode_is_n == OperationMode.HEATING.value
+    f_c = operation_mode_is_n == OperationMode.COOLING.value
 
     # ステップnにおける室iの目標作用温度, degree C, [i, 1]
 
@@ -574,19 +611,19 @@ def _get_v_hum_is_n(
     v_hum_is_n = np.zeros_like(operation_mode_is, dtype=float)
 
     # 対流暖房時の風速を 0.2 m/s とする
-    v_hum_is_n[(operation_mode_is == OperationMode.HEATING) & np.logical_not(is_radiative_heating_is)] = 0.2
+    v_hum_is_n[(operation_mode_is == OperationMode.HEATING.value) & np.logical_not(is_radiative_heating_is)] = 0.2
     # 放射暖房時の風速を 0.0 m/s とする
-    v_hum_is_n[(operation_mode_is == OperationMode.HEATING) & (is_radiative_heating_is)] = 0.0
+    v_hum_is_n[(operation_mode_is == OperationMode.HEATING.value) & (is_radiative_heating_is)] = 0.0
 
     # 対流冷房時の風速を 0.2 m/s とする
-    v_hum_is_n[(operation_mode_is == OperationMode.COOLING) & np.logical_not(is_radiative_cooling_is)] = 0.2
+    v_hum_is_n[(operation_mode_is == OperationMode.COOLING.value) & np.logical_not(is_radiative_cooling_is)] = 0.2
     # 放射冷房時の風速を 0.0 m/s とする
-    v_hum_is_n[(operation_mode_is == OperationMode.COOLING) & (is_radiative_cooling_is)] = 0.0
+    v_hum_is_n[(operation_mode_is == OperationMode.COOLING.value) & (is_radiative_cooling_is)] = 0.0
 
     # 暖冷房をせずに窓を開けている時の風速を 0.1 m/s とする
     # 対流暖房・冷房時と窓を開けている時は同時には起こらないことを期待しているが
     # もし同時にTrueの場合は窓を開けている時の風速が優先される（上書きわれる）
-    v_hum_is_n[operation_mode_is == OperationMode.STOP_OPEN] = 0.1
+    v_hum_is_n[operation_mode_is == OperationMode.STOP_OPEN.value] = 0.1
 
     # 上記に当てはまらない場合の風速は 0.0 m/s のままである。
 
@@ -609,15 +646,15 @@ def _get_clo_is_ns(operation_mode_is_n: np.ndarray):
     # 運転方法に応じてclo値の設定を決定する。
 
     # 暖房時は厚着とする。
-    clo_is_ns[operation_mode_is_n == OperationMode.HEATING] = occupants.get_clo_heavy()
+    clo_is_ns[operation_mode_is_n == OperationMode.HEATING.value] = occupants.get_clo_heavy()
 
     # 冷房時は薄着とする。
-    clo_is_ns[operation_mode_is_n == OperationMode.COOLING] = occupants.get_clo_light()
+    clo_is_ns[operation_mode_is_n == OperationMode.COOLING.value] = occupants.get_clo_light()
 
     # 運転停止（窓開）時は薄着とする。
-    clo_is_ns[operation_mode_is_n == OperationMode.STOP_OPEN] = occupants.get_clo_light()
+    clo_is_ns[operation_mode_is_n == OperationMode.STOP_OPEN.value] = occupants.get_clo_light()
 
     # 運転停止（窓閉）時は中間着とする。
-    clo_is_ns[operation_mode_is_n == OperationMode.STOP_CLOSE] = occupants.get_clo_middle()
+    clo_is_ns[operation_mode_is_n == OperationMode.STOP_CLOSE.value] = occupants.get_clo_middle()
 
     return clo_is_ns
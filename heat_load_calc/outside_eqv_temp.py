@@ -1,7 +1,10 @@
 import numpy as np
 
+from typing import Optional
+
 from heat_load_calc import inclined_surface_solar_radiation
 from heat_load_calc.weather import Weather
+from heat_load_calc.inclined_surface_solar_radiation import SolarGeometry
 from heat_load_calc.direction import Direction
 from heat_load_calc.solar_shading import SolarShading
 from heat_load_calc.window import Window
@@ -34,7 +37,8 @@ def get_theta_o_eqv_j_ns_for_external_general_part_and_external_opaque_part(
         eps_r_o_j: float,
         r_s_o_j: float,
         ssp_j: SolarShading,
-        w: Weather
+        w: Weather,
+        sg_j: Optional[SolarGeometry] = None
 ) -> np.ndarray:
     """
     相当外気温度を計算する。
@@ -46,6 +50,7 @@ def get_theta_o_eqv_j_ns_for_external_general_part_and_external_opaque_part(
         r_s_o_j: 境界jの室外側熱伝達抵抗, m2K/W
         ssp_j: 境界jのSolarShadingPartクラス
         w: Weather クラス
+        sg_j: 境界jの方位の SolarGeometry クラス（省略した場合はここで計算する。）
 
     Returns:
         ステップnにおける境界jの相当外気温度, degree C, [N+1]
@@ -53,9 +58,6 @@ def get_theta_o_eqv_j_ns_for_external_general_part_and_external_opaque_part(
         eq.2
     """
 
-    # ステップnにおける境界jの直達日射に対する日よけの影面積比率, -, [N+1]
-    f_ss_dn_j_ns = ssp_j.get_f_ss_dn_j_ns(h_sun_ns=w.h_sun_ns_plus, a_sun_ns=w.a_sun_ns_plus)
-
     # ステップnにおける境界jの天空日射に対する日よけの影面積比率, -
     f_ss_sky_j_ns = ssp_j.get_f_ss_sky_j()
 
@@ -66,23 +68,82 @@ def get_theta_o_eqv_j_ns_for_external_general_part_and_external_opaque_part(
     # ステップnにおける境界jに入射する日射量の天空成分, W/m2, [N+1]
     # ステップnにおける境界jに入射する日射量の地盤反射成分, W/m2 [N+1]
     # ステップnにおける境界jの夜間放射量, W/m2, [N+1]
-    i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, r_s_n_j_ns = inclined_surface_solar_radiation.get_i_s_j_ns(
-        w=w,
-        drct_j=t_drct_j
+    if sg_j is None:
+        sg_j = SolarGeometry.create(w=w, drct_j=t_drct_j)
+    i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, r_s_n_j_ns = sg_j.i_s_dn_j_ns, sg_j.i_s_sky_j_ns, sg_j.i_s_ref_j_ns, sg_j.r_s_n_j_ns
+
+    # 直達日射が当たるステップの番号, [N_sun]
+    ns_sun = inclined_surface_solar_radiation.get_ns_sun(i_s_dn_j_ns=i_s_dn_j_ns)
+
+    # ステップnにおける境界jの直達日射に対する日よけの影面積比率, -, [N+1]
+    # 直達日射が当たるステップについてのみ計算する。
+    f_ss_dn_j_ns = inclined_surface_solar_radiation.expand_ns_sun(
+        v_ns_sun=ssp_j.get_f_ss_dn_j_ns(h_sun_ns=w.h_sun_ns_plus[ns_sun], a_sun_ns=w.a_sun_ns_plus[ns_sun]),
+        ns_sun=ns_sun,
+        n=w.number_of_data_plus
+    )
+
+    return get_theta_o_eqv_js_ns_for_external_general_part_and_external_opaque_part(
+        a_sol_js=a_sol_j,
+        eps_r_o_js=eps_r_o_j,
+        r_s_o_js=r_s_o_j,
+        f_ss_dn_js_ns=f_ss_dn_j_ns,
+        f_ss_sky_js=f_ss_sky_j_ns,
+        f_ss_ref_js=f_ss_ref_j_ns,
+        i_s_dn_js_ns=i_s_dn_j_ns,
+        i_s_sky_js_ns=i_s_sky_j_ns,
+        i_s_ref_js_ns=i_s_ref_j_ns,
+        r_s_n_js_ns=r_s_n_j_ns,
+        w=w
     )
 
-    # ステップnにおける境界jの相当外気温度, ℃, [N+1]
+
+def get_theta_o_eqv_js_ns_for_external_general_part_and_external_opaque_part(
+        a_sol_js: np.ndarray,
+        eps_r_o_js: np.ndarray,
+        r_s_o_js: np.ndarray,
+        f_ss_dn_js_ns: np.ndarray,
+        f_ss_sky_js: np.ndarray,
+        f_ss_ref_js: np.ndarray,
+        i_s_dn_js_ns: np.ndarray,
+        i_s_sky_js_ns: np.ndarray,
+        i_s_ref_js_ns: np.ndarray,
+        r_s_n_js_ns: np.ndarray,
+        w: Weather
+) -> np.ndarray:
+    """
+    一般部位・不透明な開口部の相当外気温度を複数の境界についてまとめて計算する。
+
+    Args:
+        a_sol_js: 境界jの室外側日射吸収率, -, [J, 1]
+        eps_r_o_js: 境界jの室外側長波長放射率, -, [J, 1]
+        r_s_o_js: 境界jの室外側熱伝達抵抗, m2K/W, [J, 1]
+        f_ss_dn_js_ns: ステップnにおける境界jの直達日射に対する日よけの影面積比率, -, [J, N+1]
+        f_ss_sky_js: 境界jの天空日射に対する日よけの影面積比率, -, [J, 1]
+        f_ss_ref_js: 境界jの地面反射日射に対する日よけの影面積比率, -, [J, 1]
+        i_s_dn_js_ns: ステップnにおける境界jに入射する日射量の直達成分, W/m2, [J, N+1]
+        i_s_sky_js_ns: ステップnにおける境界jに入射する日射量の天空成分, W/m2, [J, N+1]
+        i_s_ref_js_ns: ステップnにおける境界jに入射する日射量の地盤反射成分, W/m2, [J, N+1]
+        r_s_n_js_ns: ステップnにおける境界jの夜間放射量, W/m2, [J, N+1]
+        w: Weather クラス
+
+    Returns:
+        ステップnにおける境界jの相当外気温度, degree C, [J, N+1]
+    Notes:
+        eq.2
+        境界が1つの場合は、係数をスカラー、時系列を[N+1]の配列として与えてもよい。
+    """
+
+    # ステップnにおける境界jの相当外気温度, ℃, [J, N+1]
     # 一般部位・不透明な開口部の場合、日射・長波長放射を考慮する。
     # eq.2
-    theta_o_eqv_j_ns = w.theta_o_ns_plus + (
-        a_sol_j * (
-            i_s_dn_j_ns * (1.0 - f_ss_dn_j_ns)
-            + i_s_sky_j_ns * (1.0 - f_ss_sky_j_ns)
-            + i_s_ref_j_ns * (1.0 - f_ss_ref_j_ns)
-        ) - eps_r_o_j * r_s_n_j_ns
-    ) * r_s_o_j
-
-    return theta_o_eqv_j_ns
+    return w.theta_o_ns_plus + (
+        a_sol_js * (
+            i_s_dn_js_ns * (1.0 - f_ss_dn_js_ns)
+            + i_s_sky_js_ns * (1.0 - f_ss_sky_js)
+            + i_s_ref_js_ns * (1.0 - f_ss_ref_js)
+        ) - eps_r_o_js * r_s_n_js_ns
+    ) * r_s_o_js
 
 
 def get_theta_o_eqv_j_ns_for_external_transparent_part(
@@ -92,7 +153,8 @@ def get_theta_o_eqv_j_ns_for_external_transparent_part(
     u_w_std_j: float,
     ssp_j: SolarShading,
     window_j: Window,
-    w: Weather
+    w: Weather,
+    sg_j: Optional[SolarGeometry] = None
 ) -> np.ndarray:
     """
     透明な開口部の場合の相当外気温度を計算する。
@@ -106,6 +168,7 @@ def get_theta_o_eqv_j_ns_for_external_transparent_part(
         ssp_j: SolarShading クラス
         wdw: Window クラス
         w: Weather クラス
+        sg_j: 境界jの方位の SolarGeometry クラス（省略した場合はここで計算する。）
 
     Returns:
         ステップnにおける境界jの相当外気温度, degree C, [N+1]
@@ -113,23 +176,30 @@ def get_theta_o_eqv_j_ns_for_external_transparent_part(
         eq.3~7
     """
 
+    if sg_j is None:
+        sg_j = SolarGeometry.create(w=w, drct_j=t_drct_j)
+
     # ステップ n の境界 j における傾斜面に入射する太陽の入射角, rad, [n]
-    phi_j_ns = inclined_surface_solar_radiation.get_phi_j_ns(
-        h_sun_ns=w.h_sun_ns_plus, a_sun_ns=w.a_sun_ns_plus, drct_j=t_drct_j)
+    phi_j_ns = sg_j.phi_j_ns
 
     # ステップnにおける境界jに入射する日射量の直達成分, W / m2, [n]
     # ステップnにおける境界jに入射する日射量の天空成分, W / m2, [n]
     # ステップnにおける境界jに入射する日射量の地盤反射成分, W / m2, [n]
     # ステップnにおける境界jの夜間放射量, W/m2, [n]
-    i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, r_s_n_j_ns = inclined_surface_solar_radiation.get_i_s_j_ns(
-        w=w,
-        drct_j=t_drct_j
-    )
+    i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, r_s_n_j_ns = sg_j.i_s_dn_j_ns, sg_j.i_s_sky_j_ns, sg_j.i_s_ref_j_ns, sg_j.r_s_n_j_ns
+
+    # 直達日射が当たるステップの番号, [N_sun]
+    # 直達日射に対する値は、直達日射が当たるステップについてのみ計算する。
+    ns_sun = inclined_surface_solar_radiation.get_ns_sun(i_s_dn_j_ns=i_s_dn_j_ns)
 
     # ---日よけの影面積比率
 
     # ステップ n における境界ｊの直達日射に対する日よけの影面積比率, [N+1]
-    f_ss_d_j_ns = ssp_j.get_f_ss_dn_j_ns(h_sun_ns=w.h_sun_ns_plus, a_sun_ns=w.a_sun_ns_plus)
+    f_ss_d_j_ns = inclined_surface_solar_radiation.expand_ns_sun(
+        v_ns_sun=ssp_j.get_f_ss_dn_j_ns(h_sun_ns=w.h_sun_ns_plus[ns_sun], a_sun_ns=w.a_sun_ns_plus[ns_sun]),
+        ns_sun=ns_sun,
+        n=w.number_of_data_plus
+    )
 
     # 天空日射に対する日よけの影面積比率
     f_ss_s_j_ns = ssp_j.get_f_ss_sky_j()
@@ -139,7 +209,11 @@ def get_theta_o_eqv_j_ns_for_external_transparent_part(
 
     # ステップ n における境界ｊの開口部の直達日射に対する吸収日射熱取得率, -, [N+1]
     # b_w_d_j_ns = window.get_alpha_w_j_n(phi_ns=theta_aoi_j_ns)
-    b_w_d_j_ns = window_j.get_b_w_d_j_ns(phi_j_ns=phi_j_ns)
+    b_w_d_j_ns = inclined_surface_solar_radiation.expand_ns_sun(
+        v_ns_sun=window_j.get_b_w_d_j_ns(phi_j_ns=phi_j_ns[ns_sun]),
+        ns_sun=ns_sun,
+        n=w.number_of_data_plus
+    )
 
     # 境界 ｊ　の開口部の天空日射に対する吸収日射熱取得率, -
     # b_w_s_j = window.alpha_w_s_j
@@ -149,26 +223,86 @@ def get_theta_o_eqv_j_ns_for_external_transparent_part(
     # b_w_r_j = window.alpha_w_r_j
     b_w_r_j = window_j.b_w_r_j
 
-    # 直達日射に起因する吸収日射熱取得量, W/m2, [N+1]
+    return get_theta_o_eqv_js_ns_for_external_transparent_part(
+        eps_r_o_js=eps_r_o_j,
+        r_s_o_js=r_s_o_j,
+        u_w_std_js=u_w_std_j,
+        f_ss_dn_js_ns=f_ss_d_j_ns,
+        f_ss_sky_js=f_ss_s_j_ns,
+        f_ss_ref_js=f_ss_r_j_ns,
+        b_w_d_js_ns=b_w_d_j_ns,
+        b_w_s_js=b_w_s_j,
+        b_w_r_js=b_w_r_j,
+        i_s_dn_js_ns=i_s_dn_j_ns,
+        i_s_sky_js_ns=i_s_sky_j_ns,
+        i_s_ref_js_ns=i_s_ref_j_ns,
+        r_s_n_js_ns=r_s_n_j_ns,
+        w=w
+    )
+
+
+def get_theta_o_eqv_js_ns_for_external_transparent_part(
+        eps_r_o_js: np.ndarray,
+        r_s_o_js: np.ndarray,
+        u_w_std_js: np.ndarray,
+        f_ss_dn_js_ns: np.ndarray,
+        f_ss_sky_js: np.ndarray,
+        f_ss_ref_js: np.ndarray,
+        b_w_d_js_ns: np.ndarray,
+        b_w_s_js: np.ndarray,
+        b_w_r_js: np.ndarray,
+        i_s_dn_js_ns: np.ndarray,
+        i_s_sky_js_ns: np.ndarray,
+        i_s_ref_js_ns: np.ndarray,
+        r_s_n_js_ns: np.ndarray,
+        w: Weather
+) -> np.ndarray:
+    """
+    透明な開口部の相当外気温度を複数の境界についてまとめて計算する。
+
+    Args:
+        eps_r_o_js: 境界jの室外側長波長放射率, -, [J, 1]
+        r_s_o_js: 境界jの室外側熱伝達抵抗, m2K/W, [J, 1]
+        u_w_std_js: 境界jの熱貫流率, W/m2K, [J, 1]
+        f_ss_dn_js_ns: ステップnにおける境界jの直達日射に対する日よけの影面積比率, -, [J, N+1]
+        f_ss_sky_js: 境界jの天空日射に対する日よけの影面積比率, -, [J, 1]
+        f_ss_ref_js: 境界jの地面反射日射に対する日よけの影面積比率, -, [J, 1]
+        b_w_d_js_ns: ステップnにおける境界jの開口部の直達日射に対する吸収日射熱取得率, -, [J, N+1]
+        b_w_s_js: 境界jの開口部の天空日射に対する吸収日射熱取得率, -, [J, 1]
+        b_w_r_js: 境界jの開口部の地盤反射日射に対する吸収日射熱取得率, -, [J, 1]
+        i_s_dn_js_ns: ステップnにおける境界jに入射する日射量の直達成分, W/m2, [J, N+1]
+        i_s_sky_js_ns: ステップnにおける境界jに入射する日射量の天空成分, W/m2, [J, N+1]
+        i_s_ref_js_ns: ステップnにおける境界jに入射する日射量の地盤反射成分, W/m2, [J, N+1]
+        r_s_n_js_ns: ステップnにおける境界jの夜間放射量, W/m2, [J, N+1]
+        w: Weather クラス
+
+    Returns:
+        ステップnにおける境界jの相当外気温度, degree C, [J, N+1]
+    Notes:
+        eq.3~7
+        境界が1つの場合は、係数をスカラー、時系列を[N+1]の配列として与えてもよい。
+    """
+
+    # 直達日射に起因する吸収日射熱取得量, W/m2, [J, N+1]
     # eq.5
-    q_b_dn_j_ns = b_w_d_j_ns * (1.0 - f_ss_d_j_ns) * i_s_dn_j_ns
+    q_b_dn_js_ns = b_w_d_js_ns * (1.0 - f_ss_dn_js_ns) * i_s_dn_js_ns
 
-    # 天空日射に起因する吸収日射熱取得量, W/m2, [N+1]
+    # 天空日射に起因する吸収日射熱取得量, W/m2, [J, N+1]
     # eq.6
-    q_b_sky_j_ns = b_w_s_j * (1.0 - f_ss_s_j_ns) * i_s_sky_j_ns
+    q_b_sky_js_ns = b_w_s_js * (1.0 - f_ss_sky_js) * i_s_sky_js_ns
 
-    # 地盤反射日射に起因する吸収日射熱取得量, W/m2, [N+1]
+    # 地盤反射日射に起因する吸収日射熱取得量, W/m2, [J, N+1]
     # eq.7
-    q_b_ref_j_ns = b_w_r_j * (1.0 - f_ss_r_j_ns) * i_s_ref_j_ns
+    q_b_ref_js_ns = b_w_r_js * (1.0 - f_ss_ref_js) * i_s_ref_js_ns
 
-    # 吸収日射熱取得量, W/m2, [N+1]
+    # 吸収日射熱取得量, W/m2, [J, N+1]
     # eq.4
-    q_b_all_j_ns = (q_b_dn_j_ns + q_b_sky_j_ns + q_b_ref_j_ns)
+    q_b_all_js_ns = (q_b_dn_js_ns + q_b_sky_js_ns + q_b_ref_js_ns)
 
-    # 室iの境界jの傾斜面のステップnにおける相当外気温度, ℃, [N+1]
+    # 境界jの傾斜面のステップnにおける相当外気温度, ℃, [J, N+1]
     # 透明な開口部の場合、透過日射はガラス面への透過の項で扱うため、ここでは吸収日射、長波長放射のみ考慮する。
     # eq.3
-    return w.theta_o_ns_plus - eps_r_o_j * r_s_n_j_ns * r_s_o_j + q_b_all_j_ns / u_w_std_j
+    return w.theta_o_ns_plus - eps_r_o_js * r_s_n_js_ns * r_s_o_js + q_b_all_js_ns / u_w_std_js
 
 
 def get_theta_o_eqv_j_ns_for_external_not_sun_striked(w: Weather) -> np.ndarray:
@@ -5,6 +5,8 @@ from heat_load_calc.input_models.input_calculation_day import InputCalculationDa
 N_D_MAIN_DEFAULT = 365              # 365 days
 N_D_RUN_UP_DEFAULT = 365            # 365 days
 N_D_RUN_UP_BUILD_DEFAULT = 183      # 183 days
+N_D_RUN_UP_BUILD_MIN = 2            # 2 days (minimum number of days of the adaptive run-up)
+TOL_Q_RUN_UP_DEFAULT = 0.1          # 0.1 W/m2
 
 
 def get_n_step(itv: Interval, ipt_calculation_day: InputCalculationDay = None) -> tuple[int, int, int]:
@@ -60,6 +62,26 @@ def get_n_step(itv: Interval, ipt_calculation_day: InputCalculationDay = None) -
     return n_step_main, n_step_run_up, n_step_run_up_build
 
 
+def get_tol_run_up(ipt_calculation_day: InputCalculationDay = None) -> tuple[float, float] | None:
+    """Get the tolerances to judge the convergence of the run-up calculation of the building.
+
+    Args:
+        ipt_calculation_day: InputcalculationDay Class
+
+    Returns:
+        (1) tolerance of the temperatures, K
+        (2) tolerance of the surface heat flux, W/m2
+        None means that the building is calculated for the specified number of days in the run-up calculation.
+    """
+
+    if ipt_calculation_day is None or ipt_calculation_day.tol_theta_run_up is None:
+        return None
+
+    tol_q_run_up = ipt_calculation_day.tol_q_run_up if ipt_calculation_day.tol_q_run_up is not None else TOL_Q_RUN_UP_DEFAULT
+
+    return ipt_calculation_day.tol_theta_run_up, tol_q_run_up
+
+
 def _get_n_step_main(n_hour: int, n_d_main: int) -> int:
     """calculate the number of steps for main calculation
 
@@ -1,8 +1,10 @@
+import os
+import json
 import numpy as np
 import pandas as pd
 import datetime as dt
 import itertools
-from typing import List
+from typing import List, Dict, Tuple, Optional
 
 from heat_load_calc import pmv as pmv, psychrometrics as psy
 from heat_load_calc.interval import EInterval, Interval
@@ -33,7 +35,74 @@ class Recorder:
     # 本負荷計算に年の概念は無いが、便宜上1989年として記録する。（閏年でなければ、任意）
     YEAR = '1989'
 
-    def __init__(self, n_step_main: int, id_rm_is: List[int], id_bs_js: List[int], itv: Interval = Interval(eitv=EInterval.M15)):
+    # pre_recording で事前に記録する値
+    _PRE_RECORDED = [
+        'theta_o_ns', 'x_o_ns', 'q_trs_sol_is_ns', 'q_sol_frt_is_ns', 'q_i_sol_s_ns_js', 'h_s_c_js_ns', 'h_s_r_js_ns',
+        'ac_demand_is_ns', 'q_gen_is_ns', 'x_gen_is_ns'
+    ]
+
+    # recording でステップごとに記録する値（瞬時値）と recording の引数名
+    _RECORDED_I = [
+        # 次の時刻に引き渡す値
+        ('theta_r_is_ns', 'theta_r_is_n_pls'),
+        ('theta_mrt_hum_is_ns', 'theta_mrt_hum_is_n_pls'),
+        ('x_r_is_ns', 'x_r_is_n_pls'),
+        ('theta_frt_is_ns', 'theta_frt_is_n_pls'),
+        ('x_frt_is_ns', 'x_frt_is_n_pls'),
+        ('theta_ei_js_ns', 'theta_ei_js_n_pls'),
+        ('q_s_js_ns', 'q_s_js_n_pls'),
+        # 次の時刻に引き渡さない値
+        ('theta_ot', 'theta_ot_is_n_pls'),
+        ('theta_s_js_ns', 'theta_s_js_n_pls'),
+        ('theta_rear_js_ns', 'theta_rear_js_n'),
+        ('f_cvl_js_ns', 'f_cvl_js_n_pls')
+    ]
+
+    # recording でステップごとに記録する値（平均値・積算値）と recording の引数名
+    _RECORDED_A = [
+        # 次の時刻に引き渡す値
+        ('operation_mode_is_ns', 'operation_mode_is_n'),
+        # 次の時刻に引き渡さない値
+        # 積算値
+        ('l_cs_is_ns', 'l_cs_is_n'),
+        ('l_rs_is_ns', 'l_rs_is_n'),
+        ('l_cl_is_ns', 'l_cl_is_n'),
+        # 平均値
+        ('h_hum_c_is_ns', 'h_hum_c_is_n'),
+        ('h_hum_r_is_ns', 'h_hum_r_is_n'),
+        ('q_hum_is_ns', 'q_hum_is_n'),
+        ('x_hum_is_ns', 'x_hum_is_n'),
+        ('v_reak_is_ns', 'v_leak_is_n'),
+        ('v_ntrl_is_ns', 'v_vent_ntr_is_n')
+    ]
+
+    # post_recording で計算する値（瞬時値）
+    _POST_RECORDED_I = ['rh_r_is_ns', 'q_r_js_ns', 'q_c_js_ns', 'pmv_is_ns', 'ppd_is_ns']
+
+    # post_recording で計算する値（平均値・積算値）
+    _POST_RECORDED_A = ['q_frt_is_ns', 'q_l_frt_is_ns', 'clo_is_ns', 'v_hum_is_ns']
+
+    # post_recording で計算する値の計算に必要な値
+    _DEPENDENCIES = {
+        'rh_r_is_ns': ['theta_r_is_ns', 'x_r_is_ns'],
+        'q_r_js_ns': ['theta_s_js_ns'],
+        'q_c_js_ns': ['theta_r_is_ns', 'theta_s_js_ns'],
+        'pmv_is_ns': ['theta_r_is_ns', 'x_r_is_ns', 'theta_mrt_hum_is_ns', 'clo_is_ns', 'v_hum_is_ns'],
+        'ppd_is_ns': ['pmv_is_ns'],
+        'q_frt_is_ns': ['theta_r_is_ns', 'theta_frt_is_ns'],
+        'q_l_frt_is_ns': ['x_r_is_ns', 'x_frt_is_ns'],
+        'clo_is_ns': ['operation_mode_is_ns'],
+        'v_hum_is_ns': ['operation_mode_is_ns']
+    }
+
+    def __init__(
+            self,
+            n_step_main: int,
+            id_rm_is: List[int],
+            id_bs_js: List[int],
+            itv: Interval = Interval(eitv=EInterval.M15),
+            output_names: Optional[List[str]] = None
+    ):
         """
         ロギング用に numpy の配列を用意する。
 
@@ -42,9 +111,14 @@ class Recorder:
             id_rm_is: 室のid, [i]
             id_bs_js: 境界のid, [j]
             itv: インターバルクラス
+            output_names: 出力する項目の出力名（"out_temp", "t_r", "l_s_c" 等）のリスト（None の場合はすべての項目を出力する）
 
+        Notes:
+            出力しない項目の配列は、他の出力する項目の計算に必要な場合を除き、確保・記録・計算しない。
         """
 
+        self._set_output_list(output_names=output_names)
+
         # インターバル
         self._itv = itv
 
@@ -68,133 +142,150 @@ class Recorder:
         # 平均・積算値の行数
         self._n_step_a = n_step_main
 
+        # 1/1 0:00 の瞬時値（出力しない項目を含む recording の引数名をキーとする）, [i, 1] or [j, 1]
+        # 助走計算の後の状態値を保存する際に、出力する項目によらず同じ値を保存するために記録する。
+        self._first_values_i: Dict[str, np.ndarray] = {}
+
         # ---瞬時値---
 
         # 室に関するもの
 
         # ステップ n における外気温度, degree C, [n+1], 出力名："out_temp"
-        self.theta_o_ns = np.empty(shape=self._n_step_i, dtype=float)
+        self.theta_o_ns = self._allocate(name='theta_o_ns', shape=self._n_step_i, dtype=float)
 
         # ステップ n における外気絶対湿度, kg/kg(DA), [n+1], 出力名："out_abs_humid"
-        self.x_o_ns = np.empty(shape=self._n_step_i, dtype=float)
+        self.x_o_ns = self._allocate(name='x_o_ns', shape=self._n_step_i, dtype=float)
 
         # ステップ　n　における室　i　の室温, degree C, [i, n+1], 出力名："rm[i]_t_r"
-        self.theta_r_is_ns = np.empty(shape=(n_rm, self._n_step_i), dtype=float)
+        self.theta_r_is_ns = self._allocate(name='theta_r_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n における室 i の相対湿度, %, [i, n+1], 出力名："rm[i]_rh_r"
-        self.rh_r_is_ns = np.empty(shape=(n_rm, self._n_step_i), dtype=float)
+        self.rh_r_is_ns = self._allocate(name='rh_r_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n における室 i の絶対湿度, kg/kgDA, [i, n+1], 出力名："rm[i]_x_r"
-        self.x_r_is_ns = np.empty(shape=(n_rm, self._n_step_i), dtype=float)
+        self.x_r_is_ns = self._allocate(name='x_r_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n における室 i の平均放射温度, degree C, [i, n+1], 出力名："rm[i]_mrt"
-        self.theta_mrt_hum_is_ns = np.empty(shape=(n_rm, self._n_step_i), dtype=float)
+        self.theta_mrt_hum_is_ns = self._allocate(name='theta_mrt_hum_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n における室 i の作用温度, degree C, [i, n+1], 出力名："rm[i]_ot"
-        self.theta_ot = np.empty(shape=(n_rm, self._n_step_i), dtype=float)
+        self.theta_ot = self._allocate(name='theta_ot', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n における室 i の窓の透過日射熱取得, W, [i, n+1], 出力名："rm[i]_q_sol_t"
-        self.q_trs_sol_is_ns = np.empty(shape=(n_rm, self._n_step_i), dtype=float)
+        self.q_trs_sol_is_ns = self._allocate(name='q_trs_sol_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n の室 i における家具の温度, degree C, [i, n+1], 出力名："rm[i]_t_fun"
-        self.theta_frt_is_ns = np.empty((n_rm, self._n_step_i), dtype=float)
+        self.theta_frt_is_ns = self._allocate(name='theta_frt_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n の室 i における家具吸収日射熱量, W, [i, n+1], 出力名："rm[i]_q_s_sol_fun"
-        self.q_sol_frt_is_ns = np.empty((n_rm, self._n_step_i), dtype=float)
+        self.q_sol_frt_is_ns = self._allocate(name='q_sol_frt_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n の室 i における家具の絶対湿度, kg/kgDA, [i, n+1], 出力名："rm[i]_x_fun"
-        self.x_frt_is_ns = np.empty((n_rm, self._n_step_i), dtype=float)
+        self.x_frt_is_ns = self._allocate(name='x_frt_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n の室 i におけるPMV実現値, [i, n+1], 出力名："rm[i]_pmv"
-        self.pmv_is_ns = np.empty((n_rm, self._n_step_i), dtype=float)
+        self.pmv_is_ns = self._allocate(name='pmv_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # ステップ n の室 i におけるPPD実現値, [i, n+1], 出力名："rm[i]_ppd"
-        self.ppd_is_ns = np.empty((n_rm, self._n_step_i), dtype=float)
+        self.ppd_is_ns = self._allocate(name='ppd_is_ns', shape=(n_rm, self._n_step_i), dtype=float)
 
         # 境界に関するもの
 
         # ステップ n の境界 j の室内側表面温度, degree C, [j, n+1], 出力名:"rm[i]_b[j]_t_s
-        self.theta_s_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.theta_s_js_ns = self._allocate(name='theta_s_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の等価温度, degree C, [j, n+1], 出力名:"rm[i]_b[j]_t_e
-        self.theta_ei_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.theta_ei_js_ns = self._allocate(name='theta_ei_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の裏面温度, degree C, [j, n+1], 出力名:"rm[i]_b[j]_t_b
-        self.theta_rear_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.theta_rear_js_ns = self._allocate(name='theta_rear_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の表面放射熱伝達率, W/m2K, [j, n+1], 出力名:"rm[i]_b[j]_hir_s
-        self.h_s_r_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.h_s_r_js_ns = self._allocate(name='h_s_r_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の表面放射熱流, W, [j, n+1], 出力名:"rm[i]_b[j]_qir_s
-        self.q_r_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.q_r_js_ns = self._allocate(name='q_r_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の表面対流熱伝達率, W/m2K, [j, n+1], 出力名:"rm[i]_b[j]_hic_s
-        self.h_s_c_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.h_s_c_js_ns = self._allocate(name='h_s_c_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の表面対流熱流, W, [j, n+1], 出力名:"rm[i]_b[j]_qic_s
-        self.q_c_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.q_c_js_ns = self._allocate(name='q_c_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の表面日射熱流, W, [j, n+1], 出力名:"rm[i]_b[j]_qisol_s
-        self.q_i_sol_s_ns_js = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.q_i_sol_s_ns_js = self._allocate(name='q_i_sol_s_ns_js', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の表面日射熱流, W, [j, n+1], 出力名:"rm[i]_b[j]_qiall_s
-        self.q_s_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.q_s_js_ns = self._allocate(name='q_s_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ステップ n の境界 j の係数cvl, degree C, [j, n+1], 出力名:"rm[i]_b[j]_cvl
-        self.f_cvl_js_ns = np.zeros((n_bs, self._n_step_i), dtype=float)
+        self.f_cvl_js_ns = self._allocate(name='f_cvl_js_ns', shape=(n_bs, self._n_step_i), dtype=float)
 
         # ---積算値---
 
         # ステップ n における室 i の運転状態（平均値）, [i, n], 出力名："rm[i]_ac_operate"
-        self.operation_mode_is_ns = np.empty(shape=(n_rm, self._n_step_a), dtype=object)
+        # 運転モードの値（OperationMode.value）で記録し、出力時に列挙体 OperationMode に変換する。
+        self.operation_mode_is_ns = self._allocate(name='operation_mode_is_ns', shape=(n_rm, self._n_step_a), dtype=np.int8)
 
         # ステップ n における室 i の空調需要（平均値）, [i, n], 出力名："rm[i]_occupancy"
-        self.ac_demand_is_ns = np.empty(shape=(n_rm, self._n_step_a), dtype=float)
+        self.ac_demand_is_ns = self._allocate(name='ac_demand_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n における室 i の人体周辺対流熱伝達率（平均値）, W/m2K, [i, n], 出力名："rm[i]_hc_hum"
-        self.h_hum_c_is_ns = np.empty(shape=(n_rm, self._n_step_a), dtype=float)
+        self.h_hum_c_is_ns = self._allocate(name='h_hum_c_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n における室 i の人体放射熱伝達率（平均値）, W/m2K, [i, n], 出力名："rm[i]_hr_hum"
-        self.h_hum_r_is_ns = np.empty(shape=(n_rm, self._n_step_a), dtype=float)
+        self.h_hum_r_is_ns = self._allocate(name='h_hum_r_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における人体発熱を除く内部発熱, W, [i, n], 出力名："rm[i]_q_s_except_hum"
-        self.q_gen_is_ns = np.empty(shape=(n_rm, self._n_step_a), dtype=float)
+        self.q_gen_is_ns = self._allocate(name='q_gen_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における人体発湿を除く内部発湿, kg/s, [i, n], 出力名："rm[i]_q_l_except_hum"
-        self.x_gen_is_ns = np.empty(shape=(n_rm, self._n_step_a), dtype=float)
+        self.x_gen_is_ns = self._allocate(name='x_gen_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における人体発熱, W, [i, n], 出力名："rm[i]_q_hum_s"
-        self.q_hum_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.q_hum_is_ns = self._allocate(name='q_hum_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における人体発湿, kg/s, [i, n], 出力名："rm[i]_q_hum_l"
-        self.x_hum_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.x_hum_is_ns = self._allocate(name='x_hum_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における対流空調顕熱負荷, W, [i, n], 出力名："rm[i]_l_s_c"
-        self.l_cs_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.l_cs_is_ns = self._allocate(name='l_cs_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における放射空調顕熱負荷, W, [i, n], 出力名："rm[i]_l_s_r"
-        self.l_rs_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.l_rs_is_ns = self._allocate(name='l_rs_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における対流空調潜熱負荷（加湿側を正とする）, W, [i, n], 出力名："rm[i]_l_l_c"
-        self.l_cl_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.l_cl_is_ns = self._allocate(name='l_cl_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における家具取得熱量, W, [i, n], 出力名："rm[i]_q_s_fun"
-        self.q_frt_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.q_frt_is_ns = self._allocate(name='q_frt_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における家具取得水蒸気量, kg/s, [i, n], 出力名："rm[i]_q_l_fun"
-        self.q_l_frt_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.q_l_frt_is_ns = self._allocate(name='q_l_frt_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i におけるすきま風量, m3/s, [i, n], 出力名："rm[i]_v_reak"
-        self.v_reak_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.v_reak_is_ns = self._allocate(name='v_reak_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i における自然換気量, m3/s, [i, n], 出力名："rm[i]_v_ntrl"
-        self.v_ntrl_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.v_ntrl_is_ns = self._allocate(name='v_ntrl_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ　n　の室　i　における人体廻りの風速, m/s, [i, n], 出力名："rm[i]_v_hum"
-        self.v_hum_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.v_hum_is_ns = self._allocate(name='v_hum_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
 
         # ステップ n の室 i におけるClo値, [i, n], 出力名："rm[i]_clo"
-        self.clo_is_ns = np.zeros((n_rm, self._n_step_a), dtype=float)
+        self.clo_is_ns = self._allocate(name='clo_is_ns', shape=(n_rm, self._n_step_a), dtype=float)
+
+    def _set_output_list(self, output_names: Optional[List[str]]):
+        """出力する項目のリストと、記録・計算する値の集合を設定する。
+
+        Args:
+            output_names: 出力する項目の出力名のリスト（None の場合はすべての項目を出力する）
+        """
+
+        self._output_list_outside_i = [
+            ('theta_o_ns', 'out_temp'),
+            ('x_o_ns', 'out_abs_humid')
+        ]
 
         self._output_list_room_a = [
             ('operation_mode_is_ns', 'ac_operate'),
@@ -243,6 +334,59 @@ class Recorder:
             ('f_cvl_js_ns', 'f_cvl')
         ]
 
+        if output_names is not None:
+
+            all_names = [
+                column[1] for column in self._output_list_outside_i + self._output_list_room_i
+                + self._output_list_boundary_i + self._output_list_room_a
+            ]
+
+            for output_name in output_names:
+                if output_name not in all_names:
+                    raise ValueError('出力名 `{}` は存在しません。'.format(output_name))
+
+            self._output_list_outside_i = [c for c in self._output_list_outside_i if c[1] in output_names]
+            self._output_list_room_i = [c for c in self._output_list_room_i if c[1] in output_names]
+            self._output_list_boundary_i = [c for c in self._output_list_boundary_i if c[1] in output_names]
+            self._output_list_room_a = [c for c in self._output_list_room_a if c[1] in output_names]
+
+        # 出力する値と、その計算に必要な値
+        required = set(
+            column[0] for column in self._output_list_outside_i + self._output_list_room_i
+            + self._output_list_boundary_i + self._output_list_room_a
+        )
+
+        names = list(required)
+
+        while len(names) > 0:
+            for dependency in self._DEPENDENCIES.get(names.pop(), []):
+                if dependency not in required:
+                    required.add(dependency)
+                    names.append(dependency)
+
+        self._required = required
+
+        # recording でステップごとに記録する値のうち、記録が必要な値
+        self._recorded_i = [column for column in self._RECORDED_I if column[0] in required]
+        self._recorded_a = [column for column in self._RECORDED_A if column[0] in required]
+
+    def _allocate(self, name: str, shape, dtype) -> Optional[np.ndarray]:
+        """記録・計算する値の配列を確保する。
+
+        Args:
+            name: 値の名前
+            shape: 配列の形状
+            dtype: 配列の型
+
+        Returns:
+            記録・計算しない値の場合は None
+        """
+
+        if name in self._required:
+            return np.zeros(shape=shape, dtype=dtype)
+        else:
+            return None
+
     def pre_recording(
             self,
             weather: Weather,
@@ -258,97 +402,122 @@ class Recorder:
         # ---瞬時値---
 
         # ステップ n における外気温度, ℃, [n+1]
-        self.theta_o_ns = weather.theta_o_ns_plus[0: self._n_step_i]
+        if 'theta_o_ns' in self._required:
+            self.theta_o_ns = weather.theta_o_ns_plus[0: self._n_step_i]
 
         # ステップ n における外気絶対湿度, kg/kg(DA), [n+1]
-        self.x_o_ns = weather.x_o_ns_plus[0: self._n_step_i]
+        if 'x_o_ns' in self._required:
+            self.x_o_ns = weather.x_o_ns_plus[0: self._n_step_i]
 
         # ステップ n における室 i の窓の透過日射熱取得, W, [i, n+1]
-        self.q_trs_sol_is_ns = q_trs_sol_is_ns[:, 0:self._n_step_i]
+        if 'q_trs_sol_is_ns' in self._required:
+            self.q_trs_sol_is_ns = q_trs_sol_is_ns[:, 0:self._n_step_i]
 
         # ステップ n における室 i に設置された備品等による透過日射吸収熱量, W, [i, n+1]
-        self.q_sol_frt_is_ns = q_sol_frt_is_ns[:, 0:self._n_step_i]
+        if 'q_sol_frt_is_ns' in self._required:
+            self.q_sol_frt_is_ns = q_sol_frt_is_ns[:, 0:self._n_step_i]
 
         # ステップ n の境界 j の表面日射熱流, W, [j, n+1]
-        self.q_i_sol_s_ns_js = q_s_sol_js_ns[:, 0:self._n_step_i] * bs.a_s_js
+        if 'q_i_sol_s_ns_js' in self._required:
+            self.q_i_sol_s_ns_js = q_s_sol_js_ns[:, 0:self._n_step_i] * bs.a_s_js
 
         # ステップ n の境界 j の表面対流熱伝達率, W/m2K, [j, n+1]
-        self.h_s_c_js_ns = bs.h_s_c_js.repeat(self._n_step_i, axis=1)
+        if 'h_s_c_js_ns' in self._required:
+            self.h_s_c_js_ns = bs.h_s_c_js.repeat(self._n_step_i, axis=1)
 
         # ステップ n の境界 j の表面放射熱伝達率, W/m2K, [j, n+1]
-        self.h_s_r_js_ns = bs.h_s_r_js.repeat(self._n_step_i, axis=1)
+        if 'h_s_r_js_ns' in self._required:
+            self.h_s_r_js_ns = bs.h_s_r_js.repeat(self._n_step_i, axis=1)
 
         # ---平均値・積算値---
 
         # ステップ n の室 i における当該時刻の空調需要, [i, n_step_a]
-        self.ac_demand_is_ns = scd.r_ac_demand_is_ns[:, 0:self._n_step_a]
+        if 'ac_demand_is_ns' in self._required:
+            self.ac_demand_is_ns = scd.r_ac_demand_is_ns[:, 0:self._n_step_a]
 
         # ステップnの室iにおける人体発熱を除く内部発熱, W, [i, n_step_a]
-        self.q_gen_is_ns = scd.q_gen_is_ns[:, 0:self._n_step_a]
+        if 'q_gen_is_ns' in self._required:
+            self.q_gen_is_ns = scd.q_gen_is_ns[:, 0:self._n_step_a]
 
         # ステップ n の室 i における人体発湿を除く内部発湿, kg/s, [i, n_step_a]
-        self.x_gen_is_ns = scd.x_gen_is_ns[:, 0:self._n_step_a]
+        if 'x_gen_is_ns' in self._required:
+            self.x_gen_is_ns = scd.x_gen_is_ns[:, 0:self._n_step_a]
 
     def post_recording(self, rms: Rooms, bs: Boundaries, f_mrt_is_js: np.ndarray, es: Equipments):
 
+        required = self._required
+
         # ---瞬時値---
 
-        # ステップ n の室 i における飽和水蒸気圧, Pa, [i, n+1]
-        p_vs_is_ns = psy.get_p_vs(theta=self.theta_r_is_ns)
+        if ('rh_r_is_ns' in required) or ('pmv_is_ns' in required):
+
+            # ステップ n における室 i の水蒸気圧, Pa, [i, n+1]
+            p_v_is_ns = psy.get_p_v_r_is_n(x_r_is_n=self.x_r_is_ns)
 
-        # ステップ n における室 i の水蒸気圧, Pa, [i, n+1]
-        p_v_is_ns = psy.get_p_v_r_is_n(x_r_is_n=self.x_r_is_ns)
+        if 'rh_r_is_ns' in required:
 
-        # ステップnの室iにおける相対湿度, %, [i, n+1]
-        self.rh_r_is_ns = psy.get_h(p_v=p_v_is_ns, p_vs=p_vs_is_ns)
+            # ステップ n の室 i における飽和水蒸気圧, Pa, [i, n+1]
+            p_vs_is_ns = psy.get_p_vs(theta=self.theta_r_is_ns)
+
+            # ステップnの室iにおける相対湿度, %, [i, n+1]
+            self.rh_r_is_ns = psy.get_h(p_v=p_v_is_ns, p_vs=p_vs_is_ns)
 
         # ステップnの境界jにおける表面熱流（壁体吸熱を正とする）のうち放射成分, W, [j, n]
-        self.q_r_js_ns = bs.h_s_r_js * bs.a_s_js * (np.dot(np.dot(bs.p_js_is, f_mrt_is_js), self.theta_s_js_ns) - self.theta_s_js_ns)
+        if 'q_r_js_ns' in required:
+            self.q_r_js_ns = bs.h_s_r_js * bs.a_s_js * (np.dot(np.dot(bs.p_js_is, f_mrt_is_js), self.theta_s_js_ns) - self.theta_s_js_ns)
 
         # ステップnの境界jにおける表面熱流（壁体吸熱を正とする）のうち対流成分, W, [j, n+1]
-        self.q_c_js_ns = bs.h_s_c_js * bs.a_s_js * (np.dot(bs.p_js_is, self.theta_r_is_ns) - self.theta_s_js_ns)
+        if 'q_c_js_ns' in required:
+            self.q_c_js_ns = bs.h_s_c_js * bs.a_s_js * (np.dot(bs.p_js_is, self.theta_r_is_ns) - self.theta_s_js_ns)
 
         # ---平均値・瞬時値---
 
         # ステップnの室iにおける家具取得熱量, W, [i, n]
         # ステップ n+1 の温度を用いてステップ n からステップ n+1 の平均的な熱流を求めている（後退差分）
-        self.q_frt_is_ns = np.delete(rms.g_sh_frt_is * (self.theta_r_is_ns - self.theta_frt_is_ns), 0, axis=1)
+        if 'q_frt_is_ns' in required:
+            self.q_frt_is_ns = np.delete(rms.g_sh_frt_is * (self.theta_r_is_ns - self.theta_frt_is_ns), 0, axis=1)
 
         # ステップ n の室 i の家具等から空気への水分流, kg/s, [i, n]
         # ステップ n+1 の湿度を用いてステップ n からステップ n+1 の平均的な水分流を求めている（後退差分）
-        self.q_l_frt_is_ns = np.delete(rms.g_lh_frt_is * (self.x_r_is_ns - self.x_frt_is_ns), 0, axis=1)
+        if 'q_l_frt_is_ns' in required:
+            self.q_l_frt_is_ns = np.delete(rms.g_lh_frt_is * (self.x_r_is_ns - self.x_frt_is_ns), 0, axis=1)
 
-        self.clo_is_ns = operation_mode._get_clo_is_ns(operation_mode_is_n=self.operation_mode_is_ns)
+        if 'clo_is_ns' in required:
+            self.clo_is_ns = operation_mode._get_clo_is_ns(operation_mode_is_n=self.operation_mode_is_ns)
 
-        # ステップ n+1 のPMVを計算するのに、ステップ n からステップ n+1 のClo値を用いる。
-        # 現在、Clo値の配列数が1つ多いバグがあるため、適切な長さになるようにスライスしている。
-        # TODO: 本来であれば、助走期間における、n=-1 の時の値を用いないといけないが、とりあえず、配列最後の値を先頭に持ってきて代用している。
-        clo_pls = np.append(self.clo_is_ns[:, -1:], self.clo_is_ns, axis=1)[:, 0:self._n_step_i]
+        if 'v_hum_is_ns' in required:
+            self.v_hum_is_ns = operation_mode._get_v_hum_is_n(
+                operation_mode_is=self.operation_mode_is_ns,
+                is_radiative_cooling_is=es.is_radiative_cooling_is,
+                is_radiative_heating_is=es.is_radiative_heating_is
+            )
 
-        self.v_hum_is_ns = operation_mode._get_v_hum_is_n(
-            operation_mode_is=self.operation_mode_is_ns,
-            is_radiative_cooling_is=es.is_radiative_cooling_is,
-            is_radiative_heating_is=es.is_radiative_heating_is
-        )
+        # ---瞬時値---
 
-        # ステップ n+1 のPMVを計算するのに、ステップ n からステップ n+1 の人体周りの風速を用いる。
-        # TODO: 本来であれば、助走期間における、n=-1 の時の値を用いないといけないが、とりあえず、配列最後の値を先頭に持ってきて代用している。
-        v_hum_pls = np.append(self.v_hum_is_ns[:, -1:], self.v_hum_is_ns, axis=1)
+        if 'pmv_is_ns' in required:
 
-        # ---瞬時値---
+            # ステップ n+1 のPMVを計算するのに、ステップ n からステップ n+1 のClo値を用いる。
+            # 現在、Clo値の配列数が1つ多いバグがあるため、適切な長さになるようにスライスしている。
+            # TODO: 本来であれば、助走期間における、n=-1 の時の値を用いないといけないが、とりあえず、配列最後の値を先頭に持ってきて代用している。
+            clo_pls = np.append(self.clo_is_ns[:, -1:], self.clo_is_ns, axis=1)[:, 0:self._n_step_i]
 
-        # ステップ n の室 i におけるPMV実現値, [i, n+1]
-        self.pmv_is_ns = pmv.get_pmv_is_n(
-            p_a_is_n=p_v_is_ns,
-            theta_r_is_n=self.theta_r_is_ns,
-            theta_mrt_is_n=self.theta_mrt_hum_is_ns,
-            clo_is_n=clo_pls,
-            v_hum_is_n=v_hum_pls,
-            met_is=rms.met_is
-        )
+            # ステップ n+1 のPMVを計算するのに、ステップ n からステップ n+1 の人体周りの風速を用いる。
+            # TODO: 本来であれば、助走期間における、n=-1 の時の値を用いないといけないが、とりあえず、配列最後の値を先頭に持ってきて代用している。
+            v_hum_pls = np.append(self.v_hum_is_ns[:, -1:], self.v_hum_is_ns, axis=1)
+
+            # ステップ n の室 i におけるPMV実現値, [i, n+1]
+            self.pmv_is_ns = pmv.get_pmv_is_n(
+                p_a_is_n=p_v_is_ns,
+                theta_r_is_n=self.theta_r_is_ns,
+                theta_mrt_is_n=self.theta_mrt_hum_is_ns,
+                clo_is_n=clo_pls,
+                v_hum_is_n=v_hum_pls,
+                met_is=rms.met_is
+            )
 
         # ステップ n の室 i におけるPPD実現値, [i, n+1]
-        self.ppd_is_ns = pmv.get_ppd_is_n(pmv_is_n=self.pmv_is_ns)
+        if 'ppd_is_ns' in required:
+            self.ppd_is_ns = pmv.get_ppd_is_n(pmv_is_n=self.pmv_is_ns)
 
     def recording(self, n: int, **kwargs):
 
@@ -359,20 +528,13 @@ class Recorder:
             # 瞬時値出力のステップ番号
             n_i = n + 1
 
-            # 次の時刻に引き渡す値
-            self.theta_r_is_ns[:, n_i] = kwargs["theta_r_is_n_pls"].flatten()
-            self.theta_mrt_hum_is_ns[:, n_i] = kwargs["theta_mrt_hum_is_n_pls"].flatten()
-            self.x_r_is_ns[:, n_i] = kwargs["x_r_is_n_pls"].flatten()
-            self.theta_frt_is_ns[:, n_i] = kwargs["theta_frt_is_n_pls"].flatten()
-            self.x_frt_is_ns[:, n_i] = kwargs["x_frt_is_n_pls"].flatten()
-            self.theta_ei_js_ns[:, n_i] = kwargs["theta_ei_js_n_pls"].flatten()
-            self.q_s_js_ns[:, n_i] = kwargs["q_s_js_n_pls"].flatten()
-
-            # 次の時刻に引き渡さない値
-            self.theta_ot[:, n_i] = kwargs["theta_ot_is_n_pls"].flatten()
-            self.theta_s_js_ns[:, n_i] = kwargs["theta_s_js_n_pls"].flatten()
-            self.theta_rear_js_ns[:, n_i] = kwargs["theta_rear_js_n"].flatten()
-            self.f_cvl_js_ns[:, n_i] = kwargs["f_cvl_js_n_pls"].flatten()
+            for name, key in self._recorded_i:
+                self.__dict__[name][:, n_i] = kwargs[key].flatten()
+
+            if n == -1:
+                self._first_values_i = {
+                    key: kwargs[key].reshape(-1, 1).copy() for _, key in self._RECORDED_I if key in kwargs
+                }
 
         # 平均値・積算値の書き込み
 
@@ -381,21 +543,84 @@ class Recorder:
             # 平均値出力のステップ番号
             n_a = n
 
-            # 次の時刻に引き渡す値
-            self.operation_mode_is_ns[:, n_a] = kwargs["operation_mode_is_n"].flatten()
-
-            # 次の時刻に引き渡さない値
-            # 積算値
-            self.l_cs_is_ns[:, n_a] = kwargs["l_cs_is_n"].flatten()
-            self.l_rs_is_ns[:, n_a] = kwargs["l_rs_is_n"].flatten()
-            self.l_cl_is_ns[:, n_a] = kwargs["l_cl_is_n"].flatten()
-            # 平均値
-            self.h_hum_c_is_ns[:, n_a] = kwargs["h_hum_c_is_n"].flatten()
-            self.h_hum_r_is_ns[:, n_a] = kwargs["h_hum_r_is_n"].flatten()
-            self.q_hum_is_ns[:, n_a] = kwargs["q_hum_is_n"].flatten()
-            self.x_hum_is_ns[:, n_a] = kwargs["x_hum_is_n"].flatten()
-            self.v_reak_is_ns[:, n_a] = kwargs["v_leak_is_n"].flatten()
-            self.v_ntrl_is_ns[:, n_a] = kwargs["v_vent_ntr_is_n"].flatten()
+            for name, key in self._recorded_a:
+                self.__dict__[name][:, n_a] = kwargs[key].flatten()
+
+    def get_last_values_i(self) -> Dict[str, np.ndarray]:
+        """本計算の最後の瞬時値を recording の引数名をキーとして取得する。
+
+        Returns:
+            最後の瞬時値（recording の引数名をキーとする）, [i, 1] or [j, 1]
+
+        Notes:
+            複数年の計算において、次の年の 1/1 0:00 の瞬時値として recording(n=-1, ...) に引き継ぐために用いる。
+            post_recording 及び export_pd の前に呼ぶこと。
+        """
+
+        return {key: self.__dict__[name][:, -1:].copy() for name, key in self._recorded_i}
+
+    def get_first_values_i(self) -> Dict[str, np.ndarray]:
+        """1/1 0:00 の瞬時値を recording の引数名をキーとして取得する。
+
+        Returns:
+            1/1 0:00 の瞬時値（recording の引数名をキーとする）, [i, 1] or [j, 1]
+
+        Notes:
+            助走計算の後、本計算の前に呼ぶこと。
+            出力する項目（output_names）によらず、recording(n=-1, ...) に渡されたすべての瞬時値を返す。
+        """
+
+        return {key: v.copy() for key, v in self._first_values_i.items()}
+
+    def set_first_values_i(self, values_i: Dict[str, np.ndarray]):
+        """1/1 0:00 の瞬時値を書き込む。
+
+        Args:
+            values_i: 1/1 0:00 の瞬時値（recording の引数名をキーとする）, [i, 1] or [j, 1]
+
+        Notes:
+            助走計算を行わずに保存した状態値から計算を再開する場合に用いる。
+        """
+
+        missing = [key for _, key in self._recorded_i if key not in values_i]
+
+        if len(missing) > 0:
+            raise ValueError('1/1 0:00 の瞬時値に記録に必要な項目（{}）が含まれていません。'.format(', '.join(missing)))
+
+        for name, key in self._recorded_i:
+            self.__dict__[name][:, 0] = values_i[key].flatten()
+
+        self._first_values_i = {key: np.reshape(v, (-1, 1)).copy() for key, v in values_i.items()}
+
+    def get_filled_values(self, n_step_filled: int) -> Dict[str, np.ndarray]:
+        """本計算の途中までに記録した値を取得する。
+
+        Args:
+            n_step_filled: 本計算のうち記録済みのステップ数
+
+        Returns:
+            記録済みの値（配列名をキーとする）
+                瞬時値は 1/1 0:00 を含む n_step_filled + 1 個、平均値・積算値は n_step_filled 個の値とする。
+
+        Notes:
+            本計算の途中で計算を中断し、set_filled_values で再開するために用いる。
+        """
+
+        values = {name: self.__dict__[name][:, 0:n_step_filled + 1].copy() for name, _ in self._recorded_i}
+
+        values.update({name: self.__dict__[name][:, 0:n_step_filled].copy() for name, _ in self._recorded_a})
+
+        return values
+
+    def set_filled_values(self, values: Dict[str, np.ndarray]):
+        """get_filled_values で取得した記録済みの値を書き込む。
+
+        Args:
+            values: 記録済みの値（配列名をキーとする）
+        """
+
+        for name, _ in self._recorded_i + self._recorded_a:
+            self.__dict__[name][:, 0:values[name].shape[1]] = values[name]
 
     def export_pd(self):
 
@@ -417,7 +642,7 @@ class Recorder:
         df_i1 = pd.DataFrame(data=self._get_flat_data_i().T, columns=self.get_header_i(), index=date_index_i)
 
         # 列入れ替え用の新しいヘッダーを作成
-        new_columns_i = ['out_temp', 'out_abs_humid'] + list(itertools.chain.from_iterable(
+        new_columns_i = [column[1] for column in self._output_list_outside_i] + list(itertools.chain.from_iterable(
             [[self._get_room_header_name(id=id, name=column[1]) for column in self._output_list_room_i] for id in self._id_rm_is]
         )) + list(itertools.chain.from_iterable(
             [[self._get_boundary_name(id=id, name=column[1]) for column in self._output_list_boundary_i] for id in self._id_bs_js]
@@ -430,7 +655,7 @@ class Recorder:
 
     def get_header_i(self):
 
-        return ['out_temp', 'out_abs_humid'] \
+        return [column[1] for column in self._output_list_outside_i] \
             + list(itertools.chain.from_iterable(
                 [self._get_room_header_names(name=column[1]) for column in self._output_list_room_i]))\
             + list(itertools.chain.from_iterable(
@@ -450,8 +675,10 @@ class Recorder:
         # 出力リストに従って1つずつ記録された2次元のデータを縦に並べていき（この時点で3次元になる）、concatenate でフラット化する。
         # 先頭に外気温度と外気湿度の2つのデータを並べてある。他のデータが2次元データのため、
         # 外気温度と外気湿度のデータもあえて 1 ✕ n の2次元データにしてから統合してある。
+        # 出力する項目が無い場合も空の配列を返せるように、先頭に0行の配列を並べている。
         return np.concatenate(
-            [[self.theta_o_ns], [self.x_o_ns]]
+            [np.empty((0, self._n_step_i), dtype=float)]
+            + [[self.__dict__[column[0]]] for column in self._output_list_outside_i]
             + [self.__dict__[column[0]] for column in self._output_list_room_i]
             + [self.__dict__[column[0]] for column in self._output_list_boundary_i]
         )
@@ -464,7 +691,13 @@ class Recorder:
         """
 
         # 出力リストに従って1つずつ記録された2次元のデータを縦に並べていき（この時点で3次元になる）、concatenate でフラット化する。
-        return np.concatenate([self.__dict__[column[0]] for column in self._output_list_room_a])
+        # 運転モードは値で記録しているため、列挙体 OperationMode に変換してから並べる。
+        # 出力する項目が無い場合も空の配列を返せるように、先頭に0行の配列を並べている。
+        return np.concatenate([np.empty((0, self._n_step_a), dtype=float)] + [
+            operation_mode.get_operation_mode_is_ns(operation_mode_code_is_ns=self.__dict__[column[0]])
+            if column[0] == 'operation_mode_is_ns' else self.__dict__[column[0]]
+            for column in self._output_list_room_a
+        ])
 
     def _get_date_index(self):
         """データインデックスを作成する。
@@ -473,19 +706,36 @@ class Recorder:
 
         """
 
-        # pandas 用の時間間隔 freq 引数
-        freq = self._itv.get_pandas_freq()
+        return _get_date_index(itv=self._itv, n_step_i=self._n_step_i, n_step_a=self._n_step_a)
 
-        # date time index 作成（瞬時値・平均値）
-        date_index_i = pd.date_range(start='1/1/' + self.YEAR, periods=self._n_step_i, freq=freq, name='start_time')
+    def _get_columns_i(self) -> List[Tuple[str, str, Optional[int]]]:
+        """export_pd の瞬時値の DataFrame の列を取得する。
+
+        Returns:
+            列ごとの（列名, 配列名, 配列の行番号（外気の値の場合は None））のリスト（export_pd の列の順）
+        """
 
-        # date time index 作成（積算値）（start と end の2種類作成する）
-        date_index_a_start = pd.date_range(start='1/1/' + self.YEAR, periods=self._n_step_a, freq=freq)
-        date_index_a_end = date_index_a_start + dt.timedelta(minutes=15)
-        date_index_a_start.name = 'start_time'
-        date_index_a_end.name = 'end_time'
+        return [(column[1], column[0], None) for column in self._output_list_outside_i] \
+            + [
+                (self._get_room_header_name(id=id, name=column[1]), column[0], i)
+                for i, id in enumerate(self._id_rm_is) for column in self._output_list_room_i
+            ] \
+            + [
+                (self._get_boundary_name(id=id, name=column[1]), column[0], j)
+                for j, id in enumerate(self._id_bs_js) for column in self._output_list_boundary_i
+            ]
 
-        return date_index_a_end, date_index_a_start, date_index_i
+    def _get_columns_a(self) -> List[Tuple[str, str, Optional[int]]]:
+        """export_pd の平均値・積算値の DataFrame の列を取得する。
+
+        Returns:
+            列ごとの（列名, 配列名, 配列の行番号）のリスト（export_pd の列の順）
+        """
+
+        return [
+            (self._get_room_header_name(id=id, name=column[1]), column[0], i)
+            for i, id in enumerate(self._id_rm_is) for column in self._output_list_room_a
+        ]
 
     @classmethod
     def _get_room_header_name(cls, id: int, name: str):
@@ -537,3 +787,383 @@ class Recorder:
         """
         return [self._get_boundary_name(id=id, name=name) for id in self._id_bs_js]
 
+
+class StreamingRecorder(Recorder):
+    """
+    Notes:
+        本計算の全期間分の配列を確保する代わりに、一定のステップ数（ブロック）分の配列のみを確保し、
+        ブロックが埋まるごとに post_recording と同じ後処理（相対湿度・表面熱流・PMV/PPD 等）を行ったうえで、
+        出力項目ごとの .npy ファイル（列指向の保存形式）に書き出す。
+        .npy ファイルは numpy.lib.format.open_memmap で開くため、全期間分の配列がメモリ上に保持されることはない。
+
+        ブロックの先頭の瞬時値は前のブロックの末尾の瞬時値を引き継ぐ（リングバッファ）。
+        1/1 0:00 の PMV/PPD の計算には本計算の最後のステップの Clo 値・人体周りの風速を用いる（Recorder と同じ扱い）ため、
+        post_recording の時点で計算し直して書き込む。
+        PMV の収束計算はブロック単位で行うため、Recorder の結果とは収束計算の許容誤差の範囲で異なる場合がある。
+    """
+
+    def __init__(
+            self,
+            n_step_main: int,
+            id_rm_is: List[int],
+            id_bs_js: List[int],
+            store_dir: str,
+            rms: Rooms,
+            f_mrt_is_js: np.ndarray,
+            es: Equipments,
+            n_step_block: Optional[int] = None,
+            itv: Interval = Interval(eitv=EInterval.M15),
+            output_names: Optional[List[str]] = None
+    ):
+        """
+        ブロック分の numpy の配列と、出力項目ごとの .npy ファイルを用意する。
+
+        Args:
+            n_step_main: 計算ステップの数
+            id_rm_is: 室のid, [i]
+            id_bs_js: 境界のid, [j]
+            store_dir: 出力項目ごとの .npy ファイルを保存するディレクトリ
+            rms: Rooms クラス
+            f_mrt_is_js: 室 i の微小球に対する境界 j の形態係数, -, [i, j]
+            es: Equipments クラス
+            n_step_block: 1ブロックあたりのステップ数（None の場合は itv の1日分）
+            itv: インターバルクラス
+            output_names: 出力する項目の出力名のリスト（None の場合はすべての項目を出力する）
+        """
+
+        if n_step_block is None:
+            n_step_block = itv.get_n_day()
+
+        if n_step_block < 1:
+            raise ValueError('1ブロックあたりのステップ数は1以上でなければいけません。')
+
+        # 1ブロックあたりのステップ数
+        n_step_block = min(n_step_block, n_step_main)
+
+        # ブロック分の配列を確保する。
+        super().__init__(
+            n_step_main=n_step_block, id_rm_is=id_rm_is, id_bs_js=id_bs_js, itv=itv, output_names=output_names
+        )
+
+        self._n_step_block = n_step_block
+
+        # 瞬時値の行数・平均・積算値の行数は本計算の全期間の値に置き換える。
+        self._n_step_i = n_step_main + 1
+        self._n_step_a = n_step_main
+
+        self._store_dir = store_dir
+
+        self._rms = rms
+        self._f_mrt_is_js = f_mrt_is_js
+        self._es = es
+
+        # 現在のブロックの先頭の平均値出力のステップ番号
+        self._n_a_start = 0
+
+        # 1/1 0:00 の PMV の計算に用いる室温・絶対湿度・平均放射温度, [i, 1]
+        self._theta_r_is_0 = None
+        self._x_r_is_0 = None
+        self._theta_mrt_hum_is_0 = None
+
+        os.makedirs(store_dir, exist_ok=True)
+
+        # 出力項目ごとの .npy ファイル
+        self._store = {
+            name: np.lib.format.open_memmap(
+                filename=self._get_store_path(name=name),
+                mode='w+',
+                dtype=np.int8 if name == 'operation_mode_is_ns' else float,
+                shape=shape
+            )
+            for name, shape in self._get_store_shapes().items()
+        }
+
+        # 列名と .npy ファイルの対応（ResultStore で読み込む際に用いる）
+        with open(os.path.join(store_dir, ResultStore.INDEX_FILE_NAME), 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'interval': itv.interval.value,
+                    'n_step_i': self._n_step_i,
+                    'n_step_a': self._n_step_a,
+                    'columns_i': self._get_columns_i(),
+                    'columns_a': self._get_columns_a()
+                },
+                f
+            )
+
+    @property
+    def store_dir(self) -> str:
+        return self._store_dir
+
+    def pre_recording(
+            self,
+            weather: Weather,
+            scd: Schedule,
+            bs: Boundaries,
+            q_sol_frt_is_ns: np.ndarray,
+            q_s_sol_js_ns: np.ndarray,
+            q_trs_sol_is_ns: np.ndarray
+    ):
+
+        super().pre_recording(
+            weather=weather,
+            scd=scd,
+            bs=bs,
+            q_sol_frt_is_ns=q_sol_frt_is_ns,
+            q_s_sol_js_ns=q_s_sol_js_ns,
+            q_trs_sol_is_ns=q_trs_sol_is_ns
+        )
+
+        # 事前に決まる値は全期間分をそのまま書き出し、メモリ上には保持しない。
+        self._bs = bs
+
+        for name in self._PRE_RECORDED:
+            if name in self._store:
+                self._store[name][...] = self.__dict__[name]
+            self.__dict__[name] = None
+
+    def recording(self, n: int, **kwargs):
+
+        # 助走計算の値（1/1 0:00 の瞬時値を含む）はブロックの先頭に書き込む。
+        if n < 0:
+            super().recording(n=n, **kwargs)
+            return
+
+        # ブロック内の平均値出力のステップ番号
+        n_a = n - self._n_a_start
+
+        super().recording(n=n_a, **kwargs)
+
+        if (n_a == self._n_step_block - 1) or (n == self._n_step_a - 1):
+            self._flush(n_step_filled=n_a + 1)
+
+    def post_recording(self, rms: Rooms, bs: Boundaries, f_mrt_is_js: np.ndarray, es: Equipments):
+
+        # ブロックごとの後処理は recording の中で済んでいるため、1/1 0:00 の PMV/PPD のみ計算し直す。
+        if 'pmv_is_ns' in self._required:
+
+            # 最後のブロックの末尾の Clo 値・人体周りの風速を用いる。
+            pmv_is_n = pmv.get_pmv_is_n(
+                p_a_is_n=psy.get_p_v_r_is_n(x_r_is_n=self._x_r_is_0),
+                theta_r_is_n=self._theta_r_is_0,
+                theta_mrt_is_n=self._theta_mrt_hum_is_0,
+                clo_is_n=self.clo_is_ns[:, -1:],
+                v_hum_is_n=self.v_hum_is_ns[:, -1:],
+                met_is=rms.met_is
+            )
+
+            if 'pmv_is_ns' in self._store:
+                self._store['pmv_is_ns'][:, 0:1] = pmv_is_n
+
+            if 'ppd_is_ns' in self._store:
+                self._store['ppd_is_ns'][:, 0:1] = pmv.get_ppd_is_n(pmv_is_n=pmv_is_n)
+
+        for v in self._store.values():
+            v.flush()
+
+    def get_last_values_i(self) -> Dict[str, np.ndarray]:
+
+        # 最後のブロックの末尾の瞬時値は、書き出しの際にブロックの先頭に引き継がれている。
+        return {key: self.__dict__[name][:, 0:1].copy() for name, key in self._recorded_i}
+
+    def export_pd(self):
+
+        # 保存した .npy ファイルから全期間分の DataFrame を作成する。
+        # 全期間分を読み込まずに結果を参照する場合は、ResultStore を用いる。
+        return ResultStore(store_dir=self._store_dir, kind='i').to_pd(), ResultStore(store_dir=self._store_dir, kind='a').to_pd()
+
+    def _flush(self, n_step_filled: int):
+        """ブロックの後処理を行い、.npy ファイルに書き出す。
+
+        Args:
+            n_step_filled: ブロック内で記録済みの平均値・積算値のステップ数
+        """
+
+        # 最後のブロックが途中までしか埋まっていない場合は、記録済みの範囲に切り詰める。
+        if n_step_filled < self._n_step_block:
+            for name, _ in self._recorded_i:
+                self.__dict__[name] = self.__dict__[name][:, 0:n_step_filled + 1]
+            for name, _ in self._recorded_a:
+                self.__dict__[name] = self.__dict__[name][:, 0:n_step_filled]
+
+        super().post_recording(rms=self._rms, bs=self._bs, f_mrt_is_js=self._f_mrt_is_js, es=self._es)
+
+        n_a_start = self._n_a_start
+
+        if (n_a_start == 0) and ('pmv_is_ns' in self._required):
+            self._theta_r_is_0 = self.theta_r_is_ns[:, 0:1].copy()
+            self._x_r_is_0 = self.x_r_is_ns[:, 0:1].copy()
+            self._theta_mrt_hum_is_0 = self.theta_mrt_hum_is_ns[:, 0:1].copy()
+
+        # 瞬時値はブロックの先頭（前のブロックの末尾）を除いて書き出す。ただし、最初のブロックは 1/1 0:00 の値も書き出す。
+        k_i = 0 if n_a_start == 0 else 1
+
+        for name in [column[0] for column in self._RECORDED_I] + self._POST_RECORDED_I:
+            if name in self._store:
+                self._store[name][:, n_a_start + k_i: n_a_start + n_step_filled + 1] = self.__dict__[name][:, k_i:]
+
+        for name in [column[0] for column in self._RECORDED_A] + self._POST_RECORDED_A:
+            if name in self._store:
+                self._store[name][:, n_a_start: n_a_start + n_step_filled] = self.__dict__[name]
+
+        # ブロックの末尾の瞬時値を次のブロックの先頭に引き継ぐ。
+        for name, _ in self._recorded_i:
+            self.__dict__[name][:, 0] = self.__dict__[name][:, n_step_filled]
+
+        self._n_a_start = n_a_start + n_step_filled
+
+    def _get_store_path(self, name: str) -> str:
+
+        return os.path.join(self._store_dir, name + '.npy')
+
+    def _get_store_shapes(self) -> Dict[str, Tuple[int, ...]]:
+        """出力項目ごとの配列の形状を取得する。
+
+        Returns:
+            出力項目ごとの配列の形状
+        """
+
+        shapes = {}
+
+        for column in self._output_list_outside_i:
+            shapes[column[0]] = (self._n_step_i,)
+
+        for column in self._output_list_room_i:
+            shapes[column[0]] = (self._n_rm, self._n_step_i)
+
+        for column in self._output_list_boundary_i:
+            shapes[column[0]] = (self._n_bs, self._n_step_i)
+
+        for column in self._output_list_room_a:
+            shapes[column[0]] = (self._n_rm, self._n_step_a)
+
+        return shapes
+
+
+class ResultStore:
+    """
+    Notes:
+        StreamingRecorder が書き出した計算結果を、列ごとに必要な分だけ読み込む。
+        列名・インデックスは Recorder.export_pd の DataFrame と同じとし、[] で列を参照すると pandas.Series を返す。
+        全期間分の DataFrame が必要な場合は to_pd を用いる。
+    """
+
+    # 列名と .npy ファイルの対応を保存するファイルの名前
+    INDEX_FILE_NAME = 'index.json'
+
+    def __init__(self, store_dir: str, kind: str):
+        """
+        Args:
+            store_dir: StreamingRecorder が計算結果を書き出したディレクトリ
+            kind: 'i'（瞬時値）又は 'a'（平均値・積算値）
+        """
+
+        if kind not in ['i', 'a']:
+            raise ValueError('計算結果の種類 `{}` には対応していません。'.format(kind))
+
+        with open(os.path.join(store_dir, self.INDEX_FILE_NAME), 'r', encoding='utf-8') as f:
+            d = json.load(f)
+
+        self._store_dir = store_dir
+
+        self._kind = kind
+
+        self._itv = Interval(eitv=EInterval(d['interval']))
+
+        self._n_step_i = d['n_step_i']
+
+        self._n_step_a = d['n_step_a']
+
+        # 列名ごとの配列名及び配列の行番号
+        self._columns = {column: (name, row) for column, name, row in d['columns_' + kind]}
+
+    @property
+    def store_dir(self) -> str:
+        return self._store_dir
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns.keys())
+
+    @property
+    def index(self) -> pd.Index:
+
+        date_index_a_end, date_index_a_start, date_index_i = _get_date_index(
+            itv=self._itv, n_step_i=self._n_step_i, n_step_a=self._n_step_a
+        )
+
+        if self._kind == 'i':
+            return date_index_i
+        else:
+            return pd.MultiIndex.from_arrays([date_index_a_start, date_index_a_end])
+
+    def __getitem__(self, column: str) -> pd.Series:
+
+        return pd.Series(data=self._get_values(column=column), index=self.index, name=column)
+
+    def to_pd(self) -> pd.DataFrame:
+        """全期間分の DataFrame を作成する。
+
+        Returns:
+            Recorder.export_pd と同じ DataFrame
+        """
+
+        n_step = self._n_step_i if self._kind == 'i' else self._n_step_a
+
+        data = np.concatenate(
+            [np.empty((0, n_step), dtype=float)] + [[self._get_values(column=column)] for column in self._columns]
+        )
+
+        return pd.DataFrame(data=data.T, columns=self.columns, index=self.index)
+
+    def _get_values(self, column: str) -> np.ndarray:
+        """列の値を読み込む。
+
+        Args:
+            column: 列名
+
+        Returns:
+            列の値, [n+1] or [n]
+        """
+
+        name, row = self._columns[column]
+
+        values = np.load(os.path.join(self._store_dir, name + '.npy'), mmap_mode='r')
+
+        values = np.array(values if row is None else values[row])
+
+        # 運転モードは値で記録しているため、列挙体 OperationMode に変換する。
+        if name == 'operation_mode_is_ns':
+            values = operation_mode.get_operation_mode_is_ns(operation_mode_code_is_ns=values)
+
+        return values
+
+
+def _get_date_index(itv: Interval, n_step_i: int, n_step_a: int):
+    """データインデックスを作成する。
+
+    Args:
+        itv: インターバルクラス
+        n_step_i: 瞬時値の行数
+        n_step_a: 平均・積算値の行数
+
+    Returns:
+        以下のタプル
+            (1) 積算値用（終了時刻）のインデックス
+            (2) 積算値用（開始時刻）のインデックス
+            (3) 瞬時値・平均値用のインデックス
+    """
+
+    # pandas 用の時間間隔 freq 引数
+    freq = itv.get_pandas_freq()
+
+    # date time index 作成（瞬時値・平均値）
+    date_index_i = pd.date_range(start='1/1/' + Recorder.YEAR, periods=n_step_i, freq=freq, name='start_time')
+
+    # date time index 作成（積算値）（start と end の2種類作成する）
+    date_index_a_start = pd.date_range(start='1/1/' + Recorder.YEAR, periods=n_step_a, freq=freq)
+    date_index_a_end = date_index_a_start + dt.timedelta(minutes=15)
+    date_index_a_start.name = 'start_time'
+    date_index_a_end.name = 'end_time'
+
+    return date_index_a_end, date_index_a_start, date_index_i
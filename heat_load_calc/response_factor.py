@@ -2,9 +2,47 @@
 
 """
 
+import os
 import math
+import logging
+import hashlib
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+from heat_load_calc.file_util import write_atomic
+
+
+logger = logging.getLogger(name='HeatLoadCalc').getChild('ResponseFactor')
+
+
+# version of the format of the response factor cache file
+# This value should be changed when the way to calculate the response factor is changed.
+_CACHE_VERSION = 2
+
+# directory of the response factor cache files
+# It can be specified by the environment variable HEAT_LOAD_CALC_RESPONSE_FACTOR_CACHE (not specified or empty string means no cache).
+_cache_dir: Optional[str] = os.environ.get('HEAT_LOAD_CALC_RESPONSE_FACTOR_CACHE') or None
+
+# response factors kept in this process, keyed by the hash of the layer composition
+_memo: Dict[str, Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def clear_memo():
+    """Clear the response factors kept in this process. / プロセス内で保持している応答係数を消去する。"""
+
+    _memo.clear()
+
+
+def set_cache_dir(cache_dir: Optional[str]):
+    """Set the directory of the response factor cache files. / 応答係数のキャッシュファイルのディレクトリを設定する。
+
+    Args:
+        cache_dir: directory of the cache files (None means that the cache is not used)
+    """
+
+    global _cache_dir
+
+    _cache_dir = cache_dir
 
 
 class ResponseFactor:
@@ -104,12 +142,39 @@ class ResponseFactor:
         cs = cs * 1000.0
 
         # 応答係数
-        frt0, rfa0, rft1, rfa1, row = _calc_response_factor_non_residential(C_i_k_p=cs, R_i_k_p=rs)
+        frt0, rfa0, rft1, rfa1, row = _get_response_factor_cached(is_ground=False, cs=cs, rs=rs)
 
         r_total = rs.sum() + r_o
 
         return ResponseFactor(rft0=frt0, rfa0=rfa0, rft1=rft1, rfa1=rfa1, row=row, r_total=r_total)
 
+    @classmethod
+    def create_for_unsteady_not_ground_walls(cls, cs_ws: List[np.ndarray], rs_ws: List[np.ndarray], r_o_ws: List[float]) -> List['ResponseFactor']:
+        """複数の壁の応答係数をまとめて作成する（地盤以外に用いる）
+
+        create_for_unsteady_not_ground と同じ応答係数を、計算済みでない層構成についてまとめて一度に計算する。
+        Args:
+            cs_ws: 壁ごとの単位面積あたりの熱容量, kJ/m2K, [壁数][layer数]
+            rs_ws: 壁ごとの熱抵抗, m2K/W, [壁数][layer数]
+            r_o_ws: 壁ごとの室外側熱伝達抵抗, m2K/W, [壁数]
+
+        Returns:
+            応答係数, [壁数]
+        """
+
+        # 裏面に熱容量 0.0 、熱抵抗 r_o の層を加える。
+        # 単位変換 kJ/m2K -> J/m2K
+        cs_ws = [np.append(cs, 0.0) * 1000.0 for cs in cs_ws]
+        rs_ws = [np.append(rs, r_o) for (rs, r_o) in zip(rs_ws, r_o_ws)]
+
+        # 応答係数
+        rfs = _get_response_factors_cached(is_ground=False, cs_ws=cs_ws, rs_ws=rs_ws)
+
+        return [
+            ResponseFactor(rft0=frt0, rfa0=rfa0, rft1=rft1, rfa1=rfa1, row=row, r_total=rs.sum() + r_o)
+            for ((frt0, rfa0, rft1, rfa1, row), rs, r_o) in zip(rfs, rs_ws, r_o_ws)
+        ]
+
     @classmethod
     def create_for_unsteady_ground(cls, cs: np.ndarray, rs: np.ndarray):
         """応答係数を作成する（地盤用）
@@ -131,7 +196,7 @@ class ResponseFactor:
         cs = cs * 1000.0
 
         # 応答係数
-        rft0, rfa0, rft1, rfa1, row = _calc_response_factor(is_ground=True, cs=cs, rs=rs)
+        rft0, rfa0, rft1, rfa1, row = _get_response_factor_cached(is_ground=True, cs=cs, rs=rs)
 
         # 貫流応答係数の上書
         # 土壌の計算は吸熱応答のみで計算するため、畳み込み積分に必要な指数項別応答係数はすべて０にする
@@ -144,6 +209,195 @@ class ResponseFactor:
         return ResponseFactor(rft0=rft0, rfa0=rfa0, rft1=rft1, rfa1=rfa1, row=row, r_total=r_total)
 
 
+def _get_response_factor_cached(is_ground: bool, cs: np.ndarray, rs: np.ndarray) -> Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]:
+    """Get the response factor of the layer composition using the cache. / キャッシュを用いて層構成に対する応答係数を取得する。
+
+    Args:
+        is_ground: is the layer composition for ground or not
+        cs: 単位面積あたりの熱容量, J/m2K, [layer数]
+        rs: 熱抵抗, m2K/W, [layer数]
+
+    Returns:
+        (1) 貫流応答係数の初項
+        (2) 吸熱応答係数の初項
+        (3) 貫流応答係数, [12]
+        (4) 吸熱応答係数, [12]
+        (5) 公比, [12]
+    """
+
+    return _get_response_factors_cached(is_ground=is_ground, cs_ws=[cs], rs_ws=[rs])[0]
+
+
+def _get_response_factors_cached(
+        is_ground: bool, cs_ws: List[np.ndarray], rs_ws: List[np.ndarray]
+) -> List[Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]]:
+    """Get the response factors of the layer compositions using the cache. / キャッシュを用いて層構成に対する応答係数を取得する。
+
+    Args:
+        is_ground: is the layer composition for ground or not
+        cs_ws: 壁ごとの単位面積あたりの熱容量, J/m2K, [壁数][layer数]
+        rs_ws: 壁ごとの熱抵抗, m2K/W, [壁数][layer数]
+
+    Returns:
+        response factors (rft0, rfa0, rft1, rfa1, row) of each wall, [壁数]
+
+    Notes:
+        The response factors are kept in this process, and also saved in the cache directory if set_cache_dir is called
+        (or the environment variable HEAT_LOAD_CALC_RESPONSE_FACTOR_CACHE is specified).
+        The layer compositions which are neither kept nor saved are calculated at once.
+        The arrays are shared among the boundaries with the same layer composition, so they are read only.
+    """
+
+    keys = [_get_cache_key(is_ground=is_ground, cs=cs, rs=rs) for (cs, rs) in zip(cs_ws, rs_ws)]
+
+    # layer compositions to be calculated, keyed by the hash
+    missing: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    for (key, cs, rs) in zip(keys, cs_ws, rs_ws):
+
+        if key in _memo or key in missing:
+            continue
+
+        rf = _load_cache(key=key)
+
+        if rf is None:
+            missing[key] = (cs, rs)
+        else:
+            _set_memo(key=key, rf=rf)
+
+    if len(missing) > 0:
+
+        # 層数の異なる壁は、熱容量・熱抵抗がともに0.0の層を加えて層数をそろえる。
+        n_l = max(len(cs) for (cs, _) in missing.values())
+        cs_ws_ls = np.array([np.pad(np.asarray(cs, dtype=float), (0, n_l - len(cs))) for (cs, _) in missing.values()])
+        rs_ws_ls = np.array([np.pad(np.asarray(rs, dtype=float), (0, n_l - len(rs))) for (_, rs) in missing.values()])
+
+        if is_ground:
+            rft0_ws, rfa0_ws, rft1_ws, rfa1_ws, row_ws = _calc_response_factor(is_ground=True, cs=cs_ws_ls, rs=rs_ws_ls)
+        else:
+            rft0_ws, rfa0_ws, rft1_ws, rfa1_ws, row_ws = _calc_response_factor_non_residential(C_i_k_p=cs_ws_ls, R_i_k_p=rs_ws_ls)
+
+        for (w, key) in enumerate(missing.keys()):
+            rf = (float(rft0_ws[w]), float(rfa0_ws[w]), rft1_ws[w].copy(), rfa1_ws[w].copy(), row_ws[w].copy())
+            _save_cache(key=key, rf=rf)
+            _set_memo(key=key, rf=rf)
+
+    return [_memo[key] for key in keys]
+
+
+def _set_memo(key: str, rf: Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]):
+    """Keep the response factor in this process. / 応答係数をプロセス内で保持する。
+
+    Args:
+        key: hash of the layer composition
+        rf: response factors
+    """
+
+    for a in rf[2:]:
+        a.flags.writeable = False
+
+    _memo[key] = rf
+
+
+def _get_cache_key(is_ground: bool, cs: np.ndarray, rs: np.ndarray) -> str:
+    """Get the key of the layer composition. / 層構成のキーを取得する。
+
+    Args:
+        is_ground: is the layer composition for ground or not
+        cs: 単位面積あたりの熱容量, J/m2K, [layer数]
+        rs: 熱抵抗, m2K/W, [layer数]
+
+    Returns:
+        hash of the layer composition
+    """
+
+    h = hashlib.sha256()
+    h.update(b'ground' if is_ground else b'not_ground')
+    h.update(np.ascontiguousarray(cs, dtype=np.float64).tobytes())
+    h.update(b'|')
+    h.update(np.ascontiguousarray(rs, dtype=np.float64).tobytes())
+
+    return h.hexdigest()[0:32]
+
+
+def _get_cache_path(key: str) -> Optional[str]:
+    """Get the path of the cache file. / 応答係数のキャッシュファイルのパスを取得する。
+
+    Args:
+        key: hash of the layer composition
+
+    Returns:
+        path of the cache file (None if the cache is not used)
+    """
+
+    if _cache_dir is None:
+        return None
+
+    return os.path.join(_cache_dir, 'rf_v{}_{}.npy'.format(_CACHE_VERSION, key))
+
+
+def _load_cache(key: str) -> Optional[Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]]:
+    """Load the cache file. / 応答係数のキャッシュファイルを読み込む。
+
+    Args:
+        key: hash of the layer composition
+
+    Returns:
+        response factors (None if the cache file does not exist)
+
+    Notes:
+        The cache file is the array [3, 13] whose first column is (rft0, rfa0, -) and the rest is (rft1, rfa1, row).
+    """
+
+    cache_path = _get_cache_path(key=key)
+
+    if cache_path is None or not os.path.isfile(cache_path):
+        return None
+
+    try:
+        data = np.load(cache_path)
+    except (OSError, ValueError) as e:
+        logger.warning('The response factor cache file `{}` could not be read. ({})'.format(cache_path, e))
+        return None
+
+    return float(data[0, 0]), float(data[1, 0]), data[0, 1:].copy(), data[1, 1:].copy(), data[2, 1:].copy()
+
+
+def _save_cache(key: str, rf: Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]):
+    """Save the cache file. / 応答係数のキャッシュファイルを保存する。
+
+    Args:
+        key: hash of the layer composition
+        rf: response factors
+
+    Notes:
+        The file is written to a temporary file and renamed,
+        so that the other processes do not read the file being written.
+        If the file could not be written, the cache is just not used.
+    """
+
+    cache_path = _get_cache_path(key=key)
+
+    if cache_path is None:
+        return
+
+    rft0, rfa0, rft1, rfa1, row = rf
+
+    data = np.stack([
+        np.append(rft0, rft1),
+        np.append(rfa0, rfa1),
+        np.append(0.0, row)
+    ])
+
+    try:
+
+        write_atomic(path=cache_path, write=lambda f: np.save(f, data))
+
+    except OSError as e:
+
+        logger.warning('The response factor cache file `{}` could not be saved. ({})'.format(cache_path, e))
+
+
 # ラプラス変数の設定
 def _get_laps(alp: np.ndarray) -> np.ndarray:
     """
@@ -210,146 +464,103 @@ def _get_alpha_m(is_ground: bool) -> np.ndarray:
 # 壁体の単位応答の計算
 def _get_step_reps_of_wall(C_i_k_p, R_i_k_p, laps: np.ndarray, alp: np.ndarray):
     """
-    :param layers: 壁体構成部材
+    :param C_i_k_p: 層の熱容量[J/m2K], [layer数] or [壁数, layer数]
+    :param R_i_k_p: 層の熱抵抗[m2K/W], [layer数] or [壁数, layer数]
     :param laps: ラプラス変数
     :param alp: 固定根
-    :return:
+    :return: 単位貫流応答・単位吸熱応答の初項, [] or [壁数] / 伝達関数の係数, [固定根の数] or [壁数, 固定根の数]
     """
 
-    # 四端子基本行列の初期化
-    matFi = np.zeros((len(C_i_k_p), 2, 2))
-
-    # 吸熱、貫流の各伝達関数ベクトルの初期化
-    nlaps = len(laps)
-    matGA = np.zeros((nlaps, 1))
-    matGT = np.zeros((nlaps, 1))
-
-    # 単位貫流応答、単位吸熱応答の初期化
-    dblAT0 = 1.0
-    dblAA0 = sum(R_i_k_p)
-
-    # GA(0), GT(0)
-    dblGA0 = dblAA0
-    dblGT0 = dblAT0
-
-    # 壁体の熱容量が0（定常）の場合
-    # 定常部位であっても、そのまま処理を継続する（計算上は問題ないため）
-    # if abs(dblCtotal) < 0.001:
-    #    pass #　暫定処理（VBAではここで処理を抜ける）
-
-    # 吸熱、貫流の各伝達関数ベクトルの作成
-    for lngI, lap in enumerate(laps):
-        # 伝達関数の計算
-        (GA, GT) = _calc_transfer_function(C_i_k_p=C_i_k_p, R_i_k_p=R_i_k_p, laps=lap)
-
-        # 吸熱、貫流の各伝達関数ベクトルの作成
-        matGA[lngI] = GA - dblGA0
-        matGT[lngI] = GT - dblGT0
-
-    # 伝達関数の係数を求めるための左辺行列を作成
-    nroot = len(alp)
-    matF = np.zeros((nlaps, nroot))
-    for lngI, lap in enumerate(laps):
-        for lngJ, root in enumerate(alp):
-            matF[lngI, lngJ] = lap / (lap + root)
-
-    # 最小二乗法のための係数行列を作成
-    # matU = np.zeros((nroot, nroot))
-    # for lngK in range(nroot):
-    #    for lngJ in range(nroot):
-    #         matU[lngK, lngJ] = np.sum([matF[:, lngK] * matF[:, lngJ]])
-    matU = np.dot(matF.T, matF)
-
-    # 最小二乗法のための定数項行列を作成
-    matCA = np.zeros((nroot, 1))
-    matCT = np.zeros((nroot, 1))
-    matCA[:, 0] = np.sum([matF * matGA], axis=1)
-    matCT[:, 0] = np.sum([matF * matGT], axis=1)
-
-    # 伝達関数の係数を計算
-    matAA = np.linalg.solve(matU, matCA)
-    matAT = np.linalg.solve(matU, matCT)
-
-    # 伝達関数の係数を一次元配列に変換
-    dblAT = matAT[:, 0]
-    dblAA = matAA[:, 0]
-
-    return dblAT0, dblAA0, dblAT, dblAA
+    return _get_step_reps_of_wall_weighted(C_i_k_p=C_i_k_p, R_i_k_p=R_i_k_p, laps=laps, alp=alp, weight=None)
 
 
 # 伝達関数の計算
-def _calc_transfer_function(C_i_k_p: List[float], R_i_k_p: List[float], laps: float) -> tuple[float, float]:
+def _calc_transfer_function(C_i_k_p, R_i_k_p, laps) -> tuple[np.ndarray, np.ndarray]:
 
     """
 
     Args:
-        C_i_k_p: 層の熱容量[J/m2K]
-        R_i_k_p: 層の熱抵抗[m2K/W]
-        laps: ラプラス変数[1/s]
+        C_i_k_p: 層の熱容量[J/m2K], [layer数] or [壁数, layer数]
+        R_i_k_p: 層の熱抵抗[m2K/W], [layer数] or [壁数, layer数]
+        laps: ラプラス変数[1/s], float or [ラプラス変数の数]
 
     Returns:
-        貫流伝達関数[K]
-        吸熱伝達関数[K]
-    """
-
-    # 四端子行列の初期化
-    matFt = np.identity(2, dtype=float)
+        吸熱伝達関数[m2K/W], [壁数, ラプラス変数の数] (壁・ラプラス変数が1つの場合はその次元を除く)
+        貫流伝達関数[-], [壁数, ラプラス変数の数] (壁・ラプラス変数が1つの場合はその次元を除く)
 
-    for lngK, (R_k, C_k) in enumerate(zip(R_i_k_p, C_i_k_p)):
-
-        # ---- 四端子基本行列 matFi ----
-        if abs(C_k) < 0.001:
-            # 定常部位（空気層等）の場合
-            matFi = np.array([
-                [1.0, R_k],
-                [0.0, 1.0]
-            ])
-        else:
-            # 非定常部位の場合
-            dblTemp = np.sqrt(R_k * C_k * laps)
-            dblCosh = np.cosh(dblTemp)
-            dblSinh = np.sinh(dblTemp)
-
-            matFi = np.array([
-                [dblCosh, R_k / dblTemp * dblSinh],
-                [dblTemp / R_k * dblSinh, dblCosh]
-            ])
-
-        # print('[Fi(', lngK, ')]')
-        # print(matFi)
-
-        # ---- 四端子行列 matFt ----
-        matFt = np.dot(matFt, matFi)
+    Notes:
+        全ての壁・ラプラス変数について各層の四端子基本行列を一度に作成し、室内側の層から順に四端子行列を掛け合わせる。
+        層数の異なる壁をまとめて計算する場合は、熱容量・熱抵抗がともに0.0の層（単位行列となる）を加えて層数をそろえる。
+    """
 
-    # print('martFt')
-    # print(matFt)
+    lps = np.asarray(laps, dtype=float)
+
+    # [壁数, 1, layer数] or [1, layer数] （ラプラス変数がスカラーの場合は [壁数, layer数] or [layer数]）
+    cs = np.asarray(C_i_k_p, dtype=float)
+    rs = np.asarray(R_i_k_p, dtype=float)
+    if lps.ndim > 0:
+        cs = cs[..., np.newaxis, :]
+        rs = rs[..., np.newaxis, :]
+
+    # [ラプラス変数の数, 1]
+    lps = lps[..., np.newaxis]
+
+    # 定常部位（空気層等）か否か
+    is_steady = np.abs(cs) < 0.001
+
+    # ---- 四端子基本行列 matFi ----
+    # 定常部位の場合の値は後で置き換えるため、ゼロ除算とならない値にしておく。
+    dblTemp = np.sqrt(rs * cs * lps)
+    dblTemp = np.where(is_steady, 1.0, dblTemp)
+    rs_unsteady = np.where(is_steady, 1.0, rs)
+    dblCosh = np.cosh(dblTemp)
+    dblSinh = np.sinh(dblTemp)
+
+    fi00 = np.where(is_steady, 1.0, dblCosh)
+    fi01 = np.where(is_steady, rs, rs_unsteady / dblTemp * dblSinh)
+    fi10 = np.where(is_steady, 0.0, dblTemp / rs_unsteady * dblSinh)
+    fi11 = fi00
+
+    # ---- 四端子行列 matFt ----
+    ft00 = np.ones(fi00.shape[:-1], dtype=float)
+    ft01 = np.zeros(fi00.shape[:-1], dtype=float)
+    ft10 = np.zeros(fi00.shape[:-1], dtype=float)
+    ft11 = np.ones(fi00.shape[:-1], dtype=float)
+
+    for k in range(fi00.shape[-1]):
+        ft00, ft01, ft10, ft11 = (
+            ft00 * fi00[..., k] + ft01 * fi10[..., k],
+            ft00 * fi01[..., k] + ft01 * fi11[..., k],
+            ft10 * fi00[..., k] + ft11 * fi10[..., k],
+            ft10 * fi01[..., k] + ft11 * fi11[..., k]
+        )
 
     # 吸熱、貫流の各伝達関数ベクトルの作成
-    GA = matFt[0, 1] / matFt[1, 1]
-    GT = 1.0 / matFt[1][1]
+    GA = ft01 / ft11
+    GT = 1.0 / ft11
 
     return (GA, GT)
 
 
 # 壁体の単位応答の計算（非住宅向け重み付き最小二乗法適用）
-def _get_step_reps_of_wall_weighted(C_i_k_p, R_i_k_p, laps: List[float], alp: List[float], weight: float):
+def _get_step_reps_of_wall_weighted(C_i_k_p, R_i_k_p, laps, alp, weight: Optional[float]):
     """
     重み付き最小二乗法の適用
-    :param layers: 壁体構成部材
+    :param C_i_k_p: 層の熱容量[J/m2K], [layer数] or [壁数, layer数]
+    :param R_i_k_p: 層の熱抵抗[m2K/W], [layer数] or [壁数, layer数]
     :param laps: ラプラス変数
     :param alp: 固定根
-    :param weight: 重み付き最小二乗法の重み
-    :return:
+    :param weight: 重み付き最小二乗法の重み (None の場合は重みを用いない)
+    :return: 単位貫流応答・単位吸熱応答の初項, [] or [壁数] / 伝達関数の係数, [固定根の数] or [壁数, 固定根の数]
     """
 
-    # 吸熱、貫流の各伝達関数ベクトルの初期化
-    nlaps = len(laps)
-    matGA = np.zeros((nlaps, 1))
-    matGT = np.zeros((nlaps, 1))
+    laps = np.asarray(laps, dtype=float)
+    alp = np.asarray(alp, dtype=float)
+    R_i_k_p = np.asarray(R_i_k_p, dtype=float)
 
     # 単位貫流応答、単位吸熱応答の初期化
-    dblAT0 = 1.0
-    dblAA0 = sum(R_i_k_p)
+    dblAT0 = np.ones(R_i_k_p.shape[:-1], dtype=float)
+    dblAA0 = R_i_k_p.sum(axis=-1)
 
     # GA(0), GT(0)
     dblGA0 = dblAA0
@@ -360,50 +571,36 @@ def _get_step_reps_of_wall_weighted(C_i_k_p, R_i_k_p, laps: List[float], alp: Li
     # if abs(dblCtotal) < 0.001:
     #    pass #　暫定処理（VBAではここで処理を抜ける）
 
-    # 吸熱、貫流の各伝達関数ベクトルの作成
-    for lngI, lap in enumerate(laps):
-
-        # 伝達関数の計算
-        (GA, GT) = _calc_transfer_function(C_i_k_p=C_i_k_p, R_i_k_p=R_i_k_p, laps=lap)
-
-        # 吸熱、貫流の各伝達関数ベクトルの作成
-        matGA[lngI, 0] = GA - dblGA0
-        matGT[lngI, 0] = GT - dblGT0
-
-    # print('matGA', matGA)
-    # print('matGT', matGT)
-    # 伝達関数の係数を求めるための左辺行列を作成
-    nroot = len(alp)
-    matF = np.zeros((nlaps, nroot))
-    for lngI, lap in enumerate(laps):
-        for lngJ, root in enumerate(alp):
-            matF[lngI, lngJ] = lap / (lap + root)
-
-    # 最小二乗法のための係数行列を作成
-    matU = np.zeros((nroot, nroot))
-    for lngK in range(nroot):
-       for lngJ in range(nroot):
-           for lngI in range(nlaps):
-               matU[lngK, lngJ] += np.power(laps[lngI], weight) * matF[lngI, lngK] * matF[lngI, lngJ]
-    # matU = np.dot(matF.T, matF)
-
-    # 最小二乗法のための定数項行列を作成
-    matCA = np.zeros((nroot, 1))
-    matCT = np.zeros((nroot, 1))
-    for lngK in range(nroot):
-        for lngI in range(nlaps):
-            matCA[lngK, 0] += laps[lngI] ** weight * matF[lngI, lngK] * matGA[lngI, 0]
-            matCT[lngK, 0] += laps[lngI] ** weight * matF[lngI, lngK] * matGT[lngI, 0]
+    # 吸熱、貫流の各伝達関数ベクトルの作成, [ラプラス変数の数] or [壁数, ラプラス変数の数]
+    (GA, GT) = _calc_transfer_function(C_i_k_p=C_i_k_p, R_i_k_p=R_i_k_p, laps=laps)
+    matGA = GA - dblGA0[..., np.newaxis]
+    matGT = GT - dblGT0[..., np.newaxis]
 
-    # 伝達関数の係数を計算
-    matAA = np.linalg.solve(matU, matCA)
-    matAT = np.linalg.solve(matU, matCT)
+    # 伝達関数の係数を求めるための左辺行列を作成, [ラプラス変数の数, 固定根の数]
+    matF = laps[:, np.newaxis] / (laps[:, np.newaxis] + alp[np.newaxis, :])
+
+    # 最小二乗法のための重み, [ラプラス変数の数, 1]
+    if weight is None:
+        matW = np.ones((len(laps), 1), dtype=float)
+    else:
+        matW = np.power(laps, weight)[:, np.newaxis]
 
-    # 伝達関数の係数を一次元配列に変換
-    dblAT = matAT[:, 0]
-    dblAA = matAA[:, 0]
+    # 最小二乗法のための係数行列を作成, [固定根の数, 固定根の数]
+    matU = np.dot(matF.T, matW * matF)
 
-    return dblAT0, dblAA0, dblAT, dblAA
+    # 最小二乗法のための定数項行列を作成, [固定根の数] or [壁数, 固定根の数]
+    matCA = np.dot(matGA, matW * matF)
+    matCT = np.dot(matGT, matW * matF)
+
+    # 伝達関数の係数を計算
+    # 係数行列は全ての壁で共通のため、定数項を並べて一度に解く。
+    dblAA = np.linalg.solve(matU, matCA.reshape(-1, len(alp)).T).T.reshape(matCA.shape)
+    dblAT = np.linalg.solve(matU, matCT.reshape(-1, len(alp)).T).T.reshape(matCT.shape)
+
+    if dblAT0.ndim == 0:
+        return float(dblAT0), float(dblAA0), dblAT, dblAA
+    else:
+        return dblAT0, dblAA0, dblAT, dblAA
 
 
 # 二等辺三角波励振の応答係数、指数項別応答係数、公比の計算
@@ -412,8 +609,8 @@ def _get_RFTRI(alp, AT0, AA0, AT, AA):
     # 二等辺三角波励振の応答係数の初項を計算
     dblTemp = np.array(alp) * 900
     dblE1 = (1.0 - np.exp(-dblTemp)) / dblTemp
-    dblRFT0 = AT0 + np.sum(dblE1 * AT)
-    dblRFA0 = AA0 + np.sum(dblE1 * AA)
+    dblRFT0 = AT0 + np.sum(dblE1 * AT, axis=-1)
+    dblRFA0 = AA0 + np.sum(dblE1 * AA, axis=-1)
 
     # 指数項別応答係数、公比を計算
     dblE1 = 1.0 / dblTemp * (1.0 - np.exp(-dblTemp)) ** 2.0
@@ -432,6 +629,7 @@ def _calc_response_factor(is_ground: bool, cs: np.ndarray, rs: np.ndarray):
     (2)lngStRow, lngOutputColは削除
     (3)固定根はシートから読み込んでいたが、初期化時に配列として与えるように変更
     (4)伝達関数近似のA0の周期は使用しない
+    (5)複数の壁の熱容量・熱抵抗を [壁数, layer数] の配列として与え、まとめて計算できるように変更
     :param WallType: 壁体種類, 'wall' or 'soil'
     :param DTime: 計算時間間隔[s]
     :param wall: 壁体基本情報クラス
@@ -454,12 +652,12 @@ def _calc_response_factor(is_ground: bool, cs: np.ndarray, rs: np.ndarray):
 
     Nroot = len(alpha_m)  # 根の数
 
-    RFT1_12 = np.zeros(12)
-    RFA1_12 = np.zeros(12)
-    Row_12 = np.zeros(12)
-    RFT1_12[:len(RFT1)] = RFT1
-    RFA1_12[:len(RFA1)] = RFA1
-    Row_12[:len(Row)] = Row
+    RFT1_12 = np.zeros(RFT1.shape[:-1] + (12,))
+    RFA1_12 = np.zeros(RFA1.shape[:-1] + (12,))
+    Row_12 = np.zeros(RFT1.shape[:-1] + (12,))
+    RFT1_12[..., :Nroot] = RFT1
+    RFA1_12[..., :Nroot] = RFA1
+    Row_12[..., :Nroot] = Row
 
     return RFT0, RFA0, RFT1_12, RFA1_12, Row_12
 
@@ -472,6 +670,7 @@ def _calc_response_factor_non_residential(C_i_k_p, R_i_k_p):
     (2)lngStRow, lngOutputColは削除
     (3)固定根はシートから読み込んでいたが、初期化時に配列として与えるように変更
     (4)伝達関数近似のA0の周期は使用しない
+    (5)複数の壁の熱容量・熱抵抗を [壁数, layer数] の配列として与え、まとめて計算できるように変更
     :param WallType: 壁体種類, 'wall' or 'soil'
     :param DTime: 計算時間間隔[s]
     :param wall: 壁体基本情報クラス
@@ -479,15 +678,73 @@ def _calc_response_factor_non_residential(C_i_k_p, R_i_k_p):
 
     # 固定根, 初稿 1/(86400*365)、終項 1/600、項数 10
     alpha_m = np.logspace(np.log10(1.0 / (86400.0 * 365.0)), np.log10(1.0 / 900.0), 10)
-    alpha_m_temp = alpha_m
 
     nroot = len(alpha_m)
+
+    # 壁ごとの熱容量・熱抵抗, [壁数, layer数]
+    C_i_k_p = np.asarray(C_i_k_p, dtype=float)
+    R_i_k_p = np.asarray(R_i_k_p, dtype=float)
+    is_single = C_i_k_p.ndim == 1
+    C_ws_ls = C_i_k_p.reshape(-1, C_i_k_p.shape[-1])
+    R_ws_ls = R_i_k_p.reshape(-1, R_i_k_p.shape[-1])
+    n_w = C_ws_ls.shape[0]
+
     # 実際に応答係数計算に使用する固定根を選定する
-    GA = np.zeros_like(alpha_m_temp, dtype=float)
-    GT = np.zeros_like(alpha_m_temp, dtype=float)
-    # 固定根をラプラスパラメータとして伝達関数を計算
-    for i, lap in enumerate(alpha_m_temp):
-        (GA[i], GT[i]) = _calc_transfer_function(C_i_k_p=C_i_k_p, R_i_k_p=R_i_k_p, laps=lap)
+    # 固定根をラプラスパラメータとして伝達関数を計算, [壁数, 固定根の数]
+    _, GT_ws = _calc_transfer_function(C_i_k_p=C_ws_ls, R_i_k_p=R_ws_ls, laps=alpha_m)
+
+    # 採用する固定根の場合1, [壁数, 固定根の数]
+    is_adopts_ws = np.array([_get_is_adopts(GT=GT) for GT in GT_ws], dtype=int).reshape(n_w, nroot)
+
+    RFT0_ws = np.zeros(n_w)
+    RFA0_ws = np.zeros(n_w)
+    RFT1_12 = np.zeros((n_w, 12))
+    RFA1_12 = np.zeros((n_w, 12))
+    Row_12 = np.zeros((n_w, 12))
+
+    # 採用する固定根の組み合わせが同じ壁ごとにまとめて計算する。
+    for is_adopts in np.unique(is_adopts_ws, axis=0):
+
+        ws = np.all(is_adopts_ws == is_adopts, axis=1)
+
+        # 不採用の固定根を削除
+        alpha_m_temp = alpha_m[is_adopts == 1]
+
+        # ラプラス変数の設定
+        laps = _get_laps(alpha_m_temp)
+
+        # 単位応答の計算
+        AT0, AA0, AT, AA = _get_step_reps_of_wall_weighted(
+            C_i_k_p=C_ws_ls[ws], R_i_k_p=R_ws_ls[ws], laps=laps, alp=alpha_m_temp, weight=0.0)
+
+        # 二等辺三角波励振の応答係数の初項、指数項別応答係数、公比の計算
+        RFT0, RFA0, RFT1, RFA1, Row = _get_RFTRI(alpha_m_temp, AT0, AA0, AT, AA)
+
+        # 採用した固定根の位置に値を設定する。（不採用の固定根の値は0.0とする。）
+        js = np.flatnonzero(is_adopts == 1)
+        RFT0_ws[ws] = RFT0
+        RFA0_ws[ws] = RFA0
+        RFT1_12[np.ix_(ws, js)] = RFT1
+        RFA1_12[np.ix_(ws, js)] = RFA1
+        Row_12[np.ix_(ws, js)] = Row
+
+    if is_single:
+        return float(RFT0_ws[0]), float(RFA0_ws[0]), RFT1_12[0], RFA1_12[0], Row_12[0]
+    else:
+        return RFT0_ws, RFA0_ws, RFT1_12, RFA1_12, Row_12
+
+
+def _get_is_adopts(GT: np.ndarray) -> np.ndarray:
+    """応答係数の計算に採用する固定根を選定する。
+
+    Args:
+        GT: 固定根をラプラスパラメータとした貫流伝達関数, [固定根の数]
+
+    Returns:
+        採用する固定根の場合1, [固定根の数]
+    """
+
+    nroot = len(GT)
 
     GT2 = np.zeros(nroot + 2, dtype=float)
     # 配列0に定常の伝達関数を入力
@@ -510,37 +767,7 @@ def _calc_response_factor_non_residential(C_i_k_p, R_i_k_p):
                 break
         i += 1
 
-    # 採用する根を数える
-    adopt_nroot = sum(is_adopts)
-
-    # 不採用の固定根を削除
-    for i, adopts in enumerate(reversed(is_adopts)):
-        if adopts == 0:
-            alpha_m_temp = np.delete(alpha_m_temp, nroot - i - 1)
-
-    # ラプラス変数の設定
-    laps = _get_laps(alpha_m_temp)
-
-    # 単位応答の計算
-    AT0, AA0, AT, AA = _get_step_reps_of_wall_weighted(C_i_k_p=C_i_k_p, R_i_k_p=R_i_k_p, laps=laps, alp=alpha_m_temp, weight=0.0)
-
-    # 二等辺三角波励振の応答係数の初項、指数項別応答係数、公比の計算
-    RFT0, RFA0, RFT1, RFA1, Row = _get_RFTRI(alpha_m_temp, AT0, AA0, AT, AA)
-
-    RFT1_12 = np.zeros(12)
-    RFA1_12 = np.zeros(12)
-    Row_12 = np.zeros(12)
-    # RFT1_12[:len(RFT1)] = RFT1
-    # RFA1_12[:len(RFA1)] = RFA1
-    # Row_12[:len(Row)] = Row
-    for i, alpha in enumerate(alpha_m):
-        for j, alpha_temp in enumerate(alpha_m_temp):
-            if alpha == alpha_temp:
-                RFT1_12[i] = RFT1[j]
-                RFA1_12[i] = RFA1[j]
-                Row_12[i] = Row[j]
-
-    return RFT0, RFA0, RFT1_12, RFA1_12, Row_12
+    return is_adopts
 
 
 if __name__ == '__main__':
@@ -128,7 +128,7 @@ def _get_season_status(ipt_season: InputSeason, ipt_weather: InputWeather | None
 
                 return summer_start, summer_end, winter_start, winter_end, is_summer_period_set, is_winter_period_set
 
-            case EWeatherMethod.FILE:
+            case EWeatherMethod.FILE | EWeatherMethod.HASP:
 
                 if w is None:
                     raise ValueError('Argument as Weather class is not defined. Weather should be defined when using file method in making season period.')
@@ -2,6 +2,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Dict, Callable, Tuple
 import logging
+from scipy.signal import lfilter
 
 from heat_load_calc.matrix_method import v_diag
 from heat_load_calc import next_condition, rooms, boundaries
@@ -70,9 +71,6 @@ class Sequence:
             n_rm=rms.n_r
         )
 
-        # ステップ n の室 i における窓の透過日射熱取得, W, [n]
-        q_trs_sol_is_ns = np.dot(bs.p_is_js, bs.q_trs_sol_js_nspls)
-
         # the shape factor of boundaries j for the occupant in room i, [i, j]
         f_mrt_hum_is_js = occupants_form_factor.get_f_mrt_hum_js(
             p_is_js=bs.p_is_js,
@@ -90,34 +88,15 @@ class Sequence:
             v_vent_mec_local_is_ns=scd.v_mec_vent_local_is_ns
         )
 
-        # the average value of the transparented solar radiation absorbed by the furniture in room i at step n
-        q_sol_frt_is_ns = solar_absorption.get_q_sol_frt_is_ns(q_trs_sor_is_ns=q_trs_sol_is_ns, r_sol_frt_is=rms.r_sol_frt_is)
-
-        # the transparent solar radiation absorbed by the boundary j at step n, W/m2, [J, N]
-        q_s_sol_js_ns = solar_absorption.get_q_s_sol_js_ns(
-            p_is_js=bs.p_is_js,
-            a_s_js=bs.a_s_js,
-            p_s_sol_abs_js=bs.b_s_sol_abs_js,
-            p_js_is=bs.p_js_is,
-            q_trs_sol_is_ns=q_trs_sol_is_ns,
-            r_sol_frt_is=rms.r_sol_frt_is
-        )
-
         # f_AX, -, [j, j]
         f_ax_js_js = bs.get_f_ax_js_is(f_mrt_is_js=f_mrt_is_js)
 
         # f_FIA, -, [J, I]
         f_fia_js_is = bs.get_f_fia_js_is()
 
-        # f_CRX, degree C, [J, N]
-        f_crx_js_ns = bs.get_f_crx_js_ns(q_s_sol_js_ns=q_s_sol_js_ns)
-
         # f_WSR, -, [J, I]
         f_wsr_js_is = get_f_wsr_js_is(f_ax_js_js=f_ax_js_js, f_fia_js_is=f_fia_js_is)
 
-        # f_{WSC, n}, degree C, [J, N]
-        f_wsc_js_ns = get_f_wsc_js_ns(f_ax_js_js=f_ax_js_js, f_crx_js_ns=f_crx_js_ns)
-
         # ステップnにおける室iの在室者表面における対流熱伝達率の総合熱伝達率に対する比, -, [i, 1]
         # ステップ n における室 i の在室者表面における放射熱伝達率の総合熱伝達率に対する比, -, [i, 1]
         k_c_is_n, k_r_is_n = op.get_k_is()
@@ -130,6 +109,80 @@ class Sequence:
             k_r_is_n=k_r_is_n
         )
 
+        # region 時間によらない係数の事前計算
+
+        # ステップごとの計算のうち、時間によって変化しない部分をあらかじめ計算しておく。
+
+        # f_AX の逆行列, -, [j, j]
+        f_ax_inv_js_js = np.linalg.inv(f_ax_js_js)
+
+        # 係数 f_BRM のうち時間によって変化しない部分, W/K, [i, i]
+        f_brm_cst_is_is = get_f_brm_cst_is_is(
+            a_s_js=bs.a_s_js,
+            c_a=get_c_a(),
+            v_rm_is=rms.v_r_is,
+            c_sh_frt_is=rms.c_sh_frt_is,
+            delta_t=delta_t,
+            f_wsr_js_is=f_wsr_js_is,
+            g_sh_frt_is=rms.g_sh_frt_is,
+            h_s_c_js=bs.h_s_c_js,
+            p_is_js=bs.p_is_js,
+            p_js_is=bs.p_js_is,
+            rho_a=get_rho_a(),
+            v_vent_int_is_is=mvs.v_vent_int_is_is
+        )
+
+        # 係数 f_h_wgt のうち時間によって変化しない部分, kg/(s kg/kg(DA)), [i, i]
+        f_h_wgt_cst_is_is = get_f_h_wgt_cst_is_is(
+            c_lh_frt_is=rms.c_lh_frt_is,
+            delta_t=delta_t,
+            g_lh_frt_is=rms.g_lh_frt_is,
+            rho_a=get_rho_a(),
+            v_rm_is=rms.v_r_is,
+            v_vent_int_is_is=mvs.v_vent_int_is_is
+        )
+
+        # 境界 j の表面温度が室 i の係数 f_BRC に与える影響を表す係数, W/K, [i, j]
+        f_brc_ws_is_js = get_f_brc_ws_is_js(a_s_js=bs.a_s_js, h_s_c_js=bs.h_s_c_js, p_is_js=bs.p_is_js)
+
+        # 境界 j の表面温度が室 i の係数 f_XC に与える影響を表す係数, -, [i, j]
+        f_xc_ws_is_js = get_f_xc_ws_is_js(
+            f_mrt_hum_is_js=f_mrt_hum_is_js,
+            f_xot_is_is_n_pls=f_xot_is_is_n_pls,
+            k_r_is_n=k_r_is_n
+        )
+
+        # 境界 j の表面温度が境界 j の等価温度の放射成分に与える影響を表す係数, -, [j, j]
+        f_mrt_js_js = np.dot(bs.p_js_is, f_mrt_is_js)
+
+        # 室 i の放射暖房・放射冷房運転時の係数 f_WSB, K/W, [j, i]
+        f_wsb_h_js_is = get_f_wsb_js_is_n_pls(
+            f_flb_js_is_n_pls=bs.get_f_flb_js_is_n_pls(beta_is_n=es.beta_h_is, f_flr_js_is_n=es.f_flr_h_js_is),
+            f_ax_js_js=f_ax_js_js
+        )
+        f_wsb_c_js_is = get_f_wsb_js_is_n_pls(
+            f_flb_js_is_n_pls=bs.get_f_flb_js_is_n_pls(beta_is_n=es.beta_c_is, f_flr_js_is_n=es.f_flr_c_js_is),
+            f_ax_js_js=f_ax_js_js
+        )
+
+        # 室 i の放射暖房・放射冷房運転時の係数 f_BRL, -, [i, i]
+        f_brl_h_is_is = get_f_brl_is_is_n(
+            a_s_js=bs.a_s_js, beta_is_n=es.beta_h_is, f_wsb_js_is_n_pls=f_wsb_h_js_is, h_s_c_js=bs.h_s_c_js, p_is_js=bs.p_is_js
+        )
+        f_brl_c_is_is = get_f_brl_is_is_n(
+            a_s_js=bs.a_s_js, beta_is_n=es.beta_c_is, f_wsb_js_is_n_pls=f_wsb_c_js_is, h_s_c_js=bs.h_s_c_js, p_is_js=bs.p_is_js
+        )
+
+        # 室 i の放射暖房・放射冷房運転時の係数 f_XLR, K/W, [i, i]
+        f_xlr_h_is_is = get_f_xlr_is_is_n_pls(
+            f_mrt_hum_is_js=f_mrt_hum_is_js, f_wsb_js_is_n_pls=f_wsb_h_js_is, f_xot_is_is_n_pls=f_xot_is_is_n_pls, k_r_is_n=k_r_is_n
+        )
+        f_xlr_c_is_is = get_f_xlr_is_is_n_pls(
+            f_mrt_hum_is_js=f_mrt_hum_is_js, f_wsb_js_is_n_pls=f_wsb_c_js_is, f_xot_is_is_n_pls=f_xot_is_is_n_pls, k_r_is_n=k_r_is_n
+        )
+
+        # endregion
+
         # 時間間隔クラス
         self._itv = itv
 
@@ -139,9 +192,6 @@ class Sequence:
         # ロガー
         self._logger = logger
 
-        # Weather Class
-        self._weather: Weather = weather
-
         # Schedule Class
         self._scd: Schedule = scd
 
@@ -168,18 +218,9 @@ class Sequence:
         #   ステップ n　からステップ n+1 における係数 f_l_cl_cst, kg/s, [i, 1]
         self._get_f_l_cl = es.get_f_l_cl
 
-        # the solar heat gain transmitted through the windows of room i at step n, W, [I, N]
-        self._q_trs_sol_is_ns = q_trs_sol_is_ns
-
         # mechanical ventilation amount(general ventiration amount + local ventiration amount) of room i at step n, m3/s, [I,N]
         self._v_vent_mec_is_ns = v_vent_mec_is_ns
 
-        # the average value of the transparented solar radiation absorbed by the furniture in room i at step n
-        self._q_sol_frt_is_ns = q_sol_frt_is_ns
-
-        # the transparent solar radiation absorbed by the boundary j at step n, W/m2, [J, N]
-        self._q_s_sol_js_ns = q_s_sol_js_ns
-
         # f_AX, -, [j, j]
         self._f_ax_js_js = f_ax_js_js
 
@@ -192,9 +233,6 @@ class Sequence:
         # f_WSR, -, [J, I]
         self._f_wsr_js_is = f_wsr_js_is
 
-        # f_{WSC, n}, degree C, [J, N]
-        self._f_wsc_js_ns = f_wsc_js_ns
-
         # the ratio of the radiative heat transfer coefficient to the integrated heat transfer coefficient on the surface of the occuapnts in room i at step n, -, [I, 1]
         self._k_r_is_n = k_r_is_n
 
@@ -204,6 +242,107 @@ class Sequence:
         # f_{XOT, i, i}, [I, I]
         self._f_xot_is_is_n_pls = f_xot_is_is_n_pls
 
+        # f_AX の逆行列, -, [J, J]
+        self._f_ax_inv_js_js = f_ax_inv_js_js
+
+        # 係数 f_BRM のうち時間によって変化しない部分, W/K, [I, I]
+        self._f_brm_cst_is_is = f_brm_cst_is_is
+
+        # 係数 f_h_wgt のうち時間によって変化しない部分, kg/(s kg/kg(DA)), [I, I]
+        self._f_h_wgt_cst_is_is = f_h_wgt_cst_is_is
+
+        # 境界 j の表面温度が室 i の係数 f_BRC に与える影響を表す係数, W/K, [I, J]
+        self._f_brc_ws_is_js = f_brc_ws_is_js
+
+        # 境界 j の表面温度が室 i の係数 f_XC に与える影響を表す係数, -, [I, J]
+        self._f_xc_ws_is_js = f_xc_ws_is_js
+
+        # 境界 j の表面温度が境界 j の等価温度の放射成分に与える影響を表す係数, -, [J, J]
+        self._f_mrt_js_js = f_mrt_js_js
+
+        # 室 i の放射暖房運転時・放射冷房運転時の係数 f_WSB, K/W, [J, I]
+        self._f_wsb_h_js_is = f_wsb_h_js_is
+        self._f_wsb_c_js_is = f_wsb_c_js_is
+
+        # 室 i の放射暖房運転時・放射冷房運転時の係数 f_BRL, -, [I, I]
+        self._f_brl_h_is_is = f_brl_h_is_is
+        self._f_brl_c_is_is = f_brl_c_is_is
+
+        # 室 i の放射暖房運転時・放射冷房運転時の係数 f_XLR, K/W, [I, I]
+        self._f_xlr_h_is_is = f_xlr_h_is_is
+        self._f_xlr_c_is_is = f_xlr_c_is_is
+
+        # 気象データによって変化する係数を計算する。
+        self._set_weather_values(weather=weather)
+
+    def set_weather(self, weather: Weather):
+        """Replace the weather data. / 気象データを差し替える。
+
+        Args:
+            weather: Weather class
+
+        Notes:
+            複数年の計算において、年ごとの気象データに対してステップごとの値（相当外気温度・透過日射熱取得・係数 f_WSC 等）を計算し直す。
+            時間によらない係数（応答係数・係数 f_AX 等）は計算し直さない。
+        """
+
+        self._bs.set_weather(w=weather)
+
+        self._set_weather_values(weather=weather)
+
+    def _set_weather_values(self, weather: Weather):
+        """Calculate the values at each step depending on the weather data. / 気象データによって変化するステップごとの値を計算する。
+
+        Args:
+            weather: Weather class
+        """
+
+        bs = self._bs
+        rms = self._rms
+
+        # ステップ n の室 i における窓の透過日射熱取得, W, [n]
+        q_trs_sol_is_ns = np.dot(bs.p_is_js, bs.q_trs_sol_js_nspls)
+
+        # the average value of the transparented solar radiation absorbed by the furniture in room i at step n
+        q_sol_frt_is_ns = solar_absorption.get_q_sol_frt_is_ns(q_trs_sor_is_ns=q_trs_sol_is_ns, r_sol_frt_is=rms.r_sol_frt_is)
+
+        # the transparent solar radiation absorbed by the boundary j at step n, W/m2, [J, N]
+        q_s_sol_js_ns = solar_absorption.get_q_s_sol_js_ns(
+            p_is_js=bs.p_is_js,
+            a_s_js=bs.a_s_js,
+            p_s_sol_abs_js=bs.b_s_sol_abs_js,
+            p_js_is=bs.p_js_is,
+            q_trs_sol_is_ns=q_trs_sol_is_ns,
+            r_sol_frt_is=rms.r_sol_frt_is
+        )
+
+        # f_CRX, degree C, [J, N]
+        f_crx_js_ns = bs.get_f_crx_js_ns(q_s_sol_js_ns=q_s_sol_js_ns)
+
+        # f_{WSC, n}, degree C, [J, N]
+        f_wsc_js_ns = get_f_wsc_js_ns(f_ax_js_js=self._f_ax_js_js, f_crx_js_ns=f_crx_js_ns)
+
+        # Weather Class
+        self._weather: Weather = weather
+
+        # the solar heat gain transmitted through the windows of room i at step n, W, [I, N]
+        self._q_trs_sol_is_ns = q_trs_sol_is_ns
+
+        # the average value of the transparented solar radiation absorbed by the furniture in room i at step n
+        self._q_sol_frt_is_ns = q_sol_frt_is_ns
+
+        # the transparent solar radiation absorbed by the boundary j at step n, W/m2, [J, N]
+        self._q_s_sol_js_ns = q_s_sol_js_ns
+
+        # f_{WSC, n}, degree C, [J, N]
+        self._f_wsc_js_ns = f_wsc_js_ns
+
+        # 係数 f_BRC のうち係数 f_WSC による部分, W, [I, N+1]
+        self._f_brc_wsc_is_ns = np.dot(self._f_brc_ws_is_js, f_wsc_js_ns)
+
+        # 係数 f_XC のうち係数 f_WSC による部分, degree C, [I, N+1]
+        self._f_xc_wsc_is_ns = np.dot(self._f_xc_ws_is_js, f_wsc_js_ns)
+
     @property
     def weather(self) -> Weather:
         """Weather Class"""
@@ -238,6 +377,16 @@ class Sequence:
     def es(self) -> Equipments:
         return self._es
 
+    @property
+    def itv(self) -> Interval:
+        """Interval Class"""
+        return self._itv
+
+    @property
+    def op(self) -> Operation:
+        """Operation Class"""
+        return self._op
+
     @property
     def get_f_l_cl(self) -> Callable[[np.ndarray, np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
         """次の係数を求める関数
@@ -312,6 +461,76 @@ class Sequence:
     def f_xot_is_is_n_pls(self):
         """f_{XOT, i, i}, [I, I]"""
         return self._f_xot_is_is_n_pls
+
+    @property
+    def f_ax_inv_js_js(self):
+        """f_AX の逆行列, -, [J, J]"""
+        return self._f_ax_inv_js_js
+
+    @property
+    def f_brm_cst_is_is(self):
+        """係数 f_BRM のうち時間によって変化しない部分, W/K, [I, I]"""
+        return self._f_brm_cst_is_is
+
+    @property
+    def f_h_wgt_cst_is_is(self):
+        """係数 f_h_wgt のうち時間によって変化しない部分, kg/(s kg/kg(DA)), [I, I]"""
+        return self._f_h_wgt_cst_is_is
+
+    @property
+    def f_brc_ws_is_js(self):
+        """境界 j の表面温度が室 i の係数 f_BRC に与える影響を表す係数, W/K, [I, J]"""
+        return self._f_brc_ws_is_js
+
+    @property
+    def f_brc_wsc_is_ns(self):
+        """係数 f_BRC のうち係数 f_WSC による部分, W, [I, N+1]"""
+        return self._f_brc_wsc_is_ns
+
+    @property
+    def f_xc_ws_is_js(self):
+        """境界 j の表面温度が室 i の係数 f_XC に与える影響を表す係数, -, [I, J]"""
+        return self._f_xc_ws_is_js
+
+    @property
+    def f_xc_wsc_is_ns(self):
+        """係数 f_XC のうち係数 f_WSC による部分, degree C, [I, N+1]"""
+        return self._f_xc_wsc_is_ns
+
+    @property
+    def f_mrt_js_js(self):
+        """境界 j の表面温度が境界 j の等価温度の放射成分に与える影響を表す係数, -, [J, J]"""
+        return self._f_mrt_js_js
+
+    @property
+    def f_wsb_h_js_is(self):
+        """室 i の放射暖房運転時の係数 f_WSB, K/W, [J, I]"""
+        return self._f_wsb_h_js_is
+
+    @property
+    def f_wsb_c_js_is(self):
+        """室 i の放射冷房運転時の係数 f_WSB, K/W, [J, I]"""
+        return self._f_wsb_c_js_is
+
+    @property
+    def f_brl_h_is_is(self):
+        """室 i の放射暖房運転時の係数 f_BRL, -, [I, I]"""
+        return self._f_brl_h_is_is
+
+    @property
+    def f_brl_c_is_is(self):
+        """室 i の放射冷房運転時の係数 f_BRL, -, [I, I]"""
+        return self._f_brl_c_is_is
+
+    @property
+    def f_xlr_h_is_is(self):
+        """室 i の放射暖房運転時の係数 f_XLR, K/W, [I, I]"""
+        return self._f_xlr_h_is_is
+
+    @property
+    def f_xlr_c_is_is(self):
+        """室 i の放射冷房運転時の係数 f_XLR, K/W, [I, I]"""
+        return self._f_xlr_c_is_is
     
 
     def run_tick(self, n: int, c_n: Conditions, recorder: Recorder, exe_verify: bool = False) -> Conditions:
@@ -364,7 +583,7 @@ class Sequence:
         # ステップ n+1 の境界 j における係数 f_WSV, degree C, [j, 1]
         f_wsv_js_n_pls = get_f_wsv_js_n_pls(
             f_cvl_js_n_pls=f_cvl_js_n_pls,
-            f_ax_js_js=self.f_ax_js_js
+            f_ax_inv_js_js=self.f_ax_inv_js_js
         )
 
         # ステップnからステップn+1における室iの換気・隙間風による外気の流入量, m3/s, [i, 1]
@@ -376,16 +595,14 @@ class Sequence:
         # ステップ n+1 の室 i における係数 f_BRC, W, [i, 1]
         # TODO: q_sol_frt_is_ns の値は n+1 の値を使用するべき？
         f_brc_non_nv_is_n_pls, f_brc_nv_is_n_pls = get_f_brc_is_n_pls(
-            a_s_js=self.bs.a_s_js,
             c_a=get_c_a(),
             v_rm_is=self.rms.v_r_is,
             c_sh_frt_is=self.rms.c_sh_frt_is,
             delta_t=delta_t,
-            f_wsc_js_n_pls=self.f_wsc_js_ns[:, n + 1].reshape(-1, 1),
+            f_brc_ws_is_js=self.f_brc_ws_is_js,
+            f_brc_wsc_is_n_pls=self.f_brc_wsc_is_ns[:, n + 1].reshape(-1, 1),
             f_wsv_js_n_pls=f_wsv_js_n_pls,
             g_sh_frt_is=self.rms.g_sh_frt_is,
-            h_s_c_js=self.bs.h_s_c_js,
-            p_is_js=self.bs.p_is_js,
             q_gen_is_n=self.scd.q_gen_is_ns[:, n].reshape(-1, 1),
             q_hum_is_n=q_hum_is_n,
             q_sol_frt_is_n=self.q_sol_frt_is_ns[:, n].reshape(-1, 1),
@@ -399,29 +616,18 @@ class Sequence:
 
         # ステップ n+1 における係数 f_BRM, W/K, [i, i]
         f_brm_non_nv_is_is_n_pls, f_brm_nv_is_is_n_pls = get_f_brm_is_is_n_pls(
-            a_s_js=self.bs.a_s_js,
             c_a=get_c_a(),
-            v_rm_is=self.rms.v_r_is,
-            c_sh_frt_is=self.rms.c_sh_frt_is,
-            delta_t=delta_t,
-            f_wsr_js_is=self.f_wsr_js_is,
-            g_sh_frt_is=self.rms.g_sh_frt_is,
-            h_s_c_js=self.bs.h_s_c_js,
-            p_is_js=self.bs.p_is_js,
-            p_js_is=self.bs.p_js_is,
+            f_brm_cst_is_is=self.f_brm_cst_is_is,
             rho_a=get_rho_a(),
-            v_vent_int_is_is_n=self.mvs.v_vent_int_is_is,
             v_vent_out_non_nv_is_n=v_vent_out_non_nv_is_n,
             v_vent_ntr_set_is=self.rms.v_vent_ntr_set_is
         )
 
         # ステップn+1における室iの係数 XC, [i, 1]
         f_xc_is_n_pls = get_f_xc_is_n_pls(
-            f_mrt_hum_is_js=self.f_mrt_hum_is_js,
-            f_wsc_js_n_pls=self.f_wsc_js_ns[:, n + 1].reshape(-1, 1),
-            f_wsv_js_n_pls=f_wsv_js_n_pls,
-            f_xot_is_is_n_pls=self.f_xot_is_is_n_pls,
-            k_r_is_n=self.k_r_is_n
+            f_xc_ws_is_js=self.f_xc_ws_is_js,
+            f_xc_wsc_is_n_pls=self.f_xc_wsc_is_ns[:, n + 1].reshape(-1, 1),
+            f_wsv_js_n_pls=f_wsv_js_n_pls
         )
 
         # ステップ n における係数 f_BRM,OT, W/K, [i, i]
@@ -460,12 +666,8 @@ class Sequence:
         # ステップnにおける自然風非利用時の室i*の絶対湿度が室iの潜熱バランスに与える影響を表す係数,　kg/(s kg/kg(DA)), [i, i]
         # ステップnにおける自然風利用時の室i*の絶対湿度が室iの潜熱バランスに与える影響を表す係数,　kg/(s kg/kg(DA)), [i, i]
         f_h_wgt_non_nv_is_is_n, f_h_wgt_nv_is_is_n = get_f_h_wgt_is_is_n(
-            c_lh_frt_is=self.rms.c_lh_frt_is,
-            delta_t=delta_t,
-            g_lh_frt_is=self.rms.g_lh_frt_is,
+            f_h_wgt_cst_is_is=self.f_h_wgt_cst_is_is,
             rho_a=get_rho_a(),
-            v_rm_is=self.rms.v_r_is,
-            v_vent_int_is_is_n=self.mvs.v_vent_int_is_is,
             v_vent_out_non_nv_is_n=v_vent_out_non_nv_is_n,
             v_vent_ntr_is=self.rms.v_vent_ntr_set_is
         )
@@ -514,61 +716,61 @@ class Sequence:
         )
 
         f_brm_is_is_n_pls = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             f_brm_nv_is_is_n_pls,
             f_brm_non_nv_is_is_n_pls
         )
 
         v_vent_ntr_is_n = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             self.rms.v_vent_ntr_set_is,
             0.0
         )
 
         f_brm_ot_is_is_n_pls = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             f_brm_ot_nv_is_is_n_pls,
             f_brm_ot_non_nv_is_is_n_pls
         )
 
         f_brc_ot_is_n_pls = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             f_brc_ot_nv_is_n_pls,
             f_brc_ot_non_nv_is_n_pls
         )
 
         f_h_cst_is_n = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             f_h_cst_nv_is_n,
             f_h_cst_non_nv_is_n
         )
 
         f_h_wgt_is_is_n = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             f_h_wgt_nv_is_is_n,
             f_h_wgt_non_nv_is_is_n
         )
 
         theta_r_ot_ntr_is_n_pls = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             theta_r_ot_ntr_nv_is_n_pls,
             theta_r_ot_ntr_non_nv_is_n_pls
         )
 
         theta_r_ntr_is_n_pls = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             theta_r_ntr_nv_is_n_pls,
             theta_r_ntr_non_nv_is_n_pls
         )
 
         theta_mrt_hum_ntr_is_n_pls = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             theta_mrt_hum_ntr_nv_is_n_pls,
             theta_mrt_hum_ntr_non_nv_is_n_pls
         )
 
         x_r_ntr_is_n_pls = np.where(
-            operation_mode_is_n == OperationMode.STOP_OPEN,
+            operation_mode_is_n == OperationMode.STOP_OPEN.value,
             x_r_ntr_nv_is_n_pls,
             x_r_ntr_non_nv_is_n_pls
         )
@@ -599,40 +801,25 @@ class Sequence:
             operation_mode_is_n=operation_mode_is_n
         )
 
-        # ステップ n における係数 f_FLB, K/W, [j, i]
-        #f_flb_js_is_n_pls = get_f_flb_js_is_n_pls(
-            #a_s_js=self.bs.a_s_js,
-            #beta_is_n=beta_is_n,
-            #f_flr_js_is_n=f_flr_js_is_n,
-            #h_s_c_js=self.bs.h_s_c_js,
-            #h_s_r_js=self.bs.h_s_r_js,
-            #k_ei_js_js=self.bs.k_ei_js_js,
-            #phi_a0_js=self.bs.phi_a0_js,
-            #phi_t0_js=self.bs.phi_t0_js
-        #)
-        f_flb_js_is_n_pls = self.bs.get_f_flb_js_is_n_pls(beta_is_n=beta_is_n, f_flr_js_is_n=f_flr_js_is_n)
-
         # ステップ n における係数 f_WSB, K/W, [j, i]
-        f_wsb_js_is_n_pls = get_f_wsb_js_is_n_pls(
-            f_flb_js_is_n_pls=f_flb_js_is_n_pls,
-            f_ax_js_js=self.f_ax_js_js
+        f_wsb_js_is_n_pls = get_x_xs_is_n_by_operation_mode(
+            x_c_xs_is=self.f_wsb_c_js_is,
+            x_h_xs_is=self.f_wsb_h_js_is,
+            operation_mode_is_n=operation_mode_is_n
         )
 
         # ステップ n における係数 f_BRL, -, [i, i]
-        f_brl_is_is_n = get_f_brl_is_is_n(
-            a_s_js=self.bs.a_s_js,
-            beta_is_n=beta_is_n,
-            f_wsb_js_is_n_pls=f_wsb_js_is_n_pls,
-            h_s_c_js=self.bs.h_s_c_js,
-            p_is_js=self.bs.p_is_js
+        f_brl_is_is_n = get_x_xs_is_n_by_operation_mode(
+            x_c_xs_is=self.f_brl_c_is_is,
+            x_h_xs_is=self.f_brl_h_is_is,
+            operation_mode_is_n=operation_mode_is_n
         )
 
         # ステップn+1における室iの係数 f_XLR, K/W, [i, i]
-        f_xlr_is_is_n_pls = get_f_xlr_is_is_n_pls(
-            f_mrt_hum_is_js=self.f_mrt_hum_is_js,
-            f_wsb_js_is_n_pls=f_wsb_js_is_n_pls,
-            f_xot_is_is_n_pls=self.f_xot_is_is_n_pls,
-            k_r_is_n=self.k_r_is_n
+        f_xlr_is_is_n_pls = get_x_xs_is_n_by_operation_mode(
+            x_c_xs_is=self.f_xlr_c_is_is,
+            x_h_xs_is=self.f_xlr_h_is_is,
+            operation_mode_is_n=operation_mode_is_n
         )
 
         # ステップ n における係数 f_BRL_OT, -, [i, i]
@@ -701,7 +888,7 @@ class Sequence:
         theta_ei_js_n_pls = get_theta_ei_js_n_pls(
             a_s_js=self.bs.a_s_js,
             beta_is_n=beta_is_n,
-            f_mrt_is_js=self.f_mrt_is_js,
+            f_mrt_js_js=self.f_mrt_js_js,
             f_flr_js_is_n=f_flr_js_is_n,
             h_s_c_js=self.bs.h_s_c_js,
             h_s_r_js=self.bs.h_s_r_js,
@@ -765,100 +952,25 @@ class Sequence:
         )
 
         if exe_verify:
-            
-            if n == 0:
-                print("Executing verification tests at step {}.".format(n))
-
-            # 室空気の熱収支のテスト
-            test_air_heat_balance(
-                theta_o_ns_plus=self.weather.theta_o_ns_plus[n+1].reshape(-1, 1),
+            self.verify(
+                n=n,
+                c_n=c_n,
                 theta_r_is_n_pls=theta_r_is_n_pls,
-                theta_r_is_n=c_n.theta_r_is_n,
                 theta_s_js_n_pls=theta_s_js_n_pls,
                 theta_frt_is_n_pls=theta_frt_is_n_pls,
-                v_r_is=self.rms.v_r_is, a_s_js=self.bs.a_s_js,
-                v_leak_is_n=v_leak_is_n,
-                v_vent_ntr_is_n=v_vent_ntr_is_n,
-                v_vent_int_is_is=self.mvs.v_vent_int_is_is,
-                v_vent_mec_is_ns=self.v_vent_mec_is_ns[:, n].reshape(-1, 1),
-                q_gen_is_ns=self.scd.q_gen_is_ns[:, n].reshape(-1, 1),
-                q_hum_is_n=q_hum_is_n,
-                l_cs_is_n=l_cs_is_n,
-                l_rs_is_n=l_rs_is_n,
-                beta_is_n=beta_is_n,
-                p_js_is=self.bs.p_js_is,
-                p_is_js=self.bs.p_is_js,
-                h_s_c_js=self.bs.h_s_c_js,
-                g_sh_frt_is=self.rms.g_sh_frt_is,
-                delta_t=delta_t
-            )
-
-            # 室空気の湿収支のテスト
-            test_air_moisture_balance(
-                x_o_ns_plus=self.weather.x_o_ns_plus[n+1].reshape(-1, 1),
                 x_r_is_n_pls=x_r_is_n_pls,
-                x_r_is_n=c_n.x_r_is_n,
                 x_frt_is_n_pls=x_frt_is_n_pls,
-                v_r_is=self.rms.v_r_is,
-                v_vent_int_is_is=self.mvs.v_vent_int_is_is,
-                v_leak_is_n=v_leak_is_n,
-                v_vent_ntr_is_n=v_vent_ntr_is_n,
-                v_vent_mec_is_n=self.v_vent_mec_is_ns[:, n].reshape(-1, 1),
-                x_gen_is_n=self.scd.x_gen_is_ns[:, n].reshape(-1,1),
+                theta_rear_js_n_pls=theta_rear_js_n_pls,
+                f_cvl_js_n_pls=f_cvl_js_n_pls,
+                q_s_js_n_pls=q_s_js_n_pls,
+                l_cs_is_n=l_cs_is_n,
+                l_rs_is_n=l_rs_is_n,
                 l_cl_is_n=l_cl_is_n,
+                beta_is_n=beta_is_n,
+                q_hum_is_n=q_hum_is_n,
                 x_hum_is_n=x_hum_is_n,
-                g_lh_frt_is=self.rms.g_lh_frt_is,
-                delta_t=delta_t
-            )
-        
-            #### 備品の熱収支のテスト ####
-            test_frt_heat_balance(
-                theta_frt_is_n_pls=theta_frt_is_n_pls,
-                theta_frt_is_n=c_n.theta_frt_is_n,
-                theta_r_is_n_pls=theta_r_is_n_pls,
-                q_sol_frt_is_ns=self.q_sol_frt_is_ns[:, n].reshape(-1, 1),
-                c_sh_frt_is=self.rms.c_sh_frt_is,
-                g_sh_frt_is=self.rms.g_sh_frt_is,
-                delta_t=delta_t
-            )
-            
-            # 備品の湿収支のテスト
-            test_frt_moisture_balance(
-                x_frt_is_n_pls=x_frt_is_n_pls,
-                x_frt_is_n=c_n.x_frt_is_n,
-                x_r_is_n_pls=x_r_is_n_pls,
-                c_lh_frt_is=self.rms.c_lh_frt_is,
-                g_lh_frt_is=self.rms.g_lh_frt_is,
-                delta_t=delta_t
-            )
-
-            #### 室内表面の放射熱収支のテスト ####
-            test_surface_radiation_balance(
-                theta_s_js_n_pls=theta_s_js_n_pls,
-                p_js_is=self.bs.p_js_is,
-                f_mrt_is_js=self.f_mrt_is_js,
-                h_s_r_js=self.bs.h_s_r_js,
-                a_s_js=self.bs.a_s_js,
-                p_is_js=self.bs.p_is_js
-            )
-            
-            #### 透過日射熱取得の収支のテスト ####
-            test_solar_heat_gain_balance(
-                p_is_js=self.bs.p_is_js,
-                q_trs_sol_is_ns=self.q_trs_sol_is_ns[:, n + 1].reshape(-1, 1),
-                q_sol_frt_is_ns=self.q_sol_frt_is_ns[:, n + 1].reshape(-1, 1),
-                q_s_sol_js_ns=self.q_s_sol_js_ns[:, n + 1].reshape(-1, 1),
-                a_s_js=self.bs.a_s_js
-                )
-            
-            #### 境界表面温度の計算結果のテスト ####
-            test_theta_surface(
-                theta_s_js=theta_s_js_n_pls,
-                theta_rear_js=theta_rear_js_n_pls,
-                f_cvl_js=f_cvl_js_n_pls,
-                q_i_s_js=q_s_js_n_pls,
-                phi_a0_js=self.bs.phi_a0_js,
-                phi_t0_js=self.bs.phi_t0_js
+                v_leak_is_n=v_leak_is_n,
+                v_vent_ntr_is_n=v_vent_ntr_is_n
             )
 
         if recorder is not None:
@@ -900,11 +1012,160 @@ class Sequence:
             theta_ei_js_n=theta_ei_js_n_pls
         )
 
+    def verify(
+            self,
+            n: int,
+            c_n: Conditions,
+            theta_r_is_n_pls: np.ndarray,
+            theta_s_js_n_pls: np.ndarray,
+            theta_frt_is_n_pls: np.ndarray,
+            x_r_is_n_pls: np.ndarray,
+            x_frt_is_n_pls: np.ndarray,
+            theta_rear_js_n_pls: np.ndarray,
+            f_cvl_js_n_pls: np.ndarray,
+            q_s_js_n_pls: np.ndarray,
+            l_cs_is_n: np.ndarray,
+            l_rs_is_n: np.ndarray,
+            l_cl_is_n: np.ndarray,
+            beta_is_n: np.ndarray,
+            q_hum_is_n: np.ndarray,
+            x_hum_is_n: np.ndarray,
+            v_leak_is_n: np.ndarray,
+            v_vent_ntr_is_n: np.ndarray
+    ):
+        """ステップ n からステップ n+1 の計算結果について熱収支・湿収支等のチェックを行う。
+
+        Args:
+            n: ステップ
+            c_n: ステップ n における状態
+            theta_r_is_n_pls: ステップ n+1 における室 i の温度, degree C, [i, 1]
+            theta_s_js_n_pls: ステップ n+1 における境界 j の表面温度, degree C, [j, 1]
+            theta_frt_is_n_pls: ステップ n+1 における室 i の備品等の温度, degree C, [i, 1]
+            x_r_is_n_pls: ステップ n+1 における室 i の絶対湿度, kg/kg(DA), [i, 1]
+            x_frt_is_n_pls: ステップ n+1 における室 i の備品等の絶対湿度, kg/kg(DA), [i, 1]
+            theta_rear_js_n_pls: ステップ n+1 における境界 j の裏面温度, degree C, [j, 1]
+            f_cvl_js_n_pls: ステップ n+1 における境界 j の係数 f_CVL, degree C, [j, 1]
+            q_s_js_n_pls: ステップ n+1 における境界 j の表面熱流（壁体吸熱を正とする）, W/m2, [j, 1]
+            l_cs_is_n: ステップ n から n+1 における室 i の対流暖冷房負荷（加熱を正・冷却を負とする）, W, [i, 1]
+            l_rs_is_n: ステップ n から n+1 における室 i の放射暖冷房負荷（加熱を正・冷却を負とする）, W, [i, 1]
+            l_cl_is_n: ステップ n から n+1 における室 i の潜熱負荷（加湿を正・除湿を負とする）, W, [i, 1]
+            beta_is_n: ステップ n から n+1 における室 i の放射暖冷房設備の対流成分比率, -, [i, 1]
+            q_hum_is_n: ステップ n から n+1 における室 i の人体発熱, W, [i, 1]
+            x_hum_is_n: ステップ n から n+1 における室 i の人体発湿, kg/s, [i, 1]
+            v_leak_is_n: ステップ n から n+1 における室 i のすきま風量, m3/s, [i, 1]
+            v_vent_ntr_is_n: ステップ n から n+1 における室 i の自然風利用による換気量, m3/s, [i, 1]
+        """
+
+        delta_t = self._delta_t
+
+        if n == 0:
+            print("Executing verification tests at step {}.".format(n))
+
+        # 室空気の熱収支のテスト
+        test_air_heat_balance(
+            theta_o_ns_plus=self.weather.theta_o_ns_plus[n+1].reshape(-1, 1),
+            theta_r_is_n_pls=theta_r_is_n_pls,
+            theta_r_is_n=c_n.theta_r_is_n,
+            theta_s_js_n_pls=theta_s_js_n_pls,
+            theta_frt_is_n_pls=theta_frt_is_n_pls,
+            v_r_is=self.rms.v_r_is, a_s_js=self.bs.a_s_js,
+            v_leak_is_n=v_leak_is_n,
+            v_vent_ntr_is_n=v_vent_ntr_is_n,
+            v_vent_int_is_is=self.mvs.v_vent_int_is_is,
+            v_vent_mec_is_ns=self.v_vent_mec_is_ns[:, n].reshape(-1, 1),
+            q_gen_is_ns=self.scd.q_gen_is_ns[:, n].reshape(-1, 1),
+            q_hum_is_n=q_hum_is_n,
+            l_cs_is_n=l_cs_is_n,
+            l_rs_is_n=l_rs_is_n,
+            beta_is_n=beta_is_n,
+            p_js_is=self.bs.p_js_is,
+            p_is_js=self.bs.p_is_js,
+            h_s_c_js=self.bs.h_s_c_js,
+            g_sh_frt_is=self.rms.g_sh_frt_is,
+            delta_t=delta_t
+        )
+
+        # 室空気の湿収支のテスト
+        test_air_moisture_balance(
+            x_o_ns_plus=self.weather.x_o_ns_plus[n+1].reshape(-1, 1),
+            x_r_is_n_pls=x_r_is_n_pls,
+            x_r_is_n=c_n.x_r_is_n,
+            x_frt_is_n_pls=x_frt_is_n_pls,
+            v_r_is=self.rms.v_r_is,
+            v_vent_int_is_is=self.mvs.v_vent_int_is_is,
+            v_leak_is_n=v_leak_is_n,
+            v_vent_ntr_is_n=v_vent_ntr_is_n,
+            v_vent_mec_is_n=self.v_vent_mec_is_ns[:, n].reshape(-1, 1),
+            x_gen_is_n=self.scd.x_gen_is_ns[:, n].reshape(-1,1),
+            l_cl_is_n=l_cl_is_n,
+            x_hum_is_n=x_hum_is_n,
+            g_lh_frt_is=self.rms.g_lh_frt_is,
+            delta_t=delta_t
+        )
+    
+        #### 備品の熱収支のテスト ####
+        test_frt_heat_balance(
+            theta_frt_is_n_pls=theta_frt_is_n_pls,
+            theta_frt_is_n=c_n.theta_frt_is_n,
+            theta_r_is_n_pls=theta_r_is_n_pls,
+            q_sol_frt_is_ns=self.q_sol_frt_is_ns[:, n].reshape(-1, 1),
+            c_sh_frt_is=self.rms.c_sh_frt_is,
+            g_sh_frt_is=self.rms.g_sh_frt_is,
+            delta_t=delta_t
+        )
+        
+        # 備品の湿収支のテスト
+        test_frt_moisture_balance(
+            x_frt_is_n_pls=x_frt_is_n_pls,
+            x_frt_is_n=c_n.x_frt_is_n,
+            x_r_is_n_pls=x_r_is_n_pls,
+            c_lh_frt_is=self.rms.c_lh_frt_is,
+            g_lh_frt_is=self.rms.g_lh_frt_is,
+            delta_t=delta_t
+        )
+
+        #### 室内表面の放射熱収支のテスト ####
+        test_surface_radiation_balance(
+            theta_s_js_n_pls=theta_s_js_n_pls,
+            p_js_is=self.bs.p_js_is,
+            f_mrt_is_js=self.f_mrt_is_js,
+            h_s_r_js=self.bs.h_s_r_js,
+            a_s_js=self.bs.a_s_js,
+            p_is_js=self.bs.p_is_js
+        )
+        
+        #### 透過日射熱取得の収支のテスト ####
+        test_solar_heat_gain_balance(
+            p_is_js=self.bs.p_is_js,
+            q_trs_sol_is_ns=self.q_trs_sol_is_ns[:, n + 1].reshape(-1, 1),
+            q_sol_frt_is_ns=self.q_sol_frt_is_ns[:, n + 1].reshape(-1, 1),
+            q_s_sol_js_ns=self.q_s_sol_js_ns[:, n + 1].reshape(-1, 1),
+            a_s_js=self.bs.a_s_js
+            )
+        
+        #### 境界表面温度の計算結果のテスト ####
+        test_theta_surface(
+            theta_s_js=theta_s_js_n_pls,
+            theta_rear_js=theta_rear_js_n_pls,
+            f_cvl_js=f_cvl_js_n_pls,
+            q_i_s_js=q_s_js_n_pls,
+            phi_a0_js=self.bs.phi_a0_js,
+            phi_t0_js=self.bs.phi_t0_js
+        )
+
 
     def run_tick_ground(self, gc_n: GroundConditions, n: int):
 
         return _run_tick_ground(self=self, gc_n=gc_n, n=n)
 
+    def run_ticks_ground(self, gc_n: GroundConditions, n_start: int, n_end: int) -> GroundConditions:
+
+        return _run_ticks_ground(self=self, gc_n=gc_n, n_start=n_start, n_end=n_end)
+
+    def get_ground_conditions_periodic(self, n: int) -> GroundConditions:
+
+        return _get_ground_conditions_periodic(self=self, n=n)
+
 
 def test_air_heat_balance(
         theta_r_is_n_pls: np.ndarray,
@@ -1277,6 +1538,172 @@ def _run_tick_ground(self, gc_n: GroundConditions, n: int):
     )
 
 
+def _run_ticks_ground(self, gc_n: GroundConditions, n_start: int, n_end: int) -> GroundConditions:
+    """地盤の計算をステップ n_start からステップ n_end まで一括して行う。
+
+    Args:
+        gc_n: ステップ n_start の地盤の状態値
+        n_start: 開始ステップ
+        n_end: 終了ステップ
+
+    Returns:
+        ステップ n_end の地盤の状態値
+
+    Notes:
+        _run_tick_ground をステップ n_start から n_end - 1 まで繰り返した結果と（丸め誤差を除き）一致する。
+        貫流応答の項別成分は境界 j・指数項 m ごとの1次の IIR フィルタ（lfilter）として計算する。
+        (j, m) の組ごとのループとしているのは、ループの回数が境界の数と指数項の数の積（ステップ数によらない）で、
+        計算時間のほとんどがコンパイル済みの漸化式の計算となるためである。
+        すべての組を一括して計算する方法（公比の等しい組をまとめて lfilter を呼ぶ方法、ブロックごとの等比級数の和を
+        行列積で求める方法）も試したが、1年分のステップ数では配列のコピーや演算量の増加によりいずれもこの方法より遅かった。
+        吸熱応答の項別成分は表面熱流を介して連成するため、係数行列を固有値分解してモードごとの1次の漸化式とし、
+        ステップ n_end の値を等比級数の和として求める。
+    """
+
+    if n_end <= n_start:
+        return gc_n
+
+    is_ground = self.bs.b_ground_js.flatten()
+
+    # ステップ, [L]
+    ns = np.arange(n_start, n_end)
+
+    n_l = len(ns)
+
+    theta_o_eqv_js_ns = self.bs.theta_o_eqv_js_nspls[is_ground, :]
+
+    h_i_js = self.bs.h_s_r_js[is_ground, :] + self.bs.h_s_c_js[is_ground, :]
+
+    r_js_ms = self.bs.r_js_ms[is_ground, :]
+
+    phi_a1_js_ms = self.bs.phi_a1_js_ms[is_ground, :]
+
+    k_eo_js = self.bs.k_eo_js[is_ground, :]
+
+    c_js = h_i_js / (1.0 + self.bs.phi_a0_js[is_ground, :] * h_i_js)
+
+    # ステップ n+1 の貫流応答の項別成分, degree C, [j, m, L]
+    b_t_js_ms = self.bs.phi_t1_js_ms[is_ground, :] * k_eo_js
+    theta_dsh_srf_t_js_ms_ns = np.zeros(r_js_ms.shape + (n_l,))
+    for j, m in np.ndindex(*r_js_ms.shape):
+        theta_dsh_srf_t_js_ms_ns[j, m], _ = lfilter(
+            [b_t_js_ms[j, m]], [1.0, -r_js_ms[j, m]], theta_o_eqv_js_ns[j, ns],
+            zi=[r_js_ms[j, m] * gc_n.theta_dsh_srf_t_js_ms_n[j, m]]
+        )
+
+    # ステップ n+1 の表面熱流のうち吸熱応答の項別成分によらない部分, W/m2, [j, L]
+    u_js_ns = c_js * (
+        self.weather.theta_o_ns_plus[ns + 1]
+        - self.bs.phi_t0_js[is_ground, :] * k_eo_js * theta_o_eqv_js_ns[:, ns + 1]
+        - np.sum(theta_dsh_srf_t_js_ms_ns, axis=1)
+    )
+
+    # ステップ n の表面熱流のうち吸熱応答の項別成分によらない部分（初期値と整合させる）, W/m2, [j, L]
+    u_js_ns = np.concatenate(
+        [gc_n.q_srf_js_n + c_js * np.sum(gc_n.theta_dsh_srf_a_js_ms_n, axis=1, keepdims=True), u_js_ns],
+        axis=1
+    )
+
+    # 吸熱応答の項別成分の漸化式の係数行列, [j, m, m]
+    f_js_ms_ms = r_js_ms[:, :, np.newaxis] * np.eye(r_js_ms.shape[1]) - c_js[:, :, np.newaxis] * phi_a1_js_ms[:, :, np.newaxis]
+
+    lambda_js_ks, v_js_ms_ks = np.linalg.eig(f_js_ms_ms)
+
+    # 固有ベクトルの条件数が大きい場合はステップごとに計算する。
+    if r_js_ms.shape[0] > 0 and np.max(np.linalg.cond(v_js_ms_ks)) > 1.0e8:
+        for n in ns:
+            gc_n = _run_tick_ground(self=self, gc_n=gc_n, n=n)
+        return gc_n
+
+    v_inv_js_ks_ms = np.linalg.inv(v_js_ms_ks)
+
+    b_js_ks = np.einsum('jkm,jm->jk', v_inv_js_ks_ms, phi_a1_js_ms)
+
+    y_js_ks = np.einsum('jkm,jm->jk', v_inv_js_ks_ms, gc_n.theta_dsh_srf_a_js_ms_n)
+
+    # モード k の値 y_{n+1} = lambda_k * y_n + b_k * u_n の ステップ n_end の値, [j, k]
+    y_js_ks = lambda_js_ks ** n_l * y_js_ks + b_js_ks * np.einsum(
+        'jkl,jl->jk', np.power(lambda_js_ks[:, :, np.newaxis], np.arange(n_l - 1, -1, -1)), u_js_ns[:, :-1]
+    )
+
+    theta_dsh_srf_a_js_ms_n = np.einsum('jmk,jk->jm', v_js_ms_ks, y_js_ks).real
+
+    q_srf_js_n = u_js_ns[:, [-1]] - c_js * np.sum(theta_dsh_srf_a_js_ms_n, axis=1, keepdims=True)
+
+    return GroundConditions(
+        theta_dsh_srf_a_js_ms_n=theta_dsh_srf_a_js_ms_n,
+        theta_dsh_srf_t_js_ms_n=theta_dsh_srf_t_js_ms_ns[:, :, -1],
+        q_srf_js_n=q_srf_js_n
+    )
+
+
+def _get_ground_conditions_periodic(self, n: int) -> GroundConditions:
+    """地盤の周期定常解を求める。
+
+    Args:
+        n: ステップ（負の値は前年のステップとして扱う）
+
+    Returns:
+        ステップ n の地盤の状態値
+
+    Notes:
+        _run_tick_ground の漸化式は線形で、外気温度・相当外気温度は1年を周期とするため、
+        1年を周期とする定常解を離散フーリエ変換を用いて直接求める。
+        指数項 m の項別成分は z^{-1} / (1 - r_m z^{-1}) の等比級数となり、
+        吸熱応答の項別成分と表面熱流との連成は周波数ごとの代数方程式となる。
+    """
+
+    is_ground = self.bs.b_ground_js.flatten()
+
+    # 1年のステップ数
+    n_step = self.weather.number_of_data
+
+    # ステップnの境界jにおける相当外気温度, degree C, [j, N]
+    theta_o_eqv_js_ns = self.bs.theta_o_eqv_js_nspls[is_ground, :n_step]
+
+    # ステップnにおける外気温度, degree C, [N]
+    theta_o_ns = self.weather.theta_o_ns_plus[:n_step]
+
+    h_i_js = self.bs.h_s_r_js[is_ground, :] + self.bs.h_s_c_js[is_ground, :]
+
+    r_js_ms = self.bs.r_js_ms[is_ground, :]
+
+    k_eo_js = self.bs.k_eo_js[is_ground, :]
+
+    # 周波数 k における z^{-1}, [K]
+    z_inv_ks = np.exp(-2j * np.pi * np.arange(n_step // 2 + 1) / n_step)
+
+    # 指数項 m の伝達関数 z^{-1} / (1 - r_m z^{-1}), [j, m, K]
+    g_js_ms_ks = z_inv_ks / (1.0 - r_js_ms[:, :, np.newaxis] * z_inv_ks)
+
+    theta_o_eqv_js_ks = np.fft.rfft(theta_o_eqv_js_ns, axis=1)
+
+    theta_o_ks = np.fft.rfft(theta_o_ns)
+
+    # 貫流応答の項別成分, degree C, [j, m, K]
+    theta_dsh_srf_t_js_ms_ks = (self.bs.phi_t1_js_ms[is_ground, :] * k_eo_js)[:, :, np.newaxis] * g_js_ms_ks * theta_o_eqv_js_ks[:, np.newaxis, :]
+
+    c_js = h_i_js / (1.0 + self.bs.phi_a0_js[is_ground, :] * h_i_js)
+
+    # 表面熱流, W/m2, [j, K]
+    q_srf_js_ks = c_js * (
+        theta_o_ks
+        - self.bs.phi_t0_js[is_ground, :] * k_eo_js * theta_o_eqv_js_ks
+        - np.sum(theta_dsh_srf_t_js_ms_ks, axis=1)
+    ) / (1.0 + c_js * np.sum(self.bs.phi_a1_js_ms[is_ground, :, np.newaxis] * g_js_ms_ks, axis=1))
+
+    # 吸熱応答の項別成分, degree C, [j, m, K]
+    theta_dsh_srf_a_js_ms_ks = self.bs.phi_a1_js_ms[is_ground, :, np.newaxis] * g_js_ms_ks * q_srf_js_ks[:, np.newaxis, :]
+
+    n_cyc = n % n_step
+
+    return GroundConditions(
+        theta_dsh_srf_a_js_ms_n=np.fft.irfft(theta_dsh_srf_a_js_ms_ks, n=n_step, axis=2)[:, :, n_cyc],
+        theta_dsh_srf_t_js_ms_n=np.fft.irfft(theta_dsh_srf_t_js_ms_ks, n=n_step, axis=2)[:, :, n_cyc],
+        q_srf_js_n=np.fft.irfft(q_srf_js_ks, n=n_step, axis=1)[:, [n_cyc]]
+    )
+
+
 # region equation 4 (pre calculation)
 
 def get_f_wsc_js_ns(f_ax_js_js, f_crx_js_ns):
@@ -1329,6 +1756,98 @@ def get_v_vent_mec_is_ns(v_vent_mec_general_is, v_vent_mec_local_is_ns):
 
     return v_vent_mec_general_is + v_vent_mec_local_is_ns
 
+
+def get_f_brm_cst_is_is(
+        a_s_js, c_a: float, v_rm_is, c_sh_frt_is, delta_t, f_wsr_js_is, g_sh_frt_is, h_s_c_js, p_is_js,
+        p_js_is, rho_a, v_vent_int_is_is
+):
+    """
+
+    Args:
+        a_s_js: 境界 j の面積, m2, [j, 1]
+        c_a: 空気の比熱, J/(kg K)
+        v_rm_is: 室 i の容積, m3, [i, 1]
+        c_sh_frt_is: 室 i の備品等の熱容量, J/K, [i, 1]
+        delta_t: 1ステップの時間間隔, s
+        f_wsr_js_is: 係数 f_WSR, - [j, i]
+        g_sh_frt_is: 室 i の備品等と空気間の熱コンダクタンス, W/K, [i, 1]
+        h_s_c_js: 境界 j の室内側対流熱伝達率, W/(m2 K), [j, 1]
+        p_is_js: 室 i と境界 j の接続に関する係数（境界 j が室 i に接している場合は 1 とし、それ以外の場合は 0 とする。）, -, [i, j]
+        p_js_is: 室 i と境界 j の接続に関する係数（境界 j が室 i に接している場合は 1 とし、それ以外の場合は 0 とする。）, -, [j, i]
+        rho_a: 空気の密度, kg/m3
+        v_vent_int_is_is: 室 i* から室 i への室間の空気移動量（流出換気量を含む）, m3/s, [i, i]
+
+    Returns:
+        係数 f_BRM のうち時間によって変化しない部分, W/K, [i, i]
+
+    Notes:
+        式(2.23) のうち、外気の流入量に関する項を除いた部分
+    """
+
+    return v_diag(v_rm_is * rho_a * c_a / delta_t) \
+        + np.matmul(p_is_js, (p_js_is - f_wsr_js_is) * a_s_js * h_s_c_js) \
+        + v_diag(c_sh_frt_is * g_sh_frt_is / (c_sh_frt_is + g_sh_frt_is * delta_t)) \
+        - c_a * rho_a * v_vent_int_is_is
+
+
+def get_f_h_wgt_cst_is_is(c_lh_frt_is, delta_t, g_lh_frt_is, rho_a, v_rm_is, v_vent_int_is_is):
+    """
+
+    Args:
+        c_lh_frt_is: 室 i の備品等の湿気容量, kg/(kg/kg(DA)), [i, 1]
+        delta_t: 1ステップの時間間隔, s
+        g_lh_frt_is: 室 i の備品等と空気間の湿気コンダクタンス, kg/(s kg/kg(DA)), [i, 1]
+        rho_a: 空気の密度, kg/m3
+        v_rm_is: 室 i の容量, m3, [i, 1]
+        v_vent_int_is_is: 室 i* から室 i への室間の空気移動量（流出換気量を含む）, m3/s, [i, i]
+
+    Returns:
+        係数 f_h_wgt のうち時間によって変化しない部分, kg/(s kg/kg(DA)), [i, i]
+
+    Notes:
+        式(1.5) のうち、外気の流入量に関する項を除いた部分
+    """
+
+    return v_diag(
+        rho_a * v_rm_is / delta_t + c_lh_frt_is * g_lh_frt_is / (c_lh_frt_is + delta_t * g_lh_frt_is)
+    ) - rho_a * v_vent_int_is_is
+
+
+def get_f_brc_ws_is_js(a_s_js, h_s_c_js, p_is_js):
+    """
+
+    Args:
+        a_s_js: 境界 j の面積, m2, [j, 1]
+        h_s_c_js: 境界 j の室内側対流熱伝達率, W/(m2 K), [j, 1]
+        p_is_js: 室 i と境界 j の接続に関する係数（境界 j が室 i に接している場合は 1 とし、それ以外の場合は 0 とする。）, -, [i, j]
+
+    Returns:
+        境界 j の表面温度が室 i の係数 f_BRC に与える影響を表す係数, W/K, [i, j]
+
+    Notes:
+        式(2.24) のうち、係数 f_WSC 及び係数 f_WSV にかかる係数
+    """
+
+    return p_is_js * np.swapaxes(h_s_c_js * a_s_js, -1, -2)
+
+
+def get_f_xc_ws_is_js(f_mrt_hum_is_js, f_xot_is_is_n_pls, k_r_is_n):
+    """
+
+    Args:
+        f_mrt_hum_is_js: 室 i の人体に対する境界 j の形態係数, -, [i, j]
+        f_xot_is_is_n_pls: ステップ n+1 における係数 f_XOT, -, [i, i]
+        k_r_is_n: ステップ n における室 i の人体表面の放射熱伝達率が総合熱伝達率に占める割合, -, [i, 1]
+
+    Returns:
+        境界 j の表面温度が室 i の係数 f_XC に与える影響を表す係数, -, [i, j]
+
+    Notes:
+        式(2.19) のうち、係数 f_WSC 及び係数 f_WSV にかかる係数
+    """
+
+    return np.matmul(f_xot_is_is_n_pls, k_r_is_n * f_mrt_hum_is_js)
+
 # endregion
 
 
@@ -1372,7 +1891,7 @@ def get_l_cl_is_n(f_l_cl_wgt_is_is_n, f_l_cl_cst_is_n, l_wtr, x_r_is_n_pls):
 
     """
 
-    return (np.dot(f_l_cl_wgt_is_is_n, x_r_is_n_pls) + f_l_cl_cst_is_n) * l_wtr
+    return (np.matmul(f_l_cl_wgt_is_is_n, x_r_is_n_pls) + f_l_cl_cst_is_n) * l_wtr
 
 
 def get_x_r_is_n_pls(f_h_cst_is_n, f_h_wgt_is_is_n, f_l_cl_cst_is_n, f_l_cl_wgt_is_is_n):
@@ -1424,24 +1943,16 @@ def get_x_r_ntr_is_n_pls(
 
 
 def get_f_h_wgt_is_is_n(
-        c_lh_frt_is: np.ndarray,
-        delta_t: float,
-        g_lh_frt_is: np.ndarray,
+        f_h_wgt_cst_is_is: np.ndarray,
         rho_a: float,
-        v_rm_is: np.ndarray,
-        v_vent_int_is_is_n: np.ndarray,
         v_vent_out_non_nv_is_n: np.ndarray,
         v_vent_ntr_is: np.ndarray
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
 
     Args:
-        c_lh_frt_is: 室 i の備品等の湿気容量, kg/(kg/kg(DA)), [i, 1]
-        delta_t: 1ステップの時間間隔, s
-        g_lh_frt_is: 室 i の備品等と空気間の湿気コンダクタンス, kg/(s kg/kg(DA)), [i, 1]
+        f_h_wgt_cst_is_is: 係数 f_h_wgt のうち時間によって変化しない部分, kg/(s kg/kg(DA)), [i, i]
         rho_a: 空気の密度, kg/m3
-        v_rm_is: 室 i の容量, m3, [i, 1]
-        v_vent_int_is_is_n:　ステップ n から ステップ n+1 における室 i* から室 i への室間の空気移動量（流出換気量を含む）, m3/s
         v_vent_out_non_nv_is_n: ステップnからステップn+1における室iの換気・隙間風による外気の流入量, m3/s, [i, 1]
         v_vent_ntr_is: 室iの自然風利用時の換気量, m3/s, [i, 1]
 
@@ -1454,10 +1965,7 @@ def get_f_h_wgt_is_is_n(
 
     """
 
-    f_h_wgt_non_nv_is_is_n = v_diag(
-        rho_a * (v_rm_is / delta_t + v_vent_out_non_nv_is_n)
-        + c_lh_frt_is * g_lh_frt_is / (c_lh_frt_is + delta_t * g_lh_frt_is)
-    ) - rho_a * v_vent_int_is_is_n
+    f_h_wgt_non_nv_is_is_n = f_h_wgt_cst_is_is + v_diag(rho_a * v_vent_out_non_nv_is_n)
 
     f_h_wgt_nv_is_is_n = f_h_wgt_non_nv_is_is_n + v_diag(rho_a * v_vent_ntr_is)
 
@@ -1550,13 +2058,13 @@ def get_q_s_js_n_pls(h_s_c_js, h_s_r_js, theta_ei_js_n_pls, theta_s_js_n_pls):
     return (theta_ei_js_n_pls - theta_s_js_n_pls) * (h_s_c_js + h_s_r_js)
 
 
-def get_theta_ei_js_n_pls(a_s_js, beta_is_n, f_mrt_is_js, f_flr_js_is_n, h_s_c_js, h_s_r_js, l_rs_is_n, p_js_is, q_s_sol_js_n_pls, theta_r_is_n_pls, theta_s_js_n_pls):
+def get_theta_ei_js_n_pls(a_s_js, beta_is_n, f_mrt_js_js, f_flr_js_is_n, h_s_c_js, h_s_r_js, l_rs_is_n, p_js_is, q_s_sol_js_n_pls, theta_r_is_n_pls, theta_s_js_n_pls):
     """
 
     Args:
         a_s_js: 境界 j の面積, m2, [j, 1]
         beta_is_n: ステップ n からステップ n+1 における室 i の放射暖冷房設備の対流成分比率, -, [i, 1]
-        f_mrt_is_js: 室 i の微小球に対する境界 j の形態係数, -, [i, j]
+        f_mrt_js_js: 境界 j の表面温度が境界 j の等価温度の放射成分に与える影響を表す係数, -, [j, j]
         f_flr_js_is_n: ステップ n からステップ n+1 における室 i の放射暖冷房設備の放熱量の放射成分に対する境界 j の室内側表面の吸収比率, -, [j, i]
         h_s_c_js: 境界 j の室内側対流熱伝達率, W/(m2 K), [j, 1]
         h_s_r_js: 境界 j の室内側放射熱伝達率, W/(m2 K), [j, 1]
@@ -1574,10 +2082,10 @@ def get_theta_ei_js_n_pls(a_s_js, beta_is_n, f_mrt_is_js, f_flr_js_is_n, h_s_c_j
     """
 
     return (
-        h_s_c_js * np.dot(p_js_is, theta_r_is_n_pls)
-        + h_s_r_js * np.dot(np.dot(p_js_is, f_mrt_is_js), theta_s_js_n_pls)
+        h_s_c_js * np.matmul(p_js_is, theta_r_is_n_pls)
+        + h_s_r_js * np.matmul(f_mrt_js_js, theta_s_js_n_pls)
         + q_s_sol_js_n_pls
-        + np.dot(f_flr_js_is_n, (1.0 - beta_is_n) * l_rs_is_n) / a_s_js
+        + np.matmul(f_flr_js_is_n, (1.0 - beta_is_n) * l_rs_is_n) / a_s_js
     ) / (h_s_c_js + h_s_r_js)
 
 
@@ -1596,7 +2104,7 @@ def get_theta_mrt_hum_is_n_pls(f_mrt_hum_is_js, theta_s_js_n_pls):
 
     """
 
-    return np.dot(f_mrt_hum_is_js, theta_s_js_n_pls)
+    return np.matmul(f_mrt_hum_is_js, theta_s_js_n_pls)
 
 
 def get_theta_frt_is_n_pls(c_sh_frt_is, delta_t: float, g_sh_frt_is, q_sol_frt_is_n, theta_frt_is_n, theta_r_is_n_pls):
@@ -1642,7 +2150,7 @@ def get_theta_s_js_n_pls(f_wsb_js_is_n_pls, f_wsc_js_n_pls, f_wsr_js_is, f_wsv_j
 
     """
 
-    return np.dot(f_wsr_js_is, theta_r_is_n_pls) + f_wsc_js_n_pls + np.dot(f_wsb_js_is_n_pls, l_rs_is_n) + f_wsv_js_n_pls
+    return np.matmul(f_wsr_js_is, theta_r_is_n_pls) + f_wsc_js_n_pls + np.matmul(f_wsb_js_is_n_pls, l_rs_is_n) + f_wsv_js_n_pls
 
 
 def get_theta_r_is_n_pls(f_xc_is_n_pls, f_xlr_is_is_n_pls, f_xot_is_is_n_pls, l_rs_is_n, theta_ot_is_n_pls):
@@ -1663,7 +2171,7 @@ def get_theta_r_is_n_pls(f_xc_is_n_pls, f_xlr_is_is_n_pls, f_xot_is_is_n_pls, l_
 
     """
 
-    return np.dot(f_xot_is_is_n_pls, theta_ot_is_n_pls) - np.dot(f_xlr_is_is_n_pls, l_rs_is_n) - f_xc_is_n_pls
+    return np.matmul(f_xot_is_is_n_pls, theta_ot_is_n_pls) - np.matmul(f_xlr_is_is_n_pls, l_rs_is_n) - f_xc_is_n_pls
 
 
 def get_f_brl_ot_is_is_n(f_brl_is_is_n, f_brm_is_is_n_pls, f_xlr_is_is_n_pls):
@@ -1682,7 +2190,7 @@ def get_f_brl_ot_is_is_n(f_brl_is_is_n, f_brm_is_is_n_pls, f_xlr_is_is_n_pls):
 
     """
 
-    return f_brl_is_is_n + np.dot(f_brm_is_is_n_pls, f_xlr_is_is_n_pls)
+    return f_brl_is_is_n + np.matmul(f_brm_is_is_n_pls, f_xlr_is_is_n_pls)
 
 
 def get_f_xlr_is_is_n_pls(f_mrt_hum_is_js, f_wsb_js_is_n_pls, f_xot_is_is_n_pls, k_r_is_n):
@@ -1702,7 +2210,7 @@ def get_f_xlr_is_is_n_pls(f_mrt_hum_is_js, f_wsb_js_is_n_pls, f_xot_is_is_n_pls,
 
     """
 
-    return np.dot(f_xot_is_is_n_pls, k_r_is_n * np.dot(f_mrt_hum_is_js, f_wsb_js_is_n_pls))
+    return np.matmul(f_xot_is_is_n_pls, k_r_is_n * np.matmul(f_mrt_hum_is_js, f_wsb_js_is_n_pls))
 
 
 def get_f_brl_is_is_n(a_s_js, beta_is_n, f_wsb_js_is_n_pls, h_s_c_js, p_is_js):
@@ -1723,7 +2231,7 @@ def get_f_brl_is_is_n(a_s_js, beta_is_n, f_wsb_js_is_n_pls, h_s_c_js, p_is_js):
 
     """
 
-    return np.dot(p_is_js, f_wsb_js_is_n_pls * h_s_c_js * a_s_js) + v_diag(beta_is_n)
+    return np.matmul(p_is_js, f_wsb_js_is_n_pls * h_s_c_js * a_s_js) + v_diag(beta_is_n)
 
 
 def get_f_wsb_js_is_n_pls(f_flb_js_is_n_pls, f_ax_js_js):
@@ -1763,8 +2271,8 @@ def get_beta_is_n(
         式(2.13)
     """
 
-    return beta_h_is * (operation_mode_is_n == OperationMode.HEATING)\
-        + beta_c_is * (operation_mode_is_n == OperationMode.COOLING)
+    return beta_h_is * (operation_mode_is_n == OperationMode.HEATING.value)\
+        + beta_c_is * (operation_mode_is_n == OperationMode.COOLING.value)
 
 
 def get_f_flr_js_is_n(
@@ -1787,8 +2295,28 @@ def get_f_flr_js_is_n(
 
     """
 
-    return f_flr_h_js_is * (operation_mode_is_n == OperationMode.HEATING).flatten() \
-        + f_flr_c_js_is * (operation_mode_is_n == OperationMode.COOLING).flatten()
+    return f_flr_h_js_is * np.swapaxes(operation_mode_is_n == OperationMode.HEATING.value, -1, -2) \
+        + f_flr_c_js_is * np.swapaxes(operation_mode_is_n == OperationMode.COOLING.value, -1, -2)
+
+
+def get_x_xs_is_n_by_operation_mode(x_c_xs_is: np.ndarray, x_h_xs_is: np.ndarray, operation_mode_is_n: np.ndarray):
+    """
+
+    Args:
+        x_c_xs_is: 室 i が放射冷房運転を行う場合の係数, [*, i]
+        x_h_xs_is: 室 i が放射暖房運転を行う場合の係数, [*, i]
+        operation_mode_is_n: ステップnにおける室iの運転モード, [i, 1]
+
+    Returns:
+        ステップ n からステップ n+1 における係数, [*, i]
+
+    Notes:
+        係数 f_WSB, f_BRL, f_XLR の列 i は室 i の放射暖冷房設備の対流成分比率及び吸収比率のみから定まり、
+        暖房・冷房のいずれでもない場合は 0 となるため、列ごとに運転モードに応じて選択すればよい。
+    """
+
+    return x_h_xs_is * np.swapaxes(operation_mode_is_n == OperationMode.HEATING.value, -1, -2) \
+        + x_c_xs_is * np.swapaxes(operation_mode_is_n == OperationMode.COOLING.value, -1, -2)
 
 
 def get_theta_r_ot_ntr_is_n_pls(
@@ -1841,8 +2369,8 @@ def get_f_brc_ot_is_n_pls(
         式(2.17)
     """
 
-    f_brc_ot_non_nv_is_n_pls = f_brc_non_nv_is_n_pls + np.dot(f_brm_non_nv_is_is_n_pls, f_xc_is_n_pls)
-    f_brc_ot_nv_is_n_pls = f_brc_nv_is_n_pls + np.dot(f_brm_nv_is_is_n_pls, f_xc_is_n_pls)
+    f_brc_ot_non_nv_is_n_pls = f_brc_non_nv_is_n_pls + np.matmul(f_brm_non_nv_is_is_n_pls, f_xc_is_n_pls)
+    f_brc_ot_nv_is_n_pls = f_brc_nv_is_n_pls + np.matmul(f_brm_nv_is_is_n_pls, f_xc_is_n_pls)
     return f_brc_ot_non_nv_is_n_pls, f_brc_ot_nv_is_n_pls
 
 
@@ -1862,18 +2390,16 @@ def get_f_brm_ot_is_is_n_pls(f_xot_is_is_n_pls, f_brm_non_nv_is_is_n_pls, f_brm_
     Notes:
         式(2.18)
     """
-    return np.dot(f_brm_non_nv_is_is_n_pls, f_xot_is_is_n_pls), np.dot(f_brm_nv_is_is_n_pls, f_xot_is_is_n_pls)
+    return np.matmul(f_brm_non_nv_is_is_n_pls, f_xot_is_is_n_pls), np.matmul(f_brm_nv_is_is_n_pls, f_xot_is_is_n_pls)
 
 
-def get_f_xc_is_n_pls(f_mrt_hum_is_js, f_wsc_js_n_pls, f_wsv_js_n_pls, f_xot_is_is_n_pls, k_r_is_n):
+def get_f_xc_is_n_pls(f_xc_ws_is_js, f_xc_wsc_is_n_pls, f_wsv_js_n_pls):
     """
 
     Args:
-        f_mrt_hum_is_js: 室 i の人体に対する境界 j の形態係数, -, [i, j]
-        f_wsc_js_n_pls: ステップ n+1 における係数 f_WSC, degree C, [j, 1]
+        f_xc_ws_is_js: 境界 j の表面温度が室 i の係数 f_XC に与える影響を表す係数, -, [i, j]
+        f_xc_wsc_is_n_pls: ステップ n+1 における係数 f_XC のうち係数 f_WSC による部分, degree C, [i, 1]
         f_wsv_js_n_pls: ステップ n+1 における係数 f_WSV, degree C, [j, 1]
-        f_xot_is_is_n_pls: ステップ n+1 における係数 f_XOT, -, [i, i]
-        k_r_is_n: ステップ n における室 i の人体表面の放射熱伝達率が総合熱伝達率に占める割合, -, [i, 1]
 
     Returns:
         ステップ n+1 における係数 f_XC, degree C, [i, 1]
@@ -1882,7 +2408,7 @@ def get_f_xc_is_n_pls(f_mrt_hum_is_js, f_wsc_js_n_pls, f_wsv_js_n_pls, f_xot_is_
         式(2.19)
     """
 
-    return np.dot(f_xot_is_is_n_pls, k_r_is_n * np.dot(f_mrt_hum_is_js, (f_wsc_js_n_pls + f_wsv_js_n_pls)))
+    return f_xc_wsc_is_n_pls + np.matmul(f_xc_ws_is_js, f_wsv_js_n_pls)
 
 
 def get_f_xot_is_is_n_pls(f_mrt_hum_is_js, f_wsr_js_is, k_c_is_n, k_r_is_n):
@@ -1901,7 +2427,7 @@ def get_f_xot_is_is_n_pls(f_mrt_hum_is_js, f_wsr_js_is, k_c_is_n, k_r_is_n):
         式(2.20)
     """
 
-    return np.linalg.inv(v_diag(k_c_is_n) + k_r_is_n * np.dot(f_mrt_hum_is_js, f_wsr_js_is))
+    return np.linalg.inv(v_diag(k_c_is_n) + k_r_is_n * np.matmul(f_mrt_hum_is_js, f_wsr_js_is))
 
 
 def get_k_c_is_n(n_rm: int) -> np.ndarray:
@@ -1934,26 +2460,13 @@ def get_k_r_is_n(n_rm: int) -> np.ndarray:
     return np.full((n_rm, 1), 0.5)
 
 
-def get_f_brm_is_is_n_pls(
-        a_s_js, c_a: float, v_rm_is, c_sh_frt_is, delta_t, f_wsr_js_is, g_sh_frt_is, h_s_c_js, p_is_js,
-        p_js_is, rho_a, v_vent_int_is_is_n, v_vent_out_non_nv_is_n,
-        v_vent_ntr_set_is
-):
+def get_f_brm_is_is_n_pls(c_a: float, f_brm_cst_is_is, rho_a, v_vent_out_non_nv_is_n, v_vent_ntr_set_is):
     """
 
     Args:
-        a_s_js: 境界 j の面積, m2, [j, 1]
         c_a: 空気の比熱, J/(kg K)
-        v_rm_is: 室 i の容積, m3, [i, 1]
-        c_sh_frt_is: 室 i の備品等の熱容量, J/K, [i, 1]
-        delta_t: 1ステップの時間間隔, s
-        f_wsr_js_is: 係数 f_WSR, - [j, i]
-        g_sh_frt_is: 室 i の備品等と空気間の熱コンダクタンス, W/K, [i, 1]
-        h_s_c_js: 境界 j の室内側対流熱伝達率, W/(m2 K), [j, 1]
-        p_is_js: 室 i と境界 j の接続に関する係数（境界 j が室 i に接している場合は 1 とし、それ以外の場合は 0 とする。）, -, [i, j]
-        p_js_is: 室 i と境界 j の接続に関する係数（境界 j が室 i に接している場合は 1 とし、それ以外の場合は 0 とする。）, -, [j, i]
+        f_brm_cst_is_is: 係数 f_BRM のうち時間によって変化しない部分, W/K, [i, i]
         rho_a: 空気の密度, kg/m3
-        v_vent_int_is_is_n: ステップ n から ステップ n+1 における室 i* から室 i への室間の空気移動量（流出換気量を含む）, m3/s
         v_vent_out_non_nv_is_n: ステップnからステップn+1 における室iの換気・すきま風による外気の流入量, m3/s
         v_vent_ntr_set_is: ステップnからステップn+1における室iの自然風の利用による外気の流入量, m3/s
 
@@ -1964,32 +2477,27 @@ def get_f_brm_is_is_n_pls(
     Notes:
         式(2.23)
     """
-    f_brm_non_ntr_is_is_n_pls = v_diag(v_rm_is * rho_a * c_a / delta_t) \
-        + np.dot(p_is_js, (p_js_is - f_wsr_js_is) * a_s_js * h_s_c_js) \
-        + v_diag(c_sh_frt_is * g_sh_frt_is / (c_sh_frt_is + g_sh_frt_is * delta_t)) \
-        + c_a * rho_a * (v_diag(v_vent_out_non_nv_is_n) - v_vent_int_is_is_n)
+    f_brm_non_ntr_is_is_n_pls = f_brm_cst_is_is + c_a * rho_a * v_diag(v_vent_out_non_nv_is_n)
     f_brm_ntr_is_is_n_pls = f_brm_non_ntr_is_is_n_pls + c_a * rho_a * v_diag(v_vent_ntr_set_is)
     return f_brm_non_ntr_is_is_n_pls, f_brm_ntr_is_is_n_pls
 
 
 def get_f_brc_is_n_pls(
-        a_s_js, c_a, v_rm_is, c_sh_frt_is, delta_t, f_wsc_js_n_pls, f_wsv_js_n_pls, g_sh_frt_is,
-        h_s_c_js, p_is_js, q_gen_is_n, q_hum_is_n, q_sol_frt_is_n, rho_a, theta_frt_is_n,
+        c_a, v_rm_is, c_sh_frt_is, delta_t, f_brc_ws_is_js, f_brc_wsc_is_n_pls, f_wsv_js_n_pls, g_sh_frt_is,
+        q_gen_is_n, q_hum_is_n, q_sol_frt_is_n, rho_a, theta_frt_is_n,
         theta_o_n_pls, theta_r_is_n, v_vent_out_non_nv_is_n, v_vent_ntr_is_n
 ):
     """
 
     Args:
-        a_s_js: 境界 j の面積, m2, [j, 1]
         c_a: 空気の比熱, J/(kg K)
         v_rm_is: 室容量, m3, [i, 1]
         c_sh_frt_is: 室 i の備品等の熱容量, J/K, [i, 1]
         delta_t: 1ステップの時間間隔, s
-        f_wsc_js_n_pls: ステップ n+1 における係数 f_WSC, degree C, [j, 1]
+        f_brc_ws_is_js: 境界 j の表面温度が室 i の係数 f_BRC に与える影響を表す係数, W/K, [i, j]
+        f_brc_wsc_is_n_pls: ステップ n+1 における係数 f_BRC のうち係数 f_WSC による部分, W, [i, 1]
         f_wsv_js_n_pls: ステップ n+1 における係数 f_WSV, degree C, [j, 1]
         g_sh_frt_is: 室 i の備品等と空気間の熱コンダクタンス, W/K, [i, 1]
-        h_s_c_js: 境界 j の室内側対流熱伝達率, W/(m2 K), [j, 1]
-        p_is_js: 室 i と境界 j の接続に関する係数（境界 j が室 i に接している場合は 1 とし、それ以外の場合は 0 とする。）, -, [i, j]
         q_gen_is_n: ステップ n からステップ n+1 における室 i の人体発熱を除く内部発熱, W, [i, 1]
         q_hum_is_n: ステップ n からステップ n+1 における室 i の人体発熱, W, [i, 1]
         q_sol_frt_is_n: ステップ n からステップ n+1 における室 i に設置された備品等による透過日射吸収熱量時間平均値, W, [i, 1]
@@ -2008,7 +2516,7 @@ def get_f_brc_is_n_pls(
     """
 
     f_brc_non_ntr_is_n_pls = v_rm_is * c_a * rho_a / delta_t * theta_r_is_n \
-                             + np.dot(p_is_js, h_s_c_js * a_s_js * (f_wsc_js_n_pls + f_wsv_js_n_pls)) \
+                             + f_brc_wsc_is_n_pls + np.matmul(f_brc_ws_is_js, f_wsv_js_n_pls) \
                              + c_a * rho_a * v_vent_out_non_nv_is_n * theta_o_n_pls \
                              + q_gen_is_n + q_hum_is_n \
                              + g_sh_frt_is * (c_sh_frt_is * theta_frt_is_n + q_sol_frt_is_n * delta_t) / (c_sh_frt_is + delta_t * g_sh_frt_is)
@@ -2035,12 +2543,12 @@ def get_v_vent_out_non_ntr_is_n(v_leak_is_n, v_vent_mec_is_n):
     return v_leak_is_n + v_vent_mec_is_n
 
 
-def get_f_wsv_js_n_pls(f_cvl_js_n_pls, f_ax_js_js):
+def get_f_wsv_js_n_pls(f_cvl_js_n_pls, f_ax_inv_js_js):
     """
 
     Args:
         f_cvl_js_n_pls: ステップ n+1 における係数 f_CVL, degree C, [j, 1]
-        f_ax_js_js: 係数 f_AX, -, [j, j]
+        f_ax_inv_js_js: 係数 f_AX の逆行列, -, [j, j]
 
     Returns:
         ステップ n+1 の係数 f_WSV, degree C, [j, 1]
@@ -2049,7 +2557,7 @@ def get_f_wsv_js_n_pls(f_cvl_js_n_pls, f_ax_js_js):
         式(2.27)
     """
 
-    return np.linalg.solve(f_ax_js_js, f_cvl_js_n_pls)
+    return np.matmul(f_ax_inv_js_js, f_cvl_js_n_pls)
 
 
 def get_q_hum_is_n(n_hum_is_n, q_hum_psn_is_n):
@@ -2094,7 +2602,7 @@ def get_theta_s_rear_js_n(
         式(2.32)
     """
 
-    return np.dot(k_s_er_js_js, theta_er_js_n) + k_s_eo_js * theta_eo_js_n + np.dot(k_s_r_js_is, theta_r_is_n)
+    return np.matmul(k_s_er_js_js, theta_er_js_n) + k_s_eo_js * theta_eo_js_n + np.matmul(k_s_r_js_is, theta_r_is_n)
 
 # endregion
 
@@ -0,0 +1,181 @@
+"""助走計算の後の状態値の保存・読み込み
+
+運転スケジュール・設定温度のみが異なる計算では 1/1 0:00 までの助走計算の結果はほぼ等しいため、
+助走計算の後の状態値を建物の物理的な入力のハッシュをキーとして保存し、以降の計算では助走計算を省略する。
+"""
+
+import os
+import copy
+import json
+import logging
+import hashlib
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from heat_load_calc.conditions import Conditions
+from heat_load_calc.weather import Weather
+from heat_load_calc.file_util import write_atomic
+
+
+logger = logging.getLogger(name='HeatLoadCalc').getChild('snapshot')
+
+# version of the format of the snapshot file
+# This value should be changed when the calculation of the run-up is changed.
+# version 2: the instantaneous values of all the items are saved regardless of the output names.
+_SNAPSHOT_VERSION = 2
+
+# directory of the snapshot files
+# It can be specified by the environment variable HEAT_LOAD_CALC_SNAPSHOT (not specified or empty string means no snapshot).
+_snapshot_dir: Optional[str] = os.environ.get('HEAT_LOAD_CALC_SNAPSHOT') or None
+
+# the names of the arguments of Conditions and the names of the attributes
+CONDITIONS_ITEMS = [
+    ('operation_mode_is_n', 'operation_mode_is_n'),
+    ('theta_r_is_n', 'theta_r_is_n'),
+    ('theta_mrt_hum_is_n', 'theta_mrt_hum_is_n'),
+    ('x_r_is_n', 'x_r_is_n'),
+    ('theta_dsh_s_a_js_ms_n', 'theta_dsh_srf_a_js_ms_n'),
+    ('theta_dsh_s_t_js_ms_n', 'theta_dsh_srf_t_js_ms_n'),
+    ('q_s_js_n', 'q_s_js_n'),
+    ('theta_frt_is_n', 'theta_frt_is_n'),
+    ('x_frt_is_n', 'x_frt_is_n'),
+    ('theta_ei_js_n', 'theta_ei_js_n')
+]
+
+
+def set_snapshot_dir(snapshot_dir: Optional[str]):
+    """Set the directory of the snapshot files. / 助走計算の後の状態値を保存するディレクトリを設定する。
+
+    Args:
+        snapshot_dir: directory of the snapshot files (None means that the snapshot is not used)
+    """
+
+    global _snapshot_dir
+
+    _snapshot_dir = snapshot_dir
+
+
+def get_key(d: Dict, w: Weather) -> str:
+    """Get the key of the building-physics inputs. / 建物の物理的な入力のキーを取得する。
+
+    Args:
+        d: input data as dictionary / 住宅計算条件
+        w: Weather class
+
+    Returns:
+        hash of the inputs except the operation (schedules, set-points, etc.) and the weather data
+
+    Notes:
+        以下の運転に関する入力はキーに含めない。
+            common: ac_method, ac_config, season, number_of_occupants, output_names, calculation_day の main
+            rooms: schedule
+    """
+
+    d_physics = copy.deepcopy(d)
+
+    d_common = d_physics['common']
+
+    for k in ['ac_method', 'ac_config', 'season', 'number_of_occupants', 'output_names']:
+        d_common.pop(k, None)
+
+    if 'calculation_day' in d_common:
+        d_common['calculation_day'].pop('main', None)
+
+    for d_room in d_physics.get('rooms', []):
+        d_room.pop('schedule', None)
+
+    h = hashlib.sha256()
+    h.update(json.dumps(d_physics, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+
+    # The weather data itself is included because the weather file may be changed with the same file name.
+    for a in [w.a_sun_ns_plus, w.h_sun_ns_plus, w.i_dn_ns_plus, w.i_sky_ns_plus, w.r_n_ns_plus, w.theta_o_ns_plus, w.x_o_ns_plus]:
+        h.update(np.ascontiguousarray(a, dtype=np.float64).tobytes())
+
+    return h.hexdigest()[0:32]
+
+
+def _get_snapshot_path(key: str) -> str:
+    """Get the path of the snapshot file. / 状態値のファイルのパスを取得する。
+
+    Args:
+        key: hash of the building-physics inputs
+
+    Returns:
+        path of the snapshot file
+    """
+
+    return os.path.join(_snapshot_dir, 'snapshot_v{}_{}.npz'.format(_SNAPSHOT_VERSION, key))
+
+
+def load(d: Dict, w: Weather) -> Optional[Tuple[Conditions, Dict[str, np.ndarray]]]:
+    """Load the snapshot file. / 助走計算の後の状態値を読み込む。
+
+    Args:
+        d: input data as dictionary / 住宅計算条件
+        w: Weather class
+
+    Returns:
+        以下のタプル（ファイルが無い場合は None）
+            (1) 1/1 0:00 の状態値
+            (2) 1/1 0:00 の瞬時値（Recorder.recording の引数名をキーとする）
+    """
+
+    if _snapshot_dir is None:
+        return None
+
+    snapshot_path = _get_snapshot_path(key=get_key(d=d, w=w))
+
+    if not os.path.isfile(snapshot_path):
+        return None
+
+    try:
+
+        with np.load(snapshot_path) as data:
+
+            c_n = Conditions(**{arg: data['c_' + attr].copy() for arg, attr in CONDITIONS_ITEMS})
+
+            values_i = {k[2:]: data[k].copy() for k in data.files if k.startswith('i_')}
+
+    except (OSError, ValueError, KeyError) as e:
+
+        logger.warning('The snapshot file `{}` could not be read. ({})'.format(snapshot_path, e))
+
+        return None
+
+    logger.info('The run-up calculation is skipped by the snapshot file `{}`.'.format(snapshot_path))
+
+    return c_n, values_i
+
+
+def save(d: Dict, w: Weather, c_n: Conditions, values_i: Dict[str, np.ndarray]):
+    """Save the snapshot file. / 助走計算の後の状態値を保存する。
+
+    Args:
+        d: input data as dictionary / 住宅計算条件
+        w: Weather class
+        c_n: 1/1 0:00 の状態値
+        values_i: 1/1 0:00 の瞬時値（Recorder.recording の引数名をキーとする）
+            出力する項目によらず読み込んだ計算で用いることができるよう、すべての項目の値（Recorder.get_first_values_i の値）とする。
+
+    Notes:
+        The file is written to a temporary file and renamed,
+        so that the other processes do not read the file being written.
+        If the file could not be written, the snapshot is just not used.
+    """
+
+    if _snapshot_dir is None:
+        return
+
+    snapshot_path = _get_snapshot_path(key=get_key(d=d, w=w))
+
+    data = {'c_' + attr: c_n.__dict__[attr] for _, attr in CONDITIONS_ITEMS}
+
+    data.update({'i_' + k: v for k, v in values_i.items()})
+
+    try:
+
+        write_atomic(path=snapshot_path, write=lambda f: np.savez(f, **data))
+
+    except OSError as e:
+
+        logger.warning('The snapshot file `{}` could not be saved. ({})'.format(snapshot_path, e))
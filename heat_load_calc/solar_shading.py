@@ -134,13 +134,18 @@ class SolarShadingSimple(SolarShading):
             その場合は値として 0.0 を返す。
         """
 
-        h_s_n = np.where(h_sun_ns > 0.0, h_sun_ns, 0.0)
-        a_s_n = np.where(h_sun_ns > 0.0, a_sun_ns, 0.0)
+        f_ss_d_j_n = np.zeros_like(h_sun_ns, dtype=float)
 
-        cos_a = np.where(np.cos(a_s_n - self._alpha_w_j) > 0, np.cos(a_s_n - self._alpha_w_j), 1.0)
+        # 日が出ていないとき及び太陽位置が背面にある場合は 0.0 とする。
+        #   日が出ているステップのみを取り出して計算し、日影面積比率を全ステップの配列に戻す。
+        ns_day = np.flatnonzero(h_sun_ns > 0.0)
+
+        cos_day = np.cos(a_sun_ns[ns_day] - self._alpha_w_j)
+
+        ns = ns_day[cos_day > 0.0]
 
         # ステップ n における境界 j に対する太陽のプロファイル角の正弦, -
-        tan_phi_j_n = np.tan(h_s_n) / cos_a
+        tan_phi_j_n = np.tan(h_sun_ns[ns]) / cos_day[cos_day > 0.0]
 
         # ステップ n における開口部 j に影がかかる長さ（窓上端から下方への長さ）, m
         l_ss_d_y_j_n = self._l_z_j * tan_phi_j_n - self._l_y_e_j
@@ -148,13 +153,7 @@ class SolarShadingSimple(SolarShading):
         # 日影面積率の計算 式(79)
         #   マイナスの場合（日陰が窓上端にかからない場合）は 0.0 とする。
         #   1.0を超える場合（日陰が窓下端よりも下になる場合）は 1.0 とする。
-        f_ss_d_j_n = np.clip(l_ss_d_y_j_n / self._l_y_h_j, 0.0, 1.0)
-
-        # 日が出ていないときは 0.0 とする。
-        f_ss_d_j_n[h_sun_ns <= 0.0] = 0.0
-
-        # 太陽位置が背面にある場合は 0.0 とする。
-        f_ss_d_j_n[np.cos(a_s_n - self._alpha_w_j) <= 0.0] = 0.0
+        f_ss_d_j_n[ns] = np.clip(l_ss_d_y_j_n / self._l_y_h_j, 0.0, 1.0)
 
         return f_ss_d_j_n
 
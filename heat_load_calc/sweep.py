@@ -0,0 +1,279 @@
+import copy
+import json
+import time
+import logging
+import argparse
+from os import path, getcwd, makedirs
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Any, Optional
+
+import pandas as pd
+
+from heat_load_calc import core, snapshot
+from heat_load_calc.heat_load_calc import save_result, OUTPUT_FORMATS, make_logger
+
+logger = logging.getLogger('HeatLoadCalc').getChild('sweep')
+
+# format of the result files written block by block during the calculation (see recorder.StreamingRecorder)
+STORE_FORMAT = 'npy'
+
+
+def apply_overrides(d: Dict, overrides: Dict[str, Any]) -> Dict:
+    """Make the input data of a variant by overriding the base input data.
+
+    Args:
+        d: base input data as dictionary / 住宅計算条件
+        overrides: values keyed by the dotted path of the input data
+            (e.g. "common.weather.region", "building.infiltration.c_value", "boundaries.3.layers.0.thermal_resistance")
+
+    Returns:
+        input data of the variant (the base input data is not modified)
+    """
+
+    d_variant = copy.deepcopy(d)
+
+    for key, value in overrides.items():
+
+        keys = key.split('.')
+
+        node = d_variant
+
+        for k in keys[:-1]:
+            node = node[int(k)] if isinstance(node, list) else node[k]
+
+        if isinstance(node, list):
+            node[int(keys[-1])] = value
+        else:
+            node[keys[-1]] = value
+
+    return d_variant
+
+
+def read_variants(variants_path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """Read the table of the parameter overrides.
+
+    Args:
+        variants_path: path of the csv file
+            The column 'name' is the name of the variant, and the other columns are the dotted paths of the input data.
+            Each value is read as json (number, list, etc.) if possible, otherwise as string.
+            An empty cell means that the value is not overridden.
+
+    Returns:
+        list of the name and the overrides of each variant
+    """
+
+    df = pd.read_csv(variants_path, dtype=str, keep_default_na=False)
+
+    if 'name' not in df.columns:
+        raise KeyError('Column name could not be found in the variants file.')
+
+    def parse(v: str):
+        try:
+            return json.loads(v)
+        except json.JSONDecodeError:
+            return v
+
+    return [
+        (str(row['name']), {k: parse(v) for k, v in row.items() if k != 'name' and v != ''})
+        for _, row in df.iterrows()
+    ]
+
+
+def run_sweep(
+        d: Dict,
+        variants: List[Tuple[str, Dict[str, Any]]],
+        output_data_dir: str,
+        entry_point_dir: str,
+        max_workers: Optional[int] = None,
+        output_format: str = 'csv',
+        output_names: Optional[List[str]] = None,
+        snapshot_dir: Optional[str] = None
+) -> List[Tuple[str, float]]:
+    """Run all variants of the base input data in parallel.
+
+    Args:
+        d: base input data as dictionary / 住宅計算条件
+        variants: list of the name and the overrides of each variant
+        output_data_dir: path of the directory for output files
+            The results of each variant are saved in the sub directory named after the variant.
+        entry_point_dir: the pass of the entry point directory
+        max_workers: number of worker processes (None means the number of processors)
+        output_format: format of the result files ('csv', 'parquet', 'feather', 'npz' or 'npy')
+            'npy' writes the results of each variant block by block to the .npy file of each output item
+            in the sub directory 'store' during the calculation, and the results of the whole period are not kept in memory.
+            They can be read by recorder.ResultStore.
+        output_names: output names of the recorded values (None means all values)
+        snapshot_dir: directory of the states after the run-up shared by the variants (None means no snapshot)
+            The run-up is skipped for the variants whose building-physics inputs are the same (see snapshot.get_key).
+
+    Returns:
+        list of the name and the elapsed time (sec) of each variant
+    """
+
+    if output_format not in OUTPUT_FORMATS + [STORE_FORMAT]:
+        raise ValueError('出力形式 `{}` には対応していません。'.format(output_format))
+
+    names = [name for name, _ in variants]
+
+    if len(set(names)) != len(names):
+        raise ValueError('バリエーションの名前が重複しています。')
+
+    start = time.time()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+
+        futures = [
+            executor.submit(
+                _run_variant,
+                d=apply_overrides(d=d, overrides=overrides),
+                name=name,
+                output_data_dir=output_data_dir,
+                entry_point_dir=entry_point_dir,
+                output_format=output_format,
+                output_names=output_names,
+                snapshot_dir=snapshot_dir
+            )
+            for name, overrides in variants
+        ]
+
+        results = [future.result() for future in futures]
+
+    elapsed_time = time.time() - start
+
+    logger.info('{} runs in {:.1f} sec ({:.2f} runs/min)'.format(len(results), elapsed_time, len(results) / elapsed_time * 60.0))
+
+    return results
+
+
+def _run_variant(
+        d: Dict,
+        name: str,
+        output_data_dir: str,
+        entry_point_dir: str,
+        output_format: str,
+        output_names: Optional[List[str]],
+        snapshot_dir: Optional[str] = None
+) -> Tuple[str, float]:
+    """Run one variant in the worker process.
+
+    Args:
+        d: input data of the variant
+        name: name of the variant
+        output_data_dir: path of the directory for output files
+        entry_point_dir: the pass of the entry point directory
+        output_format: format of the result files
+        output_names: output names of the recorded values
+        snapshot_dir: directory of the states after the run-up
+
+    Returns:
+        name and elapsed time (sec) of the variant
+    """
+
+    start = time.time()
+
+    if snapshot_dir is not None:
+        snapshot.set_snapshot_dir(snapshot_dir=snapshot_dir)
+
+    variant_dir = path.join(output_data_dir, name)
+
+    makedirs(variant_dir, exist_ok=True)
+
+    if output_format == STORE_FORMAT:
+
+        # The results are written during the calculation, and the DataFrames are not made.
+        core.calc(
+            d=d, entry_point_dir=entry_point_dir, output_names=output_names, store_dir=path.join(variant_dir, 'store')
+        )
+
+        return name, time.time() - start
+
+    # The Weather class is made only once per process for each region (or file) and interval (see Weather.make_weather).
+    dd_i, dd_a, _, _ = core.calc(d=d, entry_point_dir=entry_point_dir, output_names=output_names)
+
+    save_result(dd=dd_i, output_data_dir=variant_dir, name='result_detail_i', output_format=output_format)
+    save_result(dd=dd_a, output_data_dir=variant_dir, name='result_detail_a', output_format=output_format)
+
+    return name, time.time() - start
+
+
+def main(args: Optional[List[str]] = None):
+
+    parser = argparse.ArgumentParser(prog='heat_load_calc sweep', description='parameter sweep of heat load calculation')
+
+    parser.add_argument(
+        'house_data',
+        help='Relative path of the base input json file'
+    )
+
+    parser.add_argument(
+        'variants',
+        help='Relative path of the csv file of the parameter overrides'
+    )
+
+    parser.add_argument(
+        '-o', '--output_data_dir',
+        dest="output_data_dir",
+        default=getcwd(),
+        help="Relative path of output directory"
+    )
+
+    parser.add_argument(
+        '-j', '--max_workers',
+        dest='max_workers',
+        type=int,
+        default=None,
+        help="Specify the number of worker processes. (Default=number of processors)"
+    )
+
+    parser.add_argument(
+        '--output-format',
+        dest='output_format',
+        choices=OUTPUT_FORMATS + [STORE_FORMAT],
+        default='csv',
+        help="Specify the format of the result files. "
+             "npy writes the .npy file of each output item block by block during the calculation. (Default=csv)"
+    )
+
+    parser.add_argument(
+        '--output-names',
+        dest='output_names',
+        nargs='+',
+        default=None,
+        help="Specify the output names of the recorded values (e.g. t_r l_s_c). (Default=all values)"
+    )
+
+    parser.add_argument(
+        '--snapshot-dir',
+        dest='snapshot_dir',
+        default=None,
+        help="Specify the directory to share the states after the run-up among the variants of the same building."
+    )
+
+    parser.add_argument(
+        "--log",
+        choices=['DEBUG', 'INFO', 'WARN', 'ERROR', 'CRITICAL'],
+        default='INFO',
+        help="Specify the log level. (Default=INFO)"
+    )
+
+    args = parser.parse_args(args)
+
+    make_logger(log=args.log)
+
+    with open(args.house_data, 'r', encoding='utf-8') as js:
+        d = json.load(js)
+
+    run_sweep(
+        d=d,
+        variants=read_variants(variants_path=args.variants),
+        output_data_dir=args.output_data_dir,
+        entry_point_dir=path.dirname(__file__),
+        max_workers=args.max_workers,
+        output_format=args.output_format,
+        output_names=args.output_names,
+        snapshot_dir=args.snapshot_dir
+    )
+
+
+if __name__ == '__main__':
+    main()
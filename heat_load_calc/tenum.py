@@ -21,6 +21,7 @@ class EWeatherMethod(Enum):
 
     EES = 'ees'
     FILE = 'file'
+    HASP = 'hasp'
 
 
 class ERegion(IntEnum):
@@ -138,3 +139,15 @@ class EFurnitureSpecifyMethod(Enum):
 
     DEFAULT = 'default'
     SPECIFY = 'specify'
+
+
+class ERunUpGroundMethod(Enum):
+    """method for the run-up calculation of the ground / 地盤の助走計算の方法
+
+    Notes:
+        STEP: 地盤のみの助走計算をステップごとに行う。
+        PERIODIC: 1年を周期とする地盤の周期定常解を初期値とする。
+    """
+
+    STEP = 'step'
+    PERIODIC = 'periodic'
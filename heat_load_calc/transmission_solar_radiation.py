@@ -1,7 +1,10 @@
 import numpy as np
 
+from typing import Optional
+
 from heat_load_calc import inclined_surface_solar_radiation
 from heat_load_calc.weather import Weather
+from heat_load_calc.inclined_surface_solar_radiation import SolarGeometry
 from heat_load_calc.direction import Direction
 from heat_load_calc.solar_shading import SolarShading
 from heat_load_calc.window import Window
@@ -23,7 +26,8 @@ def get_q_trs_sol_j_ns_for_transparent_sun_striked(
         a_s_j: float,
         ssp_j: SolarShading,
         window_j: Window,
-        w: Weather
+        w: Weather,
+        sg_j: Optional[SolarGeometry] = None
 ) -> np.ndarray:
     """
 
@@ -33,27 +37,34 @@ def get_q_trs_sol_j_ns_for_transparent_sun_striked(
         ssp_j: 境界jの SolarShadingPart Class
         wdw_j: 境界jの Window Class
         w: Weather Class
+        sg_j: 境界jの方位の SolarGeometry Class（省略した場合はここで計算する。）
     Returns:
         ステップnにおける境界jの透過日射量, W, [N+1]
     """
 
+    if sg_j is None:
+        sg_j = SolarGeometry.create(w=w, drct_j=t_drct_j)
+
     # ステップnにおける境界jの傾斜面に入射する太陽の入射角, rad, [N+1]
-    phi_j_ns = inclined_surface_solar_radiation.get_phi_j_ns(
-        h_sun_ns=w.h_sun_ns_plus, a_sun_ns=w.a_sun_ns_plus, drct_j=t_drct_j)
+    phi_j_ns = sg_j.phi_j_ns
 
     # ステップnにおける境界jの傾斜面に入射する日射量のうち直達成分, W/m2 [N+1]
     # ステップnにおける境界jの傾斜面に入射する日射量のうち天空成分, W/m2 [N+1]
     # ステップnにおける境界jの傾斜面に入射する日射量のうち地盤反射成分, W/m2 [N+1]
-    # ステップnにおける境界jの傾斜面の夜間放射量, W/m2, [N+1]
-    i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns, _ = inclined_surface_solar_radiation.get_i_s_j_ns(
-        w=w,
-        drct_j=t_drct_j
-    )
+    i_s_dn_j_ns, i_s_sky_j_ns, i_s_ref_j_ns = sg_j.i_s_dn_j_ns, sg_j.i_s_sky_j_ns, sg_j.i_s_ref_j_ns
+
+    # 直達日射が当たるステップの番号, [N_sun]
+    # 直達日射に対する値は、直達日射が当たるステップについてのみ計算する。
+    ns_sun = inclined_surface_solar_radiation.get_ns_sun(i_s_dn_j_ns=i_s_dn_j_ns)
 
     # ---日よけの影面積比率
 
     # ステップnにおける境界jの直達日射に対する日よけの影面積比率, [N+1]
-    f_ss_d_j_ns = ssp_j.get_f_ss_dn_j_ns(h_sun_ns=w.h_sun_ns_plus, a_sun_ns=w.a_sun_ns_plus)
+    f_ss_d_j_ns = inclined_surface_solar_radiation.expand_ns_sun(
+        v_ns_sun=ssp_j.get_f_ss_dn_j_ns(h_sun_ns=w.h_sun_ns_plus[ns_sun], a_sun_ns=w.a_sun_ns_plus[ns_sun]),
+        ns_sun=ns_sun,
+        n=w.number_of_data_plus
+    )
 
     # ステップnにおける境界jの天空日射に対する日よけの影面積比率
     f_ss_s_j_ns = ssp_j.get_f_ss_sky_j()
@@ -62,7 +73,11 @@ def get_q_trs_sol_j_ns_for_transparent_sun_striked(
     f_ss_r_j_ns = ssp_j.get_f_ss_ref_j()
 
     # ステップnにおける境界jの窓の直達日射に対する日射透過率, -, [N+1]
-    tau_w_d_j_ns = window_j.get_tau_w_d_j_ns(phi_j_ns=phi_j_ns)
+    tau_w_d_j_ns = inclined_surface_solar_radiation.expand_ns_sun(
+        v_ns_sun=window_j.get_tau_w_d_j_ns(phi_j_ns=phi_j_ns[ns_sun]),
+        ns_sun=ns_sun,
+        n=w.number_of_data_plus
+    )
 
     # 境界jの窓の天空日射に対する日射透過率, -
     tau_w_s_j = window_j.tau_w_s_j
@@ -70,16 +85,59 @@ def get_q_trs_sol_j_ns_for_transparent_sun_striked(
     # 境界jの窓の地盤反射日射に対する日射透過率, -
     tau_w_r_j = window_j.tau_w_r_j
 
-    # ステップnにおける境界jの直達日射に対する単位面積当たりの透過日射量, W/m2, [N+1]
-    q_trs_sol_dn_j_ns = tau_w_d_j_ns * (1.0 - f_ss_d_j_ns) * i_s_dn_j_ns
+    return get_q_trs_sol_js_ns_for_transparent_sun_striked(
+        a_s_js=a_s_j,
+        f_ss_dn_js_ns=f_ss_d_j_ns,
+        f_ss_sky_js=f_ss_s_j_ns,
+        f_ss_ref_js=f_ss_r_j_ns,
+        tau_w_d_js_ns=tau_w_d_j_ns,
+        tau_w_s_js=tau_w_s_j,
+        tau_w_r_js=tau_w_r_j,
+        i_s_dn_js_ns=i_s_dn_j_ns,
+        i_s_sky_js_ns=i_s_sky_j_ns,
+        i_s_ref_js_ns=i_s_ref_j_ns
+    )
+
+
+def get_q_trs_sol_js_ns_for_transparent_sun_striked(
+        a_s_js: np.ndarray,
+        f_ss_dn_js_ns: np.ndarray,
+        f_ss_sky_js: np.ndarray,
+        f_ss_ref_js: np.ndarray,
+        tau_w_d_js_ns: np.ndarray,
+        tau_w_s_js: np.ndarray,
+        tau_w_r_js: np.ndarray,
+        i_s_dn_js_ns: np.ndarray,
+        i_s_sky_js_ns: np.ndarray,
+        i_s_ref_js_ns: np.ndarray
+) -> np.ndarray:
+    """日射が当たる「透明な開口部」の透過日射量を複数の境界についてまとめて計算する。
+
+    Args:
+        a_s_js: 境界jの面積, m2, [J, 1]
+        f_ss_dn_js_ns: ステップnにおける境界jの直達日射に対する日よけの影面積比率, -, [J, N+1]
+        f_ss_sky_js: 境界jの天空日射に対する日よけの影面積比率, -, [J, 1]
+        f_ss_ref_js: 境界jの地面反射日射に対する日よけの影面積比率, -, [J, 1]
+        tau_w_d_js_ns: ステップnにおける境界jの窓の直達日射に対する日射透過率, -, [J, N+1]
+        tau_w_s_js: 境界jの窓の天空日射に対する日射透過率, -, [J, 1]
+        tau_w_r_js: 境界jの窓の地盤反射日射に対する日射透過率, -, [J, 1]
+        i_s_dn_js_ns: ステップnにおける境界jの傾斜面に入射する日射量のうち直達成分, W/m2, [J, N+1]
+        i_s_sky_js_ns: ステップnにおける境界jの傾斜面に入射する日射量のうち天空成分, W/m2, [J, N+1]
+        i_s_ref_js_ns: ステップnにおける境界jの傾斜面に入射する日射量のうち地盤反射成分, W/m2, [J, N+1]
+    Returns:
+        ステップnにおける境界jの透過日射量, W, [J, N+1]
+    Notes:
+        境界が1つの場合は、係数をスカラー、時系列を[N+1]の配列として与えてもよい。
+    """
 
-    # ステップnにおける境界jの天空日射に対する単位面積当たりの透過日射量, W/m2, [N+1]
-    q_trs_sol_sky_j_ns = tau_w_s_j * (1.0 - f_ss_s_j_ns) * i_s_sky_j_ns
+    # ステップnにおける境界jの直達日射に対する単位面積当たりの透過日射量, W/m2, [J, N+1]
+    q_trs_sol_dn_js_ns = tau_w_d_js_ns * (1.0 - f_ss_dn_js_ns) * i_s_dn_js_ns
 
-    # ステップnにおける境界jの地盤反射日射に対する単位面積当たりの透過日射量, W/m2, [N+1]
-    q_trs_sol_ref_j_ns = tau_w_r_j * (1.0 - f_ss_r_j_ns) * i_s_ref_j_ns
+    # ステップnにおける境界jの天空日射に対する単位面積当たりの透過日射量, W/m2, [J, N+1]
+    q_trs_sol_sky_js_ns = tau_w_s_js * (1.0 - f_ss_sky_js) * i_s_sky_js_ns
 
-    # ステップnにおける境界jの透過日射量, W, [N+1]
-    q_trs_sol_j_ns = (q_trs_sol_dn_j_ns + q_trs_sol_sky_j_ns + q_trs_sol_ref_j_ns) * a_s_j
+    # ステップnにおける境界jの地盤反射日射に対する単位面積当たりの透過日射量, W/m2, [J, N+1]
+    q_trs_sol_ref_js_ns = tau_w_r_js * (1.0 - f_ss_ref_js) * i_s_ref_js_ns
 
-    return q_trs_sol_j_ns
+    # ステップnにおける境界jの透過日射量, W, [J, N+1]
+    return (q_trs_sol_dn_js_ns + q_trs_sol_sky_js_ns + q_trs_sol_ref_js_ns) * a_s_js
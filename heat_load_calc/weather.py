@@ -2,19 +2,75 @@
 import pandas as pd
 import os
 import logging
-from typing import Tuple, Dict
+import hashlib
+from typing import Tuple, Dict, Optional, Iterator
+from collections import OrderedDict
 import math
+import itertools
 
-from heat_load_calc import solar_position
+from heat_load_calc import solar_position, hasp_weather_read
+from heat_load_calc.file_util import write_atomic
 from heat_load_calc.interval import Interval
 from heat_load_calc.region import Region
 from heat_load_calc.tenum import ERegion, EInterval, EWeatherMethod
-from heat_load_calc.input_models.input_weather import InputWeather, InputWeatherEES, InputWeatherFile
+from heat_load_calc.input_models.input_weather import InputWeather, InputWeatherEES, InputWeatherFile, InputWeatherHASP
 
 
 logger = logging.getLogger(name='HeatLoadCalc').getChild('Weather')
 
 
+# version of the format of the weather cache file
+# This value should be changed when the way to make the weather data from the ees, csv or hasp file is changed.
+_CACHE_VERSION = 1
+
+# directory of the weather cache files
+# It can be specified by the environment variable HEAT_LOAD_CALC_WEATHER_CACHE (not specified or empty string means no cache).
+_cache_dir: Optional[str] = os.environ.get('HEAT_LOAD_CALC_WEATHER_CACHE') or None
+
+
+# maximum number of the Weather classes kept in this process (0 means that the Weather class is not kept)
+_memo_size: int = 16
+
+# Weather classes kept in this process, keyed by (method, region or file, interval)
+_memo: OrderedDict = OrderedDict()
+
+
+def set_memo_size(memo_size: int):
+    """Set the maximum number of the Weather classes kept in this process. / プロセス内で保持する Weather クラスの最大数を設定する。
+
+    Args:
+        memo_size: maximum number of the Weather classes (0 means that the Weather class is not kept)
+    """
+
+    global _memo_size
+
+    if memo_size < 0:
+        raise ValueError('memo_size should be zero or positive.')
+
+    _memo_size = memo_size
+
+    while len(_memo) > _memo_size:
+        _memo.popitem(last=False)
+
+
+def clear_memo():
+    """Clear the Weather classes kept in this process. / プロセス内で保持している Weather クラスを消去する。"""
+
+    _memo.clear()
+
+
+def set_cache_dir(cache_dir: Optional[str]):
+    """Set the directory of the weather cache files. / 気象データのキャッシュファイルのディレクトリを設定する。
+
+    Args:
+        cache_dir: directory of the cache files (None means that the cache is not used)
+    """
+
+    global _cache_dir
+
+    _cache_dir = cache_dir
+
+
 class Weather:
 
     def __init__(
@@ -26,7 +82,8 @@ class Weather:
             r_n_ns: np.ndarray,
             theta_o_ns: np.ndarray,
             x_o_ns: np.ndarray,
-            itv: Interval = Interval(eitv=EInterval.M15)
+            itv: Interval = Interval(eitv=EInterval.M15),
+            v_pls: Optional[np.ndarray] = None
     ):
         """
 
@@ -39,6 +96,9 @@ class Weather:
             theta_o_ns: outside temperature at step n, ステップnにおける外気温度, degree C, [N]
             x_o_ns: outside absolute humidity at step n, ステップnにおける外気絶対湿度, kg/kg(DA), [N]
             itv: interval class
+            v_pls: values at the first step of the following year / 次の年の最初のステップにおける値, [7]
+                in the order of a_sun, h_sun, i_dn, i_sky, r_n, theta_o and x_o.
+                None means that the values at the first step of this year are used (the year is cyclic).
         """
 
         if a_sun_ns.size != itv.get_n_step_annual():
@@ -64,6 +124,9 @@ class Weather:
         self._theta_o_ns = theta_o_ns
         self._x_o_ns = x_o_ns
 
+        # values at the first step of the following year, [7]
+        self._v_pls = v_pls
+
         self._itv = itv
 
         # the number of data
@@ -71,6 +134,43 @@ class Weather:
 
     @classmethod
     def make_weather(cls, ipt_weather: InputWeather, itv: Interval, entry_point_dir: str = ""):
+        """Make the Weather class. / Weather クラスを作成する。
+
+        Args:
+            ipt_weather: InputWeather class
+            itv: interval class
+            entry_point_dir: the pass of the entry point directory
+
+        Returns:
+            Weather class
+
+        Notes:
+            The Weather class is kept in this process (LRU, up to the size set by set_memo_size),
+            and the same instance is returned for the same method, region (or file) and interval.
+            The arrays of the returned Weather class are read-only since they are shared.
+        """
+
+        key = _get_memo_key(ipt_weather=ipt_weather, itv=itv, entry_point_dir=entry_point_dir)
+
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+        w = cls._make_weather(ipt_weather=ipt_weather, itv=itv, entry_point_dir=entry_point_dir)
+
+        if _memo_size > 0:
+
+            w._set_read_only()
+
+            _memo[key] = w
+
+            while len(_memo) > _memo_size:
+                _memo.popitem(last=False)
+
+        return w
+
+    @classmethod
+    def _make_weather(cls, ipt_weather: InputWeather, itv: Interval, entry_point_dir: str = ""):
 
         if ipt_weather.method == EWeatherMethod.EES:
 
@@ -105,6 +205,29 @@ class Weather:
 
             return _make_from_pd(file_path=file_path, itv=itv, latitude=latitude, longitude=longitude)
 
+        elif ipt_weather.method == EWeatherMethod.HASP:
+
+            if not isinstance(ipt_weather, InputWeatherHASP):
+                raise Exception()
+
+            ipt_weather_hasp: InputWeatherHASP = ipt_weather
+
+            file_path = os.path.join(entry_point_dir, ipt_weather_hasp.file_path)
+
+            if not os.path.isfile(file_path):
+                raise FileExistsError('The specified file does not exist when hasp method is applied.')
+
+            logger.info('Load weather data from the hasp file `{}`'.format(file_path))
+
+            return _make_from_hasp(
+                file_path=file_path, itv=itv, latitude=ipt_weather_hasp.latitude, longitude=ipt_weather_hasp.longitude
+            )
+
+    def _set_read_only(self):
+        """Make the arrays read-only so that the instance can be shared. / 共有できるように配列を読み取り専用にする。"""
+
+        for v in [self._a_sun_ns, self._h_sun_ns, self._i_dn_ns, self._i_sky_ns, self._r_n_ns, self._theta_o_ns, self._x_o_ns]:
+            v.flags.writeable = False
 
     @classmethod
     def create_constant(cls, a_sun: float, h_sun: float, i_dn: float, i_sky: float, r_n: float, theta_o: float, x_o: float, itv: Interval = Interval(eitv=EInterval.M15)):
@@ -143,37 +266,37 @@ class Weather:
     @property
     def a_sun_ns_plus(self) -> np.ndarray:
         """solar direction at step n / ステップnの太陽方位角, rad, [N+1]"""
-        return _add_index_0_data_to_end(d=self._a_sun_ns)
+        return _add_index_0_data_to_end(d=self._a_sun_ns, d_pls=None if self._v_pls is None else self._v_pls[0])
 
     @property
     def h_sun_ns_plus(self) -> np.ndarray:
         """solar altitude at step n / ステップnの太陽高度, rad, [N+1]"""
-        return _add_index_0_data_to_end(d=self._h_sun_ns)
+        return _add_index_0_data_to_end(d=self._h_sun_ns, d_pls=None if self._v_pls is None else self._v_pls[1])
 
     @property
     def i_dn_ns_plus(self) -> np.ndarray:
         """normal surface direct solar radiation at step n / ステップnの法線面直達日射量, W/m2, [N+1]"""
-        return _add_index_0_data_to_end(d=self._i_dn_ns)
+        return _add_index_0_data_to_end(d=self._i_dn_ns, d_pls=None if self._v_pls is None else self._v_pls[2])
 
     @property
     def i_sky_ns_plus(self) -> np.ndarray:
         """horizontal sky solar radiation at step n / ステップnの水平面天空日射量, W/m2, [N+1]"""
-        return _add_index_0_data_to_end(d=self._i_sky_ns)
+        return _add_index_0_data_to_end(d=self._i_sky_ns, d_pls=None if self._v_pls is None else self._v_pls[3])
 
     @property
     def r_n_ns_plus(self) -> np.ndarray:
         """nighttime solar radiation at step n / ステップnの夜間放射量, W/m2, [N+1]"""
-        return _add_index_0_data_to_end(d=self._r_n_ns)
+        return _add_index_0_data_to_end(d=self._r_n_ns, d_pls=None if self._v_pls is None else self._v_pls[4])
 
     @property
     def theta_o_ns_plus(self) -> np.ndarray:
         """outside temperature at step n / ステップnの外気温度, degree C, [N+1]"""
-        return _add_index_0_data_to_end(d=self._theta_o_ns)
+        return _add_index_0_data_to_end(d=self._theta_o_ns, d_pls=None if self._v_pls is None else self._v_pls[5])
 
     @property
     def x_o_ns_plus(self) -> np.ndarray:
         """outside absolute humidity at step n / ステップnの外気絶対湿度, kg/kg(DA), [N+1]"""
-        return _add_index_0_data_to_end(d=self._x_o_ns)
+        return _add_index_0_data_to_end(d=self._x_o_ns, d_pls=None if self._v_pls is None else self._v_pls[6])
 
     @property
     def number_of_data(self) -> int:
@@ -240,17 +363,133 @@ class Weather:
         return np.average(self._theta_o_ns)
 
 
-def _add_index_0_data_to_end(d: np.ndarray) -> np.ndarray:
+class WeatherStream:
+    """Stream of the Weather classes of each year read from a multi-year weather file. / 複数年の気象データを1年ずつ読み込む。
+
+    Notes:
+        The file has the same columns as the file method and the rows of the hourly data for the years (8760 rows per year).
+        The data is read and interpolated year by year, so the weather data of all the years is not kept in memory.
+        The value at the end of each year (the step N) is the value at the first step of the following year.
+        ファイルの列はファイル指定の方法と同じで、1年あたり8760行の時刻別の値を年数分並べたものとする。
+    """
+
+    def __init__(self, file_path: str, itv: Interval, latitude: float, longitude: float):
+        """
+
+        Args:
+            file_path: the file path of the weather data / 気象データのファイルのパス
+            itv: interval, Interval 列挙体
+            latitude: latitude / 緯度（北緯）, degree
+            longitude: longitude / 経度（東経）, degree
+        """
+
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError("Error: File {} is not exist.".format(file_path))
+
+        # number of the rows except the header
+        with open(file_path, 'rb') as f:
+            n_row = sum(1 for line in f if line.strip() != b'') - 1
+
+        if n_row < 8760 or n_row % 8760 != 0:
+            raise ValueError('気象データの行数は8760の倍数である必要があります。')
+
+        self._file_path = file_path
+        self._itv = itv
+        self._latitude = latitude
+        self._longitude = longitude
+        self._n_year = n_row // 8760
+
+    @classmethod
+    def create(cls, ipt_weather: InputWeather, itv: Interval, entry_point_dir: str = ""):
+        """Make the WeatherStream class from the input of the file method. / ファイル指定の気象データの入力から作成する。
+
+        Args:
+            ipt_weather: InputWeather class
+            itv: interval class
+            entry_point_dir: the pass of the entry point directory
+
+        Returns:
+            WeatherStream class
+        """
+
+        if ipt_weather.method != EWeatherMethod.FILE:
+            raise ValueError('複数年の気象データはファイル指定の方法（file）でのみ指定できます。')
+
+        return cls(
+            file_path=os.path.join(entry_point_dir, ipt_weather.file_path),
+            itv=itv,
+            latitude=ipt_weather.latitude,
+            longitude=ipt_weather.longitude
+        )
+
+    @property
+    def n_year(self) -> int:
+        """number of the years / 年数"""
+        return self._n_year
+
+    def __iter__(self) -> Iterator[Weather]:
+        """Read and interpolate the weather data year by year. / 1年ずつ気象データを読み込み補間する。
+
+        Returns:
+            iterator of the Weather class of each year
+        """
+
+        phi_loc, lambda_loc = math.radians(self._latitude), math.radians(self._longitude)
+
+        # The solar position is the same for every year.
+        h_sun_ns, a_sun_ns = solar_position.calc_solar_position(phi_loc=phi_loc, lambda_loc=lambda_loc, interval=self._itv)
+
+        with pd.read_csv(self._file_path, chunksize=8760) as chunks:
+
+            pp = next(chunks)
+
+            # The data of the following year is read before making the Weather class,
+            # because the value at the end of the year is the value at the first step of the following year.
+            for pp_next in itertools.chain(chunks, [None]):
+
+                yield _make_from_data_frame(pp=pp, itv=self._itv, h_sun_ns=h_sun_ns, a_sun_ns=a_sun_ns, pp_next=pp_next)
+
+                pp = pp_next
+
+
+def _get_memo_key(ipt_weather: InputWeather, itv: Interval, entry_point_dir: str) -> Tuple:
+    """Get the key of the Weather class kept in this process.
+
+    Args:
+        ipt_weather: InputWeather class
+        itv: interval class
+        entry_point_dir: the pass of the entry point directory
+
+    Returns:
+        (method, region or (file path, modified time, latitude, longitude), interval)
+    """
+
+    if isinstance(ipt_weather, InputWeatherFile):
+
+        file_path = os.path.abspath(os.path.join(entry_point_dir, ipt_weather.file_path))
+
+        # The modified time is included so that the changed file is read again.
+        mtime = os.path.getmtime(file_path) if os.path.isfile(file_path) else None
+
+        return ipt_weather.method, (file_path, mtime, ipt_weather.latitude, ipt_weather.longitude), itv.interval
+
+    else:
+
+        return ipt_weather.method, ipt_weather.region, itv.interval
+
+
+def _add_index_0_data_to_end(d: np.ndarray, d_pls: Optional[float] = None) -> np.ndarray:
     """ Add the first data to the end of the list. / リストの最後に一番最初のデータを追加する。
 
     Args:
         d: list / リスト
+        d_pls: data added instead of the first data (e.g. the first data of the following year) / 最初のデータの代わりに追加するデータ
 
     Returns:
         added list / 追加されたリスト
     """
 
-    return np.append(d, d[0])
+    return np.append(d, d[0] if d_pls is None else d_pls)
 
 
 def _make_from_pd(file_path, itv: Interval, latitude: float, longitude: float) -> Weather:
@@ -268,6 +507,14 @@ def _make_from_pd(file_path, itv: Interval, latitude: float, longitude: float) -
     if not os.path.isfile(file_path):
         raise FileNotFoundError("Error: File {} is not exist.".format(file_path))
 
+    # path of the cache file
+    cache_path = _get_cache_path(path_and_filename=file_path, itv=itv, latitude=latitude, longitude=longitude)
+
+    w = _load_cache(cache_path=cache_path, itv=itv)
+
+    if w is not None:
+        return w
+
     pp = pd.read_csv(file_path)
 
     if not len(pp) == 8760:
@@ -280,22 +527,134 @@ def _make_from_pd(file_path, itv: Interval, latitude: float, longitude: float) -
     #   (2) solar direction at step n, rad / 太陽方位角, [N]
     h_sun_ns, a_sun_ns = solar_position.calc_solar_position(phi_loc=phi_loc, lambda_loc=lambda_loc, interval=itv)
 
+    w = _make_from_data_frame(pp=pp, itv=itv, h_sun_ns=h_sun_ns, a_sun_ns=a_sun_ns)
+
+    if cache_path is not None:
+        _save_cache(
+            cache_path=cache_path,
+            data=np.stack([w._a_sun_ns, w._h_sun_ns, w._i_dn_ns, w._i_sky_ns, w._r_n_ns, w._theta_o_ns, w._x_o_ns])
+        )
+
+    return w
+
+
+def _make_from_data_frame(
+        pp: pd.DataFrame, itv: Interval, h_sun_ns: np.ndarray, a_sun_ns: np.ndarray, pp_next: Optional[pd.DataFrame] = None
+) -> Weather:
+    """Make the Weather class from the hourly weather data of a year. / 1年分の時刻別の気象データから Weather クラスを作成する。
+
+    Args:
+        pp: hourly weather data of the year / 1年分の時刻別の気象データ, [8760]
+        itv: interval, Interval 列挙体
+        h_sun_ns: solar altitude at step n / 太陽高度, rad, [N]
+        a_sun_ns: solar direction at step n / 太陽方位角, rad, [N]
+        pp_next: hourly weather data of the following year / 次の年の時刻別の気象データ
+            None means that the year is cyclic (the data at 1/1 0:00 is used after the data at 12/31 23:00).
+
+    Returns:
+        Weather class
+    """
+
+    def interpolate(column: str) -> np.ndarray:
+        return _interpolate(
+            weather_data=pp[column].to_numpy(),
+            interval=itv,
+            rolling=False,
+            weather_data_next=None if pp_next is None else pp_next[column].iloc[0]
+        )
+
     # outside temperature at step n / ステップnにおける外気温度, degree C, [N]
-    theta_o_ns = _interpolate(weather_data=pp['temperature'].to_numpy(), interval=itv, rolling=False)
+    theta_o_ns = interpolate(column='temperature')
 
     # outside absolute humidity at step n / ステップnにおける外気絶対湿度, kg / kg(DA), [N]
     # Convert to the unit kg / kg(DA) because the unit in file is g / kg(DA)
     # g/kgDA から kg/kgDA へ単位変換を行う。
-    x_o_ns = _interpolate(weather_data=pp['absolute humidity'].to_numpy(), interval=itv, rolling=False) / 1000.0
+    x_o_ns = interpolate(column='absolute humidity') / 1000.0
 
     # normal surface direct solar radiation at step n / ステップnにおける法線面直達日射量, W / m2, [N]
-    i_dn_ns = _interpolate(weather_data=pp['normal direct solar radiation'].to_numpy(), interval=itv, rolling=False)
+    i_dn_ns = interpolate(column='normal direct solar radiation')
 
     # horizontal sky solar radiation at step n / ステップnにおける水平面天空日射量, W / m2, [N]
-    i_sky_ns = _interpolate(weather_data=pp['horizontal sky solar radiation'].to_numpy(), interval=itv, rolling=False)
+    i_sky_ns = interpolate(column='horizontal sky solar radiation')
 
     # nighttime radiation at step n / ステップnにおける夜間放射量, W / m2, [N]
-    r_n_ns = _interpolate(weather_data=pp['outward radiation'].to_numpy(), interval=itv, rolling=False)
+    r_n_ns = interpolate(column='outward radiation')
+
+    if pp_next is None:
+        v_pls = None
+    else:
+        # The value at the first step of the following year is the hourly value at 1/1 0:00 of the following year.
+        v_pls = np.array([
+            a_sun_ns[0],
+            h_sun_ns[0],
+            pp_next['normal direct solar radiation'].iloc[0],
+            pp_next['horizontal sky solar radiation'].iloc[0],
+            pp_next['outward radiation'].iloc[0],
+            pp_next['temperature'].iloc[0],
+            pp_next['absolute humidity'].iloc[0] / 1000.0
+        ], dtype=float)
+
+    return Weather(
+        a_sun_ns=a_sun_ns,
+        h_sun_ns=h_sun_ns,
+        i_dn_ns=i_dn_ns,
+        i_sky_ns=i_sky_ns,
+        r_n_ns=r_n_ns,
+        theta_o_ns=theta_o_ns,
+        x_o_ns=x_o_ns,
+        itv=itv,
+        v_pls=v_pls
+    )
+
+
+def _make_from_hasp(file_path: str, itv: Interval, latitude: float, longitude: float) -> Weather:
+    """Read the weather data from the specified hasp file. / HASP形式の気象データを読み込む。
+
+    Args:
+        file_path: the file path of the weather data (3 column SI format) / 気象データのファイルのパス（3カラムのSI形式）
+        itv: interval, Interval 列挙体
+        latitude: latitude / 緯度（北緯）, degree
+        longitude: longitude / 経度（東経）, degree
+    Returns:
+        Weather class
+
+    Notes:
+        The data of the hasp file starts at 1:00 in 1/1 as the ees file.
+    """
+
+    # path of the cache file
+    cache_path = _get_cache_path(path_and_filename=file_path, itv=itv, latitude=latitude, longitude=longitude)
+
+    w = _load_cache(cache_path=cache_path, itv=itv)
+
+    if w is not None:
+        return w
+
+    # outside temperature / 外気温度, degree C, [8760]
+    # outside absolute humidity / 外気絶対湿度, kg / kg(DA), [8760]
+    # normal surface direct solar radiation / 法線面直達日射量, W / m2, [8760]
+    # horizontal sky solar radiation / 水平面天空日射量, W / m2, [8760]
+    # nighttime radiation / 夜間放射量, W / m2, [8760]
+    theta_o_hs, x_o_hs, i_dn_hs, i_sky_hs, r_n_hs, _, _ = hasp_weather_read.hasp_read(file_name=file_path)
+
+    phi_loc, lambda_loc = math.radians(latitude), math.radians(longitude)
+
+    # solar position / 太陽位置
+    #   (1) solar altitude at step n / 太陽高度, rad, [N]
+    #   (2) solar direction at step n, rad / 太陽方位角, [N]
+    h_sun_ns, a_sun_ns = solar_position.calc_solar_position(phi_loc=phi_loc, lambda_loc=lambda_loc, interval=itv)
+
+    theta_o_ns = _interpolate(weather_data=theta_o_hs, interval=itv, rolling=True).round(3)
+    x_o_ns = _interpolate(weather_data=x_o_hs, interval=itv, rolling=True).round(6)
+    i_dn_ns = _interpolate(weather_data=i_dn_hs, interval=itv, rolling=True)
+    i_sky_ns = _interpolate(weather_data=i_sky_hs, interval=itv, rolling=True)
+    r_n_ns = _interpolate(weather_data=r_n_hs, interval=itv, rolling=True)
+
+    if cache_path is not None:
+        _save_cache(
+            cache_path=cache_path,
+            data=np.stack([a_sun_ns, h_sun_ns, i_dn_ns, i_sky_ns, r_n_ns, theta_o_ns, x_o_ns])
+        )
 
     return Weather(
         a_sun_ns=a_sun_ns,
@@ -319,6 +678,17 @@ def _make_weather_ees(region: Region, itv: Interval) -> Weather:
         Weather Class
     """
 
+    # absolute file path
+    path_and_filename = _get_path_and_filename(region=region)
+
+    # path of the cache file
+    cache_path = _get_cache_path(path_and_filename=path_and_filename, itv=itv)
+
+    w = _load_cache(cache_path=cache_path, itv=itv)
+
+    if w is not None:
+        return w
+
     # Load the climate data.
     #   (1) outside temperature at step n / ステップnにおける外気温度, degree C, [N]
     #   (2) normal surface direct solar radiation at step n / ステップnにおける法線面直達日射量, W / m2, [N]
@@ -340,18 +710,135 @@ def _make_weather_ees(region: Region, itv: Interval) -> Weather:
     #   solar azimuth at step n / ステップnにおける太陽方位角, rad, [N]
     h_sun_ns, a_sun_ns = solar_position.calc_solar_position(phi_loc=phi_loc, lambda_loc=lambda_loc, interval=itv)
 
+    theta_o_ns = theta_o_ns.round(3)
+    x_o_ns = x_o_ns.round(6)
+
+    if cache_path is not None:
+        _save_cache(
+            cache_path=cache_path,
+            data=np.stack([a_sun_ns, h_sun_ns, i_dn_ns, i_sky_ns, r_n_ns, theta_o_ns, x_o_ns])
+        )
+
     return Weather(
         a_sun_ns=a_sun_ns,
         h_sun_ns=h_sun_ns,
         i_dn_ns=i_dn_ns,
         i_sky_ns=i_sky_ns,
         r_n_ns=r_n_ns,
-        theta_o_ns=theta_o_ns.round(3),
-        x_o_ns=x_o_ns.round(6),
+        theta_o_ns=theta_o_ns,
+        x_o_ns=x_o_ns,
+        itv=itv
+    )
+
+
+def _get_path_and_filename(region: Region) -> str:
+    """Get the absolute path of the ees file depending on the region. / 地域の区分に応じた気象データファイルのパスを取得する。
+
+    Args:
+        region: 地域の区分
+
+    Returns:
+        absolute file path
+    """
+
+    # Get the file name corresponding to the region. / 地域の区分に応じたファイル名の取得する。
+    weather_data_filename = _get_filename(region=region)
+
+    return str(os.path.dirname(__file__)) + '/expanded_amedas/' + weather_data_filename
+
+
+def _get_cache_path(
+        path_and_filename: str, itv: Interval, latitude: Optional[float] = None, longitude: Optional[float] = None
+) -> Optional[str]:
+    """Get the path of the cache file. / 気象データのキャッシュファイルのパスを取得する。
+
+    Args:
+        path_and_filename: absolute path of the ees, csv or hasp file
+        itv: Interval 列挙体
+        latitude: latitude / 緯度（北緯）, degree (only for the csv or hasp file)
+        longitude: longitude / 経度（東経）, degree (only for the csv or hasp file)
+
+    Returns:
+        path of the cache file (None if the cache is not used or the file does not exist)
+
+    Notes:
+        The file name contains the hash of the file (and the location), so the cache is invalidated when the file is changed.
+    """
+
+    if _cache_dir is None or not os.path.isfile(path_and_filename):
+        return None
+
+    h = hashlib.sha256()
+
+    with open(path_and_filename, 'rb') as f:
+        h.update(f.read())
+
+    # The solar position depends on the location.
+    if latitude is not None or longitude is not None:
+        h.update(repr((latitude, longitude)).encode('utf-8'))
+
+    file_hash = h.hexdigest()[0:16]
+
+    name = os.path.splitext(os.path.basename(path_and_filename))[0]
+
+    return os.path.join(_cache_dir, '{}_{}_v{}_{}.npy'.format(name, itv.interval.value, _CACHE_VERSION, file_hash))
+
+
+def _load_cache(cache_path: Optional[str], itv: Interval) -> Optional[Weather]:
+    """Load the cache file. / 気象データのキャッシュファイルを読み込む。
+
+    Args:
+        cache_path: path of the cache file (None if the cache is not used)
+        itv: Interval 列挙体
+
+    Returns:
+        Weather class (None if the cache file does not exist)
+
+    Notes:
+        The cache file contains the interpolated weather data and the solar position, [7, N].
+    """
+
+    if cache_path is None or not os.path.isfile(cache_path):
+        return None
+
+    logger.info('Load weather data from the cache file `{}`'.format(cache_path))
+
+    data = np.load(cache_path, mmap_mode='r')
+
+    return Weather(
+        a_sun_ns=data[0],
+        h_sun_ns=data[1],
+        i_dn_ns=data[2],
+        i_sky_ns=data[3],
+        r_n_ns=data[4],
+        theta_o_ns=data[5],
+        x_o_ns=data[6],
         itv=itv
     )
 
 
+def _save_cache(cache_path: str, data: np.ndarray):
+    """Save the cache file. / 気象データのキャッシュファイルを保存する。
+
+    Args:
+        cache_path: path of the cache file
+        data: weather data, [7, N]
+
+    Notes:
+        The file is written to a temporary file and renamed,
+        so that the other processes do not read the file being written.
+        If the file could not be written, the cache is just not used.
+    """
+
+    try:
+
+        write_atomic(path=cache_path, write=lambda f: np.save(f, data))
+
+    except OSError as e:
+
+        logger.warning('The weather cache file `{}` could not be saved. ({})'.format(cache_path, e))
+
+
 def _load(region: Region, itv: Interval) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Read the weather data depend on the region and interpolates at specified time intervals to create data. / 地域の区分に応じて気象データを読み込み、指定された時間間隔で補間を行いデータを作成する。
 
@@ -372,11 +859,8 @@ def _load(region: Region, itv: Interval) -> Tuple[np.ndarray, np.ndarray, np.nda
         interval = '15m' -> n = 8760 * 4
     """
 
-    # Get the file name corresponding to the region. / 地域の区分に応じたファイル名の取得する。
-    weather_data_filename = _get_filename(region=region)
-
     # absolute file path
-    path_and_filename = str(os.path.dirname(__file__)) + '/expanded_amedas/' + weather_data_filename
+    path_and_filename = _get_path_and_filename(region=region)
 
     # read the file
     if not os.path.isfile(path_and_filename):
@@ -409,7 +893,9 @@ def _load(region: Region, itv: Interval) -> Tuple[np.ndarray, np.ndarray, np.nda
     return theta_o_ns, i_dn_ns, i_sky_ns, r_n_ns, x_o_ns
 
 
-def _interpolate(weather_data: np.ndarray, interval: Interval, rolling: bool) -> np.ndarray:
+def _interpolate(
+        weather_data: np.ndarray, interval: Interval, rolling: bool, weather_data_next: Optional[float] = None
+) -> np.ndarray:
     """Interpolate the hourly 8760 data to the specified interval. / 1時間ごとの8760データを指定された間隔のデータに補間する。
     '1h': 1時間間隔の場合、 n = 8760
     '30m': 30分間隔の場合、 n = 8760 * 2 = 17520
@@ -421,6 +907,8 @@ def _interpolate(weather_data: np.ndarray, interval: Interval, rolling: bool) ->
         rolling: is rolling? / rolling するか否か。
             If the data starts at 1:00, this value should be TRUE in order to move the data at 24:00 in 12/31 to 1/1 0:00.
             データが1時始まりの場合は最終行の 12/31 24:00 のデータを 1/1 0:00 に持ってくるため、この値は True にすること。
+        weather_data_next: hourly data at 1/1 0:00 of the following year (only used when rolling is False) / 次の年の1/1 0:00のデータ
+            None means that the data at 1/1 0:00 of this year is used. / None の場合はこの年の1/1 0:00のデータを用いる。
 
     Returns:
         interpolated weather data of specified interval / 指定する時間間隔に補間された気象データ, [N]
@@ -455,7 +943,10 @@ def _interpolate(weather_data: np.ndarray, interval: Interval, rolling: bool) ->
             data2 = weather_data
         else:
             data1 = weather_data
-            data2 = np.roll(weather_data, -1)
+            if weather_data_next is None:
+                data2 = np.roll(weather_data, -1)
+            else:
+                data2 = np.append(weather_data[1:], weather_data_next)
 
         # Interporats. / 直線補完 2 dimentional array [2, 8760] or [4, 8760]
         data_interp_2d = alpha[np.newaxis, :] * data1[:, np.newaxis] + (1.0 - alpha[np.newaxis, :]) * data2[:, np.newaxis]
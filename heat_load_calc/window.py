@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from typing import Optional, Tuple, Union, TypeVar
+from typing import Optional, Tuple, Union, TypeVar, Dict
 from math import sin, cos, pi
 import numpy as np
 from abc import ABC, abstractmethod
@@ -65,12 +65,26 @@ class GlassType(Enum):
     MULTIPLE = 'multiple'
 
 
+# solar transmittance and absorbed solar heat of quarter-sphere for uniformly diffuse solar radiation
+# keyed by glass type, u value and eta value of glazing
+_memo_c: Dict[Tuple[GlassType, float, float], Tuple[float, float]] = {}
+
+
+def clear_memo():
+    """Clear the diffuse solar properties of glazing kept in this process. / プロセス内で保持している拡散日射に対するガラスの特性値を消去する。"""
+
+    _memo_c.clear()
+
+
 class Glazing(ABC):
 
     # The number of segments
     # for numerical integration to calculate the difference in sky radiation transmittance
     M = 1000
 
+    # glass type
+    T_GLZ: GlassType
+
     @classmethod
     def create(cls, t_glz_j: GlassType, u_w_g_j: float, eta_w_g_j: float):
         """create class
@@ -107,9 +121,7 @@ class Glazing(ABC):
             solar transmittance of quarter-sphere for uniformly diffuse solar radiation
         """
 
-        phi_ms = self._get_phi_ms()
-
-        return np.pi / self.M * np.sum(self.get_tau_w_g_j_phis(phis=phi_ms) * np.sin(phi_ms) * np.cos(phi_ms))
+        return self._get_c_j()[0]
 
     def get_b_w_g_c_j(self) -> float:
         """Calculate absorbed solar heat of a quater-sphere for uniformly diffuse solar radiation.
@@ -118,9 +130,35 @@ class Glazing(ABC):
             absorbed solar heat of quater-sphere for uniformly diffuse solar radiation
         """
 
-        phi_ms = self._get_phi_ms()
+        return self._get_c_j()[1]
+
+    def _get_c_j(self) -> Tuple[float, float]:
+        """Calculate solar transmittance and absorbed solar heat of a quarter-sphere for uniformly diffuse solar radiation.
+
+        Returns:
+            solar transmittance of quarter-sphere for uniformly diffuse solar radiation
+            absorbed solar heat of quater-sphere for uniformly diffuse solar radiation
+
+        Notes:
+            The values depend only on the glass type, u value and eta value of glazing,
+            so the numerical integration is done only once in the process for the same glazing.
+        """
+
+        key = (self.T_GLZ, self._u_w_g_j, self._eta_w_g_j)
+
+        if key not in _memo_c:
 
-        return np.pi / self.M * np.sum(self.get_b_w_g_j_phis(phis=phi_ms) * np.sin(phi_ms) * np.cos(phi_ms))
+            phi_ms = self._get_phi_ms()
+
+            sin_ms = np.sin(phi_ms)
+            cos_ms = np.cos(phi_ms)
+
+            _memo_c[key] = (
+                float(np.pi / self.M * np.sum(self.get_tau_w_g_j_phis(phis=phi_ms) * sin_ms * cos_ms)),
+                float(np.pi / self.M * np.sum(self.get_b_w_g_j_phis(phis=phi_ms) * sin_ms * cos_ms))
+            )
+
+        return _memo_c[key]
 
     @classmethod
     def _get_phi_ms(cls):
@@ -134,8 +172,16 @@ class Glazing(ABC):
 
 class SingleGlazing(Glazing):
 
+    T_GLZ = GlassType.SINGLE
+
     def __init__(self, u_w_g_j: float, eta_w_g_j: float):
 
+        # u value of glazing(normal, at winter condition), W/m2K
+        self._u_w_g_j = u_w_g_j
+
+        # eta value of glazing
+        self._eta_w_g_j = eta_w_g_j
+
         # thermal resistance of surface, m2K/W
         r_w_o_w, r_w_i_w, r_w_o_s, r_w_i_s = _get_r_w()
 
@@ -284,8 +330,16 @@ class SingleGlazing(Glazing):
 
 class DoubleGlazing(Glazing):
 
+    T_GLZ = GlassType.MULTIPLE
+
     def __init__(self, u_w_g_j: float, eta_w_g_j: float):
 
+        # u value of glazing(normal, at winter condition), W/m2K
+        self._u_w_g_j = u_w_g_j
+
+        # eta value of glazing
+        self._eta_w_g_j = eta_w_g_j
+
         # thermal resistance of surface, m2K/W
         r_w_o_w, r_w_i_w, r_w_o_s, r_w_i_s = _get_r_w()
 
@@ -731,8 +785,9 @@ def _get_tau_n_phi(phi: T) -> T:
     Notes:
         eq.19
     """
-    return 2.552 * np.cos(phi) + 1.364 * np.power(np.cos(phi), 2) - 11.388 * np.power(np.cos(phi), 3) \
-        + 13.617 * np.power(np.cos(phi), 4) - 5.146 * np.power(np.cos(phi), 5)
+    cos_phi = np.cos(phi)
+    return 2.552 * cos_phi + 1.364 * np.power(cos_phi, 2) - 11.388 * np.power(cos_phi, 3) \
+        + 13.617 * np.power(cos_phi, 4) - 5.146 * np.power(cos_phi, 5)
 
 
 def _get_rho_n_phi(phi_ns: T) -> T:
@@ -744,8 +799,9 @@ def _get_rho_n_phi(phi_ns: T) -> T:
     Notes:
         eq.20
     """
-    return 1.0 - 5.189 * np.cos(phi_ns) + 12.392 * np.power(np.cos(phi_ns), 2) - 16.593 * np.power(np.cos(phi_ns), 3) \
-           + 11.851 * np.power(np.cos(phi_ns), 4) - 3.461 * np.power(np.cos(phi_ns), 5)
+    cos_phi_ns = np.cos(phi_ns)
+    return 1.0 - 5.189 * cos_phi_ns + 12.392 * np.power(cos_phi_ns, 2) - 16.593 * np.power(cos_phi_ns, 3) \
+           + 11.851 * np.power(cos_phi_ns, 4) - 3.461 * np.power(cos_phi_ns, 5)
 
 
 def _get_rho_w_g_s1b_j(tau_w_g_s1_j: float) -> float:
@@ -0,0 +1,28 @@
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+
+# 例題の入力データのディレクトリ
+ENTRY_POINT_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'heat_load_calc', 'example')
+
+
+def load_example(calculation_day: Optional[Dict] = None) -> Tuple[str, Dict]:
+    """例題の住宅（data_example1.json）の入力データを読み込む。
+
+    Args:
+        calculation_day: 入力データの common の calculation_day を置き換える値（None の場合は置き換えない）
+
+    Returns:
+        以下のタプル
+            (1) 例題の入力データのディレクトリ（core.calc の entry_point_dir）
+            (2) 入力データ
+    """
+
+    with open(os.path.join(ENTRY_POINT_DIR, 'data_example1.json'), 'r', encoding='utf-8') as f:
+        d = json.load(f)
+
+    if calculation_day is not None:
+        d['common']['calculation_day'] = calculation_day
+
+    return ENTRY_POINT_DIR, d
@@ -0,0 +1,95 @@
+import unittest
+import copy
+from unittest import mock
+
+import pandas as pd
+
+from heat_load_calc import core, batch
+from heat_load_calc.sequence import Sequence
+from test.module_test.example_data import load_example
+
+
+class TestBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 3, 'run_up': 3, 'run_up_building': 2})
+
+        # 地域・空調方式・C値を変えた住戸
+        d2 = copy.deepcopy(d)
+        d2['common']['weather']['region'] = '7'
+        d2['common']['ac_method'] = 'ot'
+        d2['building']['infiltration']['c_value'] = 5.0
+
+        cls._ds = [d, d2]
+
+    def test_same_as_core(self):
+        """一括計算の結果が住戸ごとの core.calc の結果と一致することを確認する。"""
+
+        results = batch.calc_batch(ds=self._ds, entry_point_dir=self._entry_point_dir)
+
+        self.assertEqual(2, len(results))
+
+        for d, (dd_i, dd_a, _, _) in zip(self._ds, results):
+
+            dd_i_expected, dd_a_expected, _, _ = core.calc(d=d, entry_point_dir=self._entry_point_dir)
+
+            pd.testing.assert_frame_equal(dd_i_expected, dd_i, rtol=1e-9)
+            pd.testing.assert_frame_equal(dd_a_expected, dd_a, rtol=1e-9)
+
+    def test_run_up_options(self):
+        """助走計算の方法・出力する項目が入力で指定された場合も、一括計算の結果が core.calc の結果と一致することを確認する。"""
+
+        ds = copy.deepcopy(self._ds)
+
+        for d in ds:
+            d['common']['calculation_day'].update({'run_up_tolerance': 0.01, 'run_up_ground_method': 'periodic'})
+            d['common']['output_names'] = ['t_r', 'l_s_c']
+
+        results = batch.calc_batch(ds=ds, entry_point_dir=self._entry_point_dir)
+
+        for d, (dd_i, dd_a, _, _) in zip(ds, results):
+
+            dd_i_expected, dd_a_expected, _, _ = core.calc(d=d, entry_point_dir=self._entry_point_dir)
+
+            self.assertNotIn('rm0_x_r', dd_i.columns)
+
+            pd.testing.assert_frame_equal(dd_i_expected, dd_i, rtol=1e-9)
+            pd.testing.assert_frame_equal(dd_a_expected, dd_a, rtol=1e-9)
+
+    def test_exe_verify(self):
+        """exe_verify を指定した場合、本計算の各ステップで住戸ごとに熱収支のチェックが行われ、収支が合うことを確認する。"""
+
+        with mock.patch.object(Sequence, 'verify', autospec=True, side_effect=Sequence.verify) as m, \
+                self.assertNoLogs('HeatLoadCalc', level='ERROR'):
+            results = batch.calc_batch(ds=self._ds, entry_point_dir=self._entry_point_dir, exe_verify=True)
+
+        # 本計算のステップ数（3日 × 96ステップ）× 住戸数
+        self.assertEqual(3 * 96 * 2, m.call_count)
+
+        for (dd_i, dd_a, _, _), (dd_i_expected, dd_a_expected, _, _) in zip(
+                results, batch.calc_batch(ds=self._ds, entry_point_dir=self._entry_point_dir)
+        ):
+            pd.testing.assert_frame_equal(dd_i_expected, dd_i)
+            pd.testing.assert_frame_equal(dd_a_expected, dd_a)
+
+    def test_different_tolerance(self):
+
+        d2 = copy.deepcopy(self._ds[1])
+        d2['common']['calculation_day']['run_up_tolerance'] = 0.01
+
+        with self.assertRaises(ValueError):
+            batch.calc_batch(ds=[self._ds[0], d2], entry_point_dir=self._entry_point_dir)
+
+    def test_different_calculation_day(self):
+
+        d2 = copy.deepcopy(self._ds[1])
+        d2['common']['calculation_day']['main'] = 4
+
+        with self.assertRaises(ValueError):
+            batch.calc_batch(ds=[self._ds[0], d2], entry_point_dir=self._entry_point_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -131,6 +131,24 @@ class TestBoundaries(unittest.TestCase):
                 connected_room_id_js=np.array([0,3,3,7,7,7,7,5,5,5]).reshape(-1, 1)
             )
 
+    def test_get_k_ei_js_js(self):
+
+        # 間仕切りの境界のみ裏面の境界の列に1.0が設定される。
+        result = boundaries._get_k_ei_js_js(
+            t_b_js=[BoundaryType.INTERNAL, BoundaryType.EXTERNAL_GENERAL_PART, BoundaryType.INTERNAL, BoundaryType.GROUND],
+            j_rear_js=[2, None, 0, None]
+        )
+
+        np.testing.assert_array_equal(
+            np.array([
+                [0.0, 0.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0]
+            ]),
+            result
+        )
+
     def test_n_b(self):
 
         # number of boundaries        
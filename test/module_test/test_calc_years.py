@@ -0,0 +1,67 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+from heat_load_calc import core
+from heat_load_calc.weather import WeatherStream
+from heat_load_calc.interval import EInterval, Interval
+from test.module_test.example_data import load_example
+
+
+class TestCalcYears(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 365, 'run_up': 2, 'run_up_building': 1})
+
+        # 計算時間を短くするため1時間間隔とする。
+        d['common']['interval'] = '1h'
+
+        cls._d = d
+
+    def test_calc_years(self):
+        """2年分の気象データに対して、1年目は同じ気象データの1年間の計算と一致し、2年目は1年目の最後の状態から始まることを確認する。"""
+
+        pp = pd.read_csv(os.path.join(os.path.dirname(__file__), 'weather_for_method_file.csv'))
+
+        with tempfile.TemporaryDirectory() as d:
+
+            file_path = os.path.join(d, 'years.csv')
+
+            pd.concat([pp, pp.assign(temperature=pp['temperature'] + 1.0)]).to_csv(file_path, index=False)
+
+            ws = WeatherStream(file_path=file_path, itv=Interval(eitv=EInterval.H1), latitude=26.21, longitude=127.685)
+
+            with mock.patch.object(core, '_run_main', wraps=core._run_main) as m:
+                (dd_i1, dd_a1), (dd_i2, dd_a2) = list(
+                    core.calc_years(d=self._d, entry_point_dir=self._entry_point_dir, ws=ws, exe_verify=True)
+                )
+
+            self.assertEqual(2, m.call_count)
+            self.assertTrue(all(c.kwargs['exe_verify'] for c in m.call_args_list))
+
+            w1 = next(iter(ws))
+
+        dd_i, dd_a, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir, w=w1)
+
+        # 1年目
+        pd.testing.assert_frame_equal(dd_i, dd_i1)
+        pd.testing.assert_frame_equal(dd_a, dd_a1)
+
+        # 2年目の 1/1 0:00 の瞬時値は1年目の最後のステップの瞬時値とする。
+        # 事後に計算する値（表面放射熱流等）は行列積の丸め誤差の範囲で一致する。
+        self.assertEqual(8761, len(dd_i2))
+        pd.testing.assert_series_equal(
+            dd_i1.iloc[-1], dd_i2.iloc[0], check_names=False, check_exact=False, rtol=1e-10
+        )
+
+        # 2年目は外気温度が異なるため、1年目とは異なる計算結果となる。
+        self.assertFalse(dd_i1.iloc[1:].equals(dd_i2.iloc[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+from heat_load_calc import core, checkpoint, snapshot
+from test.module_test.example_data import load_example
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 2, 'run_up': 2, 'run_up_building': 1})
+
+        cls._d = d
+
+    def setUp(self):
+
+        self._snapshot_dir = snapshot._snapshot_dir
+
+        snapshot.set_snapshot_dir(snapshot_dir=None)
+
+    def tearDown(self):
+
+        snapshot.set_snapshot_dir(snapshot_dir=self._snapshot_dir)
+
+    def test_resume(self):
+        """チェックポイントから再開した計算の結果が、中断しない計算の結果と一致することを確認する。"""
+
+        dd_i0, dd_a0, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+        with tempfile.TemporaryDirectory() as d:
+
+            # 計算の終了時にチェックポイントを削除しないことで、1日目の終わりで中断された状態を再現する。
+            with mock.patch.object(checkpoint, 'remove'):
+                core.calc(d=self._d, entry_point_dir=self._entry_point_dir, checkpoint_dir=d, n_step_checkpoint=96)
+
+            self.assertEqual(['checkpoint.npz'], os.listdir(d))
+
+            with self.assertLogs('HeatLoadCalc', level='INFO') as cm:
+                dd_i1, dd_a1, _, _ = core.calc(
+                    d=self._d, entry_point_dir=self._entry_point_dir, checkpoint_dir=d, n_step_checkpoint=96
+                )
+
+            self.assertTrue(any('resumed from step 96' in m for m in cm.output))
+            self.assertFalse(any('助走計算' in m for m in cm.output))
+
+            # 計算が終了した時点でチェックポイントは削除される。
+            self.assertEqual([], os.listdir(d))
+
+        pd.testing.assert_frame_equal(dd_i0, dd_i1)
+        pd.testing.assert_frame_equal(dd_a0, dd_a1)
+
+    def test_other_calculation(self):
+        """異なる計算のチェックポイントは用いないことを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            with mock.patch.object(checkpoint, 'remove'):
+                core.calc(
+                    d=self._d, entry_point_dir=self._entry_point_dir, checkpoint_dir=d, n_step_checkpoint=96,
+                    output_names=['t_r']
+                )
+
+            with self.assertLogs('HeatLoadCalc', level='INFO') as cm:
+                core.calc(d=self._d, entry_point_dir=self._entry_point_dir, checkpoint_dir=d, n_step_checkpoint=96)
+
+            self.assertTrue(any('another calculation' in m for m in cm.output))
+            self.assertTrue(any('助走計算' in m for m in cm.output))
+
+    def test_store_dir(self):
+        """計算結果をブロックごとに書き出す場合はチェックポイントを指定できないことを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            with self.assertRaises(ValueError):
+                core.calc(
+                    d=self._d, entry_point_dir=self._entry_point_dir,
+                    store_dir=os.path.join(d, 'store'), checkpoint_dir=os.path.join(d, 'checkpoint')
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+
+from heat_load_calc import conditions
+
+
+class TestConditions(unittest.TestCase):
+
+    def test_is_converged(self):
+        """状態値の差と許容値の大小関係により収束の判定が行われることを確認する。"""
+
+        c1 = conditions.initialize_conditions(n_spaces=2, n_bdries=3)
+
+        c2 = conditions.copy_conditions(c=c1)
+
+        self.assertIsNot(c1.theta_r_is_n, c2.theta_r_is_n)
+        self.assertTrue(conditions.is_converged(c1=c1, c2=c2, tol_theta=0.01, tol_q=0.1))
+
+        c2.theta_r_is_n[1, 0] += 0.02
+
+        self.assertFalse(conditions.is_converged(c1=c1, c2=c2, tol_theta=0.01, tol_q=0.1))
+        self.assertTrue(conditions.is_converged(c1=c1, c2=c2, tol_theta=0.05, tol_q=0.1))
+
+        # 複製元の状態値は変更されない。
+        self.assertEqual(15.0, c1.theta_r_is_n[1, 0])
+
+        c3 = conditions.copy_conditions(c=c1)
+
+        c3.theta_dsh_srf_t_js_ms_n[2, 11] = -0.02
+
+        self.assertFalse(conditions.is_converged(c1=c1, c2=c3, tol_theta=0.01, tol_q=0.1))
+
+        c4 = conditions.copy_conditions(c=c1)
+
+        c4.q_s_js_n[:, :] = np.array([[0.05], [-0.05], [0.2]])
+
+        self.assertFalse(conditions.is_converged(c1=c1, c2=c4, tol_theta=0.01, tol_q=0.1))
+        self.assertTrue(conditions.is_converged(c1=c1, c2=c4, tol_theta=0.01, tol_q=0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -282,3 +282,61 @@ class TestEquipments(unittest.TestCase):
             [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
             ]).T, e.f_flr_c_js_is)
 
+
+    def test_f_l_cl(self):
+        """RAC の潜熱負荷の係数を一括計算した結果が、機器ごとに計算した結果の合計と一致することを確認する。"""
+
+        def rac(id: int, space_id: int, q_max: float, bf: float) -> Dict:
+            return {
+                "equipment_type": "rac",
+                "id": id,
+                "name": "rac_" + str(id),
+                "property": {
+                    "space_id": space_id,
+                    "q_min": 200,
+                    "q_max": q_max,
+                    "v_min": 10,
+                    "v_max": 30,
+                    "bf": bf
+                }
+            }
+
+        d = {
+            "heating_equipments": [rac(id=1, space_id=2, q_max=4000, bf=0.2)],
+            "cooling_equipments": [
+                rac(id=1, space_id=2, q_max=4000, bf=0.2),
+                rac(id=2, space_id=4, q_max=2800, bf=0.2),
+                rac(id=3, space_id=4, q_max=5600, bf=0.25)
+            ]
+        }
+
+        id_r_is = np.array([2, 4, 6]).reshape(-1, 1)
+        id_js = np.array([1, 3, 5]).reshape(-1, 1)
+        connected_room_id_js = np.array([2, 4, 6]).reshape(-1, 1)
+        p_is_js = np.identity(3, dtype=int)
+
+        e = Equipments(d=d, id_r_is=id_r_is, id_b_js=id_js, connected_room_id_js=connected_room_id_js, p_is_js=p_is_js)
+
+        # 室2: 冷房（除湿あり）, 室4: 冷房（2台）, 室6: 設備なし
+        l_cs_is_n = np.array([-1500.0, -3000.0, 0.0]).reshape(-1, 1)
+        theta_r_is_n_pls = np.array([27.0, 26.0, 28.0]).reshape(-1, 1)
+        x_r_ntr_is_n_pls = np.array([0.018, 0.016, 0.016]).reshape(-1, 1)
+
+        f_l_cl_cst_is_n, f_l_cl_wgt_is_is_n = e.get_f_l_cl(
+            l_cs_is_n=l_cs_is_n, theta_r_is_n_pls=theta_r_is_n_pls, x_r_ntr_is_n_pls=x_r_ntr_is_n_pls
+        )
+
+        expected_wgt = np.zeros((3, 3), dtype=float)
+        expected_cst = np.zeros((3, 1), dtype=float)
+
+        for ce in e._ces:
+            wgt, cst = ce.get_f_l_is_n(
+                q_s_is_n=-l_cs_is_n, theta_r_is_n_pls=theta_r_is_n_pls, x_r_ntr_is_n_pls=x_r_ntr_is_n_pls
+            )
+            expected_wgt = expected_wgt - wgt
+            expected_cst = expected_cst + cst
+
+        self.assertTrue(np.all(expected_cst[0:2] > 0.0))
+
+        np.testing.assert_allclose(expected_wgt, f_l_cl_wgt_is_is_n, rtol=1e-12)
+        np.testing.assert_allclose(expected_cst, f_l_cl_cst_is_n, rtol=1e-12)
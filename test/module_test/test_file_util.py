@@ -0,0 +1,47 @@
+import unittest
+import os
+import tempfile
+
+from heat_load_calc.file_util import write_atomic
+
+
+class TestWriteAtomic(unittest.TestCase):
+
+    def test_write(self):
+        """ファイルが書き出され、一時ファイルが残らないことを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            path = os.path.join(d, 'sub', 'a.bin')
+
+            write_atomic(path=path, write=lambda f: f.write(b'abc'))
+
+            with open(path, 'rb') as f:
+                self.assertEqual(b'abc', f.read())
+
+            self.assertEqual(['a.bin'], os.listdir(os.path.join(d, 'sub')))
+
+    def test_error(self):
+        """書き出しに失敗した場合、元のファイルが残り、一時ファイルが削除されることを確認する。"""
+
+        def write(f):
+            f.write(b'x')
+            raise OSError('error')
+
+        with tempfile.TemporaryDirectory() as d:
+
+            path = os.path.join(d, 'a.bin')
+
+            write_atomic(path=path, write=lambda f: f.write(b'abc'))
+
+            with self.assertRaises(OSError):
+                write_atomic(path=path, write=write)
+
+            with open(path, 'rb') as f:
+                self.assertEqual(b'abc', f.read())
+
+            self.assertEqual(['a.bin'], os.listdir(d))
+
+
+if __name__ == '__main__':
+    unittest.main()
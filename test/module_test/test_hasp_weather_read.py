@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from heat_load_calc import hasp_weather_read
+
+
+class TestHaspWeatherRead(unittest.TestCase):
+
+    file_name = os.path.join(os.path.dirname(hasp_weather_read.__file__), 'expanded_amedas', 'tokyo_3column_SI.has')
+
+    def test_read_hasp_array(self):
+        """HASP形式のファイルの気象要素が [7, 8760] の整数の配列として読み込まれることを確認する。"""
+
+        d = hasp_weather_read.read_hasp_array(file_name=self.file_name)
+
+        self.assertEqual((7, 8760), d.shape)
+
+        # 1月1日の1時～3時の気温及び絶対湿度
+        np.testing.assert_array_equal(d[0, 0:3], [551, 548, 546])
+        np.testing.assert_array_equal(d[1, 0:3], [37, 36, 36])
+
+        # 1月1日の7時～9時の法線面直達日射量（空白を含む値）
+        np.testing.assert_array_equal(d[2, 6:9], [0, 171, 274])
+
+    def test_hasp_read(self):
+        """換算後の気象要素を確認する。"""
+
+        ta, xa, idn, isky, rn, wdre, wv = hasp_weather_read.hasp_read(file_name=self.file_name)
+
+        for v in [ta, xa, idn, isky, rn, wdre, wv]:
+            self.assertEqual(8760, len(v))
+
+        self.assertAlmostEqual(5.1, ta[0])
+        self.assertAlmostEqual(0.0037, xa[0])
+        self.assertAlmostEqual(475.0, idn[7])
+
+    def test_invalid_file(self):
+        """行数が足りないファイル・数値以外の文字を含むファイルはエラーとなることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            with open(self.file_name, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+
+            file_name = os.path.join(d, 'weather.has')
+
+            with open(file_name, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines[:-7]))
+
+            with self.assertRaises(ValueError):
+                hasp_weather_read.read_hasp_array(file_name=file_name)
+
+            with open(file_name, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(['x' + lines[0][1:]] + lines[1:]))
+
+            with self.assertRaises(ValueError):
+                hasp_weather_read.read_hasp_array(file_name=file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import importlib.util
+import logging
+import os
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+from heat_load_calc import core
+from heat_load_calc import heat_load_calc
+from test.module_test.example_data import load_example
+
+
+class TestSaveResult(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        entry_point_dir, d = load_example(calculation_day={'main': 1, 'run_up': 1, 'run_up_building': 1})
+
+        cls._dd_i, cls._dd_a, _, _ = core.calc(d=d, entry_point_dir=entry_point_dir)
+
+    def test_npz(self):
+        """npz で保存した計算結果が、列名・日時のインデックスを保ったまま読み込めることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as output_data_dir:
+
+            for name, dd in [('result_detail_i', self._dd_i), ('result_detail_a', self._dd_a)]:
+
+                with self.subTest(name=name):
+
+                    result_path = heat_load_calc.save_result(
+                        dd=dd,
+                        output_data_dir=output_data_dir,
+                        name=name,
+                        output_format='npz'
+                    )
+
+                    self.assertEqual(os.path.join(output_data_dir, name + '.npz'), result_path)
+
+                    # 運転モードは csv と同様に文字列として保存される。
+                    expected = dd.apply(lambda c: c.astype(str) if c.dtype == object else c)
+
+                    pd.testing.assert_frame_equal(
+                        expected, heat_load_calc.read_result_npz(result_path=result_path), check_dtype=False, check_freq=False
+                    )
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed.')
+    def test_feather(self):
+        """feather で保存した計算結果が、日時のインデックスを復元して読み込めることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as output_data_dir:
+
+            for name, dd in [('result_detail_i', self._dd_i), ('result_detail_a', self._dd_a)]:
+
+                with self.subTest(name=name):
+
+                    result_path = heat_load_calc.save_result(
+                        dd=dd, output_data_dir=output_data_dir, name=name, output_format='feather'
+                    )
+
+                    expected = dd.apply(lambda c: c.astype(str) if c.dtype == object else c)
+
+                    pd.testing.assert_frame_equal(
+                        expected, heat_load_calc.read_result_feather(result_path=result_path), check_dtype=False, check_freq=False
+                    )
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed.')
+    def test_parquet(self):
+        """parquet で保存した計算結果が、列名・日時のインデックスを保ったまま読み込めることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as output_data_dir:
+
+            for name, dd in [('result_detail_i', self._dd_i), ('result_detail_a', self._dd_a)]:
+
+                with self.subTest(name=name):
+
+                    result_path = heat_load_calc.save_result(
+                        dd=dd, output_data_dir=output_data_dir, name=name, output_format='parquet'
+                    )
+
+                    self.assertEqual(os.path.join(output_data_dir, name + '.parquet'), result_path)
+
+                    expected = dd.apply(lambda c: c.astype(str) if c.dtype == object else c)
+
+                    pd.testing.assert_frame_equal(
+                        expected, pd.read_parquet(result_path), check_dtype=False, check_freq=False
+                    )
+
+    def test_without_pyarrow(self):
+        """pyarrow が無い場合、parquet・feather の代わりに npz で保存され、警告が出力されることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as output_data_dir:
+
+            for output_format in ['parquet', 'feather']:
+
+                with self.subTest(output_format=output_format):
+
+                    with mock.patch.object(heat_load_calc.importlib.util, 'find_spec', return_value=None), \
+                            self.assertLogs('HeatLoadCalc', level='WARNING') as cm:
+                        result_path = heat_load_calc.save_result(
+                            dd=self._dd_a, output_data_dir=output_data_dir, name='result_detail_a', output_format=output_format
+                        )
+
+                    self.assertEqual(os.path.join(output_data_dir, 'result_detail_a.npz'), result_path)
+                    self.assertTrue(any('pyarrow is not installed' in m for m in cm.output))
+
+                    expected = self._dd_a.apply(lambda c: c.astype(str) if c.dtype == object else c)
+
+                    pd.testing.assert_frame_equal(
+                        expected, heat_load_calc.read_result_npz(result_path=result_path), check_dtype=False, check_freq=False
+                    )
+
+    def test_unknown_format(self):
+
+        with self.assertRaises(ValueError):
+            heat_load_calc.run(
+                logger=logging.getLogger('HeatLoadCalc'),
+                house_data_path='',
+                output_data_dir=tempfile.gettempdir(),
+                output_format='xlsx'
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -220,3 +220,43 @@ class TestInclinedSurfaceSolarRadiation(unittest.TestCase):
         self.assertAlmostEqual(result[8], expected[8])
 
 
+
+    def test_solar_geometry_table(self):
+        """同じ方位に対しては一度だけ計算され、個別に計算した値と一致することを確認する。"""
+
+        sgt = issr.SolarGeometryTable(w=self.w)
+
+        sg_s = sgt.get(drct_j=Direction.S)
+
+        self.assertIs(sg_s, sgt.get(drct_j=Direction.S))
+
+        sgt.get(drct_j=Direction.TOP)
+
+        self.assertEqual(2, sgt.n_direction)
+
+        i_s_dn, i_s_sky, i_s_ref, r_s_n = issr.get_i_s_j_ns(w=self.w, drct_j=Direction.S)
+
+        np.testing.assert_array_equal(
+            sg_s.phi_j_ns,
+            issr.get_phi_j_ns(h_sun_ns=self.w.h_sun_ns_plus, a_sun_ns=self.w.a_sun_ns_plus, drct_j=Direction.S)
+        )
+        np.testing.assert_array_equal(sg_s.i_s_dn_j_ns, i_s_dn)
+        np.testing.assert_array_equal(sg_s.i_s_sky_j_ns, i_s_sky)
+        np.testing.assert_array_equal(sg_s.i_s_ref_j_ns, i_s_ref)
+        np.testing.assert_array_equal(sg_s.r_s_n_j_ns, r_s_n)
+
+        self.assertFalse(sg_s.i_s_dn_j_ns.flags.writeable)
+
+    def test_ns_sun(self):
+        """直達日射が入射するステップのみを取り出し、全ステップの配列に戻せることを確認する。"""
+
+        i_s_dn_j_ns = np.array([0.0, 100.0, 0.0, 250.0, 0.0])
+
+        ns_sun = issr.get_ns_sun(i_s_dn_j_ns=i_s_dn_j_ns)
+
+        np.testing.assert_array_equal(ns_sun, [1, 3])
+
+        np.testing.assert_array_equal(
+            issr.expand_ns_sun(v_ns_sun=i_s_dn_j_ns[ns_sun] * 2.0, ns_sun=ns_sun, n=5),
+            i_s_dn_j_ns * 2.0
+        )
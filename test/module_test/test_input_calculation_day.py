@@ -1,6 +1,7 @@
 import pytest
 
 from heat_load_calc.input_models.input_calculation_day import InputCalculationDay
+from heat_load_calc.tenum import ERunUpGroundMethod
 
 
 def test_all_key_defined():
@@ -114,3 +115,46 @@ def test_key__main__out_of_range_over_365():
 
     assert 'Value \'main\' in tag \'calculation_day\' is out of range.' in str(e)
 
+
+
+def test_key__run_up_tolerance__defined():
+
+    d_calculation_day = {
+        'main': 365,
+        'run_up_tolerance': 0.01,
+        'run_up_tolerance_heat_flux': 0.2
+    }
+
+    ipt_calculation_day = InputCalculationDay.read(d_calculation_day=d_calculation_day)
+
+    assert ipt_calculation_day.tol_theta_run_up == 0.01
+    assert ipt_calculation_day.tol_q_run_up == 0.2
+
+
+def test_key__run_up_tolerance__out_of_range():
+
+    d_calculation_day = {
+        'main': 365,
+        'run_up_tolerance': 0.0
+    }
+
+    with pytest.raises(ValueError) as e:
+        InputCalculationDay.read(d_calculation_day=d_calculation_day)
+
+    assert 'Value \'run_up_tolerance\' in tag \'calculation_day\' is out of range.' in str(e)
+
+
+def test_key__run_up_ground_method():
+
+    ipt_calculation_day = InputCalculationDay.read(d_calculation_day={'main': 365})
+
+    assert ipt_calculation_day.run_up_ground_method == ERunUpGroundMethod.STEP
+
+    ipt_calculation_day = InputCalculationDay.read(d_calculation_day={'main': 365, 'run_up_ground_method': 'periodic'})
+
+    assert ipt_calculation_day.run_up_ground_method == ERunUpGroundMethod.PERIODIC
+
+    with pytest.raises(ValueError) as e:
+        InputCalculationDay.read(d_calculation_day={'main': 365, 'run_up_ground_method': 'test'})
+
+    assert 'An invalid value was specified in \'calculation_day\' tag.' in str(e)
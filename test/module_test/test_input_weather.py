@@ -1,7 +1,7 @@
 import pytest
 
 
-from heat_load_calc.input_models.input_weather import InputWeather, InputWeatherEES, InputWeatherFile
+from heat_load_calc.input_models.input_weather import InputWeather, InputWeatherEES, InputWeatherFile, InputWeatherHASP
 from heat_load_calc.tenum import EWeatherMethod, ERegion
 
 
@@ -182,3 +182,21 @@ def test_latitude_and_longitude_value():
 
     assert ipt_weather_file.longitude == 139.44
 
+
+
+def test_hasp_method():
+
+    d_weather = {
+        'method': 'hasp',
+        'file_path': 'some_file_name',
+        'latitude': 35.69,
+        'longitude': 139.76
+    }
+
+    ipt_weather = InputWeather.read(d_weather=d_weather)
+
+    assert isinstance(ipt_weather, InputWeatherHASP)
+
+    assert ipt_weather.method == EWeatherMethod.HASP
+
+    assert ipt_weather.file_path == 'some_file_name'
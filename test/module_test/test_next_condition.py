@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from heat_load_calc import next_condition
+from heat_load_calc.operation_mode import OperationMode
+
+
+class TestNextCondition(unittest.TestCase):
+
+    def setUp(self):
+
+        self._kt = np.array([[10.0, -1.0, -0.5], [-1.0, 12.0, -2.0], [-0.5, -2.0, 8.0]])
+        self._kc = np.identity(3, dtype=float)
+        self._kr = np.array([[0.6, 0.1, 0.0], [0.1, 0.7, 0.1], [0.0, 0.1, 0.5]])
+        self._k = np.array([[200.0], [150.0], [100.0]])
+
+    def _get_load_and_temp(self):
+
+        # 室0: 対流暖房, 室1: 放射暖房, 室2: 非空調
+        return next_condition.get_load_and_temp(
+            kt=self._kt,
+            kc=self._kc,
+            kr=self._kr,
+            k=self._k,
+            nt=np.array([[0], [0], [1]]),
+            theta_set=np.array([[20.0], [22.0], [0.0]]),
+            c=np.array([[1], [0], [0]]),
+            lc_set=np.zeros((3, 1)),
+            r=np.array([[0], [1], [0]]),
+            lr_set=np.zeros((3, 1))
+        )
+
+    def test_load_and_temp(self):
+        """解が熱収支式 kt theta = kc Lc + kr Lr + k を満たすことを確認する。"""
+
+        theta, lc, lr = self._get_load_and_temp()
+
+        np.testing.assert_allclose(np.dot(self._kt, theta), np.dot(self._kc, lc) + np.dot(self._kr, lr) + self._k)
+        np.testing.assert_allclose(theta[0:2], [[20.0], [22.0]])
+
+    def _get_next_temp_and_load(self, lr_h_max_cap: float):
+
+        # 室0: 対流暖房, 室1: 放射暖房, 室2: 非空調（_get_load_and_temp と同じ条件）
+        h, s = OperationMode.HEATING.value, OperationMode.STOP_CLOSE.value
+
+        return next_condition.get_next_temp_and_load(
+            ac_demand_is_ns=np.ones((3, 1)),
+            brc_ot_is_n=self._k,
+            brm_ot_is_is_n=self._kt,
+            brl_ot_is_is_n=self._kr,
+            theta_lower_target_is_n=np.array([[20.0], [22.0], [20.0]]),
+            theta_upper_target_is_n=np.full((3, 1), 27.0),
+            operation_mode_is_n=np.array([[h], [h], [s]]),
+            is_radiative_heating_is=np.array([[False], [True], [False]]),
+            is_radiative_cooling_is=np.array([[False], [False], [False]]),
+            lr_h_max_cap_is=np.full((3, 1), lr_h_max_cap),
+            lr_cs_max_cap_is=np.full((3, 1), 1000.0),
+            theta_natural_is_n=np.full((3, 1), 15.0),
+            n=0
+        )
+
+    def test_next_temp_and_load_within_capacity(self):
+        """放射空調負荷が最大放熱量を超えない場合、再計算を省略した結果が1回目の計算結果と一致することを確認する。"""
+
+        theta_expected, lc_expected, lr_expected = self._get_load_and_temp()
+
+        # 放射空調負荷（約 77 W）は最大放熱量以下となる。
+        self.assertLess(lr_expected[1, 0], 100.0)
+
+        with mock.patch.object(next_condition, 'get_load_and_temp', wraps=next_condition.get_load_and_temp) as m:
+            theta, lc, lr = self._get_next_temp_and_load(lr_h_max_cap=100.0)
+
+        self.assertEqual(1, m.call_count)
+
+        np.testing.assert_allclose(theta, theta_expected)
+        np.testing.assert_allclose(lc, lc_expected)
+        np.testing.assert_allclose(lr, lr_expected)
+
+    def test_next_temp_and_load_over_capacity(self):
+        """放射空調負荷が最大放熱量を超える場合、放射空調負荷を最大放熱量に固定し、不足分を対流空調負荷として再計算することを確認する。"""
+
+        with mock.patch.object(next_condition, 'get_load_and_temp', wraps=next_condition.get_load_and_temp) as m:
+            theta, lc, lr = self._get_next_temp_and_load(lr_h_max_cap=50.0)
+
+        self.assertEqual(2, m.call_count)
+
+        np.testing.assert_allclose(lr, [[0.0], [50.0], [0.0]])
+        np.testing.assert_allclose(theta[0:2], [[20.0], [22.0]])
+        self.assertGreater(lc[1, 0], 0.0)
+        np.testing.assert_allclose(np.dot(self._kt, theta), np.dot(self._kc, lc) + np.dot(self._kr, lr) + self._k)
+
+
+if __name__ == '__main__':
+    unittest.main()
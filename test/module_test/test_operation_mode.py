@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+
+from heat_load_calc import operation_mode
+from heat_load_calc.operation_mode import OperationMode
+
+
+class TestOperationMode(unittest.TestCase):
+
+    def test_operation_mode_code(self):
+        """空調需要・参照値・目標上下限値の組み合わせごとに運転モードを確認する。"""
+
+        # 室0: 空調需要なし（ケース 1）
+        # 室1: 暖房（ケース 2-1）
+        # 室2: 冷房（ケース 2-2-1）
+        # 室3: 窓開（ケース 2-2-2）
+        # 室4: 窓閉（ケース 2-3）
+        # 室5: 目標値なし
+        code = operation_mode._get_operation_mode_code_is_n(
+            x_lower_target_is_n=np.array([[20.0], [20.0], [20.0], [20.0], [20.0], [np.nan]]),
+            x_upper_target_is_n=np.array([[27.0], [27.0], [27.0], [27.0], [27.0], [np.nan]]),
+            r_ac_demand_is_n=np.array([[0.0], [1.0], [1.0], [1.0], [1.0], [1.0]]),
+            x_h_is_n=np.array([[15.0], [15.0], [30.0], [30.0], [25.0], [15.0]]),
+            x_c_is_n=np.array([[30.0], [15.0], [30.0], [30.0], [25.0], [30.0]]),
+            x_wop_is_n=np.array([[30.0], [15.0], [30.0], [26.0], [25.0], [30.0]])
+        )
+
+        self.assertEqual((6, 1), code.shape)
+
+        expected = [
+            OperationMode.STOP_CLOSE,
+            OperationMode.HEATING,
+            OperationMode.COOLING,
+            OperationMode.STOP_OPEN,
+            OperationMode.STOP_CLOSE,
+            OperationMode.STOP_CLOSE
+        ]
+
+        for c, e in zip(code.flatten(), expected):
+            self.assertEqual(e, OperationMode(c))
+
+    def test_operation_mode_is_ns(self):
+        """int8 型の運転モードの値が列挙体 OperationMode に変換されることを確認する。"""
+
+        code = np.array([[1, 2], [3, 4]], dtype=np.int8)
+
+        mode = operation_mode.get_operation_mode_is_ns(operation_mode_code_is_ns=code)
+
+        self.assertEqual(OperationMode.COOLING, mode[0, 0])
+        self.assertEqual(OperationMode.HEATING, mode[0, 1])
+        self.assertEqual(OperationMode.STOP_OPEN, mode[1, 0])
+        self.assertEqual(OperationMode.STOP_CLOSE, mode[1, 1])
+
+    def test_target(self):
+        """空調モードに応じた目標上下限値が配列として設定されることを確認する。"""
+
+        op = operation_mode.Operation(
+            d_common={'ac_method': 'air_temperature'},
+            t_ac_mode_is_ns=np.array([[0, 1, 2], [2, 0, 1]]),
+            r_ac_demand_is_ns=np.array([[0.0, 1.0, 1.0], [1.0, 0.0, 1.0]]),
+            n_rm=2
+        )
+
+        np.testing.assert_array_equal(op._x_lower_target_is_ns, [[np.nan, 20.0, 20.0], [20.0, np.nan, 20.0]])
+        np.testing.assert_array_equal(op._x_upper_target_is_ns, [[np.nan, 27.0, 27.0], [27.0, np.nan, 27.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
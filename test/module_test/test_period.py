@@ -70,3 +70,18 @@ class TestPeriod(unittest.TestCase):
         self.assertEqual(183*24, n_step_run_up_build)
         
 
+    def test_tol_run_up(self):
+
+        self.assertIsNone(period.get_tol_run_up(ipt_calculation_day=None))
+
+        self.assertIsNone(
+            period.get_tol_run_up(ipt_calculation_day=InputCalculationDay.read(d_calculation_day={'main': 365}))
+        )
+
+        tol_theta, tol_q = period.get_tol_run_up(
+            ipt_calculation_day=InputCalculationDay.read(d_calculation_day={'main': 365, 'run_up_tolerance': 0.01})
+        )
+
+        self.assertEqual(0.01, tol_theta)
+        self.assertEqual(period.TOL_Q_RUN_UP_DEFAULT, tol_q)
+
@@ -0,0 +1,174 @@
+import unittest
+import copy
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from heat_load_calc import core, recorder
+from heat_load_calc.recorder import Recorder, ResultStore
+from heat_load_calc.interval import Interval
+from heat_load_calc.tenum import EInterval
+from test.module_test.example_data import load_example
+
+
+class TestRecorder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 2, 'run_up': 2, 'run_up_building': 1})
+
+        cls._d = d
+
+        cls._dd_i, cls._dd_a, _, _ = core.calc(d=d, entry_point_dir=cls._entry_point_dir)
+
+    def test_allocation(self):
+        """出力しない項目の配列が確保されないことを確認する。"""
+
+        rcd = Recorder(n_step_main=4, id_rm_is=[0, 1], id_bs_js=[0, 1, 2], output_names=['l_s_c', 'ppd'])
+
+        self.assertEqual((2, 4), rcd.l_cs_is_ns.shape)
+        self.assertEqual((2, 5), rcd.ppd_is_ns.shape)
+
+        # PPD の計算に必要な値は確保される。
+        self.assertEqual((2, 5), rcd.theta_r_is_ns.shape)
+        self.assertEqual((2, 4), rcd.operation_mode_is_ns.shape)
+
+        self.assertIsNone(rcd.l_rs_is_ns)
+        self.assertIsNone(rcd.theta_s_js_ns)
+        self.assertIsNone(rcd.h_s_c_js_ns)
+        self.assertIsNone(rcd.rh_r_is_ns)
+
+    def test_unknown_output_name(self):
+
+        with self.assertRaises(ValueError):
+            Recorder(n_step_main=4, id_rm_is=[0, 1], id_bs_js=[0, 1, 2], output_names=['l_s_x'])
+
+    def test_output_names(self):
+        """出力する項目を指定した結果が、すべての項目を出力した結果の該当する列と一致することを確認する。"""
+
+        for output_names in [['l_s_c', 'l_s_r', 'l_l_c'], ['out_temp', 'pmv', 'qic_s', 'q_s_fun']]:
+
+            with self.subTest(output_names=output_names):
+
+                dd_i, dd_a, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir, output_names=output_names)
+
+                pd.testing.assert_frame_equal(self._dd_i[dd_i.columns], dd_i, check_column_type=False)
+                pd.testing.assert_frame_equal(self._dd_a[dd_a.columns], dd_a, check_dtype=False)
+
+                self.assertEqual(
+                    set(output_names),
+                    set(c.split('_', 1)[1] for c in list(dd_i.columns) + list(dd_a.columns) if c != 'out_temp')
+                    | ({'out_temp'} & set(dd_i.columns))
+                )
+
+    def test_output_names_in_input(self):
+        """入力データの common の output_names で出力する項目を指定できることを確認する。"""
+
+        d = copy.deepcopy(self._d)
+        d['common']['output_names'] = ['l_s_c']
+
+        dd_i, dd_a, _, _ = core.calc(d=d, entry_point_dir=self._entry_point_dir)
+
+        self.assertEqual(0, len(dd_i.columns))
+        self.assertEqual(['rm0_l_s_c', 'rm1_l_s_c', 'rm2_l_s_c'], list(dd_a.columns))
+
+
+class TestStreamingRecorder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 3, 'run_up': 3, 'run_up_building': 2})
+
+        cls._d = d
+
+        cls._dd_i, cls._dd_a, _, _ = core.calc(d=d, entry_point_dir=cls._entry_point_dir)
+
+    def test_same_as_recorder(self):
+        """ブロックごとに書き出した結果が、全期間分をメモリ上に保持した結果と一致することを確認する。"""
+
+        # 最後のブロックが途中までしか埋まらないブロックの大きさとする。
+        for n_step_block in [96, 40]:
+
+            with self.subTest(n_step_block=n_step_block), tempfile.TemporaryDirectory() as store_dir:
+
+                store_i, store_a, _, _ = core.calc(
+                    d=self._d, entry_point_dir=self._entry_point_dir, store_dir=store_dir, n_step_block=n_step_block
+                )
+
+                # 全期間分の DataFrame は作成されない。
+                self.assertIsInstance(store_i, ResultStore)
+                self.assertIsInstance(store_a, ResultStore)
+
+                pd.testing.assert_frame_equal(self._dd_i, store_i.to_pd(), rtol=1e-6)
+                pd.testing.assert_frame_equal(self._dd_a, store_a.to_pd(), rtol=1e-9)
+
+                # 出力項目ごとの .npy ファイルが保存されていることを確認する。
+                l_cs_is_ns = np.load(os.path.join(store_dir, 'l_cs_is_ns.npy'))
+                self.assertEqual((len(self._d['rooms']), len(self._dd_a)), l_cs_is_ns.shape)
+
+                del l_cs_is_ns
+
+    def test_result_store(self):
+        """ResultStore の列名・インデックス・列の値が Recorder.export_pd の DataFrame と一致することを確認する。"""
+
+        with tempfile.TemporaryDirectory() as store_dir:
+
+            store_i, store_a, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir, store_dir=store_dir)
+
+            self.assertEqual(list(self._dd_i.columns), store_i.columns)
+            self.assertEqual(list(self._dd_a.columns), store_a.columns)
+
+            pd.testing.assert_index_equal(self._dd_i.index, store_i.index, exact=False)
+            pd.testing.assert_index_equal(self._dd_a.index, store_a.index, exact=False)
+
+            pd.testing.assert_series_equal(self._dd_i['rm1_t_r'], store_i['rm1_t_r'], rtol=1e-6, check_freq=False)
+            pd.testing.assert_series_equal(self._dd_i['b3_t_s'], store_i['b3_t_s'], rtol=1e-6, check_freq=False)
+            pd.testing.assert_series_equal(self._dd_a['rm2_ac_operate'], store_a['rm2_ac_operate'], check_dtype=False)
+
+    def test_default_n_step_block(self):
+        """1ブロックあたりのステップ数の既定値が計算時間間隔の1日分であることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as store_dir:
+
+            sqc, _, _, _ = core.make_sequence(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            for eitv, n_step_block in [(EInterval.M15, 96), (EInterval.H1, 24)]:
+
+                result = recorder.StreamingRecorder(
+                    n_step_main=500,
+                    id_rm_is=list(sqc.rms.id_r_is.flatten()),
+                    id_bs_js=list(sqc.bs.id_js.flatten()),
+                    store_dir=store_dir,
+                    rms=sqc.rms,
+                    f_mrt_is_js=sqc.f_mrt_is_js,
+                    es=sqc.es,
+                    itv=Interval(eitv=eitv)
+                )
+
+                self.assertEqual(n_step_block, result._n_step_block)
+
+    def test_output_names(self):
+        """出力する項目を指定した場合、その項目のみが書き出されることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as store_dir:
+
+            store_i, store_a, _, _ = core.calc(
+                d=self._d, entry_point_dir=self._entry_point_dir, store_dir=store_dir, n_step_block=40,
+                output_names=['ppd', 'l_s_c']
+            )
+
+            dd_i, dd_a = store_i.to_pd(), store_a.to_pd()
+
+            pd.testing.assert_frame_equal(self._dd_i[dd_i.columns], dd_i, rtol=1e-6)
+            pd.testing.assert_frame_equal(self._dd_a[dd_a.columns], dd_a, check_dtype=False)
+
+            self.assertEqual(['index.json', 'l_cs_is_ns.npy', 'ppd_is_ns.npy'], sorted(os.listdir(store_dir)))
+
+            del dd_i, dd_a
+
+if __name__ == '__main__':
+    unittest.main()
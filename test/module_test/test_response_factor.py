@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from heat_load_calc import response_factor
+from heat_load_calc.response_factor import ResponseFactor
+
+
+class TestResponseFactor(unittest.TestCase):
+
+    def setUp(self):
+
+        # 熱容量, kJ/m2K / 熱抵抗, m2K/W
+        self._cs = np.array([10.375, 0.0, 10.375])
+        self._rs = np.array([0.0568, 0.09, 0.0568])
+
+        self._cache_dir = response_factor._cache_dir
+
+    def tearDown(self):
+
+        response_factor.set_cache_dir(cache_dir=self._cache_dir)
+        response_factor.clear_memo()
+
+    def _assert_rf_equal(self, rf1: ResponseFactor, rf2: ResponseFactor):
+
+        self.assertEqual(rf1.rft0, rf2.rft0)
+        self.assertEqual(rf1.rfa0, rf2.rfa0)
+        np.testing.assert_array_equal(rf1.rft1, rf2.rft1)
+        np.testing.assert_array_equal(rf1.rfa1, rf2.rfa1)
+        np.testing.assert_array_equal(rf1.row, rf2.row)
+        self.assertEqual(rf1.r_total, rf2.r_total)
+
+    def test_memo(self):
+        """同じ層構成の応答係数はプロセス内で一度だけ計算されることを確認する。"""
+
+        response_factor.set_cache_dir(cache_dir=None)
+        response_factor.clear_memo()
+
+        rf1 = ResponseFactor.create_for_unsteady_not_ground(cs=self._cs, rs=self._rs, r_o=0.04)
+        rf2 = ResponseFactor.create_for_unsteady_not_ground(cs=self._cs, rs=self._rs, r_o=0.04)
+
+        self.assertEqual(1, len(response_factor._memo))
+        self.assertIs(rf1.rfa1, rf2.rfa1)
+        self.assertFalse(rf1.rfa1.flags.writeable)
+
+        # 室外側熱伝達抵抗が異なる場合・地盤の場合は別の層構成とする。
+        ResponseFactor.create_for_unsteady_not_ground(cs=self._cs, rs=self._rs, r_o=0.11)
+        ResponseFactor.create_for_unsteady_ground(cs=self._cs, rs=self._rs)
+
+        self.assertEqual(3, len(response_factor._memo))
+
+        # キャッシュを用いずに計算した値と一致する。
+        rft0, rfa0, rft1, rfa1, row = response_factor._calc_response_factor_non_residential(
+            C_i_k_p=np.append(self._cs, 0.0) * 1000.0, R_i_k_p=np.append(self._rs, 0.04)
+        )
+        self.assertEqual(rft0, rf1.rft0)
+        self.assertEqual(rfa0, rf1.rfa0)
+        np.testing.assert_array_equal(rft1, rf1.rft1)
+        np.testing.assert_array_equal(rfa1, rf1.rfa1)
+        np.testing.assert_array_equal(row, rf1.row)
+
+    def test_walls(self):
+        """複数の壁をまとめて計算した応答係数が壁ごとに計算した応答係数と一致することを確認する。"""
+
+        response_factor.set_cache_dir(cache_dir=None)
+
+        cs_ws = [self._cs, np.array([7.47, 0.0, 180.0, 3.6]), np.array([1.0])]
+        rs_ws = [self._rs, np.array([0.0409090909, 0.07, 0.05625, 2.9411764706]), np.array([0.5])]
+        r_o_ws = [0.04, 0.11, 0.04]
+
+        response_factor.clear_memo()
+
+        rfs = ResponseFactor.create_for_unsteady_not_ground_walls(cs_ws=cs_ws, rs_ws=rs_ws, r_o_ws=r_o_ws)
+
+        for (cs, rs, r_o, rf) in zip(cs_ws, rs_ws, r_o_ws, rfs):
+
+            response_factor.clear_memo()
+
+            self._assert_rf_equal(rf, ResponseFactor.create_for_unsteady_not_ground(cs=cs, rs=rs, r_o=r_o))
+
+    def test_transfer_function(self):
+        """ラプラス変数をまとめて計算した伝達関数が四端子行列の積と一致することを確認する。"""
+
+        cs = np.array([10375.0, 0.0, 10375.0, 0.0])
+        rs = np.array([0.0568, 0.09, 0.0568, 0.04])
+        laps = np.array([1.0e-6, 1.0e-4, 1.0e-2])
+
+        ga, gt = response_factor._calc_transfer_function(C_i_k_p=cs, R_i_k_p=rs, laps=laps)
+
+        self.assertEqual((3,), ga.shape)
+
+        for (lap, ga_k, gt_k) in zip(laps, ga, gt):
+
+            matFt = np.identity(2)
+
+            for (c, r) in zip(cs, rs):
+                if c == 0.0:
+                    matFi = np.array([[1.0, r], [0.0, 1.0]])
+                else:
+                    t = np.sqrt(r * c * lap)
+                    matFi = np.array([[np.cosh(t), r / t * np.sinh(t)], [t / r * np.sinh(t), np.cosh(t)]])
+                matFt = np.dot(matFt, matFi)
+
+            self.assertAlmostEqual(matFt[0, 1] / matFt[1, 1], ga_k)
+            self.assertAlmostEqual(1.0 / matFt[1, 1], gt_k)
+
+    def test_cache_file(self):
+        """キャッシュファイルから読み込んだ応答係数が計算した応答係数と一致することを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            response_factor.set_cache_dir(cache_dir=d)
+            response_factor.clear_memo()
+
+            rf1 = ResponseFactor.create_for_unsteady_not_ground(cs=self._cs, rs=self._rs, r_o=0.04)
+            rf_g1 = ResponseFactor.create_for_unsteady_ground(cs=self._cs, rs=self._rs)
+
+            self.assertEqual(2, len(os.listdir(d)))
+
+            # プロセス内で保持した応答係数を消去し、キャッシュファイルから読み込む。
+            response_factor.clear_memo()
+
+            rf2 = ResponseFactor.create_for_unsteady_not_ground(cs=self._cs, rs=self._rs, r_o=0.04)
+            rf_g2 = ResponseFactor.create_for_unsteady_ground(cs=self._cs, rs=self._rs)
+
+            self._assert_rf_equal(rf1, rf2)
+            self._assert_rf_equal(rf_g1, rf_g2)
+
+
+if __name__ == '__main__':
+    unittest.main()
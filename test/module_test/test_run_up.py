@@ -0,0 +1,58 @@
+import unittest
+import json
+
+from heat_load_calc import core, snapshot
+from test.module_test.example_data import load_example
+
+
+class TestRunUpTolerance(unittest.TestCase):
+    """収束判定を行う助走計算（run_up_tolerance）による 1/1 0:00 の状態が、日数を固定した助走計算による状態に近いことを確認する。"""
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 1, 'run_up': 365, 'run_up_building': 183})
+
+        cls._d = d
+
+    def setUp(self):
+
+        self._snapshot_dir = snapshot._snapshot_dir
+
+        snapshot.set_snapshot_dir(snapshot_dir=None)
+
+    def tearDown(self):
+
+        snapshot.set_snapshot_dir(snapshot_dir=self._snapshot_dir)
+
+    def test_fixed_run_up(self):
+        """許容値 0.01 K の場合、室温・表面温度・平均放射温度・家具の温度の差が 0.05 K 以下、
+        絶対湿度の差が 0.0005 kg/kg(DA) 以下であることを確認する。"""
+
+        d = json.loads(json.dumps(self._d))
+
+        d['common']['calculation_day']['run_up_tolerance'] = 0.01
+
+        with self.assertLogs('HeatLoadCalc', level='INFO') as cm:
+            dd_i, _, _, _ = core.calc(d=d, entry_point_dir=self._entry_point_dir)
+
+        # 建物全体の助走計算は183日（上限）より前に収束する。
+        self.assertTrue(any('収束しました' in m for m in cm.output))
+
+        dd_i_ref, _, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+        for suffix, tol in [('_t_r', 0.05), ('_t_s', 0.05), ('_mrt', 0.05), ('_t_fun', 0.05), ('_x_r', 0.0005)]:
+
+            with self.subTest(suffix=suffix):
+
+                columns = [c for c in dd_i.columns if c.endswith(suffix)]
+
+                self.assertTrue(len(columns) > 0)
+
+                diff = (dd_i.iloc[0][columns].astype(float) - dd_i_ref.iloc[0][columns].astype(float)).abs()
+
+                self.assertLessEqual(diff.max(), tol)
+
+
+if __name__ == '__main__':
+    unittest.main()
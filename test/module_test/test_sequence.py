@@ -0,0 +1,192 @@
+import unittest
+
+import numpy as np
+
+from heat_load_calc import core, sequence
+from heat_load_calc.conditions import initialize_conditions
+from heat_load_calc.global_number import get_c_a, get_rho_a
+from heat_load_calc.operation_mode import OperationMode
+from test.module_test.example_data import load_example
+
+
+class TestSequenceCoefficients(unittest.TestCase):
+    """事前計算した係数を用いた計算が、ステップごとに係数を計算する元の式と一致することを確認する。"""
+
+    @classmethod
+    def setUpClass(cls):
+
+        entry_point_dir, d = load_example(calculation_day={'main': 1, 'run_up': 1, 'run_up_building': 1})
+
+        # 室0・室1に床暖房、室0・室2に床冷房を設置し、対流成分比率を暖房・冷房で異なる値とする。
+        def floor(equipment_type, id, boundary_id, convection_ratio):
+            return {
+                'id': id,
+                'name': '{} no.{}'.format(equipment_type, id),
+                'equipment_type': equipment_type,
+                'property': {
+                    'space_id': 0,
+                    'boundary_id': boundary_id,
+                    'max_capacity': 100.0,
+                    'area': 10.0,
+                    'convection_ratio': convection_ratio
+                }
+            }
+
+        d['equipments']['heating_equipments'][0] = floor('floor_heating', 0, 6, 0.2)
+        d['equipments']['heating_equipments'][1] = floor('floor_heating', 1, 34, 0.1)
+        d['equipments']['cooling_equipments'][0] = floor('floor_cooling', 0, 6, 0.3)
+        d['equipments']['cooling_equipments'][2] = floor('floor_cooling', 2, 43, 0.0)
+
+        cls._sqc, _, _, _ = core.make_sequence(d=d, entry_point_dir=entry_point_dir)
+
+        h, c, o, s = (m.value for m in [OperationMode.HEATING, OperationMode.COOLING, OperationMode.STOP_OPEN, OperationMode.STOP_CLOSE])
+
+        # 暖房・冷房が混在する運転モード
+        # 室0は暖房と冷房を、室1は冷房と暖房を、室2は停止と冷房を切り替える。
+        cls._operation_modes = [
+            np.array([[h], [c], [s]]),
+            np.array([[c], [h], [c]]),
+            np.array([[h], [h], [o]]),
+            np.array([[c], [c], [c]]),
+            np.array([[s], [o], [s]])
+        ]
+
+    def test_radiative_coefficients(self):
+        """係数 f_WSB, f_BRL, f_XLR を運転モードに応じて列ごとに選択した値が、元の式による値と一致することを確認する。"""
+
+        sqc = self._sqc
+
+        es = sqc.es
+
+        self.assertTrue(np.any(es.is_radiative_heating_is))
+        self.assertTrue(np.any(es.is_radiative_cooling_is))
+
+        for operation_mode_is_n in self._operation_modes:
+
+            with self.subTest(operation_mode_is_n=operation_mode_is_n.flatten()):
+
+                beta_is_n = sequence.get_beta_is_n(
+                    beta_c_is=es.beta_c_is, beta_h_is=es.beta_h_is, operation_mode_is_n=operation_mode_is_n
+                )
+
+                f_flr_js_is_n = sequence.get_f_flr_js_is_n(
+                    f_flr_c_js_is=es.f_flr_c_js_is, f_flr_h_js_is=es.f_flr_h_js_is, operation_mode_is_n=operation_mode_is_n
+                )
+
+                f_wsb_expected = sequence.get_f_wsb_js_is_n_pls(
+                    f_flb_js_is_n_pls=sqc.bs.get_f_flb_js_is_n_pls(beta_is_n=beta_is_n, f_flr_js_is_n=f_flr_js_is_n),
+                    f_ax_js_js=sqc.f_ax_js_js
+                )
+
+                f_brl_expected = sequence.get_f_brl_is_is_n(
+                    a_s_js=sqc.bs.a_s_js,
+                    beta_is_n=beta_is_n,
+                    f_wsb_js_is_n_pls=f_wsb_expected,
+                    h_s_c_js=sqc.bs.h_s_c_js,
+                    p_is_js=sqc.bs.p_is_js
+                )
+
+                f_xlr_expected = sequence.get_f_xlr_is_is_n_pls(
+                    f_mrt_hum_is_js=sqc.f_mrt_hum_is_js,
+                    f_wsb_js_is_n_pls=f_wsb_expected,
+                    f_xot_is_is_n_pls=sqc.f_xot_is_is_n_pls,
+                    k_r_is_n=sqc.k_r_is_n
+                )
+
+                for x_c, x_h, expected in [
+                    (sqc.f_wsb_c_js_is, sqc.f_wsb_h_js_is, f_wsb_expected),
+                    (sqc.f_brl_c_is_is, sqc.f_brl_h_is_is, f_brl_expected),
+                    (sqc.f_xlr_c_is_is, sqc.f_xlr_h_is_is, f_xlr_expected)
+                ]:
+                    np.testing.assert_allclose(
+                        sequence.get_x_xs_is_n_by_operation_mode(x_c_xs_is=x_c, x_h_xs_is=x_h, operation_mode_is_n=operation_mode_is_n),
+                        expected,
+                        rtol=1e-10,
+                        atol=1e-14
+                    )
+
+    def test_f_wsv_f_brc_f_xc(self):
+        """係数 f_AX の逆行列及び f_BRC, f_XC の分解した係数を用いた値が、元の式による値と一致することを確認する。"""
+
+        sqc = self._sqc
+
+        bs = sqc.bs
+
+        rng = np.random.default_rng(0)
+
+        c_n = initialize_conditions(n_spaces=sqc.rms.n_r, n_bdries=bs.n_b)
+
+        for n in [0, 10, 50]:
+
+            with self.subTest(n=n):
+
+                f_cvl_js_n_pls = rng.uniform(-5.0, 5.0, size=(bs.n_b, 1))
+
+                # 元の式: f_WSV = f_AX^-1 f_CVL を連立方程式として解く。
+                f_wsv_expected = np.linalg.solve(sqc.f_ax_js_js, f_cvl_js_n_pls)
+
+                f_wsv_js_n_pls = sequence.get_f_wsv_js_n_pls(f_cvl_js_n_pls=f_cvl_js_n_pls, f_ax_inv_js_js=sqc.f_ax_inv_js_js)
+
+                np.testing.assert_allclose(f_wsv_js_n_pls, f_wsv_expected, rtol=1e-10, atol=1e-12)
+
+                f_wsc_js_n_pls = sqc.f_wsc_js_ns[:, n + 1].reshape(-1, 1)
+
+                v_vent_out_non_nv_is_n = rng.uniform(0.0, 0.1, size=(sqc.rms.n_r, 1))
+
+                q_hum_is_n = rng.uniform(0.0, 200.0, size=(sqc.rms.n_r, 1))
+
+                kwargs = dict(
+                    c_a=get_c_a(),
+                    v_rm_is=sqc.rms.v_r_is,
+                    c_sh_frt_is=sqc.rms.c_sh_frt_is,
+                    delta_t=sqc.itv.get_delta_t(),
+                    g_sh_frt_is=sqc.rms.g_sh_frt_is,
+                    q_gen_is_n=sqc.scd.q_gen_is_ns[:, n].reshape(-1, 1),
+                    q_hum_is_n=q_hum_is_n,
+                    q_sol_frt_is_n=sqc.q_sol_frt_is_ns[:, n].reshape(-1, 1),
+                    rho_a=get_rho_a(),
+                    theta_frt_is_n=c_n.theta_frt_is_n,
+                    theta_o_n_pls=sqc.weather.theta_o_ns_plus[n + 1],
+                    theta_r_is_n=c_n.theta_r_is_n,
+                    v_vent_out_non_nv_is_n=v_vent_out_non_nv_is_n,
+                    v_vent_ntr_is_n=sqc.rms.v_vent_ntr_set_is
+                )
+
+                f_brc_non_nv, f_brc_nv = sequence.get_f_brc_is_n_pls(
+                    f_brc_ws_is_js=sqc.f_brc_ws_is_js,
+                    f_brc_wsc_is_n_pls=sqc.f_brc_wsc_is_ns[:, n + 1].reshape(-1, 1),
+                    f_wsv_js_n_pls=f_wsv_js_n_pls,
+                    **kwargs
+                )
+
+                # 元の式(2.24): 表面温度の寄与 f_WSC + f_WSV をステップごとに面積・対流熱伝達率で重み付けする。
+                f_brc_non_nv_expected = kwargs['v_rm_is'] * kwargs['c_a'] * kwargs['rho_a'] / kwargs['delta_t'] * kwargs['theta_r_is_n'] \
+                    + np.dot(bs.p_is_js, bs.h_s_c_js * bs.a_s_js * (f_wsc_js_n_pls + f_wsv_js_n_pls)) \
+                    + kwargs['c_a'] * kwargs['rho_a'] * v_vent_out_non_nv_is_n * kwargs['theta_o_n_pls'] \
+                    + kwargs['q_gen_is_n'] + q_hum_is_n \
+                    + kwargs['g_sh_frt_is'] * (kwargs['c_sh_frt_is'] * kwargs['theta_frt_is_n'] + kwargs['q_sol_frt_is_n'] * kwargs['delta_t']) \
+                    / (kwargs['c_sh_frt_is'] + kwargs['delta_t'] * kwargs['g_sh_frt_is'])
+
+                f_brc_nv_expected = f_brc_non_nv_expected \
+                    + kwargs['c_a'] * kwargs['rho_a'] * sqc.rms.v_vent_ntr_set_is * kwargs['theta_o_n_pls']
+
+                np.testing.assert_allclose(f_brc_non_nv, f_brc_non_nv_expected, rtol=1e-10)
+                np.testing.assert_allclose(f_brc_nv, f_brc_nv_expected, rtol=1e-10)
+
+                f_xc_is_n_pls = sequence.get_f_xc_is_n_pls(
+                    f_xc_ws_is_js=sqc.f_xc_ws_is_js,
+                    f_xc_wsc_is_n_pls=sqc.f_xc_wsc_is_ns[:, n + 1].reshape(-1, 1),
+                    f_wsv_js_n_pls=f_wsv_js_n_pls
+                )
+
+                # 元の式(2.19)
+                f_xc_expected = np.dot(
+                    sqc.f_xot_is_is_n_pls,
+                    sqc.k_r_is_n * np.dot(sqc.f_mrt_hum_is_js, f_wsc_js_n_pls + f_wsv_js_n_pls)
+                )
+
+                np.testing.assert_allclose(f_xc_is_n_pls, f_xc_expected, rtol=1e-10, atol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+import copy
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from heat_load_calc import core, snapshot
+from heat_load_calc.weather import Weather
+from heat_load_calc.interval import EInterval, Interval
+from heat_load_calc.input_models.input_weather import InputWeather
+from test.module_test.example_data import load_example
+
+
+class TestSnapshot(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 1, 'run_up': 2, 'run_up_building': 1})
+
+        cls._d = d
+
+        cls._w = Weather.make_weather(
+            itv=Interval(eitv=EInterval.M15), ipt_weather=InputWeather.read(d_weather=d['common']['weather'])
+        )
+
+    def setUp(self):
+
+        self._snapshot_dir = snapshot._snapshot_dir
+
+    def tearDown(self):
+
+        snapshot.set_snapshot_dir(snapshot_dir=self._snapshot_dir)
+
+    def test_key(self):
+        """運転に関する入力のみが異なる場合は同じキーとなり、建物の物理的な入力が異なる場合は異なるキーとなることを確認する。"""
+
+        key = snapshot.get_key(d=self._d, w=self._w)
+
+        d_operation = copy.deepcopy(self._d)
+        d_operation['common']['ac_method'] = 'air_temperature'
+        d_operation['common']['calculation_day']['main'] = 365
+        d_operation['rooms'][0]['schedule'] = {'name': 'zero'}
+
+        self.assertEqual(key, snapshot.get_key(d=d_operation, w=self._w))
+
+        d_physics = copy.deepcopy(self._d)
+        d_physics['building']['infiltration']['c_value'] = 1.0
+
+        self.assertNotEqual(key, snapshot.get_key(d=d_physics, w=self._w))
+
+        d_run_up = copy.deepcopy(self._d)
+        d_run_up['common']['calculation_day']['run_up_building'] = 2
+
+        self.assertNotEqual(key, snapshot.get_key(d=d_run_up, w=self._w))
+
+    def test_load(self):
+        """保存した状態値から計算した結果が、助走計算を行った結果と一致することを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            snapshot.set_snapshot_dir(snapshot_dir=None)
+
+            dd_i0, dd_a0, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            snapshot.set_snapshot_dir(snapshot_dir=d)
+
+            # 1回目は状態値を保存し、2回目は保存した状態値を読み込む。
+            dd_i1, dd_a1, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            self.assertEqual(1, len(os.listdir(d)))
+
+            with self.assertLogs('HeatLoadCalc', level='INFO') as cm:
+                dd_i2, dd_a2, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            self.assertTrue(any('skipped' in m for m in cm.output))
+            self.assertFalse(any('助走計算（建物全体）' in m for m in cm.output))
+
+            for dd_i, dd_a in [(dd_i1, dd_a1), (dd_i2, dd_a2)]:
+                pd.testing.assert_frame_equal(dd_i0, dd_i)
+                pd.testing.assert_frame_equal(dd_a0, dd_a)
+
+            # 出力する項目が異なる場合も、保存した状態値を用いる。
+            dd_i3, _, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir, output_names=['t_r'])
+
+            self.assertEqual(1, len(os.listdir(d)))
+            np.testing.assert_array_equal(dd_i0[dd_i3.columns].to_numpy(), dd_i3.to_numpy())
+
+    def test_load_output_names(self):
+        """出力する項目を限定した計算で保存した状態値から、すべての項目を出力する計算の 1/1 0:00 の瞬時値が復元されることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            snapshot.set_snapshot_dir(snapshot_dir=None)
+
+            dd_i0, dd_a0, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            snapshot.set_snapshot_dir(snapshot_dir=d)
+
+            # 瞬時値を出力しない計算で状態値を保存する。
+            core.calc(d=self._d, entry_point_dir=self._entry_point_dir, output_names=['l_s_c'])
+
+            self.assertEqual(1, len(os.listdir(d)))
+
+            with self.assertLogs('HeatLoadCalc', level='INFO') as cm:
+                dd_i1, dd_a1, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            self.assertTrue(any('skipped' in m for m in cm.output))
+
+            pd.testing.assert_frame_equal(dd_i0, dd_i1)
+            pd.testing.assert_frame_equal(dd_a0, dd_a1)
+
+    def test_load_missing_values(self):
+        """記録に必要な瞬時値が含まれない状態値を読み込んだ場合は例外を送出することを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            snapshot.set_snapshot_dir(snapshot_dir=d)
+
+            core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            c_n, values_i = snapshot.load(d=self._d, w=self._w)
+
+            del values_i['theta_s_js_n_pls']
+
+            snapshot.save(d=self._d, w=self._w, c_n=c_n, values_i=values_i)
+
+            with self.assertRaises(ValueError):
+                core.calc(d=self._d, entry_point_dir=self._entry_point_dir)
+
+            # 欠けている項目を出力しない計算では用いることができる。
+            core.calc(d=self._d, entry_point_dir=self._entry_point_dir, output_names=['t_r'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -46,6 +46,32 @@ class TestSolarShading(unittest.TestCase):
         self.assertAlmostEqual(ss.get_f_ss_sky_j(), 0.068638682)
         self.assertEqual(ss.get_f_ss_ref_j(), 0.0)
 
+    def test_solar_shading_simple_night_and_back(self):
+        """日が出ていないステップ及び太陽位置が背面にあるステップの日影面積比率が 0.0 であることを確認する。"""
+
+        ss = SolarShading.create(
+            ssp_dict={
+                'existence': True,
+                'input_method': 'simple',
+                'depth': 0.4,
+                'd_h': 2.0,
+                'd_e': 0.1
+            },
+            direction=Direction.S
+        )
+
+        results = ss.get_f_ss_dn_j_ns(
+            h_sun_ns=np.array([-np.pi/6, np.pi/4, np.pi/4, np.pi/3, 0.0]),
+            a_sun_ns=np.array([0.0, np.pi, np.pi*2/3, 0.0, 0.0])
+        )
+        expected = [0.0, 0.0, 0.0, (0.4*3**0.5-0.1)/2.0, 0.0]
+
+        self.assertEqual(5, len(results))
+
+        for r, e in zip(results, expected):
+            with self.subTest(r=r, e=e):
+                self.assertAlmostEqual(r, e)
+
     @unittest.skip('not implemented')
     def test_solar_shading_detail(self):
         pass
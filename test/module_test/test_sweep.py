@@ -0,0 +1,139 @@
+import unittest
+import json
+import logging
+import os
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+from heat_load_calc import core, sweep
+from heat_load_calc.heat_load_calc import read_result_npz
+from heat_load_calc.recorder import ResultStore
+from test.module_test.example_data import load_example
+
+
+class TestSweep(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._entry_point_dir, d = load_example(calculation_day={'main': 1, 'run_up': 1, 'run_up_building': 1})
+
+        cls._d = d
+
+    def test_apply_overrides(self):
+
+        d = sweep.apply_overrides(
+            d=self._d,
+            overrides={'common.weather.region': 7, 'building.infiltration.c_value': 5.0, 'rooms.0.volume': 10.0}
+        )
+
+        self.assertEqual(7, d['common']['weather']['region'])
+        self.assertEqual(5.0, d['building']['infiltration']['c_value'])
+        self.assertEqual(10.0, d['rooms'][0]['volume'])
+
+        # 元の入力データは変更されない。
+        self.assertNotEqual(7, self._d['common']['weather']['region'])
+
+    def test_read_variants(self):
+
+        with tempfile.TemporaryDirectory() as d:
+
+            variants_path = os.path.join(d, 'variants.csv')
+
+            with open(variants_path, 'w', encoding='utf-8') as f:
+                f.write('name,common.weather.region,common.ac_method\n')
+                f.write('r7,7,\n')
+                f.write('ot,,ot\n')
+
+            variants = sweep.read_variants(variants_path=variants_path)
+
+        self.assertEqual([('r7', {'common.weather.region': 7}), ('ot', {'common.ac_method': 'ot'})], variants)
+
+    def test_run_sweep(self):
+        """並列計算した結果が core.calc の結果と一致することを確認する。"""
+
+        variants = [('base', {}), ('r7', {'common.weather.region': '7', 'building.infiltration.c_value': 5.0})]
+
+        with tempfile.TemporaryDirectory() as output_data_dir:
+
+            results = sweep.run_sweep(
+                d=self._d,
+                variants=variants,
+                output_data_dir=output_data_dir,
+                entry_point_dir=self._entry_point_dir,
+                max_workers=2,
+                output_format='npz'
+            )
+
+            self.assertEqual(['base', 'r7'], [name for name, _ in results])
+
+            for name, overrides in variants:
+
+                dd_i, dd_a, _, _ = core.calc(
+                    d=sweep.apply_overrides(d=self._d, overrides=overrides), entry_point_dir=self._entry_point_dir
+                )
+
+                pd.testing.assert_frame_equal(
+                    dd_i, read_result_npz(result_path=os.path.join(output_data_dir, name, 'result_detail_i.npz')),
+                    check_freq=False
+                )
+
+    def test_run_sweep_store(self):
+        """出力形式 npy の場合、計算結果がブロックごとに書き出され、ResultStore で読み込めることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as output_data_dir:
+
+            sweep.run_sweep(
+                d=self._d,
+                variants=[('base', {})],
+                output_data_dir=output_data_dir,
+                entry_point_dir=self._entry_point_dir,
+                max_workers=1,
+                output_format='npy',
+                output_names=['t_r', 'l_s_c']
+            )
+
+            self.assertEqual(['store'], os.listdir(os.path.join(output_data_dir, 'base')))
+
+            dd_i, dd_a, _, _ = core.calc(d=self._d, entry_point_dir=self._entry_point_dir, output_names=['t_r', 'l_s_c'])
+
+            store_dir = os.path.join(output_data_dir, 'base', 'store')
+
+            pd.testing.assert_frame_equal(dd_i, ResultStore(store_dir=store_dir, kind='i').to_pd())
+            pd.testing.assert_frame_equal(dd_a, ResultStore(store_dir=store_dir, kind='a').to_pd())
+
+    def test_main_output_names(self):
+        """コマンドラインで出力する項目を指定できることを確認する。"""
+
+        with tempfile.TemporaryDirectory() as d:
+
+            house_data_path = os.path.join(d, 'house.json')
+
+            with open(house_data_path, 'w', encoding='utf-8') as f:
+                json.dump(self._d, f)
+
+            variants_path = os.path.join(d, 'variants.csv')
+
+            with open(variants_path, 'w', encoding='utf-8') as f:
+                f.write('name\nbase\n')
+
+            with mock.patch.object(sweep, 'run_sweep') as run_sweep, mock.patch.object(sweep, 'make_logger'):
+                sweep.main(args=[house_data_path, variants_path, '-o', d, '--output-names', 't_r', 'l_s_c'])
+
+            self.assertEqual(['t_r', 'l_s_c'], run_sweep.call_args.kwargs['output_names'])
+
+    def test_duplicated_name(self):
+
+        with self.assertRaises(ValueError):
+            sweep.run_sweep(
+                d=self._d,
+                variants=[('a', {}), ('a', {})],
+                output_data_dir=tempfile.gettempdir(),
+                entry_point_dir=self._entry_point_dir
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
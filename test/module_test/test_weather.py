@@ -1,9 +1,19 @@
 import unittest
 import os
+import sys
+import subprocess
+import shutil
+import tempfile
 
-from heat_load_calc.weather import Weather
+import numpy as np
+import pandas as pd
+
+from heat_load_calc import weather, hasp_weather_read, core
+from heat_load_calc.weather import Weather, WeatherStream
 from heat_load_calc.interval import EInterval, Interval
+from heat_load_calc.tenum import ERegion
 from heat_load_calc.input_models.input_weather import InputWeather
+from test.module_test.example_data import load_example
 
 
 class TestWeather(unittest.TestCase):
@@ -584,6 +594,240 @@ class TestWeather(unittest.TestCase):
         self.assertEqual(w_m30_ave_d.size, 365)
         self.assertEqual(w_h1_ave_d.size, 365)
 
+    def test_weather_cache_default(self):
+        """環境変数で指定しない場合は、気象データのキャッシュファイルを作成しないことを確認する。"""
+
+        env = {k: v for k, v in os.environ.items() if k != 'HEAT_LOAD_CALC_WEATHER_CACHE'}
+        env['PYTHONPATH'] = os.path.join(os.path.dirname(__file__), '..', '..')
+
+        out = subprocess.run(
+            [sys.executable, '-c', 'from heat_load_calc import weather; print(weather._cache_dir)'],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+
+        self.assertEqual('None', out.strip())
+
+    def test_weather_cache(self):
+        """キャッシュファイルから読み込んだ気象データが、ees ファイルから作成した気象データと一致することを確認する。"""
+
+        cache_dir = weather._cache_dir
+        memo_size = weather._memo_size
+
+        try:
+
+            # プロセス内で保持した Weather クラスを用いないようにする。
+            weather.set_memo_size(memo_size=0)
+
+            with tempfile.TemporaryDirectory() as d:
+
+                weather.set_cache_dir(cache_dir=None)
+
+                w0 = Weather.make_weather(itv=Interval(eitv=EInterval.M30), ipt_weather=self.ipt_weather_ees)
+
+                weather.set_cache_dir(cache_dir=d)
+
+                # 1回目はキャッシュファイルを作成し、2回目はキャッシュファイルから読み込む。
+                w1 = Weather.make_weather(itv=Interval(eitv=EInterval.M30), ipt_weather=self.ipt_weather_ees)
+
+                self.assertEqual(1, len(os.listdir(d)))
+
+                w2 = Weather.make_weather(itv=Interval(eitv=EInterval.M30), ipt_weather=self.ipt_weather_ees)
+
+                for w in [w1, w2]:
+                    np.testing.assert_array_equal(w0.a_sun_ns_plus, w.a_sun_ns_plus)
+                    np.testing.assert_array_equal(w0.h_sun_ns_plus, w.h_sun_ns_plus)
+                    np.testing.assert_array_equal(w0.i_dn_ns_plus, w.i_dn_ns_plus)
+                    np.testing.assert_array_equal(w0.i_sky_ns_plus, w.i_sky_ns_plus)
+                    np.testing.assert_array_equal(w0.r_n_ns_plus, w.r_n_ns_plus)
+                    np.testing.assert_array_equal(w0.theta_o_ns_plus, w.theta_o_ns_plus)
+                    np.testing.assert_array_equal(w0.x_o_ns_plus, w.x_o_ns_plus)
+
+                # ees ファイルが変更された場合は、別のキャッシュファイルとなる。
+                path_and_filename = os.path.join(d, '01_kitami.csv')
+                shutil.copyfile(weather._get_path_and_filename(region=weather.Region(ERegion.Region1)), path_and_filename)
+                cache_path1 = weather._get_cache_path(path_and_filename=path_and_filename, itv=Interval(eitv=EInterval.M30))
+
+                with open(path_and_filename, 'a', encoding='utf-8') as f:
+                    f.write('\n')
+                cache_path2 = weather._get_cache_path(path_and_filename=path_and_filename, itv=Interval(eitv=EInterval.M30))
+
+                self.assertNotEqual(cache_path1, cache_path2)
+
+        finally:
+
+            weather.set_cache_dir(cache_dir=cache_dir)
+            weather.set_memo_size(memo_size=memo_size)
+
+    def test_weather_values_hasp_h1(self):
+        """HASP形式の気象データが1時始まりのデータとして読み込まれることを確認する。"""
+
+        ipt_weather_hasp = InputWeather.read(
+            d_weather={
+                'method': 'hasp',
+                'file_path': os.path.join(os.path.dirname(weather.__file__), 'expanded_amedas', 'tokyo_3column_SI.has'),
+                'latitude': 35.69,
+                'longitude': 139.76
+            }
+        )
+
+        cache_dir = weather._cache_dir
+        memo_size = weather._memo_size
+
+        try:
+
+            weather.set_memo_size(memo_size=0)
+
+            with tempfile.TemporaryDirectory() as d:
+
+                weather.set_cache_dir(cache_dir=d)
+
+                # 1回目はキャッシュファイルを作成し、2回目はキャッシュファイルから読み込む。
+                w1 = Weather.make_weather(itv=Interval(eitv=EInterval.H1), ipt_weather=ipt_weather_hasp)
+
+                self.assertEqual(1, len(os.listdir(d)))
+
+                w2 = Weather.make_weather(itv=Interval(eitv=EInterval.H1), ipt_weather=ipt_weather_hasp)
+
+                ta, xa, idn, isky, rn, _, _ = hasp_weather_read.hasp_read(file_name=ipt_weather_hasp.file_path)
+
+                for w in [w1, w2]:
+                    self.assertEqual(8760, w.number_of_data)
+                    # 12/31 24:00 のデータは 1/1 0:00 のデータとなる。
+                    self.assertAlmostEqual(ta[-1], w.theta_o_ns_plus[0])
+                    self.assertAlmostEqual(ta[0], w.theta_o_ns_plus[1])
+                    self.assertAlmostEqual(xa[0], w.x_o_ns_plus[1])
+                    self.assertAlmostEqual(idn[0], w.i_dn_ns_plus[1])
+                    self.assertAlmostEqual(isky[0], w.i_sky_ns_plus[1])
+                    self.assertAlmostEqual(rn[0], w.r_n_ns_plus[1])
+
+                np.testing.assert_array_equal(w1.h_sun_ns_plus, w2.h_sun_ns_plus)
+
+        finally:
+
+            weather.set_cache_dir(cache_dir=cache_dir)
+            weather.set_memo_size(memo_size=memo_size)
+
+    def test_weather_memo(self):
+        """同じ地域・時間間隔の気象データは同じ読み取り専用のインスタンスが返されることを確認する。"""
+
+        memo_size = weather._memo_size
+
+        try:
+
+            weather.clear_memo()
+            weather.set_memo_size(memo_size=2)
+
+            w1 = Weather.make_weather(itv=Interval(eitv=EInterval.M15), ipt_weather=self.ipt_weather_ees)
+            w2 = Weather.make_weather(itv=Interval(eitv=EInterval.M15), ipt_weather=self.ipt_weather_ees)
+
+            self.assertIs(w1, w2)
+
+            with self.assertRaises(ValueError):
+                w1._theta_o_ns[0] = 0.0
+
+            # 時間間隔が異なる場合は別のインスタンスとなる。
+            w3 = Weather.make_weather(itv=Interval(eitv=EInterval.H1), ipt_weather=self.ipt_weather_ees)
+
+            self.assertIsNot(w1, w3)
+
+            # 保持する最大数を超えた場合は、最も古く使われたものから消去される。
+            w4 = Weather.make_weather(
+                itv=Interval(eitv=EInterval.M15), ipt_weather=self.ipt_weather_file, entry_point_dir=self.entry_point_dir
+            )
+
+            self.assertIsNot(w1, Weather.make_weather(itv=Interval(eitv=EInterval.M15), ipt_weather=self.ipt_weather_ees))
+            self.assertIs(w4, Weather.make_weather(
+                itv=Interval(eitv=EInterval.M15), ipt_weather=self.ipt_weather_file, entry_point_dir=self.entry_point_dir
+            ))
+
+        finally:
+
+            weather.set_memo_size(memo_size=memo_size)
+
+    def test_weather_stream(self):
+        """複数年の気象データが1年ずつ読み込まれ、年末の値が次の年の最初の値となることを確認する。"""
+
+        pp1 = pd.read_csv(os.path.join(self.entry_point_dir, 'weather_for_method_file.csv'))
+        pp2 = pp1.copy()
+        pp2['temperature'] = pp2['temperature'] + 1.0
+
+        cache_dir = weather._cache_dir
+
+        try:
+
+            weather.set_cache_dir(cache_dir=None)
+
+            with tempfile.TemporaryDirectory() as d:
+
+                file_path1 = os.path.join(d, 'year1.csv')
+                file_path2 = os.path.join(d, 'year2.csv')
+                file_path = os.path.join(d, 'years.csv')
+
+                pp1.to_csv(file_path1, index=False)
+                pp2.to_csv(file_path2, index=False)
+                pd.concat([pp1, pp2]).to_csv(file_path, index=False)
+
+                itv = Interval(eitv=EInterval.M30)
+
+                ws = WeatherStream(file_path=file_path, itv=itv, latitude=26.21, longitude=127.685)
+
+                self.assertEqual(2, ws.n_year)
+
+                w1, w2 = list(ws)
+
+                w1_ref = weather._make_from_pd(file_path=file_path1, itv=itv, latitude=26.21, longitude=127.685)
+                w2_ref = weather._make_from_pd(file_path=file_path2, itv=itv, latitude=26.21, longitude=127.685)
+
+                # 1年目の年末の値は2年目の最初の値となり、年末の補間区間以外は1年分のデータと一致する。
+                self.assertEqual(17520, w1.number_of_data)
+                self.assertEqual(w2.theta_o_ns_plus[0], w1.theta_o_ns_plus[-1])
+                self.assertAlmostEqual((w1.theta_o_ns_plus[-3] + w1.theta_o_ns_plus[-1]) / 2, w1.theta_o_ns_plus[-2])
+                np.testing.assert_array_equal(w1_ref.theta_o_ns_plus[:-2], w1.theta_o_ns_plus[:-2])
+                np.testing.assert_array_equal(w1_ref.x_o_ns_plus[:-2], w1.x_o_ns_plus[:-2])
+                np.testing.assert_array_equal(w1_ref.i_dn_ns_plus[:-2], w1.i_dn_ns_plus[:-2])
+                np.testing.assert_array_equal(w1_ref.h_sun_ns_plus, w1.h_sun_ns_plus)
+
+                # 最後の年は1年分のデータと同様に年末の値を1/1 0:00の値とする。
+                np.testing.assert_array_equal(w2_ref.theta_o_ns_plus, w2.theta_o_ns_plus)
+                np.testing.assert_array_equal(w2_ref.r_n_ns_plus, w2.r_n_ns_plus)
+
+                # 行数が8760の倍数でない場合
+                pp1.iloc[:-1].to_csv(file_path, index=False)
+
+                with self.assertRaises(ValueError):
+                    WeatherStream(file_path=file_path, itv=itv, latitude=26.21, longitude=127.685)
+
+        finally:
+
+            weather.set_cache_dir(cache_dir=cache_dir)
+
+    def test_sequence_set_weather(self):
+        """気象データを差し替えた Sequence クラスの値が、その気象データから作成した値と一致することを確認する。"""
+
+        entry_point_dir, d = load_example()
+
+        itv = Interval(eitv=EInterval.M15)
+
+        w1 = Weather.make_weather(itv=itv, ipt_weather=self.ipt_weather_ees)
+        w2 = Weather.make_weather(
+            itv=itv, ipt_weather=self.ipt_weather_file, entry_point_dir=self.entry_point_dir
+        )
+
+        sqc, _, _, _ = core.make_sequence(d=d, entry_point_dir=entry_point_dir, w=w1)
+        sqc_ref, _, _, _ = core.make_sequence(d=d, entry_point_dir=entry_point_dir, w=w2)
+
+        sqc.set_weather(weather=w2)
+
+        self.assertIs(w2, sqc.weather)
+        np.testing.assert_array_equal(sqc_ref.bs.theta_o_eqv_js_nspls, sqc.bs.theta_o_eqv_js_nspls)
+        np.testing.assert_array_equal(sqc_ref.bs.q_trs_sol_js_nspls, sqc.bs.q_trs_sol_js_nspls)
+        np.testing.assert_array_equal(sqc_ref.q_trs_sol_is_ns, sqc.q_trs_sol_is_ns)
+        np.testing.assert_array_equal(sqc_ref.q_sol_frt_is_ns, sqc.q_sol_frt_is_ns)
+        np.testing.assert_array_equal(sqc_ref.q_s_sol_js_ns, sqc.q_s_sol_js_ns)
+        np.testing.assert_array_equal(sqc_ref.f_wsc_js_ns, sqc.f_wsc_js_ns)
+        np.testing.assert_array_equal(sqc_ref.f_brc_wsc_is_ns, sqc.f_brc_wsc_is_ns)
+        np.testing.assert_array_equal(sqc_ref.f_xc_wsc_is_ns, sqc.f_xc_wsc_is_ns)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from math import radians
 
 from heat_load_calc import window
@@ -361,3 +362,32 @@ class TestWindow(unittest.TestCase):
         # 0.0 * 0.72
         self.assertAlmostEqual(w_m.get_b_w_d_j_ns(phi_j_ns=radians(90.0)), 0.0)
 
+
+    def test_memo_c(self):
+        """同じガラスの拡散日射に対する特性値はプロセス内で一度だけ計算されることを確認する。"""
+
+        window.clear_memo()
+
+        w1 = Window(u_w_std_j=3.0, eta_w_std_j=0.5, t_glz_j=GlassType.MULTIPLE, r_a_w_g_j=0.72, t_flame=FlameType.RESIN)
+        w2 = Window(u_w_std_j=3.0, eta_w_std_j=0.5, t_glz_j=GlassType.MULTIPLE, r_a_w_g_j=0.72, t_flame=FlameType.RESIN)
+
+        self.assertEqual(1, len(window._memo_c))
+        self.assertEqual(w1.tau_w_s_j, w2.tau_w_s_j)
+        self.assertEqual(w1.b_w_s_j, w2.b_w_s_j)
+
+        # ガラスの種類が異なる場合は別のガラスとする。
+        Window(u_w_std_j=3.0, eta_w_std_j=0.5, t_glz_j=GlassType.SINGLE, r_a_w_g_j=0.72, t_flame=FlameType.RESIN)
+
+        self.assertEqual(2, len(window._memo_c))
+
+        # 数値積分の値と一致する。
+        g = w1.glazing
+        phi_ms = g._get_phi_ms()
+        self.assertAlmostEqual(
+            g.get_tau_w_g_c_j(),
+            np.pi / g.M * np.sum(g.get_tau_w_g_j_phis(phis=phi_ms) * np.sin(phi_ms) * np.cos(phi_ms))
+        )
+        self.assertAlmostEqual(
+            g.get_b_w_g_c_j(),
+            np.pi / g.M * np.sum(g.get_b_w_g_j_phis(phis=phi_ms) * np.sin(phi_ms) * np.cos(phi_ms))
+        )
@@ -3,7 +3,7 @@ import unittest
 import json
 import numpy as np
 
-from heat_load_calc import core, schedule, weather, interval
+from heat_load_calc import core, schedule, weather, interval, conditions
 
 
 # 定常状態のテスト
@@ -52,3 +52,75 @@ class TestSigleRoomWithGround(unittest.TestCase):
 
         self.assertAlmostEqual(10.005432475852627, self._dd_i['b0_t_s']['1989-1-31 0:00:00'])
         self.assertAlmostEqual(10.005432475852627, self._dd_i['b1_t_s']['1989-1-31 0:00:00'])
+
+
+class TestGroundPeriodic(unittest.TestCase):
+    """
+    地盤の周期定常解が地盤の漸化式を満たし、1年を周期とすることを確認する。
+    気象データは6地域の拡張アメダス気象データとする。
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        s_folder = os.path.join(os.path.dirname(__file__), 'data')
+
+        with open(os.path.join(s_folder, "mid_data_house.json"), 'r', encoding='utf-8') as js:
+            d = json.load(js)
+
+        d['common']['weather'] = {'method': 'ees', 'region': 6}
+        d['common']['interval'] = '1h'
+
+        cls._sqc, _, _, _ = core.make_sequence(d=d, entry_point_dir=os.path.dirname(__file__))
+
+    def test_recurrence(self):
+
+        n_step = self._sqc.weather.number_of_data
+
+        for n in [0, 100, 5000, n_step - 1]:
+
+            gc_n = self._sqc.get_ground_conditions_periodic(n=n)
+
+            gc_npls = self._sqc.run_tick_ground(gc_n=gc_n, n=n)
+
+            gc_npls_expected = self._sqc.get_ground_conditions_periodic(n=n + 1)
+
+            np.testing.assert_allclose(gc_npls_expected.theta_dsh_srf_a_js_ms_n, gc_npls.theta_dsh_srf_a_js_ms_n, atol=1.0e-10)
+            np.testing.assert_allclose(gc_npls_expected.theta_dsh_srf_t_js_ms_n, gc_npls.theta_dsh_srf_t_js_ms_n, atol=1.0e-10)
+            np.testing.assert_allclose(gc_npls_expected.q_srf_js_n, gc_npls.q_srf_js_n, atol=1.0e-10)
+
+        # 前年のステップは1年後のステップと等しい。
+        np.testing.assert_array_equal(
+            self._sqc.get_ground_conditions_periodic(n=-24).q_srf_js_n,
+            self._sqc.get_ground_conditions_periodic(n=n_step - 24).q_srf_js_n
+        )
+
+        # 年間で変動する。
+        self.assertGreater(
+            np.abs(
+                self._sqc.get_ground_conditions_periodic(n=0).q_srf_js_n
+                - self._sqc.get_ground_conditions_periodic(n=5000).q_srf_js_n
+            ).max(),
+            1.0
+        )
+
+    def test_run_ticks_ground(self):
+        """地盤の計算を一括して行った結果が、ステップごとに計算した結果と一致することを確認する。"""
+
+        # 周期定常解を初期値とした場合と、初期値を0とした場合
+        for gc_start in [
+            self._sqc.get_ground_conditions_periodic(n=-2000),
+            conditions.initialize_ground_conditions(n_grounds=self._sqc.bs.n_ground)
+        ]:
+
+            gc_n = gc_start
+
+            for n in range(-2000, -24):
+                gc_n = self._sqc.run_tick_ground(gc_n=gc_n, n=n)
+
+            gc_n_batch = self._sqc.run_ticks_ground(gc_n=gc_start, n_start=-2000, n_end=-24)
+
+            np.testing.assert_allclose(gc_n.theta_dsh_srf_a_js_ms_n, gc_n_batch.theta_dsh_srf_a_js_ms_n, atol=1.0e-10)
+            np.testing.assert_allclose(gc_n.theta_dsh_srf_t_js_ms_n, gc_n_batch.theta_dsh_srf_t_js_ms_n, atol=1.0e-10)
+            np.testing.assert_allclose(gc_n.q_srf_js_n, gc_n_batch.q_srf_js_n, atol=1.0e-10)
+